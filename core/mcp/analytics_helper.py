@@ -27,6 +27,17 @@ try:
 except ImportError:
     HAS_REQUESTS = False
 
+# Cached YAML config (optional - falls back to parsing on every lookup)
+try:
+    from core.utils.config_snapshot import get_user_profile
+    HAS_CONFIG_SNAPSHOT = True
+except ImportError:
+    try:
+        from utils.config_snapshot import get_user_profile
+        HAS_CONFIG_SNAPSHOT = True
+    except ImportError:
+        HAS_CONFIG_SNAPSHOT = False
+
 
 # Configuration
 PENDO_ENDPOINT = "https://app.pendo.io/data/track"
@@ -118,6 +129,9 @@ def is_analytics_enabled() -> bool:
 
 def load_user_profile() -> dict:
     """Load user profile from yaml."""
+    if HAS_CONFIG_SNAPSHOT:
+        return get_user_profile(get_vault_path())
+    
     try:
         import yaml
     except ImportError:
@@ -41,6 +41,13 @@ try:
 except ImportError:
     _HAS_HEALTH = False
 
+# Cached YAML config (optional - falls back to parsing on every lookup)
+try:
+    from core.utils.config_snapshot import load_yaml
+    HAS_CONFIG_SNAPSHOT = True
+except ImportError:
+    HAS_CONFIG_SNAPSHOT = False
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -213,6 +220,9 @@ def load_user_profile() -> Optional[Dict]:
     if not USER_PROFILE_FILE.exists():
         return None
 
+    if HAS_CONFIG_SNAPSHOT:
+        return load_yaml(USER_PROFILE_FILE)
+
     try:
         with open(USER_PROFILE_FILE, 'r') as f:
             return yaml.safe_load(f) if yaml else None
@@ -7,11 +7,20 @@ into structured data for the Career MCP server.
 """
 
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, date
 from collections import defaultdict
 
+# Shared parsed-document cache (optional - parse on every call without it)
+try:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from core.utils.doc_cache import cached_parser
+except ImportError:
+    def cached_parser(name, copy=True):
+        return lambda parser: parser
+
 
 # ============================================================================
 # DATE PARSING
@@ -308,6 +317,7 @@ def extract_bullet_list_under_heading(content: str, heading: str) -> List[str]:
 # EVIDENCE FILE PARSING
 # ============================================================================
 
+@cached_parser('evidence')
 def parse_evidence_file(filepath: Path) -> Dict[str, Any]:
     """
     Parse a career evidence file and extract structured fields.
@@ -425,6 +435,7 @@ def scan_evidence_directory(evidence_dir: Path, date_range: Optional[Tuple[date,
 # LADDER FILE PARSING
 # ============================================================================
 
+@cached_parser('career_ladder')
 def parse_ladder_file(filepath: Path) -> Dict[str, Any]:
     """
     Parse career ladder markdown and extract competency structure.
@@ -62,6 +62,14 @@ try:
 except ImportError:
     _HAS_HEALTH = False
 
+# Off-loop tool execution (optional - handlers run inline on the event loop without it)
+try:
+    from core.utils.tool_executor import ToolExecutor
+    # generate_evidence_from_work writes evidence files; everything else only reads
+    _tool_executor = ToolExecutor(exclusive={"generate_evidence_from_work"})
+except ImportError:
+    _tool_executor = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -283,27 +291,9 @@ async def handle_call_tool(
     arguments = arguments or {}
     
     try:
-        if name == "scan_evidence":
-            return await handle_scan_evidence(arguments)
-        elif name == "parse_ladder":
-            return await handle_parse_ladder(arguments)
-        elif name == "analyze_coverage":
-            return await handle_analyze_coverage(arguments)
-        elif name == "timeline_analysis":
-            return await handle_timeline_analysis(arguments)
-        elif name == "scan_work_for_evidence":
-            return await handle_scan_work_for_evidence(arguments)
-        elif name == "skills_gap_analysis":
-            return await handle_skills_gap_analysis(arguments)
-        elif name == "generate_evidence_from_work":
-            return await handle_generate_evidence_from_work(arguments)
-        elif name == "promotion_readiness_score":
-            return await handle_promotion_readiness_score(arguments)
-        else:
-            return [types.TextContent(
-                type="text",
-                text=json.dumps({"error": f"Unknown tool: {name}"}, indent=2)
-            )]
+        if _tool_executor is not None:
+            return await _tool_executor.run_handler(name, _handle_call_tool_inner, name, arguments)
+        return await _handle_call_tool_inner(name, arguments)
     except Exception as e:
         if _HAS_HEALTH:
             _tool_human_messages = {
@@ -332,6 +322,31 @@ async def handle_call_tool(
         )]
 
 
+async def _handle_call_tool_inner(name: str, arguments: dict) -> list[types.TextContent]:
+    """Route a tool call to its handler — wrapped by handle_call_tool for error reporting."""
+    if name == "scan_evidence":
+        return await handle_scan_evidence(arguments)
+    elif name == "parse_ladder":
+        return await handle_parse_ladder(arguments)
+    elif name == "analyze_coverage":
+        return await handle_analyze_coverage(arguments)
+    elif name == "timeline_analysis":
+        return await handle_timeline_analysis(arguments)
+    elif name == "scan_work_for_evidence":
+        return await handle_scan_work_for_evidence(arguments)
+    elif name == "skills_gap_analysis":
+        return await handle_skills_gap_analysis(arguments)
+    elif name == "generate_evidence_from_work":
+        return await handle_generate_evidence_from_work(arguments)
+    elif name == "promotion_readiness_score":
+        return await handle_promotion_readiness_score(arguments)
+    else:
+        return [types.TextContent(
+            type="text",
+            text=json.dumps({"error": f"Unknown tool: {name}"}, indent=2)
+        )]
+
+
 async def handle_scan_evidence(arguments: dict) -> list[types.TextContent]:
     """Scan and aggregate evidence files"""
     
@@ -42,6 +42,21 @@ try:
 except ImportError:
     _HAS_HEALTH = False
 
+# Cached YAML config (optional - falls back to parsing on every lookup)
+try:
+    from core.utils.config_snapshot import get_user_profile
+    HAS_CONFIG_SNAPSHOT = True
+except ImportError:
+    HAS_CONFIG_SNAPSHOT = False
+
+# Off-loop tool execution (optional - handlers run inline on the event loop without it)
+try:
+    from core.utils.tool_executor import ToolExecutor
+    # Tools that rewrite commitment_queue.json run alone
+    _tool_executor = ToolExecutor(exclusive={"scan_for_commitments", "process_commitment"})
+except ImportError:
+    _tool_executor = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("commitment-detection")
@@ -58,16 +73,24 @@ USER_PROFILE = Path(VAULT_PATH) / "System" / "user-profile.yaml"
 # CONFIGURATION HELPERS
 # ============================================================================
 
+def load_user_profile() -> dict:
+    """Load user-profile.yaml ({} if missing). Read-only: the result may be shared."""
+    if HAS_CONFIG_SNAPSHOT:
+        return get_user_profile(Path(VAULT_PATH), copy=False)
+    
+    import yaml
+    if USER_PROFILE.exists():
+        with open(USER_PROFILE, 'r') as f:
+            return yaml.safe_load(f) or {}
+    return {}
+
 def is_beta_activated() -> bool:
     """Check if the screenpipe beta feature is activated."""
     try:
-        import yaml
-        if USER_PROFILE.exists():
-            with open(USER_PROFILE, 'r') as f:
-                config = yaml.safe_load(f)
-            beta = config.get('beta', {})
-            activated = beta.get('activated', {})
-            return 'screenpipe' in activated
+        config = load_user_profile()
+        beta = config.get('beta', {})
+        activated = beta.get('activated', {})
+        return 'screenpipe' in activated
     except Exception as e:
         logger.warning(f"Could not read user profile for beta check: {e}")
     return False
@@ -79,12 +102,9 @@ def is_screenpipe_enabled() -> bool:
         return False
     
     try:
-        import yaml
-        if USER_PROFILE.exists():
-            with open(USER_PROFILE, 'r') as f:
-                config = yaml.safe_load(f)
-            screenpipe_config = config.get('screenpipe', {})
-            return screenpipe_config.get('enabled', False)
+        config = load_user_profile()
+        screenpipe_config = config.get('screenpipe', {})
+        return screenpipe_config.get('enabled', False)
     except Exception as e:
         logger.warning(f"Could not read user profile: {e}")
     return False
@@ -92,15 +112,12 @@ def is_screenpipe_enabled() -> bool:
 def is_commitment_detection_enabled() -> bool:
     """Check if commitment detection feature is enabled."""
     try:
-        import yaml
-        if USER_PROFILE.exists():
-            with open(USER_PROFILE, 'r') as f:
-                config = yaml.safe_load(f)
-            screenpipe_config = config.get('screenpipe', {})
-            if not screenpipe_config.get('enabled', False):
-                return False
-            features = screenpipe_config.get('features', {})
-            return features.get('commitment_detection', True)
+        config = load_user_profile()
+        screenpipe_config = config.get('screenpipe', {})
+        if not screenpipe_config.get('enabled', False):
+            return False
+        features = screenpipe_config.get('features', {})
+        return features.get('commitment_detection', True)
     except Exception as e:
         logger.warning(f"Could not read user profile: {e}")
     return False
@@ -602,6 +619,8 @@ async def handle_list_tools():
 async def handle_call_tool(name: str, arguments: dict):
     """Handle tool calls."""
     try:
+        if _tool_executor is not None:
+            return await _tool_executor.run_handler(name, _handle_call_tool_inner, name, arguments)
         return await _handle_call_tool_inner(name, arguments)
     except Exception as e:
         if _HAS_HEALTH:
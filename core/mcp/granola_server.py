@@ -2,7 +2,8 @@
 """
 Granola Meeting Notes MCP Server for Dex
 
-Primary: Uses Granola's unofficial API for complete data
+Primary: Uses Granola's unofficial API for complete data, mirrored into a local
+         SQLite store (System/.granola-meetings.db) that is delta-synced
 Fallback: Reads from local cache if API fails
 Provides access to meeting notes, transcripts, and action items.
 
@@ -11,6 +12,7 @@ Tools:
 - granola_get_recent_meetings: Get recent meetings
 - granola_get_meeting_details: Get full details for a specific meeting
 - granola_search_meetings: Search meetings by title or attendee
+- granola_export_meetings: Export meetings as vault meeting notes (incremental, resumable)
 """
 
 import os
@@ -18,10 +20,12 @@ import json
 import logging
 import platform
 import requests
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, date, timedelta
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 
 from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
@@ -95,13 +99,98 @@ try:
 except ImportError:
     _HAS_HEALTH = False
 
+# Off-loop tool execution (optional - handlers run inline on the event loop without it)
+try:
+    from core.utils.tool_executor import ToolExecutor
+    # granola_get_extent pages through up to two years of documents — one at a time
+    # granola_export_meetings runs its own worker pool — one export at a time
+    _tool_executor = ToolExecutor(limits={"granola_get_extent": 1, "granola_export_meetings": 1})
+except ImportError:
+    _tool_executor = None
+
+# Parse-once cache-v3.json reader (optional - re-reads the whole file per call without it)
+try:
+    from core.utils.granola_cache import load_granola_cache, cache_stats as granola_cache_stats
+    HAS_GRANOLA_CACHE = True
+except ImportError:
+    HAS_GRANOLA_CACHE = False
+
+# Transcript segment index (optional - detail views return the joined transcript only)
+try:
+    from core.utils.transcript_segments import TranscriptSegments, format_offset
+    HAS_TRANSCRIPT_SEGMENTS = True
+except ImportError:
+    HAS_TRANSCRIPT_SEGMENTS = False
+
+# Segment indexes kept for recently viewed meetings: meeting id -> (transcript version, index)
+TRANSCRIPT_INDEXES_KEPT = 16
+_transcript_indexes: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+_transcript_indexes_lock = threading.Lock()
+
+# Memoized, non-recursive notes renderer (optional - renders every panel on every call without it)
+NOTES_CACHE_FILE = VAULT_PATH / 'System' / '.granola-notes.db'
+try:
+    from core.utils.prosemirror import MarkdownCache
+    _notes_cache = MarkdownCache(db_path=NOTES_CACHE_FILE)
+except ImportError:
+    _notes_cache = None
+
+# Local meeting store (optional - falls back to one API page per call)
+try:
+    from core.utils.granola_store import GranolaMeetingStore
+    HAS_MEETING_STORE = True
+except ImportError:
+    HAS_MEETING_STORE = False
+
+MEETING_STORE_FILE = VAULT_PATH / 'System' / '.granola-meetings.db'
+
+# Seconds between delta syncs of the meeting store — calls in between are local queries
+STORE_SYNC_INTERVAL = 60
+
+# Late-bound: meeting_search_text renders notes with helpers defined further down
+_meeting_store = GranolaMeetingStore(
+    MEETING_STORE_FILE, doc_text=lambda doc: meeting_search_text(doc)
+) if HAS_MEETING_STORE else None
+_last_store_sync = 0.0
+_store_full_sync_thread: Optional[threading.Thread] = None
+_store_full_sync_lock = threading.Lock()
+_transcripts_cache_signature = None  # (mtime_ns, size) of cache-v3.json last attached to the store
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Response cache to avoid rate limits (5 min TTL)
-_response_cache = {}
-_cache_ttl = 300  # 5 minutes
+# API response cache to avoid rate limits (optional - every call hits the API without it).
+# Document lists go stale fastest; anything else keeps the default TTL.
+API_CACHE_FILE = VAULT_PATH / 'System' / '.granola-api-cache.db'
+API_CACHE_TTLS = {
+    '/v2/get-documents': 120,
+}
+try:
+    from core.utils.response_cache import ResponseCache
+    _response_cache = ResponseCache(ttls=API_CACHE_TTLS, default_ttl=300, db_path=API_CACHE_FILE)
+except ImportError:
+    _response_cache = None
+
+# Bulk export into vault meeting notes (optional - granola_export_meetings is unavailable without it)
+MEETINGS_EXPORT_DIR = '00-Inbox/Meetings'
+EXPORT_MANIFEST_FILE = VAULT_PATH / 'System' / '.granola-export.json'
+try:
+    from core.utils.meeting_export import ExportItem, MeetingExporter
+    from core.utils.page_generators import generate_meeting_note
+    HAS_MEETING_EXPORT = True
+except ImportError:
+    HAS_MEETING_EXPORT = False
+
+# Bump when render_meeting_note's output changes so already-exported notes are re-rendered
+EXPORT_FORMAT_VERSION = 2
+
+# Cancellation checks for long tool loops (no-op without the tool executor)
+try:
+    from core.utils.tool_executor import check_cancelled
+except ImportError:
+    def check_cancelled():
+        pass
 
 
 # Custom JSON encoder for handling date/datetime objects
@@ -140,26 +229,32 @@ def get_api_access_token() -> Optional[str]:
         return None
 
 
-def fetch_from_api(endpoint: str, data: Dict[str, Any], retries: int = 2) -> Optional[Dict[str, Any]]:
+def fetch_from_api(endpoint: str, data: Dict[str, Any], retries: int = 2,
+                   use_cache: bool = True) -> Optional[Dict[str, Any]]:
     """
     Fetch data from Granola API with exponential backoff on failures
     
+    Successful responses are cached per endpoint TTL (memory + disk), and
+    identical concurrent requests share one HTTP call.
+    
     Args:
         endpoint: API endpoint (e.g., '/v2/get-documents')
         data: Request payload
         retries: Number of retries on failure
+        use_cache: False to skip a cached response (the fresh one still refreshes the cache)
     
     Returns:
-        API response dict or None on failure
+        API response dict or None on failure (treat as read-only)
     """
-    # Check response cache
-    cache_key = f"{endpoint}:{json.dumps(data, sort_keys=True)}"
-    if cache_key in _response_cache:
-        cached_time, cached_response = _response_cache[cache_key]
-        if time.time() - cached_time < _cache_ttl:
-            logger.debug(f"Using cached response for {endpoint}")
-            return cached_response
-    
+    if _response_cache is None:
+        return post_to_api(endpoint, data, retries)
+    return _response_cache.get_or_fetch(
+        endpoint, data, lambda: post_to_api(endpoint, data, retries), use_cache=use_cache
+    )
+
+
+def post_to_api(endpoint: str, data: Dict[str, Any], retries: int = 2) -> Optional[Dict[str, Any]]:
+    """One uncached API request (with retries) — use fetch_from_api instead"""
     token = get_api_access_token()
     if not token:
         logger.warning("No API token available, falling back to cache")
@@ -180,8 +275,6 @@ def fetch_from_api(endpoint: str, data: Dict[str, Any], retries: int = 2) -> Opt
             
             if response.status_code == 200:
                 result = response.json()
-                # Cache successful response
-                _response_cache[cache_key] = (time.time(), result)
                 logger.debug(f"API request successful: {endpoint}")
                 return result
             elif response.status_code == 429:
@@ -210,6 +303,138 @@ def fetch_from_api(endpoint: str, data: Dict[str, Any], retries: int = 2) -> Opt
     return None
 
 
+def fetch_documents_page(offset: int, limit: int, use_cache: bool = True) -> Optional[List[Dict[str, Any]]]:
+    """One page of /v2/get-documents (with notes panels), or None if the request failed"""
+    response = fetch_from_api('/v2/get-documents', {
+        'limit': limit,
+        'offset': offset,
+        'include_last_viewed_panel': True
+    }, use_cache=use_cache)
+    if not response or 'docs' not in response:
+        return None
+    return response['docs']
+
+
+def fetch_store_page(offset: int, limit: int) -> Optional[List[Dict[str, Any]]]:
+    """Page fetcher for store syncs - the store is the cache, so syncs always need the live pages"""
+    return fetch_documents_page(offset, limit, use_cache=False)
+
+
+def _run_store_full_sync(full: bool) -> None:
+    """Full pass over the document history (runs on a background thread)"""
+    global _transcripts_cache_signature
+    try:
+        result = _meeting_store.sync(fetch_store_page, full=full)
+        logger.info(f"Meeting store {result['mode']} sync: {result['changed']} changed "
+                    f"in {result['pages']} page(s)")
+        if result['changed']:
+            # New meetings may have transcripts in the local cache already
+            _transcripts_cache_signature = None
+    except Exception as e:
+        logger.error(f"Meeting store full sync failed: {e}")
+
+
+def start_store_full_sync(full: bool = False) -> bool:
+    """Start a background full pass unless one is already running. Returns True if started."""
+    global _store_full_sync_thread
+    with _store_full_sync_lock:
+        if _store_full_sync_thread is not None and _store_full_sync_thread.is_alive():
+            return False
+        _store_full_sync_thread = threading.Thread(
+            target=_run_store_full_sync, args=(full,), daemon=True, name='granola-store-full-sync'
+        )
+        _store_full_sync_thread.start()
+        return True
+
+
+def sync_meeting_store(force: bool = False, full: bool = False) -> bool:
+    """
+    Bring the local meeting store up to date (delta sync at most every STORE_SYNC_INTERVAL).
+    
+    Full passes (the first backfill, resuming one, the periodic resync) run on
+    a background thread so no tool call waits for the whole history; until the
+    first one completes, callers keep using the first API page.
+    
+    Returns:
+        True if the store has completed a full pass and can serve reads
+    """
+    global _last_store_sync, _transcripts_cache_signature
+    if _meeting_store is None:
+        return False
+    
+    try:
+        now = time.time()
+        if force or full or now - _last_store_sync >= STORE_SYNC_INTERVAL:
+            # Throttle failed syncs too, so an offline API doesn't add retries to every call
+            _last_store_sync = now
+            if get_api_access_token():
+                if full or _meeting_store.full_pass_due:
+                    start_store_full_sync(full)
+                if _meeting_store.ready:
+                    result = _meeting_store.delta_sync(fetch_store_page)
+                    if result['changed']:
+                        logger.info(f"Meeting store delta sync: {result['changed']} changed "
+                                    f"in {result['pages']} page(s)")
+                        _transcripts_cache_signature = None
+        return _meeting_store.ready
+    except Exception as e:
+        logger.error(f"Meeting store unavailable: {e}")
+        return False
+
+
+def sync_store_transcripts() -> None:
+    """Attach transcripts from Granola's local cache to stored meetings (only when the cache changed)"""
+    global _transcripts_cache_signature
+    if _meeting_store is None:
+        return
+    try:
+        st = GRANOLA_CACHE.stat()
+    except OSError:
+        return
+    signature = (st.st_mtime_ns, st.st_size)
+    if signature == _transcripts_cache_signature:
+        return
+    
+    cache = read_granola_cache()
+    if not cache:
+        return
+    cached_transcripts = cache['transcripts']
+    transcripts = {}
+    for meeting_id in cached_transcripts:
+        if hasattr(cached_transcripts, 'meta'):
+            # Precomputed by the cache reader - entries are only decoded if the store needs them
+            count, version, _ = cached_transcripts.meta(meeting_id)
+        else:
+            entries = cached_transcripts[meeting_id]
+            # Transcripts only grow, so entry count + last timestamp identifies a version
+            count = len(entries)
+            version = f"{count}:{entries[-1].get('end_timestamp') or entries[-1].get('start_timestamp', '')}" if entries else ''
+        if count:
+            transcripts[meeting_id] = (
+                version,
+                lambda meeting_id=meeting_id: join_transcript(cached_transcripts[meeting_id])
+            )
+    updated = _meeting_store.set_transcripts(transcripts)
+    if updated:
+        logger.info(f"Indexed {updated} transcript(s) from the Granola cache")
+    _transcripts_cache_signature = signature
+
+
+def get_api_documents(since: Optional[datetime] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    API documents, newest first: the full history from the local store, or the
+    first API page when the store is unavailable. None if neither works.
+    
+    Args:
+        since: Only documents created at/after this time, give or take a day
+               (store only — callers still apply their own exact cutoff)
+    """
+    if sync_meeting_store():
+        # A day of slack covers timezone offsets in created_at strings
+        return _meeting_store.documents(since=(since - timedelta(days=1)).isoformat() if since else None)
+    return fetch_documents_page(0, 100)
+
+
 def convert_api_doc_to_meeting_info(doc: Dict[str, Any]) -> Dict[str, Any]:
     """Convert API document format to standardized meeting info"""
     meeting_id = doc.get('id', '')
@@ -227,7 +452,7 @@ def convert_api_doc_to_meeting_info(doc: Dict[str, Any]) -> Dict[str, Any]:
         content = panel.get('content')
         if content and isinstance(content, dict):
             # Convert ProseMirror to markdown
-            notes = convert_prosemirror_to_markdown(content)
+            notes = convert_prosemirror_to_markdown(content, notes_cache_key(doc))
             if notes:
                 has_content = True
                 content_blocks = len(content.get('content', []))
@@ -261,11 +486,38 @@ def convert_api_doc_to_meeting_info(doc: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def convert_prosemirror_to_markdown(content: Dict[str, Any]) -> str:
-    """Convert ProseMirror JSON to Markdown"""
+def meeting_search_text(doc: Dict[str, Any]) -> Dict[str, str]:
+    """Rendered notes and attendee names/emails for the meeting store's full-text index"""
+    info = convert_api_doc_to_meeting_info(doc)
+    attendees = []
+    for participant in info['participants']:
+        attendees.extend(v for v in (participant['name'], participant.get('email')) if v)
+    return {
+        'notes': info['notes'] or doc.get('notes_markdown') or '',
+        'attendees': ' '.join(attendees)
+    }
+
+
+def notes_cache_key(doc: Dict[str, Any], meeting_id: Optional[str] = None) -> Optional[str]:
+    """Memo key for a document's rendered panel — changes whenever the document is edited"""
+    doc_id = meeting_id or doc.get('id')
+    updated_at = doc.get('updated_at')
+    return f"{doc_id}:{updated_at}" if doc_id and updated_at else None
+
+
+def convert_prosemirror_to_markdown(content: Dict[str, Any], cache_key: Optional[str] = None) -> str:
+    """
+    Convert ProseMirror JSON to Markdown
+    
+    Renders are memoized by cache_key (see notes_cache_key); without a key
+    the content is rendered every time.
+    """
     if not content or not isinstance(content, dict) or 'content' not in content:
         return ""
     
+    if _notes_cache is not None:
+        return _notes_cache.render(content, cache_key)
+    
     def process_node(node):
         if not isinstance(node, dict):
             return ""
@@ -331,11 +583,19 @@ def convert_prosemirror_to_markdown(content: Dict[str, Any]) -> str:
 
 
 def read_granola_cache() -> Optional[Dict[str, Any]]:
-    """Read and parse Granola's local cache file (fallback data source)"""
+    """
+    Read and parse Granola's local cache file (fallback data source)
+    
+    With the cache reader available, the file is decoded once per version and
+    shared between calls (treat it as read-only); transcripts decode lazily.
+    """
     if not GRANOLA_CACHE.exists():
         logger.debug("Cache file not found")
         return None
     
+    if HAS_GRANOLA_CACHE:
+        return load_granola_cache(GRANOLA_CACHE)
+    
     try:
         raw_data = GRANOLA_CACHE.read_text()
         cache_wrapper = json.loads(raw_data)
@@ -354,18 +614,23 @@ def read_granola_cache() -> Optional[Dict[str, Any]]:
         return None
 
 
+def join_transcript(entries: List[Dict[str, Any]]) -> str:
+    """Transcript entries joined into one string in time order"""
+    return ' '.join(
+        t.get('text', '') 
+        for t in sorted(entries, key=lambda x: x.get('start_timestamp', ''))
+    ).strip()
+
+
 def extract_meeting_info_from_cache(doc: Dict[str, Any], transcripts: Dict[str, Any], meeting_id: str) -> Dict[str, Any]:
     """Extract relevant meeting information from a Granola cache document (fallback)"""
     
-    # Get transcript if available
-    transcript_entries = transcripts.get(meeting_id, [])
-    if transcript_entries:
-        transcript = ' '.join(
-            t.get('text', '') 
-            for t in sorted(transcript_entries, key=lambda x: x.get('start_timestamp', ''))
-        ).strip()
+    # Get transcript length if available (precomputed by the cache reader - no decode needed)
+    if hasattr(transcripts, 'meta'):
+        transcript_length = transcripts.meta(meeting_id)[2]
     else:
-        transcript = None
+        transcript_entries = transcripts.get(meeting_id, [])
+        transcript_length = len(join_transcript(transcript_entries)) if transcript_entries else 0
     
     # Extract participants
     participants = []
@@ -393,14 +658,14 @@ def extract_meeting_info_from_cache(doc: Dict[str, Any], transcripts: Dict[str,
         if panel and isinstance(panel, dict):
             panel_content = panel.get('content')
             if panel_content and isinstance(panel_content, dict):
-                notes = convert_prosemirror_to_markdown(panel_content)
+                notes = convert_prosemirror_to_markdown(panel_content, notes_cache_key(doc, meeting_id))
         elif panel and isinstance(panel, str):
             try:
                 parsed_panel = json.loads(panel)
                 if isinstance(parsed_panel, dict):
                     panel_content = parsed_panel.get('content')
                     if panel_content and isinstance(panel_content, dict):
-                        notes = convert_prosemirror_to_markdown(panel_content)
+                        notes = convert_prosemirror_to_markdown(panel_content, notes_cache_key(doc, meeting_id))
             except (json.JSONDecodeError, TypeError):
                 pass
     
@@ -410,8 +675,8 @@ def extract_meeting_info_from_cache(doc: Dict[str, Any], transcripts: Dict[str,
         'date': meeting_date,
         'created_at': created_at,
         'notes': notes,
-        'has_transcript': bool(transcript),
-        'transcript_length': len(transcript) if transcript else 0,
+        'has_transcript': transcript_length > 0,
+        'transcript_length': transcript_length,
         'participants': participants,
         'participant_count': len(participants),
         'source': 'cache'
@@ -428,7 +693,17 @@ def get_meetings_from_cache(
     cutoff_date = datetime.now() - timedelta(days=days_back)
     meetings = []
     
-    for meeting_id, doc in cache['documents'].items():
+    # The cache reader pre-sorts live meetings newest first, so we can stop at `limit`
+    meeting_ids = cache.get('meeting_ids')
+    if meeting_ids is not None:
+        documents = ((meeting_id, cache['documents'][meeting_id]) for meeting_id in meeting_ids)
+    else:
+        documents = cache['documents'].items()
+    
+    for meeting_id, doc in documents:
+        if meeting_ids is not None and len(meetings) >= limit:
+            break
+        
         # Skip non-meeting documents
         if doc.get('type') != 'meeting':
             continue
@@ -468,20 +743,16 @@ def get_recent_meetings(days_back: int = 7, limit: int = 20) -> List[Dict[str, A
     """
     # Try API first
     logger.info(f"Fetching recent meetings (days_back={days_back}, limit={limit})")
-    api_response = fetch_from_api('/v2/get-documents', {
-        'limit': 100,  # Get more to filter by date
-        'offset': 0,
-        'include_last_viewed_panel': True
-    })
+    cutoff_date = datetime.now() - timedelta(days=days_back)
+    api_docs = get_api_documents(since=cutoff_date)
     
-    if api_response and 'docs' in api_response:
-        logger.info(f"Using API data ({len(api_response['docs'])} documents)")
+    if api_docs is not None:
+        logger.info(f"Using API data ({len(api_docs)} documents)")
         
         # Filter and convert API documents
-        cutoff_date = datetime.now() - timedelta(days=days_back)
         meetings = []
         
-        for doc in api_response['docs']:
+        for doc in api_docs:
             created_at = doc.get('created_at', '')
             if created_at:
                 try:
@@ -517,14 +788,6 @@ def get_meeting_by_id_from_cache(cache: Dict[str, Any], meeting_id: str) -> Opti
     
     info = extract_meeting_info_from_cache(doc, cache['transcripts'], meeting_id)
     
-    # Add full transcript for detail view
-    transcript_entries = cache['transcripts'].get(meeting_id, [])
-    if transcript_entries:
-        info['transcript'] = ' '.join(
-            t.get('text', '') 
-            for t in sorted(transcript_entries, key=lambda x: x.get('start_timestamp', ''))
-        ).strip()
-    
     # Add action items if present in notes (uses notes from extract_meeting_info_from_cache which checks last_viewed_panel)
     notes = info.get('notes', '')
     action_items = []
@@ -538,21 +801,124 @@ def get_meeting_by_id_from_cache(cache: Dict[str, Any], meeting_id: str) -> Opti
     return info
 
 
-def get_meeting_details(meeting_id: str) -> Optional[Dict[str, Any]]:
+def get_transcript_segments(meeting_id: str) -> Optional[Any]:
+    """Segment index of a meeting's transcript from the local cache (None if it has none)"""
+    if not HAS_TRANSCRIPT_SEGMENTS:
+        return None
+    cache = read_granola_cache()
+    if not cache:
+        return None
+    transcripts = cache['transcripts']
+    if meeting_id not in transcripts:
+        return None
+    if hasattr(transcripts, 'meta'):
+        version = transcripts.meta(meeting_id)[1]
+    else:
+        entries = transcripts[meeting_id]
+        version = f"{len(entries)}:{entries[-1].get('end_timestamp', '')}" if entries else ''
+    
+    with _transcript_indexes_lock:
+        cached = _transcript_indexes.get(meeting_id)
+        if cached and cached[0] == version:
+            _transcript_indexes.move_to_end(meeting_id)
+            return cached[1]
+    
+    segments = TranscriptSegments(transcripts[meeting_id])
+    with _transcript_indexes_lock:
+        _transcript_indexes[meeting_id] = (version, segments)
+        while len(_transcript_indexes) > TRANSCRIPT_INDEXES_KEPT:
+            _transcript_indexes.popitem(last=False)
+    return segments
+
+
+def attach_transcript(info: Dict[str, Any], meeting_id: str, mode: str = 'full',
+                      options: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Add the meeting's transcript to `info` in the requested shape
+    
+    Modes:
+        full:   the whole transcript as one string (default)
+        none:   only has_transcript / transcript_length / segment count
+        window: segments between options start_minute and end_minute
+        search: segments containing options transcript_query, with
+                context_segments either side
+        page:   segments [offset, offset + limit)
+    """
+    options = options or {}
+    if not HAS_TRANSCRIPT_SEGMENTS:
+        # No segment index - only the joined transcript is available
+        cache = read_granola_cache() if mode == 'full' else None
+        entries = cache['transcripts'].get(meeting_id, []) if cache else []
+        if entries:
+            info['transcript'] = join_transcript(entries)
+            info['has_transcript'] = True
+            info['transcript_length'] = len(info['transcript'])
+        return
+    
+    segments = get_transcript_segments(meeting_id)
+    if not segments:
+        return
+    
+    info['has_transcript'] = True
+    info['transcript_length'] = segments.text_length
+    info['transcript_segment_count'] = len(segments)
+    info['transcript_duration'] = format_offset(segments.duration)
+    
+    if mode == 'full':
+        info['transcript'] = segments.text()
+    elif mode == 'window':
+        start = float(options.get('start_minute') or 0) * 60
+        end = options.get('end_minute')
+        end = float(end) * 60 if end is not None else None
+        info['transcript_window'] = {
+            'start_minute': start / 60,
+            'end_minute': end / 60 if end is not None else None,
+            'segments': segments.to_dicts(segments.window(start, end)),
+        }
+    elif mode == 'search':
+        query = options.get('transcript_query') or ''
+        excerpts = segments.search(query, context=int(options.get('context_segments', 2)),
+                                   limit=int(options.get('limit', 10)))
+        info['transcript_matches'] = {
+            'query': query,
+            'excerpts': excerpts,
+        }
+    elif mode == 'page':
+        offset = max(0, int(options.get('offset', 0)))
+        limit = int(options.get('limit', 50))
+        indices = segments.page(offset, limit)
+        next_offset = offset + len(indices)
+        info['transcript_page'] = {
+            'offset': offset,
+            'limit': limit,
+            'total': len(segments),
+            'next_offset': next_offset if next_offset < len(segments) else None,
+            'segments': segments.to_dicts(indices),
+        }
+
+
+def get_meeting_details(meeting_id: str, transcript: str = 'full',
+                        transcript_options: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
     """
     Get detailed meeting information by ID (API-first with cache fallback)
+    
+    The transcript (from Granola's local cache) is attached per `transcript`
+    mode - see attach_transcript.
     """
     logger.info(f"Fetching details for meeting {meeting_id}")
     
-    # Try API first - get all meetings and find the one we need
-    api_response = fetch_from_api('/v2/get-documents', {
-        'limit': 100,
-        'offset': 0,
-        'include_last_viewed_panel': True
-    })
+    # Try API first - look the meeting up in the local store (or the first API page)
+    if sync_meeting_store():
+        doc = _meeting_store.get(meeting_id)
+        if doc is None and sync_meeting_store(force=True):
+            # Created since the last delta sync (e.g. a meeting that just ended)
+            doc = _meeting_store.get(meeting_id)
+        api_docs = [doc] if doc else []
+    else:
+        api_docs = fetch_documents_page(0, 100)
     
-    if api_response and 'docs' in api_response:
-        for doc in api_response['docs']:
+    if api_docs:
+        for doc in api_docs:
             if doc.get('id') == meeting_id:
                 logger.info(f"Found meeting in API data")
                 info = convert_api_doc_to_meeting_info(doc)
@@ -566,6 +932,7 @@ def get_meeting_details(meeting_id: str) -> Optional[Dict[str, Any]]:
                         action_items.append(line[5:].strip())
                 
                 info['action_items'] = action_items
+                attach_transcript(info, meeting_id, transcript, transcript_options)
                 return info
     
     # Fallback to cache
@@ -574,6 +941,7 @@ def get_meeting_details(meeting_id: str) -> Optional[Dict[str, Any]]:
     if cache:
         result = get_meeting_by_id_from_cache(cache, meeting_id)
         if result:
+            attach_transcript(result, meeting_id, transcript, transcript_options)
             return result
     
     logger.warning(f"Meeting {meeting_id} not found in API or cache")
@@ -584,15 +952,25 @@ def search_meetings_in_cache(
     cache: Dict[str, Any],
     query: str,
     days_back: int = 30,
-    limit: int = 10
+    limit: int = 10,
+    until: Optional[str] = None
 ) -> List[Dict[str, Any]]:
-    """Search meetings by title, notes, or participant names in cache (fallback)"""
+    """Search meetings by title, notes, or participant names in cache (fallback)
+    
+    until: optional ISO date/timestamp — skip meetings created at/after it
+    """
     
     query_lower = query.lower()
     cutoff_date = datetime.now() - timedelta(days=days_back)
     results = []
     
-    for meeting_id, doc in cache['documents'].items():
+    meeting_ids = cache.get('meeting_ids')
+    if meeting_ids is not None:
+        documents = ((meeting_id, cache['documents'][meeting_id]) for meeting_id in meeting_ids)
+    else:
+        documents = cache['documents'].items()
+    
+    for meeting_id, doc in documents:
         # Skip non-meeting documents
         if doc.get('type') != 'meeting':
             continue
@@ -610,6 +988,8 @@ def search_meetings_in_cache(
                     continue
             except:
                 pass
+            if until and created_at >= until:
+                continue
         
         # Search in title
         title = doc.get('title', '').lower()
@@ -624,7 +1004,7 @@ def search_meetings_in_cache(
             if panel and isinstance(panel, dict):
                 panel_content = panel.get('content')
                 if panel_content and isinstance(panel_content, dict):
-                    notes = convert_prosemirror_to_markdown(panel_content)
+                    notes = convert_prosemirror_to_markdown(panel_content, notes_cache_key(doc, meeting_id))
         if query_lower in notes.lower():
             results.append(extract_meeting_info_from_cache(doc, cache['transcripts'], meeting_id))
             continue
@@ -647,27 +1027,52 @@ def search_meetings_in_cache(
     return results[:limit]
 
 
-def search_meetings(query: str, days_back: int = 30, limit: int = 10) -> List[Dict[str, Any]]:
+def search_meetings(query: str, days_back: int = 30, limit: int = 10,
+                    start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
     """
-    Search meetings by title, notes, or participant names (API-first with cache fallback)
+    Search meetings by title, notes, transcript, or participant names/emails
+    
+    With the local meeting store, this is a BM25-ranked full-text search
+    ("quoted phrases", prefix* terms) and each result carries a score and a
+    highlighted snippet. Otherwise falls back to a substring scan of the first
+    API page, then the local cache.
+    
+    Args:
+        start_date/end_date: Optional YYYY-MM-DD range (inclusive); start_date
+                             overrides days_back
     """
     logger.info(f"Searching meetings for '{query}' (days_back={days_back}, limit={limit})")
     
-    # Try API first - get broader set and filter
-    api_response = fetch_from_api('/v2/get-documents', {
-        'limit': 100,
-        'offset': 0,
-        'include_last_viewed_panel': True
-    })
+    if start_date:
+        cutoff_date = datetime.fromisoformat(start_date)
+        days_back = max((datetime.now() - cutoff_date).days + 1, 0)
+    else:
+        cutoff_date = datetime.now() - timedelta(days=days_back)
+    until = (datetime.fromisoformat(end_date) + timedelta(days=1)).isoformat() if end_date else None
     
-    if api_response and 'docs' in api_response:
-        logger.info(f"Searching in API data ({len(api_response['docs'])} documents)")
+    # Ranked full-text search over the stored history
+    if sync_meeting_store() and _meeting_store.has_fts:
+        sync_store_transcripts()
+        hits = _meeting_store.search(query, since=cutoff_date.isoformat(), until=until, limit=limit)
+        if hits is not None:
+            results = []
+            for hit in hits:
+                info = convert_api_doc_to_meeting_info(hit['doc'])
+                info['score'] = hit['score']
+                info['snippet'] = hit['snippet']
+                results.append(info)
+            return results
+    
+    # Try API first - search the stored history (or the first API page)
+    api_docs = get_api_documents(since=cutoff_date)
+    
+    if api_docs is not None:
+        logger.info(f"Searching in API data ({len(api_docs)} documents)")
         
         query_lower = query.lower()
-        cutoff_date = datetime.now() - timedelta(days=days_back)
         results = []
         
-        for doc in api_response['docs']:
+        for doc in api_docs:
             # Check date cutoff
             created_at = doc.get('created_at', '')
             if created_at:
@@ -689,7 +1094,7 @@ def search_meetings(query: str, days_back: int = 30, limit: int = 10) -> List[Di
             if isinstance(panel, dict):
                 content = panel.get('content', {})
                 if isinstance(content, dict):
-                    notes_text = convert_prosemirror_to_markdown(content)
+                    notes_text = convert_prosemirror_to_markdown(content, notes_cache_key(doc))
                     if notes_text and query_lower in notes_text.lower():
                         results.append(convert_api_doc_to_meeting_info(doc))
                         continue
@@ -707,6 +1112,9 @@ def search_meetings(query: str, days_back: int = 30, limit: int = 10) -> List[Di
                     results.append(convert_api_doc_to_meeting_info(doc))
                     break
         
+        if until:
+            results = [r for r in results if not r.get('created_at') or r['created_at'] < until]
+        
         # Sort by date descending and limit
         results.sort(key=lambda x: x.get('created_at', ''), reverse=True)
         return results[:limit]
@@ -715,12 +1123,173 @@ def search_meetings(query: str, days_back: int = 30, limit: int = 10) -> List[Di
     logger.info("API failed, falling back to cache for search")
     cache = read_granola_cache()
     if cache:
-        return search_meetings_in_cache(cache, query, days_back, limit)
+        return search_meetings_in_cache(cache, query, days_back, limit, until)
     
     logger.error("Both API and cache failed for search")
     return []
 
 
+# ============================================================================
+# EXPORT (vault meeting notes)
+# ============================================================================
+
+def meeting_start(created_at: str) -> Optional[datetime]:
+    """Meeting start in local time (naive), from a Granola created_at timestamp"""
+    if not created_at:
+        return None
+    try:
+        started = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return started.astimezone().replace(tzinfo=None) if started.tzinfo else started
+
+
+def render_meeting_note(info: Dict[str, Any], started: datetime,
+                        transcript_entries: Optional[List[Dict[str, Any]]] = None) -> str:
+    """
+    Vault meeting note for a meeting info dict: frontmatter, then the
+    page_generators meeting note, then the transcript when one is given.
+
+    Output depends only on its inputs (no timestamps of its own), so an
+    unchanged meeting renders to an identical file.
+    """
+    title = info.get('title') or 'Untitled Meeting'
+    names = [p['name'] for p in info.get('participants', []) if p.get('name')]
+    # Emails let company aggregation match the note by domain
+    emails = [p['email'] for p in info.get('participants', []) if p.get('email')]
+
+    # Checkboxes move from the discussion into the note's Action Items section
+    discussion, action_items = [], []
+    for line in (info.get('notes') or '').split('\n'):
+        stripped = line.strip()
+        if stripped.startswith('- [ ]') or stripped.startswith('* [ ]'):
+            action_items.append(stripped[5:].strip())
+        else:
+            discussion.append(line)
+
+    content = "---\n"
+    content += f"date: {started.strftime('%Y-%m-%d')}\n"
+    content += f"time: {started.strftime('%H:%M')}\n"
+    content += "type: meeting-note\n"
+    content += "source: granola\n"
+    content += f"title: {json.dumps(title)}\n"
+    content += f"participants: {json.dumps(names)}\n"
+    content += f"participant_emails: {json.dumps(emails)}\n"
+    content += f"granola_id: {info['id']}\n"
+    content += "---\n\n"
+    content += generate_meeting_note(
+        title,
+        date=started,
+        attendees=[name.replace(' ', '_') for name in names],
+        notes='\n'.join(discussion).strip(),
+        action_items=action_items,
+    )
+
+    if transcript_entries:
+        content += "## Transcript\n\n"
+        if HAS_TRANSCRIPT_SEGMENTS:
+            segments = TranscriptSegments(transcript_entries)
+            for segment in segments.segments:
+                content += f"**[{format_offset(segment.start) or '--:--'}] {segment.speaker}:** {segment.text}\n\n"
+        else:
+            content += f"{join_transcript(transcript_entries)}\n\n"
+
+    return content
+
+
+def iter_export_items(days_back: Optional[int] = None, include_transcript: bool = False):
+    """
+    Meetings to export, newest first, as ExportItems whose render() does the work
+
+    Listing is cheap — ids and versions from the meeting store (or the cache's
+    sorted meeting ids) — so unchanged meetings are skipped without loading or
+    rendering their documents. Transcripts come from Granola's local cache.
+    """
+    cutoff = datetime.now() - timedelta(days=days_back) if days_back else None
+    use_store = sync_meeting_store()
+    cache = read_granola_cache() if include_transcript or not use_store else None
+    transcripts = cache['transcripts'] if cache else {}
+
+    def transcript_version(meeting_id: str) -> str:
+        if not include_transcript or meeting_id not in transcripts:
+            return ''
+        if hasattr(transcripts, 'meta'):
+            return transcripts.meta(meeting_id)[1]
+        entries = transcripts[meeting_id]
+        return f"{len(entries)}:{entries[-1].get('end_timestamp', '')}" if entries else ''
+
+    def make_item(meeting_id: str, title: str, created_at: str, updated_at: str, load_info) -> Optional[Any]:
+        started = meeting_start(created_at)
+        if started is None or (cutoff and started < cutoff):
+            return None
+
+        def render() -> str:
+            entries = transcripts.get(meeting_id) if include_transcript else None
+            return render_meeting_note(load_info(), started, entries)
+
+        return ExportItem(
+            id=meeting_id,
+            version=f"{EXPORT_FORMAT_VERSION}|{updated_at}|{transcript_version(meeting_id)}",
+            date=started.strftime('%Y-%m-%d'),
+            title=title or 'Untitled Meeting',
+            render=render,
+        )
+
+    if use_store:
+        # A day of slack covers timezone offsets in created_at strings
+        since = (cutoff - timedelta(days=1)).isoformat() if cutoff else None
+        for meeting_id, title, created_at, updated_at in _meeting_store.summaries(since=since):
+            item = make_item(meeting_id, title, created_at, updated_at,
+                             lambda meeting_id=meeting_id: convert_api_doc_to_meeting_info(
+                                 _meeting_store.get(meeting_id)))
+            if item:
+                yield item
+        return
+
+    if not cache:
+        return
+    documents = cache['documents']
+    meeting_ids = cache.get('meeting_ids')
+    if meeting_ids is None:
+        meeting_ids = [
+            meeting_id for meeting_id, doc in documents.items()
+            if doc.get('type') == 'meeting' and not doc.get('deleted_at')
+        ]
+    for meeting_id in meeting_ids:
+        doc = documents[meeting_id]
+        item = make_item(meeting_id, doc.get('title'), doc.get('created_at', ''),
+                         doc.get('updated_at') or doc.get('created_at', ''),
+                         lambda doc=doc, meeting_id=meeting_id: extract_meeting_info_from_cache(
+                             doc, transcripts, meeting_id))
+        if item:
+            yield item
+
+
+def export_meetings(days_back: Optional[int] = None, include_transcript: bool = False,
+                    force: bool = False, dry_run: bool = False, workers: Optional[int] = None,
+                    on_progress=None) -> Dict[str, Any]:
+    """
+    Export Granola meetings to 00-Inbox/Meetings/YYYY-MM-DD/<slug>.md
+
+    Resumable: meetings whose version matches the export manifest are skipped,
+    so re-running after an interruption only does the remaining work.
+    """
+    exporter_args = {'workers': workers} if workers else {}
+    exporter = MeetingExporter(VAULT_PATH, MEETINGS_EXPORT_DIR, EXPORT_MANIFEST_FILE, **exporter_args)
+
+    def progress(summary: Dict[str, Any]) -> None:
+        check_cancelled()
+        if on_progress:
+            on_progress(summary)
+
+    started = time.time()
+    summary = exporter.export(iter_export_items(days_back, include_transcript),
+                              force=force, dry_run=dry_run, on_progress=progress)
+    summary['seconds'] = round(time.time() - started, 1)
+    summary['meetings_dir'] = MEETINGS_EXPORT_DIR
+    return summary
+
+
 # Initialize the MCP server
 app = Server("dex-granola-mcp")
 
@@ -758,13 +1327,45 @@ async def handle_list_tools() -> list[types.Tool]:
         ),
         types.Tool(
             name="granola_get_meeting_details",
-            description="Get full details for a specific meeting including transcript",
+            description="Get full details for a specific meeting including transcript. For long calls, ask for a time window, the passages matching a query, or a page of transcript segments instead of the full text.",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "meeting_id": {
                         "type": "string",
                         "description": "The meeting ID from Granola"
+                    },
+                    "transcript": {
+                        "type": "string",
+                        "enum": ["full", "none", "window", "search", "page"],
+                        "description": "How to return the transcript: full text (default), none, a time window, segments matching transcript_query, or a page of segments",
+                        "default": "full"
+                    },
+                    "start_minute": {
+                        "type": "number",
+                        "description": "window: minutes from the start of the call (default 0)"
+                    },
+                    "end_minute": {
+                        "type": "number",
+                        "description": "window: end of the window in minutes (default: end of call)"
+                    },
+                    "transcript_query": {
+                        "type": "string",
+                        "description": "search: phrase to find in the transcript"
+                    },
+                    "context_segments": {
+                        "type": "integer",
+                        "description": "search: segments of context either side of a match",
+                        "default": 2
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "page: first segment to return",
+                        "default": 0
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "page: segments per page (default 50); search: max excerpts (default 10)"
                     }
                 },
                 "required": ["meeting_id"]
@@ -772,19 +1373,27 @@ async def handle_list_tools() -> list[types.Tool]:
         ),
         types.Tool(
             name="granola_search_meetings",
-            description="Search meetings by title, notes, or participant name",
+            description="Search meetings by title, notes, transcript, or participant name/email. Results are ranked by relevance with highlighted snippets; supports \"quoted phrases\" and prefix* terms.",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "query": {
                         "type": "string",
-                        "description": "Search term"
+                        "description": "Search terms (all must match), \"exact phrases\", or prefix* terms"
                     },
                     "days_back": {
                         "type": "integer",
                         "description": "How many days back to search (default: 30)",
                         "default": 30
                     },
+                    "start_date": {
+                        "type": "string",
+                        "description": "Only meetings on/after this date (YYYY-MM-DD); overrides days_back"
+                    },
+                    "end_date": {
+                        "type": "string",
+                        "description": "Only meetings on/before this date (YYYY-MM-DD)"
+                    },
                     "limit": {
                         "type": "integer",
                         "description": "Maximum results to return (default: 10)",
@@ -820,6 +1429,42 @@ async def handle_list_tools() -> list[types.Tool]:
                     }
                 }
             }
+        ),
+        types.Tool(
+            name="granola_export_meetings",
+            description="Export Granola meetings as vault meeting notes (00-Inbox/Meetings/YYYY-MM-DD/<title>.md). Resumable and incremental: meetings unchanged since the last export are skipped, and notes edited in the vault are never overwritten unless force=true.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "days_back": {
+                        "type": "integer",
+                        "description": "Only meetings from the last N days (default: all meetings)"
+                    },
+                    "include_transcript": {
+                        "type": "boolean",
+                        "description": "Append the transcript from Granola's local cache to each note (default: false)",
+                        "default": False
+                    },
+                    "force": {
+                        "type": "boolean",
+                        "description": "Re-render every meeting and overwrite notes edited since they were exported (default: false)",
+                        "default": False
+                    },
+                    "dry_run": {
+                        "type": "boolean",
+                        "description": "Report what would be written without touching the vault (default: false)",
+                        "default": False
+                    }
+                }
+            }
+        ),
+        types.Tool(
+            name="granola_cache_stats",
+            description="Hit ratios and sizes of the Granola caches (API responses per endpoint, rendered notes, local cache file reads)",
+            inputSchema={
+                "type": "object",
+                "properties": {}
+            }
         )
     ]
 
@@ -830,6 +1475,8 @@ async def handle_call_tool(
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """Handle tool calls"""
     try:
+        if _tool_executor is not None:
+            return await _tool_executor.run_handler(name, _handle_call_tool_inner, name, arguments)
         return await _handle_call_tool_inner(name, arguments)
     except Exception as e:
         if _HAS_HEALTH:
@@ -840,6 +1487,8 @@ async def handle_call_tool(
                 "granola_search_meetings": "Meeting search failed",
                 "granola_get_today_meetings": "Today's meetings lookup failed",
                 "granola_get_extent": "Granola data extent lookup failed",
+                "granola_export_meetings": "Granola meeting export failed",
+                "granola_cache_stats": "Granola cache stats lookup failed",
             }
             _log_health_error(
                 source="granola-mcp",
@@ -863,7 +1512,7 @@ async def _handle_call_tool_inner(
         api_token = get_api_access_token()
         if api_token:
             # Quick test - try to fetch 1 document
-            test_response = fetch_from_api('/v2/get-documents', {'limit': 1, 'offset': 0})
+            test_response = fetch_from_api('/v2/get-documents', {'limit': 1, 'offset': 0}, use_cache=False)
             api_available = test_response is not None
         
         # Check cache availability
@@ -875,7 +1524,7 @@ async def _handle_call_tool_inner(
             cache = read_granola_cache()
             if cache:
                 cache_available = True
-                meetings_count = len([
+                meetings_count = len(cache['meeting_ids']) if 'meeting_ids' in cache else len([
                     doc for doc in cache.get('documents', {}).values()
                     if doc.get('type') == 'meeting' and not doc.get('deleted_at')
                 ])
@@ -906,6 +1555,17 @@ async def _handle_call_tool_inner(
             result["cache"]["last_modified"] = datetime.fromtimestamp(
                 GRANOLA_CACHE.stat().st_mtime
             ).isoformat()
+            if HAS_GRANOLA_CACHE:
+                result["cache"]["reads"] = granola_cache_stats()
+        
+        if _notes_cache is not None:
+            result["notes_cache"] = _notes_cache.stats()
+        
+        if _meeting_store is not None:
+            try:
+                result["store"] = _meeting_store.status()
+            except Exception as e:
+                result["store"] = {"error": str(e)}
         
         return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
     
@@ -940,7 +1600,14 @@ async def _handle_call_tool_inner(
                 "error": "meeting_id is required"
             }, indent=2))]
         
-        meeting = get_meeting_details(meeting_id)
+        transcript_mode = arguments.get("transcript", "full")
+        if transcript_mode == "search" and not arguments.get("transcript_query"):
+            return [types.TextContent(type="text", text=json.dumps({
+                "success": False,
+                "error": "transcript_query is required when transcript is 'search'"
+            }, indent=2))]
+        
+        meeting = get_meeting_details(meeting_id, transcript_mode, arguments)
         
         if not meeting:
             return [types.TextContent(type="text", text=json.dumps({
@@ -973,7 +1640,15 @@ async def _handle_call_tool_inner(
         days_back = arguments.get("days_back", 30)
         limit = arguments.get("limit", 10)
         
-        meetings = search_meetings(query, days_back, limit)
+        try:
+            meetings = search_meetings(query, days_back, limit,
+                                       start_date=arguments.get("start_date"),
+                                       end_date=arguments.get("end_date"))
+        except ValueError as e:
+            return [types.TextContent(type="text", text=json.dumps({
+                "success": False,
+                "error": f"Invalid date (expected YYYY-MM-DD): {e}"
+            }, indent=2))]
         
         result = {
             "success": True,
@@ -1114,7 +1789,35 @@ async def _handle_call_tool_inner(
         }
         
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
+
+    elif name == "granola_export_meetings":
+        if not HAS_MEETING_EXPORT:
+            return [types.TextContent(type="text", text=json.dumps({
+                "success": False,
+                "error": "Meeting export is unavailable (core.utils.meeting_export could not be imported)"
+            }, indent=2))]
+        
+        summary = export_meetings(
+            days_back=arguments.get("days_back"),
+            include_transcript=arguments.get("include_transcript", False),
+            force=arguments.get("force", False),
+            dry_run=arguments.get("dry_run", False),
+        )
+        result = {
+            "success": summary['failed'] == 0,
+            "dry_run": arguments.get("dry_run", False),
+            **summary
+        }
+        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
     
+    elif name == "granola_cache_stats":
+        result = {
+            "api_responses": _response_cache.stats() if _response_cache is not None else None,
+            "rendered_notes": _notes_cache.stats() if _notes_cache is not None else None,
+            "cache_file_reads": granola_cache_stats() if HAS_GRANOLA_CACHE else None,
+        }
+        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+
     else:
         return [types.TextContent(type="text", text=json.dumps({
             "error": f"Unknown tool: {name}"
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Granola notes rendering — recursive vs. explicit stack vs. memoized
+
+Builds synthetic panels shaped like Granola's enhanced notes (headings over
+nested bullet lists with bold/italic/code marks), from a short 1:1 up to a
+multi-hour workshop, and times per render:
+
+  legacy   the original recursive renderer
+  stack    core.utils.prosemirror.to_markdown (explicit stack)
+  memory   MarkdownCache.render with the render already in memory
+  disk     MarkdownCache.render on a fresh cache backed by a warm SQLite file
+
+Output is checked to be identical to the legacy renderer, and a pathological
+deeply nested panel is rendered to show the recursion limit no longer applies.
+
+Usage:
+    python core/mcp/scripts/bench_prosemirror.py
+    python core/mcp/scripts/bench_prosemirror.py --sections 5 40 200 --repeat 50
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.prosemirror import MarkdownCache, to_markdown  # noqa: E402
+
+WORDS = ('pricing renewal roadmap hiring budget launch customer escalation migration '
+         'partner security onboarding demo contract pipeline forecast churn integration').split()
+
+
+def legacy_convert(content: dict) -> str:
+    """The pre-stack implementation, kept here as the reference."""
+    if not content or not isinstance(content, dict) or 'content' not in content:
+        return ""
+
+    def process_node(node):
+        if not isinstance(node, dict):
+            return ""
+        node_type = node.get('type', '')
+        content = node.get('content', [])
+        text = node.get('text', '')
+        marks = node.get('marks', [])
+        if text and marks:
+            for mark in marks:
+                mark_type = mark.get('type', '')
+                if mark_type == 'bold':
+                    text = f"**{text}**"
+                elif mark_type == 'italic':
+                    text = f"*{text}*"
+                elif mark_type == 'code':
+                    text = f"`{text}`"
+        if node_type == 'heading':
+            level = node.get('attrs', {}).get('level', 1)
+            return f"{'#' * level} {''.join(process_node(c) for c in content)}\n\n"
+        elif node_type == 'paragraph':
+            return f"{''.join(process_node(c) for c in content)}\n\n"
+        elif node_type == 'bulletList':
+            items = [f"- {''.join(process_node(c) for c in item.get('content', [])).strip()}"
+                     for item in content if item.get('type') == 'listItem']
+            return '\n'.join(items) + '\n\n'
+        elif node_type == 'orderedList':
+            items = [f"{idx}. {''.join(process_node(c) for c in item.get('content', [])).strip()}"
+                     for idx, item in enumerate(content, 1) if item.get('type') == 'listItem']
+            return '\n'.join(items) + '\n\n'
+        elif node_type == 'codeBlock':
+            return f"```\n{''.join(process_node(c) for c in content)}```\n\n"
+        elif node_type == 'blockquote':
+            return f"> {''.join(process_node(c) for c in content)}\n\n"
+        elif node_type == 'text':
+            return text
+        elif node_type == 'hardBreak':
+            return '\n'
+        return ''.join(process_node(c) for c in content)
+
+    return process_node(content).strip()
+
+
+def text(rng: random.Random) -> dict:
+    node = {'type': 'text', 'text': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(3, 14)))}
+    if rng.random() < 0.2:
+        node['marks'] = [{'type': rng.choice(['bold', 'italic', 'code'])}]
+    return node
+
+
+def paragraph(rng: random.Random) -> dict:
+    return {'type': 'paragraph', 'content': [text(rng) for _ in range(rng.randint(1, 3))]}
+
+
+def bullet_list(rng: random.Random, depth: int = 0) -> dict:
+    items = []
+    for _ in range(rng.randint(2, 6)):
+        item = {'type': 'listItem', 'content': [paragraph(rng)]}
+        if depth < 2 and rng.random() < 0.3:
+            item['content'].append(bullet_list(rng, depth + 1))
+        items.append(item)
+    return {'type': rng.choice(['bulletList', 'bulletList', 'orderedList']), 'content': items}
+
+
+def make_panel(sections: int, rng: random.Random) -> dict:
+    nodes = []
+    for _ in range(sections):
+        nodes.append({'type': 'heading', 'attrs': {'level': 3}, 'content': [text(rng)]})
+        nodes.append(rng.choice([paragraph, bullet_list, bullet_list])(rng))
+    return {'type': 'doc', 'content': nodes}
+
+
+def deep_panel(depth: int) -> dict:
+    node = {'type': 'paragraph', 'content': [{'type': 'text', 'text': 'bottom'}]}
+    for _ in range(depth):
+        node = {'type': 'bulletList', 'content': [{'type': 'listItem', 'content': [node]}]}
+    return {'type': 'doc', 'content': [node]}
+
+
+def per_call_ms(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sections', type=int, nargs='+', default=[5, 40, 200])
+    parser.add_argument('--repeat', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    db_path = Path(tempfile.mkdtemp(prefix='dex-bench-')) / 'notes.db'
+
+    print("sections |    KB | legacy ms | stack ms | memory ms | disk ms | same")
+    print("---------+-------+-----------+----------+-----------+---------+-----")
+    for sections in args.sections:
+        panel = make_panel(sections, rng)
+        key = f"doc-{sections}:2026-01-01T00:00:00Z"
+        size_kb = len(repr(panel)) / 1024
+
+        legacy_ms = per_call_ms(lambda: legacy_convert(panel), args.repeat)
+        stack_ms = per_call_ms(lambda: to_markdown(panel), args.repeat)
+
+        warm = MarkdownCache(db_path=db_path)
+        warm.render(panel, key)
+        memory_ms = per_call_ms(lambda: warm.render(panel, key), args.repeat)
+        warm.close()
+
+        def disk_lookup():
+            cold = MarkdownCache(db_path=db_path)
+            cold.render(panel, key)
+            cold.close()
+        disk_ms = per_call_ms(disk_lookup, args.repeat)
+
+        same = legacy_convert(panel) == to_markdown(panel)
+        print(f"{sections:>8} | {size_kb:5.0f} | {legacy_ms:9.3f} | {stack_ms:8.3f} | {memory_ms:9.4f} | "
+              f"{disk_ms:7.3f} | {'yes' if same else 'NO'}")
+
+    depth = sys.getrecursionlimit() * 2
+    try:
+        legacy_convert(deep_panel(depth))
+        legacy_result = "ok"
+    except RecursionError:
+        legacy_result = "RecursionError"
+    stack_lines = to_markdown(deep_panel(depth)).count('\n') + 1
+    print(f"\nNesting depth {depth}: legacy -> {legacy_result}, stack -> {stack_lines} line(s)")
+    print("ms = mean per render. disk includes opening the SQLite file.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Benchmark: session memory queries — connection per call vs. pooled connections
+
+Builds a synthetic sessions DB shaped like the Dex app's (sessions, messages
+and observations with FTS5 indexes), then times each session_memory_server
+query function two ways:
+
+  per-call  a fresh read-only connection per query, sqlite_master re-probed
+            (the server without core.utils.sqlite_pool)
+  pooled    the thread's long-lived connection, cached statements, schema
+            probe reused until schema_version changes
+
+and the entity timelines two ways:
+
+  scan      LIKE '%name%' over sessions / messages / observations
+  indexed   range scan of the mention side table (core.utils.mention_index),
+            after its initial build (reported separately)
+
+Usage:
+    python core/mcp/scripts/bench_session_memory.py
+    python core/mcp/scripts/bench_session_memory.py --sessions 20000 --messages 40 --repeat 200
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+WORDS = ('pricing renewal roadmap hiring budget launch customer escalation migration '
+         'partner security onboarding demo contract pipeline forecast churn integration').split()
+PEOPLE = ['Sarah Chen', 'Marcus Lee', 'Priya Patel', 'Tom Becker', 'Ana Souza', 'Ken Ito']
+RARE_PERSON = 'Zoe Quinn'  # in ~0.2% of sessions: LIKE has to scan nearly everything to fill a page
+TOOLS = ['create_task', 'vault_search', 'granola_get_recent_meetings', 'update_person', 'get_calendar']
+
+SCHEMA = """
+CREATE TABLE sessions (id TEXT PRIMARY KEY, name TEXT, status TEXT, pinned INTEGER DEFAULT 0,
+    pillar TEXT, summary TEXT, entities TEXT, message_count INTEGER, created_at TEXT, updated_at TEXT);
+CREATE TABLE messages (id TEXT PRIMARY KEY, session_id TEXT, role TEXT, content TEXT, created_at TEXT);
+CREATE TABLE observations (id TEXT PRIMARY KEY, session_id TEXT, type TEXT, summary TEXT,
+    entities TEXT, tool_name TEXT, timestamp TEXT);
+CREATE INDEX idx_messages_session ON messages(session_id, created_at);
+CREATE INDEX idx_sessions_updated ON sessions(updated_at);
+CREATE INDEX idx_observations_ts ON observations(timestamp);
+CREATE VIRTUAL TABLE sessions_fts USING fts5(name, summary, entities, content='sessions');
+CREATE VIRTUAL TABLE messages_fts USING fts5(content, content='messages');
+CREATE VIRTUAL TABLE observations_fts USING fts5(summary, content='observations');
+"""
+
+
+def sentence(rng, n):
+    return ' '.join(rng.choice(WORDS) for _ in range(n))
+
+
+def build_db(path: Path, sessions: int, messages: int, observations: int, seed: int) -> None:
+    rng = random.Random(seed)
+    now = datetime.now()
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    for s in range(sessions):
+        ts = (now - timedelta(hours=s * 3)).isoformat()
+        person = RARE_PERSON if rng.random() < 0.002 else rng.choice(PEOPLE)
+        entities = f'{{"entities": [{{"name": "{person}"}}], "decisions": ["{sentence(rng, 6)}"], "topics": ["pricing"]}}'
+        conn.execute("INSERT INTO sessions VALUES (?,?,?,?,?,?,?,?,?,?)",
+                     (f's{s}', f'{sentence(rng, 3)} with {person}', 'archived', 0, None,
+                      sentence(rng, 40), entities, messages, ts, ts))
+        conn.executemany("INSERT INTO messages VALUES (?,?,?,?,?)", [
+            (f's{s}m{m}', f's{s}', 'user' if m % 2 else 'assistant',
+             f'{sentence(rng, 60)} {person if m == 0 else rng.choice(PEOPLE)} {sentence(rng, 20)}',
+             (now - timedelta(hours=s * 3, seconds=-m)).isoformat())
+            for m in range(messages)
+        ])
+        conn.executemany("INSERT INTO observations VALUES (?,?,?,?,?,?,?)", [
+            (f's{s}o{o}', f's{s}', 'tool_call', f'{sentence(rng, 12)} {person}',
+             f'["{person}"]', rng.choice(TOOLS), (now - timedelta(hours=s * 3, seconds=-o)).isoformat())
+            for o in range(observations)
+        ])
+    conn.executescript("""
+        INSERT INTO sessions_fts(sessions_fts) VALUES('rebuild');
+        INSERT INTO messages_fts(messages_fts) VALUES('rebuild');
+        INSERT INTO observations_fts(observations_fts) VALUES('rebuild');
+    """)
+    conn.commit()
+    conn.close()
+
+
+def time_calls(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=5000)
+    parser.add_argument('--messages', type=int, default=20, help='messages per session')
+    parser.add_argument('--observations', type=int, default=10, help='observations per session')
+    parser.add_argument('--repeat', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    vault = Path(tempfile.mkdtemp(prefix='dex-bench-sessions-'))
+    (vault / 'System').mkdir()
+    db_path = vault / 'System' / '.dex-sessions.db'
+    start = time.perf_counter()
+    build_db(db_path, args.sessions, args.messages, args.observations, args.seed)
+    print(f"Built {args.sessions:,} sessions / {args.sessions * args.messages:,} messages / "
+          f"{args.sessions * args.observations:,} observations "
+          f"({db_path.stat().st_size / 1e6:.0f} MB) in {time.perf_counter() - start:.1f}s")
+
+    os.environ['VAULT_PATH'] = str(vault)
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    import session_memory_server as server  # noqa: E402
+
+    if server._pool is None:
+        sys.exit("core.utils.sqlite_pool is unavailable")
+    pool = server._pool
+
+    calls = [
+        ('get_session_summary', lambda: server.get_session_detail('s42', include_full=True)),
+        ('get_recent_tool_usage', lambda: server.get_recent_tool_usage('vault_search', days=7, limit=20)),
+        ('get_recent_decisions', lambda: server.get_recent_decisions(7, 20)),
+        ('search_observations', lambda: server.search_observations_fts('pricing', limit=20)),
+        ('search_sessions', lambda: server.search_sessions_fts('roadmap budget', 10, False)),
+        ('get_session_context', lambda: server.get_session_context_for_entity('Priya Patel', 10)),
+    ]
+
+    index = server._mention_index
+    if index is None:
+        sys.exit("core.utils.mention_index is unavailable")
+    server._mention_index = None  # timelines are compared separately below
+
+    print(f"\n{'query':24} {'per-call ms':>12} {'pooled ms':>10} {'speedup':>8}")
+    for name, call in calls:
+        server._pool = None
+        per_call = time_calls(call, args.repeat)
+        server._pool = pool
+        call()  # open this thread's connection and probe the schema once
+        pooled = time_calls(call, args.repeat)
+        print(f"{name:24} {per_call:12.3f} {pooled:10.3f} {per_call / pooled:7.1f}x")
+
+    print(f"\npool: {pool.stats()['opened']} connection(s) opened, {pool.stats()['probes']} schema probe(s)")
+
+    start = time.perf_counter()
+    index.refresh(server.get_db(), force=True)
+    status = index.status()
+    print(f"\nmention index built in {time.perf_counter() - start:.1f}s: {status['entities']} entities, "
+          f"{sum(status['mentions'].values()):,} mentions")
+
+    timelines = []
+    for person in ('Priya Patel', RARE_PERSON):
+        timelines += [
+            (f'session_context {person}', lambda p=person: server.get_session_context_for_entity(p, 10)),
+            (f'entity_timeline {person}', lambda p=person: server.get_entity_timeline(p, 20)),
+            (f'observations {person}', lambda p=person: server.get_observation_timeline_for_entity(p, 20)),
+        ]
+    print(f"\n{'timeline':28} {'scan ms':>8} {'indexed ms':>10} {'speedup':>8}")
+    for name, call in timelines:
+        server._mention_index = None
+        scanned = call()
+        scan = time_calls(call, max(5, args.repeat // 10))
+        server._mention_index = index
+        indexed_result = call()
+        indexed = time_calls(call, args.repeat)
+        same = [r.get('id') or r.get('message_id') for r in scanned] == \
+            [r.get('id') or r.get('message_id') for r in indexed_result]
+        print(f"{name:28} {scan:8.3f} {indexed:10.3f} {scan / indexed:7.1f}x"
+              f"{'' if same else '  (different order among equal timestamps)'}")
+
+    index.close()
+    pool.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark: find_similar_tasks full scan vs. trigram candidate index
+
+Builds synthetic task lists (1k / 10k / 50k active tasks), then runs the same
+queries — half near-duplicates of existing titles, half new items — through:
+
+  legacy   the original loop (SequenceMatcher against every active task)
+  scan     find_similar_tasks with the candidate index disabled
+  indexed  find_similar_tasks with the candidate index (first sync excluded)
+
+and reports mean latency per query plus how often the indexed results differ
+from the legacy ones. QMD is disabled so only the local scorer is measured.
+
+Usage:
+    python core/mcp/scripts/bench_task_dedup.py
+    python core/mcp/scripts/bench_task_dedup.py --sizes 1000 10000 --queries 50
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Point the server at an empty scratch vault so nothing real is touched (removed on exit)
+SCRATCH_VAULT = tempfile.TemporaryDirectory(prefix='dex-bench-')
+os.environ['VAULT_PATH'] = SCRATCH_VAULT.name
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import work_server  # noqa: E402
+from work_server import DEDUP_CONFIG, calculate_similarity, extract_keywords, find_similar_tasks  # noqa: E402
+
+VERBS = ['Send', 'Review', 'Draft', 'Schedule', 'Follow up on', 'Prepare', 'Update', 'Share',
+         'Fix', 'Write', 'Finalize', 'Plan', 'Research', 'Book', 'Confirm', 'Close out']
+OBJECTS = ['renewal contract', 'Q3 hiring plan', 'board deck', 'pricing proposal', 'launch checklist',
+           'customer escalation', 'roadmap doc', 'security review', 'onboarding guide', 'budget',
+           'migration runbook', 'partner agreement', 'offsite agenda', 'OKR draft', 'demo script']
+QUALIFIERS = ['for', 'with', 'about', 'before meeting with', 'after call with']
+NAMES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark', 'Wayne', 'Wonka', 'Tyrell',
+         'Cyberdyne', 'Soylent', 'Vandelay', 'Dunder', 'Pied Piper', 'Massive Dynamic']
+TAILS = ['', ' by Friday', ' this week', ' (v2)', ' and loop in legal', ' for the exec sync', ' ASAP']
+
+
+def make_title(rng: random.Random) -> str:
+    return (f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} {rng.choice(QUALIFIERS)} "
+            f"{rng.choice(NAMES)} {rng.randint(1, 999)}{rng.choice(TAILS)}")
+
+
+def perturb(title: str, rng: random.Random) -> str:
+    words = title.split()
+    op = rng.choice(['drop', 'swap', 'typo', 'prefix'])
+    if op == 'drop' and len(words) > 3:
+        del words[rng.randrange(1, len(words))]
+    elif op == 'swap' and len(words) > 3:
+        i = rng.randrange(1, len(words) - 1)
+        words[i], words[i + 1] = words[i + 1], words[i]
+    elif op == 'typo':
+        i = rng.randrange(len(words))
+        w = words[i]
+        if len(w) > 3:
+            j = rng.randrange(1, len(w) - 1)
+            words[i] = w[:j] + w[j + 1] + w[j] + w[j + 2:]
+    else:
+        words.insert(0, 'Please')
+    return ' '.join(words)
+
+
+def make_tasks(n: int, rng: random.Random) -> list:
+    return [
+        {'title': make_title(rng), 'section': rng.choice(['Next Week', 'Backlog', 'This Week']),
+         'source_file': '03-Tasks/Tasks.md', 'completed': False, 'status': 'n'}
+        for _ in range(n)
+    ]
+
+
+def legacy_find_similar(item: str, existing_tasks: list) -> list:
+    """The pre-index implementation (without QMD), kept here as the reference."""
+    similar = []
+    item_keywords = extract_keywords(item)
+    for task in existing_tasks:
+        if task.get('completed') or task.get('status') == 'd':
+            continue
+        title = task.get('title', '')
+        title_similarity = calculate_similarity(item, title)
+        task_keywords = extract_keywords(title)
+        if item_keywords and task_keywords:
+            keyword_overlap = len(item_keywords & task_keywords) / len(item_keywords | task_keywords)
+        else:
+            keyword_overlap = 0
+        similarity_score = (title_similarity * 0.6) + (keyword_overlap * 0.25)
+        if similarity_score >= DEDUP_CONFIG['similarity_threshold']:
+            similar.append({
+                'title': title,
+                'section': task.get('section', ''),
+                'source': task.get('source', ''),
+                'similarity_score': round(similarity_score, 2),
+                'semantic_match': False
+            })
+    similar.sort(key=lambda x: x['similarity_score'], reverse=True)
+    return similar[:3]
+
+
+def timed(fn, queries, tasks):
+    start = time.perf_counter()
+    results = [fn(q, tasks) for q in queries]
+    return (time.perf_counter() - start) / len(queries) * 1000, results
+
+
+def run(size: int, n_queries: int, seed: int, skip_legacy_over: int) -> None:
+    rng = random.Random(seed)
+    tasks = make_tasks(size, rng)
+    queries = [perturb(rng.choice(tasks)['title'], rng) for _ in range(n_queries // 2)]
+    queries += [make_title(rng) for _ in range(n_queries - len(queries))]
+
+    original_min = DEDUP_CONFIG['index_min_tasks']
+
+    legacy_ms, legacy = (None, None)
+    if size <= skip_legacy_over:
+        legacy_ms, legacy = timed(legacy_find_similar, queries, tasks)
+
+    DEDUP_CONFIG['index_min_tasks'] = float('inf')
+    scan_ms, scan = timed(find_similar_tasks, queries, tasks)
+
+    DEDUP_CONFIG['index_min_tasks'] = 0
+    work_server._similarity_index = work_server.SimilarityIndex()
+    build_start = time.perf_counter()
+    find_similar_tasks(queries[0], tasks)
+    build_ms = (time.perf_counter() - build_start) * 1000
+    indexed_ms, indexed = timed(find_similar_tasks, queries, tasks)
+    DEDUP_CONFIG['index_min_tasks'] = original_min
+
+    reference = legacy if legacy is not None else scan
+    differing = sum(1 for a, b in zip(reference, indexed) if a != b)
+    missed_dupes = sum(1 for a, b in zip(reference, indexed) if a and not b)
+
+    legacy_col = f"{legacy_ms:9.1f}" if legacy_ms is not None else "  skipped"
+    print(f"{size:>7} | {legacy_col} | {scan_ms:9.1f} | {indexed_ms:9.2f} | {build_ms:9.0f} | "
+          f"{differing:>4}/{n_queries:<4} | {missed_dupes:>4}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--queries', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--skip-legacy-over', type=int, default=10000,
+                        help='Skip the legacy loop above this size (it takes minutes at 50k)')
+    args = parser.parse_args()
+
+    work_server.HAS_QMD = False
+    try:
+        print("  tasks | legacy ms |   scan ms | index ms  | build ms | differ    | lost dupes")
+        print("--------+-----------+-----------+-----------+----------+-----------+-----------")
+        for size in args.sizes:
+            run(size, args.queries, args.seed, args.skip_legacy_over)
+        print("\nms = mean per query. build = first sync of the candidate index.")
+        print("differ/lost dupes compare indexed results to legacy (or scan when legacy is skipped).")
+    finally:
+        if work_server._work_index is not None:
+            work_server._work_index.close()
+        SCRATCH_VAULT.cleanup()
+
+
+if __name__ == '__main__':
+    main()
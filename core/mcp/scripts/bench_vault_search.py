@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vault_search without QMD — grep fallback vs. the built-in BM25 index
+
+Builds a synthetic vault of markdown notes, then times the two fallbacks in
+core/utils/qmd_query.py for a handful of queries:
+
+  grep    `rg -l` (or grep -r), ranked by output order, snippets read back
+  index   core.utils.vault_index (BM25F), after its initial build and save
+          (reported separately, along with a cold load from the saved file)
+
+Usage:
+    python core/mcp/scripts/bench_vault_search.py
+    python core/mcp/scripts/bench_vault_search.py --notes 20000 --repeat 20
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils import qmd_query  # noqa: E402
+from core.utils.vault_index import VaultIndex  # noqa: E402
+
+WORDS = ('pricing renewal roadmap hiring budget launch customer escalation migration partner security '
+         'onboarding demo contract pipeline forecast churn integration retention discount analytics '
+         'quarterly planning feedback design review').split()
+FILLER = ('the team discussed next steps and agreed to follow up later this week with notes '
+          'from the call and open questions').split()
+FOLDERS = ['00-Inbox/Meetings', '04-Projects', '05-Areas/People', '05-Areas/Companies', '03-Tasks']
+QUERIES = ['customer retention', 'pricing renewal discount', 'security migration plan', 'quarterly forecast']
+
+
+def build_vault(root: Path, notes: int, seed: int) -> None:
+    rng = random.Random(seed)
+    (root / 'System').mkdir()
+    for folder in FOLDERS:
+        (root / folder).mkdir(parents=True)
+    for n in range(notes):
+        topic = rng.sample(WORDS, 3)
+        body = '\n\n'.join(
+            f"## {rng.choice(WORDS).title()}\n\n" + ' '.join(rng.choice(FILLER + WORDS[:8]) for _ in range(80))
+            for _ in range(4)
+        )
+        path = root / rng.choice(FOLDERS) / f"{'_'.join(topic)}_{n}.md"
+        path.write_text(f"# {' '.join(topic).title()}\n\n{body}\n")
+
+
+def time_calls(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--notes', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    vault = Path(tempfile.mkdtemp(prefix='dex-bench-vault-'))
+    build_vault(vault, args.notes, args.seed)
+    print(f"Built {args.notes:,} notes in {vault}")
+
+    start = time.perf_counter()
+    index = VaultIndex(vault, refresh_interval=3600)
+    index.refresh(force=True)
+    status = index.status()
+    print(f"index built in {time.perf_counter() - start:.2f}s: {status['terms']:,} terms, "
+          f"{status['postings']:,} postings, {status['index_bytes'] / 1e6:.2f} MB on disk")
+
+    start = time.perf_counter()
+    cold = VaultIndex(vault, refresh_interval=3600)
+    cold.refresh(force=True)
+    print(f"cold load from disk + change scan: {time.perf_counter() - start:.2f}s")
+
+    print(f"\n{'query':28} {'grep ms':>9} {'index ms':>9} {'speedup':>8}")
+    for query in QUERIES:
+        grep = time_calls(lambda: qmd_query._grep_fallback(query, str(vault), limit=10), args.repeat)
+        indexed = time_calls(lambda: index.search(query, limit=10), args.repeat)
+        print(f"{query:28} {grep:9.1f} {indexed:9.2f} {grep / indexed:7.0f}x")
+
+
+if __name__ == '__main__':
+    main()
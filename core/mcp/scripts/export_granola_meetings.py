@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Export Granola meetings into the vault as meeting notes
+
+Command-line front end for granola_server.export_meetings — the same export
+the granola_export_meetings tool runs — for onboarding backfills of the whole
+Granola history. Notes land in 00-Inbox/Meetings/YYYY-MM-DD/<title>.md.
+
+Safe to interrupt and re-run: progress is checkpointed to
+System/.granola-export.json and meetings already exported unchanged are
+skipped. Notes edited in the vault since export are left alone unless --force.
+
+Usage:
+    VAULT_PATH=~/Dex python core/mcp/scripts/export_granola_meetings.py
+    VAULT_PATH=~/Dex python core/mcp/scripts/export_granola_meetings.py --days-back 90 --transcripts
+    VAULT_PATH=~/Dex python core/mcp/scripts/export_granola_meetings.py --dry-run
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import granola_server  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--days-back', type=int, default=None, help='only meetings from the last N days')
+    parser.add_argument('--transcripts', action='store_true', help='append transcripts from the local cache')
+    parser.add_argument('--force', action='store_true', help='re-render everything, overwriting local edits')
+    parser.add_argument('--dry-run', action='store_true', help='count what would be written')
+    parser.add_argument('--workers', type=int, default=None, help='render/write threads (default: DEX_EXPORT_WORKERS or 4)')
+    args = parser.parse_args()
+
+    if not granola_server.HAS_MEETING_EXPORT:
+        sys.exit("core.utils.meeting_export is unavailable")
+
+    def progress(summary):
+        done = sum(summary[k] for k in ('written', 'unchanged', 'modified_locally', 'failed'))
+        if done % 100 == 0:
+            print(f"  {done} rendered — {summary['written']} written, {summary['skipped']} skipped",
+                  file=sys.stderr)
+
+    print(f"Exporting Granola meetings into {granola_server.VAULT_PATH / granola_server.MEETINGS_EXPORT_DIR}",
+          file=sys.stderr)
+    summary = granola_server.export_meetings(
+        days_back=args.days_back,
+        include_transcript=args.transcripts,
+        force=args.force,
+        dry_run=args.dry_run,
+        workers=args.workers,
+        on_progress=progress,
+    )
+    print(json.dumps(summary, indent=2))
+    sys.exit(1 if summary['failed'] else 0)
+
+
+if __name__ == '__main__':
+    main()
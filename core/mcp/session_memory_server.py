@@ -8,6 +8,7 @@ Read-only access to:
 - Entity timelines (cross-session awareness)
 - Observations (tool-use history, decisions, insights)
 - Progressive disclosure (3-layer token-efficient retrieval)
+- Unified ranked search across all three, paged by cursor
 
 DB location: System/.dex-sessions.db (shared with dex-app via WAL mode)
 """
@@ -32,15 +33,43 @@ logger = logging.getLogger(__name__)
 # Configuration
 BASE_DIR = Path(os.environ.get('VAULT_PATH', Path.cwd()))
 DB_PATH = BASE_DIR / 'System' / '.dex-sessions.db'
+DB_MISSING_MESSAGE = f"Sessions DB not found at {DB_PATH}. Start the Dex app first to create it."
+
+# Long-lived read-only connections (optional - opens a connection per query without it)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+try:
+    from core.utils.sqlite_pool import ReadOnlyPool
+    _pool = ReadOnlyPool(DB_PATH, missing_message=DB_MISSING_MESSAGE)
+except ImportError:
+    _pool = None
+
+# Unified ranked search with cursors (optional - search_memory is unavailable without it)
+try:
+    from core.utils.memory_search import search_memory, FIELDS as MEMORY_SEARCH_FIELDS, KINDS as MEMORY_SEARCH_KINDS
+    HAS_MEMORY_SEARCH = True
+except ImportError:
+    HAS_MEMORY_SEARCH = False
+    MEMORY_SEARCH_FIELDS, MEMORY_SEARCH_KINDS = (), ()
+
+# Entity mention side table (optional - timelines scan with LIKE without it)
+MENTIONS_DB_PATH = BASE_DIR / 'System' / '.dex-session-mentions.db'
+try:
+    from core.utils.mention_index import MentionIndex
+    _mention_index = MentionIndex(MENTIONS_DB_PATH)
+except ImportError:
+    _mention_index = None
 
 # ---------------------------------------------------------------------------
 # Database helpers
 # ---------------------------------------------------------------------------
 
 def get_db() -> sqlite3.Connection:
-    """Open a read-only WAL-mode connection to the sessions DB."""
+    """Read-only connection to the sessions DB (this thread's pooled one when available)."""
+    if _pool is not None:
+        return _pool.connection()
+
     if not DB_PATH.exists():
-        raise FileNotFoundError(f"Sessions DB not found at {DB_PATH}. Start the Dex app first to create it.")
+        raise FileNotFoundError(DB_MISSING_MESSAGE)
 
     conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
     conn.row_factory = sqlite3.Row
@@ -48,6 +77,51 @@ def get_db() -> sqlite3.Connection:
     return conn
 
 
+def release_db(conn: sqlite3.Connection) -> None:
+    """Done with a get_db() connection — pooled connections stay open for the next call."""
+    if _pool is None:
+        conn.close()
+
+
+def has_table(conn: sqlite3.Connection, name: str) -> bool:
+    """Whether the DB has a table (older app versions predate observations)."""
+    if _pool is not None:
+        return _pool.has_table(name)
+    return conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (name,)
+    ).fetchone() is not None
+
+
+def indexed_rows(conn: sqlite3.Connection, kind: str, entity_name: str, limit: int,
+                 sql: str) -> Optional[List[sqlite3.Row]]:
+    """
+    Rows mentioning an entity, newest first, looked up in the mention index.
+
+    `sql` selects the rows for a JSON array of ids (bound as the only parameter).
+    Returns None when the index can't serve the lookup - callers scan instead.
+    """
+    if _mention_index is None:
+        return None
+    try:
+        rows: List[sqlite3.Row] = []
+        offset = 0
+        while len(rows) < limit:
+            hits = _mention_index.timeline(conn, entity_name, kind, limit, offset)
+            if hits is None:
+                return None
+            ids = [item_id for item_id, _, _ in hits]
+            # Mentions of since-deleted rows drop out here
+            found = {row["id"]: row for row in conn.execute(sql, (json.dumps(ids),))}
+            rows.extend(found[item_id] for item_id in ids if item_id in found)
+            offset += len(hits)
+            if len(hits) < limit:
+                break
+        return rows[:limit]
+    except sqlite3.Error as e:
+        logger.warning(f"Mention index lookup failed, scanning instead: {e}")
+        return None
+
+
 def rows_to_dicts(rows) -> List[Dict]:
     """Convert sqlite3.Row objects to plain dicts."""
     return [dict(row) for row in rows]
@@ -73,7 +147,7 @@ def search_sessions_fts(query: str, limit: int = 10, include_messages: bool = Tr
     results = {"sessions": [], "messages": []}
     fts_query = query.replace("'", "").replace('"', '').strip()
     if not fts_query:
-        conn.close()
+        release_db(conn)
         return results
 
     # Search sessions (name, summary, entities)
@@ -129,23 +203,43 @@ def search_sessions_fts(query: str, limit: int = 10, include_messages: bool = Tr
         except sqlite3.OperationalError:
             pass
 
-    conn.close()
+    release_db(conn)
     return results
 
 
+def search_all_memory(query: str, kinds: Optional[List[str]] = None, fields: Optional[List[str]] = None,
+                      limit: int = 10, cursor: Optional[str] = None, days: Optional[int] = None,
+                      half_life_days: Optional[float] = None) -> Dict:
+    """One BM25 + recency ranking across sessions, messages and observations, with a next-page cursor."""
+    conn = get_db()
+    try:
+        options = {'half_life_days': half_life_days} if half_life_days else {}
+        return search_memory(conn, query, kinds=kinds, fields=fields, limit=limit, cursor=cursor,
+                             days=days, has_table=lambda name: has_table(conn, name), **options)
+    finally:
+        release_db(conn)
+
+
 def get_session_context_for_entity(entity_name: str, limit: int = 10) -> List[Dict]:
     """Find sessions mentioning an entity by name (in entities JSON, name, summary, or messages)."""
     conn = get_db()
     pattern = f"%{entity_name}%"
 
-    rows = conn.execute("""
-        SELECT DISTINCT s.id, s.name, s.status, s.summary, s.entities,
+    rows = indexed_rows(conn, 'session', entity_name, limit, """
+        SELECT s.id, s.name, s.status, s.summary, s.entities,
                s.message_count, s.created_at, s.updated_at
         FROM sessions s
-        WHERE s.name LIKE ? OR s.summary LIKE ? OR s.entities LIKE ?
-        ORDER BY s.updated_at DESC
-        LIMIT ?
-    """, (pattern, pattern, pattern, limit)).fetchall()
+        WHERE s.id IN (SELECT value FROM json_each(?))
+    """)
+    if rows is None:
+        rows = conn.execute("""
+            SELECT DISTINCT s.id, s.name, s.status, s.summary, s.entities,
+                   s.message_count, s.created_at, s.updated_at
+            FROM sessions s
+            WHERE s.name LIKE ? OR s.summary LIKE ? OR s.entities LIKE ?
+            ORDER BY s.updated_at DESC
+            LIMIT ?
+        """, (pattern, pattern, pattern, limit)).fetchall()
 
     results = []
     for row in rows:
@@ -162,7 +256,7 @@ def get_session_context_for_entity(entity_name: str, limit: int = 10) -> List[Di
             "updated_at": row["updated_at"],
         })
 
-    conn.close()
+    release_db(conn)
     return results
 
 
@@ -193,7 +287,7 @@ def get_recent_decisions(days: int = 7, limit: int = 20) -> List[Dict]:
                 "updated_at": row["updated_at"],
             })
 
-    conn.close()
+    release_db(conn)
     return results
 
 
@@ -203,15 +297,23 @@ def get_entity_timeline(entity_name: str, limit: int = 20) -> List[Dict]:
     pattern = f"%{entity_name}%"
 
     # Get messages mentioning this entity
-    rows = conn.execute("""
+    rows = indexed_rows(conn, 'message', entity_name, limit, """
         SELECT m.id, m.session_id, m.role, m.content, m.created_at,
                s.name as session_name
         FROM messages m
         JOIN sessions s ON s.id = m.session_id
-        WHERE m.content LIKE ?
-        ORDER BY m.created_at DESC
-        LIMIT ?
-    """, (pattern, limit)).fetchall()
+        WHERE m.id IN (SELECT value FROM json_each(?))
+    """)
+    if rows is None:
+        rows = conn.execute("""
+            SELECT m.id, m.session_id, m.role, m.content, m.created_at,
+                   s.name as session_name
+            FROM messages m
+            JOIN sessions s ON s.id = m.session_id
+            WHERE m.content LIKE ?
+            ORDER BY m.created_at DESC
+            LIMIT ?
+        """, (pattern, limit)).fetchall()
 
     timeline = []
     for row in rows:
@@ -235,7 +337,7 @@ def get_entity_timeline(entity_name: str, limit: int = 20) -> List[Dict]:
             "created_at": row["created_at"],
         })
 
-    conn.close()
+    release_db(conn)
     return timeline
 
 
@@ -250,7 +352,7 @@ def get_session_detail(session_id: str, include_full: bool = False) -> Optional[
     """, (session_id,)).fetchone()
 
     if not row:
-        conn.close()
+        release_db(conn)
         return None
 
     entities_data = safe_json_parse(row["entities"], {})
@@ -283,7 +385,7 @@ def get_session_detail(session_id: str, include_full: bool = False) -> Optional[
             for m in reversed(messages)
         ]
 
-    conn.close()
+    release_db(conn)
     return result
 
 
@@ -294,15 +396,12 @@ def search_observations_fts(query: str, obs_type: Optional[str] = None,
     results = []
     fts_query = query.replace("'", "").replace('"', '').strip()
     if not fts_query:
-        conn.close()
+        release_db(conn)
         return results
 
     # Check if observations table exists
-    tables = conn.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='observations'"
-    ).fetchone()
-    if not tables:
-        conn.close()
+    if not has_table(conn, 'observations'):
+        release_db(conn)
         return results
 
     conditions = ["observations_fts MATCH ?"]
@@ -349,7 +448,7 @@ def search_observations_fts(query: str, obs_type: Optional[str] = None,
     except sqlite3.OperationalError:
         pass
 
-    conn.close()
+    release_db(conn)
     return results
 
 
@@ -358,24 +457,30 @@ def get_observation_timeline_for_entity(entity_name: str, limit: int = 20) -> Li
     conn = get_db()
     results = []
 
-    tables = conn.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='observations'"
-    ).fetchone()
-    if not tables:
-        conn.close()
+    if not has_table(conn, 'observations'):
+        release_db(conn)
         return results
 
     pattern = f"%{entity_name}%"
-    rows = conn.execute("""
+    rows = indexed_rows(conn, 'observation', entity_name, limit, """
         SELECT o.id, o.session_id, o.type, o.summary, o.entities,
                o.tool_name, o.timestamp,
                s.name as session_name
         FROM observations o
         JOIN sessions s ON s.id = o.session_id
-        WHERE o.summary LIKE ? OR o.entities LIKE ?
-        ORDER BY o.timestamp DESC
-        LIMIT ?
-    """, (pattern, pattern, limit)).fetchall()
+        WHERE o.id IN (SELECT value FROM json_each(?))
+    """)
+    if rows is None:
+        rows = conn.execute("""
+            SELECT o.id, o.session_id, o.type, o.summary, o.entities,
+                   o.tool_name, o.timestamp,
+                   s.name as session_name
+            FROM observations o
+            JOIN sessions s ON s.id = o.session_id
+            WHERE o.summary LIKE ? OR o.entities LIKE ?
+            ORDER BY o.timestamp DESC
+            LIMIT ?
+        """, (pattern, pattern, limit)).fetchall()
 
     for row in rows:
         results.append({
@@ -389,7 +494,7 @@ def get_observation_timeline_for_entity(entity_name: str, limit: int = 20) -> Li
             "timestamp": row["timestamp"],
         })
 
-    conn.close()
+    release_db(conn)
     return results
 
 
@@ -399,11 +504,8 @@ def get_recent_tool_usage(tool_name: Optional[str] = None,
     conn = get_db()
     results = []
 
-    tables = conn.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='observations'"
-    ).fetchone()
-    if not tables:
-        conn.close()
+    if not has_table(conn, 'observations'):
+        release_db(conn)
         return results
 
     cutoff = (datetime.now() - timedelta(days=days)).isoformat()
@@ -439,7 +541,7 @@ def get_recent_tool_usage(tool_name: Optional[str] = None,
             "timestamp": row["timestamp"],
         })
 
-    conn.close()
+    release_db(conn)
     return results
 
 
@@ -487,6 +589,51 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["query"],
             },
         ),
+        types.Tool(
+            name="search_memory",
+            description=(
+                "One ranked search across sessions, messages and observations (BM25 relevance weighted "
+                "toward recent activity). Returns next_cursor when more results exist - pass it back to "
+                "get the next page. Pick fields to control tokens: snippet and content are the largest."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": 'Keywords, "quoted phrases", prefix* terms; AND/OR/NOT supported'
+                    },
+                    "kinds": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": list(MEMORY_SEARCH_KINDS)},
+                        "description": "What to search (default: all)"
+                    },
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": list(MEMORY_SEARCH_FIELDS)},
+                        "description": "Fields per result (default: kind, id, session_id, session_name, timestamp, score, snippet)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Results per page (default 10, max 100)",
+                        "default": 10
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from the previous page (same query and filters)"
+                    },
+                    "days": {
+                        "type": "integer",
+                        "description": "Only results from the last N days"
+                    },
+                    "recency_half_life_days": {
+                        "type": "number",
+                        "description": "Age in days at which the recency boost halves (default 30)"
+                    },
+                },
+                "required": ["query"],
+            },
+        ),
         types.Tool(
             name="get_session_context",
             description=(
@@ -679,6 +826,25 @@ async def handle_call_tool(name: str, arguments: dict | None) -> list[types.Text
 
             return [types.TextContent(type="text", text=json.dumps(results, indent=2))]
 
+        elif name == "search_memory":
+            if not HAS_MEMORY_SEARCH:
+                return [types.TextContent(type="text", text=json.dumps({
+                    "error": "Unified search is unavailable (core.utils.memory_search could not be imported)"
+                }))]
+            try:
+                results = search_all_memory(
+                    args["query"],
+                    kinds=args.get("kinds"),
+                    fields=args.get("fields"),
+                    limit=args.get("limit", 10),
+                    cursor=args.get("cursor"),
+                    days=args.get("days"),
+                    half_life_days=args.get("recency_half_life_days"),
+                )
+            except ValueError as e:
+                return [types.TextContent(type="text", text=json.dumps({"error": str(e)}))]
+            return [types.TextContent(type="text", text=json.dumps(results, indent=2))]
+
         elif name == "get_session_context":
             entity_name = args["entity_name"]
             limit = args.get("limit", 10)
@@ -749,6 +915,13 @@ async def _main():
     logger.info(f"DB path: {DB_PATH}")
     logger.info(f"DB exists: {DB_PATH.exists()}")
 
+    # Probe the schema once up front; query functions consult the cached result
+    if _pool is not None and DB_PATH.exists():
+        try:
+            logger.info(f"Observations table: {_pool.has_table('observations')}")
+        except sqlite3.Error as e:
+            logger.warning(f"Sessions DB schema probe failed: {e}")
+
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await app.run(
             read_stream,
@@ -0,0 +1,64 @@
+"""
+Tests for the mtime-keyed YAML config cache
+
+Run with: pytest core/mcp/tests/test_config_snapshot.py -v
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils import config_snapshot
+from core.utils.config_snapshot import cache_stats, get_profile_flag, get_user_profile, load_yaml
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    config_snapshot.clear_cache()
+    yield
+    config_snapshot.clear_cache()
+
+
+def test_parses_once_until_the_file_changes(tmp_path):
+    path = tmp_path / "pillars.yaml"
+    path.write_text("pillars:\n  - id: sales\n")
+    os.utime(path, ns=(1_000, 1_000))
+
+    before = cache_stats()
+    assert load_yaml(path) == {"pillars": [{"id": "sales"}]}
+    assert load_yaml(path, copy=False) == {"pillars": [{"id": "sales"}]}
+    after = cache_stats()
+    assert (after["loads"] - before["loads"], after["hits"] - before["hits"], after["files"]) == (1, 1, 1)
+
+    # Same size, new mtime: still re-read
+    path.write_text("pillars:\n  - id: build\n")
+    os.utime(path, ns=(2_000, 2_000))
+    assert load_yaml(path) == {"pillars": [{"id": "build"}]}
+    assert cache_stats()["loads"] - before["loads"] == 2
+
+    path.unlink()
+    assert load_yaml(path, default={}) == {}
+    assert cache_stats()["files"] == 0
+
+
+def test_copies_protect_the_cached_parse(tmp_path):
+    assert get_user_profile(tmp_path) == {}
+
+    (tmp_path / "System").mkdir()
+    path = tmp_path / "System" / "user-profile.yaml"
+    path.write_text("demo_mode: true\nname: Sam\n")
+    profile = get_user_profile(tmp_path)
+    profile["name"] = "changed"
+    assert get_user_profile(tmp_path)["name"] == "Sam"
+    assert get_profile_flag(tmp_path, "demo_mode") is True
+    assert get_profile_flag(tmp_path, "obsidian_mode") is False
+
+    path.write_text("- not a mapping\n")
+    assert get_user_profile(tmp_path) == {}
+    path.write_text("demo_mode: [unclosed\n")
+    assert load_yaml(path, default="fallback") == "fallback"
@@ -0,0 +1,82 @@
+"""
+Tests for the shared parsed-document cache
+
+Run with: pytest core/mcp/tests/test_doc_cache.py -v
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.doc_cache import DocumentCache
+
+
+def counting_parser(calls):
+    def parse(path: Path):
+        calls.append(path)
+        return {"lines": path.read_text().split("\n")}
+    return parse
+
+
+def test_reuses_parse_until_file_changes(tmp_path):
+    cache = DocumentCache()
+    calls = []
+    parse = counting_parser(calls)
+    page = tmp_path / "Jane_Doe.md"
+    page.write_text("a\nb")
+
+    assert cache.get("person", page, parse) == {"lines": ["a", "b"]}
+    assert cache.get("person", page, parse) == {"lines": ["a", "b"]}
+    assert len(calls) == 1
+
+    page.write_text("a\nb\nc")
+    os.utime(page, ns=(page.stat().st_atime_ns, page.stat().st_mtime_ns + 1_000_000))
+    assert cache.get("person", page, parse) == {"lines": ["a", "b", "c"]}
+    assert len(calls) == 2
+
+    stats = cache.stats()
+    assert stats["parsers"]["person"] == {"hits": 1, "misses": 2, "evictions": 0}
+
+
+def test_returns_copies(tmp_path):
+    cache = DocumentCache()
+    page = tmp_path / "page.md"
+    page.write_text("x")
+    parse = counting_parser([])
+
+    cache.get("doc", page, parse)["lines"].append("mutated")
+    assert cache.get("doc", page, parse) == {"lines": ["x"]}
+
+
+def test_evicts_least_recently_used(tmp_path):
+    calls = []
+    parse = counting_parser(calls)
+    pages = []
+    for i in range(3):
+        page = tmp_path / f"p{i}.md"
+        page.write_text("y" * 200)
+        pages.append(page)
+
+    probe = DocumentCache()
+    probe.get("doc", pages[0], parse)
+    one_entry = probe.stats()["approx_bytes"]
+
+    cache = DocumentCache(max_bytes=one_entry * 2)
+    cache.get("doc", pages[0], parse)
+    cache.get("doc", pages[1], parse)
+    cache.get("doc", pages[0], parse)   # p0 is now most recent
+    cache.get("doc", pages[2], parse)   # evicts p1
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["approx_bytes"] <= cache.max_bytes
+
+    calls.clear()
+    cache.get("doc", pages[0], parse)
+    assert calls == []
+    cache.get("doc", pages[1], parse)
+    assert calls == [pages[1]]
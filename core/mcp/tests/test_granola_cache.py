@@ -0,0 +1,80 @@
+"""
+Tests for the parse-once Granola cache reader
+
+Run with: pytest core/mcp/tests/test_granola_cache.py -v
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils import granola_cache
+from core.utils.granola_cache import load_granola_cache
+
+
+def write_cache(path, documents, transcripts):
+    state = {
+        'documents': documents,
+        'transcripts': transcripts,
+        'people': {'p1': {'name': 'Sarah Chen'}},
+        'panels': {'huge': 'x' * 1000},
+    }
+    path.write_text(json.dumps({'cache': json.dumps({'state': state})}))
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    granola_cache.clear_cache()
+    path = tmp_path / "cache-v3.json"
+    write_cache(path, {
+        'm1': {'type': 'meeting', 'title': 'Older', 'created_at': '2026-01-01T10:00:00Z'},
+        'm2': {'type': 'meeting', 'title': 'Newer', 'created_at': '2026-02-01T10:00:00Z'},
+        'gone': {'type': 'meeting', 'title': 'Deleted', 'created_at': '2026-03-01T10:00:00Z',
+                 'deleted_at': '2026-03-02T00:00:00Z'},
+        'note': {'type': 'note', 'title': 'Not a meeting'},
+    }, {
+        'm2': [{'text': 'world', 'start_timestamp': '2'},
+               {'text': 'hello', 'start_timestamp': '1', 'end_timestamp': '1.5'}],
+    })
+    return path
+
+
+def test_decodes_once_per_file_version(cache_file):
+    first = load_granola_cache(cache_file)
+    assert load_granola_cache(cache_file) is first
+    assert granola_cache.cache_stats()['loads'] == 1
+
+    stat = cache_file.stat()
+    write_cache(cache_file, {'m3': {'type': 'meeting', 'created_at': '2026-04-01'}}, {})
+    os.utime(cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert list(load_granola_cache(cache_file)['documents']) == ['m3']
+
+
+def test_keeps_only_used_state(cache_file):
+    cache = load_granola_cache(cache_file)
+    assert set(cache) == {'documents', 'transcripts', 'people', 'meeting_ids'}
+    assert cache['meeting_ids'] == ['m2', 'm1']
+    assert cache['people']['p1']['name'] == 'Sarah Chen'
+
+
+def test_transcripts_decode_lazily_with_precomputed_meta(cache_file):
+    transcripts = load_granola_cache(cache_file)['transcripts']
+    assert 'm2' in transcripts and 'm1' not in transcripts
+    assert transcripts.meta('m2') == (2, '2:1.5', len('hello world'))
+    assert transcripts.meta('m1') == (0, '', 0)
+    assert [e['text'] for e in transcripts['m2']] == ['world', 'hello']
+    assert transcripts.get('m1', []) == []
+
+
+def test_missing_or_corrupt_file(tmp_path):
+    granola_cache.clear_cache()
+    assert load_granola_cache(tmp_path / "missing.json") is None
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    assert load_granola_cache(bad) is None
@@ -0,0 +1,86 @@
+"""
+Tests for the Granola MCP Server's meeting store integration
+
+Run with: pytest core/mcp/tests/test_granola_server.py -v
+"""
+
+import importlib
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def make_docs(n):
+    return [
+        {'id': f'doc-{i}', 'title': f'Meeting {i}', 'created_at': f'2026-01-{28 - i % 28:02d}T10:00:00.000Z',
+         'updated_at': f'2026-02-01T00:00:{i % 60:02d}.000Z'}
+        for i in range(n)
+    ]
+
+
+class FakeApi:
+    """/v2/get-documents over a list; live requests past the first page wait for `release`."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.calls = []
+        self.release = threading.Event()
+
+    def __call__(self, offset, limit, use_cache=True):
+        self.calls.append((offset, use_cache))
+        if offset and not use_cache:
+            self.release.wait(5)
+        return self.docs[offset:offset + limit]
+
+
+@pytest.fixture
+def gs(tmp_path, monkeypatch):
+    """granola_server imported fresh against an empty vault, with a fake API."""
+    monkeypatch.setenv('VAULT_PATH', str(tmp_path))
+    (tmp_path / 'System').mkdir()
+    sys.modules.pop('granola_server', None)
+    module = importlib.import_module('granola_server')
+    monkeypatch.setattr(module, 'GRANOLA_CACHE', tmp_path / 'no-cache.json')
+    monkeypatch.setattr(module, 'get_api_access_token', lambda: 'token')
+    api = FakeApi(make_docs(250))
+    monkeypatch.setattr(module, 'fetch_documents_page', api)
+    module.api = api
+    yield module
+    api.release.set()
+    if module._store_full_sync_thread is not None:
+        module._store_full_sync_thread.join(5)
+    module._meeting_store.close()
+    sys.modules.pop('granola_server', None)
+
+
+def test_first_backfill_runs_off_the_request_path(gs):
+    # The backfill is stuck on page two; the call answers from the first API page meanwhile
+    assert gs.sync_meeting_store() is False
+    assert [doc['id'] for doc in gs.get_api_documents()][:2] == ['doc-0', 'doc-1']
+    assert gs.start_store_full_sync() is False  # single flight
+
+    gs.api.release.set()
+    gs._store_full_sync_thread.join(5)
+    assert gs._meeting_store.ready and len(gs._meeting_store) == 250
+    assert gs.sync_meeting_store(force=True) is True
+    assert len(gs.get_api_documents()) == 250
+
+
+def test_store_miss_forces_a_delta_sync(gs):
+    gs.api.release.set()
+    gs.sync_meeting_store()
+    gs._store_full_sync_thread.join(5)
+    assert gs.sync_meeting_store(force=True)
+
+    gs.api.docs.insert(0, {'id': 'just-ended', 'title': 'Pricing review', 'created_at': '2026-03-01T09:00:00.000Z',
+                           'updated_at': '2026-03-01T09:00:00.000Z'})
+    gs.api.calls.clear()
+    details = gs.get_meeting_details('just-ended', transcript='none')
+    assert details['title'] == 'Pricing review'
+    assert gs.api.calls == [(0, False), (100, False)]
+    assert gs._meeting_store.get('just-ended') is not None
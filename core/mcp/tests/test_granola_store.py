@@ -0,0 +1,212 @@
+"""
+Tests for the Granola meeting store
+
+Run with: pytest core/mcp/tests/test_granola_store.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.granola_store import GranolaMeetingStore
+
+
+def make_docs(n):
+    return [
+        {'id': f'doc-{i}', 'title': f'Meeting {i}',
+         'created_at': f'2026-01-{28 - i % 28:02d}T10:00:{i % 60:02d}.000Z',
+         'updated_at': f'2026-02-01T00:00:{i % 60:02d}.000Z'}
+        for i in range(n)
+    ]
+
+
+class FakeApi:
+    def __init__(self, docs):
+        self.docs = docs
+        self.calls = []
+        self.fail_at = None
+
+    def __call__(self, offset, limit):
+        self.calls.append(offset)
+        if self.fail_at is not None and offset >= self.fail_at:
+            return None
+        return self.docs[offset:offset + limit]
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = GranolaMeetingStore(tmp_path / "meetings.db")
+    yield s
+    s.close()
+
+
+def test_full_sync_pages_through_history(store):
+    api = FakeApi(make_docs(250))
+    result = store.sync(api, page_size=100)
+
+    assert result['complete'] and result['mode'] == 'full'
+    assert api.calls == [0, 100, 200]
+    assert len(store) == 250
+    assert store.get('doc-249')['title'] == 'Meeting 249'
+    assert store.ready
+
+
+def test_interrupted_full_sync_resumes(store):
+    api = FakeApi(make_docs(250))
+    api.fail_at = 200
+    assert store.sync(api, page_size=100)['complete'] is False
+    assert not store.ready
+
+    api.fail_at = None
+    api.calls.clear()
+    assert store.sync(api, page_size=100)['complete']
+    assert api.calls == [200]
+    assert len(store) == 250
+
+
+def test_delta_sync_stops_at_first_unchanged_page(store):
+    docs = make_docs(250)
+    api = FakeApi(docs)
+    store.sync(api, page_size=100)
+
+    docs.insert(0, {'id': 'fresh', 'title': 'Fresh', 'created_at': '2026-03-01T09:00:00.000Z',
+                    'updated_at': '2026-03-01T09:00:00.000Z'})
+    api.calls.clear()
+    result = store.sync(api, page_size=100)
+
+    assert result['mode'] == 'delta'
+    assert result['changed'] == 1
+    assert api.calls == [0, 100]
+    assert store.documents()[0]['id'] == 'fresh'
+
+
+def test_full_resync_removes_deleted_documents(tmp_path):
+    store = GranolaMeetingStore(tmp_path / "meetings.db", full_resync_interval=0)
+    docs = make_docs(120)
+    api = FakeApi(docs)
+    store.sync(api, page_size=100)
+
+    del docs[5]
+    result = store.sync(api, page_size=100)
+    assert result['mode'] == 'full'
+    assert result['removed'] == 1
+    assert store.get('doc-5') is None
+    store.close()
+
+
+def test_resumed_full_pass_keeps_documents_it_skipped(store):
+    docs = make_docs(250)
+    api = FakeApi(docs)
+    store.sync(api, page_size=100)
+
+    api.fail_at = 100
+    assert store.sync(api, full=True, page_size=100)['complete'] is False
+
+    # A deletion upstream shifts every later document up a slot, so doc-100
+    # is now on the page the interrupted pass already fetched
+    del docs[0]
+    api.fail_at = None
+    result = store.sync(api, page_size=100)
+    assert result['complete'] and result['removed'] == 0
+    assert store.get('doc-100') is not None
+
+    # The next pass that runs start to finish removes what is really gone
+    result = store.sync(api, full=True, page_size=100)
+    assert result['removed'] == 1 and store.get('doc-0') is None and len(store) == 249
+
+
+def test_delta_sync_runs_while_full_pass_fetches(store):
+    docs = make_docs(250)
+    store.sync(FakeApi(docs), page_size=100)
+    seen = []
+
+    def slow_api(offset, limit):
+        if offset == 100 and not seen:
+            # Reads and a delta sync from another caller go through mid-pass
+            seen.append(store.get('doc-0')['title'])
+            docs.insert(0, {'id': 'fresh', 'title': 'Fresh', 'created_at': '2026-03-01T09:00:00.000Z',
+                            'updated_at': '2026-03-01T09:00:00.000Z'})
+            seen.append(store.delta_sync(FakeApi(docs), page_size=100)['changed'])
+        return docs[offset:offset + limit]
+
+    assert store.sync(slow_api, full=True, page_size=100)['complete']
+    assert seen == ['Meeting 0', 1]
+    assert store.get('fresh') is not None and len(store) == 251
+    assert not store.full_pass_due
+
+
+def test_documents_since_filter(store):
+    store.sync(FakeApi(make_docs(56)), page_size=100)
+    recent = store.documents(since='2026-01-27T00:00:00')
+    assert recent
+    assert all(d['created_at'] >= '2026-01-27' for d in recent)
+    assert recent == sorted(recent, key=lambda d: d['created_at'], reverse=True)
+
+
+def test_build_match_query_quotes_terms():
+    from core.utils.granola_store import build_match_query
+
+    assert build_match_query('acme.com roadmap') == '"acme.com" "roadmap"'
+    assert build_match_query('"pricing review" acm*') == '"pricing review" "acm"*'
+    assert build_match_query('OR budget OR') == '"budget"'
+    assert build_match_query('- :') == ''
+
+
+def test_full_text_search_ranks_and_filters(store):
+    docs = [
+        {'id': 'a', 'title': 'Pricing review with Acme', 'created_at': '2026-01-10T10:00:00.000Z',
+         'notes_markdown': 'Discussed the enterprise tier.',
+         'people': {'attendees': [{'name': 'Sarah Chen', 'email': 'sarah@acme.com'}]}},
+        {'id': 'b', 'title': 'Weekly sync', 'created_at': '2026-02-10T10:00:00.000Z',
+         'notes_markdown': 'Quick pricing question came up.'},
+        {'id': 'c', 'title': 'Hiring plan', 'created_at': '2026-03-10T10:00:00.000Z',
+         'notes_markdown': 'Roadmap for Q2 hiring.'},
+    ]
+    store.sync(FakeApi(docs), page_size=100)
+    if not store.has_fts:
+        pytest.skip("SQLite built without FTS5")
+
+    hits = store.search('pricing')
+    assert [h['doc']['id'] for h in hits] == ['a', 'b']  # title match outranks notes match
+    assert '**' in hits[0]['snippet']
+
+    assert [h['doc']['id'] for h in store.search('"pricing review"')] == ['a']
+    assert [h['doc']['id'] for h in store.search('road*')] == ['c']
+    assert [h['doc']['id'] for h in store.search('sarah@acme.com')] == ['a']
+    assert [h['doc']['id'] for h in store.search('pricing', since='2026-02-01')] == ['b']
+    assert store.search('pricing', until='2026-01-01') == []
+
+
+def test_transcripts_are_searchable_and_follow_deletions(tmp_path):
+    store = GranolaMeetingStore(tmp_path / "meetings.db", full_resync_interval=0)
+    docs = [{'id': 'm1', 'title': 'Standup', 'created_at': '2026-01-05T09:00:00.000Z'},
+            {'id': 'm2', 'title': 'Retro', 'created_at': '2026-01-06T09:00:00.000Z'}]
+    api = FakeApi(docs)
+    store.sync(api, page_size=100)
+    if not store.has_fts:
+        pytest.skip("SQLite built without FTS5")
+
+    loads = []
+    def loader(text):
+        return lambda: loads.append(text) or text
+
+    transcripts = {'m1': ('v1', loader('we should migrate the xylophone service')),
+                   'unknown': ('v1', loader('ignored'))}
+    assert store.set_transcripts(transcripts) == 1
+    assert store.set_transcripts(transcripts) == 0
+    assert loads == ['we should migrate the xylophone service']
+    assert [h['doc']['id'] for h in store.search('xylophone')] == ['m1']
+
+    # Updating the document keeps its transcript in the index
+    docs[0] = dict(docs[0], title='Daily standup', updated_at='2026-01-07T00:00:00.000Z')
+    store.sync(api, page_size=100)
+    assert [h['doc']['id'] for h in store.search('xylophone daily')] == ['m1']
+
+    del docs[0]
+    store.sync(api, page_size=100)
+    assert store.search('xylophone') == []
+    store.close()
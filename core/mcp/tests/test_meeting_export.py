@@ -0,0 +1,97 @@
+"""
+Tests for the parallel, resumable meeting export
+
+Run with: pytest core/mcp/tests/test_meeting_export.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.meeting_export import ExportItem, MeetingExporter, slugify
+
+
+class Meetings:
+    """Export items whose render() calls are counted."""
+
+    def __init__(self, count):
+        self.versions = {f"m{i:04d}": 'v1' for i in range(count)}
+        self.rendered = []
+
+    def items(self):
+        for meeting_id, version in self.versions.items():
+            yield ExportItem(
+                id=meeting_id, version=version, date='2026-01-05', title=f"Sync {meeting_id[-1]}",
+                render=lambda meeting_id=meeting_id, version=version: self.render(meeting_id, version),
+            )
+
+    def render(self, meeting_id, version):
+        self.rendered.append(meeting_id)
+        return f"# {meeting_id}\n\n{version}\n"
+
+
+def test_export_writes_notes_and_skips_unchanged_on_rerun(tmp_path):
+    meetings = Meetings(30)
+    summary = MeetingExporter(tmp_path, workers=4).export(meetings.items())
+    assert summary['written'] == 30 and summary['failed'] == 0
+    # Titles repeat every 10 meetings, so later ones get id-suffixed names
+    notes = sorted((tmp_path / '00-Inbox/Meetings/2026-01-05').glob('*.md'))
+    assert len(notes) == 30
+    assert (tmp_path / '00-Inbox/Meetings/2026-01-05/sync-0.md').read_text() == "# m0000\n\nv1\n"
+    assert not list(tmp_path.rglob('*.tmp'))
+
+    meetings.rendered.clear()
+    meetings.versions['m0003'] = 'v2'
+    summary = MeetingExporter(tmp_path).export(meetings.items())
+    assert summary['skipped'] == 29 and summary['written'] == 1
+    assert meetings.rendered == ['m0003']
+
+
+def test_interrupted_export_resumes(tmp_path):
+    meetings = Meetings(120)
+
+    def stop_after_60(summary):
+        if summary['written'] >= 60:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        MeetingExporter(tmp_path, workers=2).export(meetings.items(), on_progress=stop_after_60)
+
+    meetings.rendered.clear()
+    summary = MeetingExporter(tmp_path).export(meetings.items())
+    assert summary['skipped'] >= 60
+    assert summary['skipped'] + summary['written'] + summary['unchanged'] == 120
+    assert len(meetings.rendered) <= 60
+    assert len(list((tmp_path / '00-Inbox/Meetings').rglob('*.md'))) == 120
+
+
+def test_local_edits_and_foreign_files_are_not_overwritten(tmp_path):
+    folder = tmp_path / '00-Inbox/Meetings/2026-01-05'
+    folder.mkdir(parents=True)
+    (folder / 'sync-0.md').write_text('my own note')
+
+    meetings = Meetings(1)
+    MeetingExporter(tmp_path).export(meetings.items())
+    assert (folder / 'sync-0.md').read_text() == 'my own note'
+    exported = folder / 'sync-0-m0000.md'
+    assert exported.exists()
+
+    exported.write_text('edited in the vault')
+    meetings.versions['m0000'] = 'v2'
+    summary = MeetingExporter(tmp_path).export(meetings.items())
+    assert summary['modified_locally'] == 1
+    assert exported.read_text() == 'edited in the vault'
+
+    summary = MeetingExporter(tmp_path).export(meetings.items(), force=True)
+    assert summary['written'] == 1
+    assert exported.read_text() == "# m0000\n\nv2\n"
+
+
+def test_slugify():
+    assert slugify('Q3 Roadmap: Pricing & Packaging!') == 'q3-roadmap-pricing-packaging'
+    assert slugify('') == 'meeting'
+    assert len(slugify('x' * 100)) == 60
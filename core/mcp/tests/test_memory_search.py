@@ -0,0 +1,90 @@
+"""
+Tests for unified session memory search
+
+Run with: pytest core/mcp/tests/test_memory_search.py -v
+"""
+
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.memory_search import search_memory
+
+SCHEMA = """
+CREATE TABLE sessions (id TEXT PRIMARY KEY, name TEXT, status TEXT, summary TEXT, updated_at TEXT);
+CREATE TABLE messages (id TEXT PRIMARY KEY, session_id TEXT, role TEXT, content TEXT, created_at TEXT);
+CREATE TABLE observations (id TEXT PRIMARY KEY, session_id TEXT, type TEXT, summary TEXT,
+    tool_name TEXT, timestamp TEXT);
+CREATE VIRTUAL TABLE sessions_fts USING fts5(name, summary, content='sessions');
+CREATE VIRTUAL TABLE messages_fts USING fts5(content, content='messages');
+CREATE VIRTUAL TABLE observations_fts USING fts5(summary, content='observations');
+"""
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    now = datetime.now()
+    for i in range(10):
+        ts = (now - timedelta(days=i * 20)).isoformat()
+        conn.execute("INSERT INTO sessions VALUES (?, ?, 'archived', ?, ?)",
+                     (f's{i}', f'Session {i}', 'pricing discussion' if i % 2 else 'hiring plan', ts))
+        conn.executemany("INSERT INTO messages VALUES (?, ?, 'user', ?, ?)", [
+            (f's{i}m{m}', f's{i}', f'we talked about pricing tier {m}' if m % 3 == 0 else 'other topics', ts)
+            for m in range(6)
+        ])
+        conn.execute("INSERT INTO observations VALUES (?, ?, 'tool_call', ?, 'create_task', ?)",
+                     (f's{i}o', f's{i}', 'created pricing task', ts))
+    conn.executescript("""
+        INSERT INTO sessions_fts(sessions_fts) VALUES('rebuild');
+        INSERT INTO messages_fts(messages_fts) VALUES('rebuild');
+        INSERT INTO observations_fts(observations_fts) VALUES('rebuild');
+    """)
+    return conn
+
+
+def test_merges_all_kinds_ranked_by_score(conn):
+    page = search_memory(conn, 'pricing', limit=100)
+    kinds = {r['kind'] for r in page['results']}
+    assert kinds == {'session', 'message', 'observation'}
+    assert len(page['results']) == 5 + 20 + 10
+    scores = [r['score'] for r in page['results']]
+    assert scores == sorted(scores, reverse=True)
+    assert page['next_cursor'] is None
+    assert '«pricing»' in page['results'][0]['snippet']
+
+
+def test_cursor_pages_cover_every_result_exactly_once(conn):
+    everything = [(r['kind'], r['id']) for r in search_memory(conn, 'pricing', limit=100)['results']]
+    seen, cursor = [], None
+    while True:
+        page = search_memory(conn, 'pricing', fields=['kind', 'id'], limit=4, cursor=cursor)
+        assert all(set(r) == {'kind', 'id'} for r in page['results'])
+        seen += [(r['kind'], r['id']) for r in page['results']]
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+    assert seen == everything
+
+    with pytest.raises(ValueError):
+        search_memory(conn, 'hiring', cursor=search_memory(conn, 'pricing', limit=1)['next_cursor'])
+
+
+def test_recency_and_filters(conn):
+    # Identical observation text: the newest ranks first
+    observations = search_memory(conn, 'pricing', kinds=['observation'], fields=['id'], limit=3)['results']
+    assert [r['id'] for r in observations] == ['s0o', 's1o', 's2o']
+
+    recent = search_memory(conn, 'pricing', days=30, fields=['id', 'timestamp'], limit=100)['results']
+    assert recent and all(r['id'].startswith(('s0', 's1')) for r in recent)
+
+    with pytest.raises(ValueError):
+        search_memory(conn, 'pricing', fields=['password'])
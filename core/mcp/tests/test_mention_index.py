@@ -0,0 +1,156 @@
+"""
+Tests for the entity mention index
+
+Run with: pytest core/mcp/tests/test_mention_index.py -v
+"""
+
+import json
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.mention_index import MentionIndex, entity_names, normalize
+
+SCHEMA = """
+CREATE TABLE sessions (id TEXT PRIMARY KEY, name TEXT, summary TEXT, entities TEXT, updated_at TEXT);
+CREATE TABLE messages (id TEXT PRIMARY KEY, session_id TEXT, content TEXT, created_at TEXT);
+CREATE TABLE observations (id TEXT PRIMARY KEY, session_id TEXT, summary TEXT, entities TEXT, timestamp TEXT);
+CREATE VIRTUAL TABLE sessions_fts USING fts5(name, summary, entities, content='sessions');
+CREATE VIRTUAL TABLE messages_fts USING fts5(content, content='messages');
+CREATE VIRTUAL TABLE observations_fts USING fts5(summary, content='observations');
+CREATE TRIGGER sessions_ai AFTER INSERT ON sessions BEGIN
+    INSERT INTO sessions_fts(rowid, name, summary, entities) VALUES (new.rowid, new.name, new.summary, new.entities);
+END;
+CREATE TRIGGER sessions_au AFTER UPDATE ON sessions BEGIN
+    INSERT INTO sessions_fts(sessions_fts, rowid, name, summary, entities)
+        VALUES ('delete', old.rowid, old.name, old.summary, old.entities);
+    INSERT INTO sessions_fts(rowid, name, summary, entities) VALUES (new.rowid, new.name, new.summary, new.entities);
+END;
+CREATE TRIGGER messages_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts(rowid, content) VALUES (new.rowid, new.content);
+END;
+CREATE TRIGGER observations_ai AFTER INSERT ON observations BEGIN
+    INSERT INTO observations_fts(rowid, summary) VALUES (new.rowid, new.summary);
+END;
+"""
+
+
+def make_source(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "sessions.db"))
+    conn.executescript(SCHEMA)
+    conn.execute("INSERT INTO sessions VALUES ('s1', 'Pricing review', 'Talked to Sarah Chen', ?, '2026-01-01')",
+                 (json.dumps({'entities': [{'name': 'Acme Corp'}]}),))
+    conn.execute("INSERT INTO sessions VALUES ('s2', 'Hiring', 'Nothing relevant', '{}', '2026-01-02')")
+    conn.executemany("INSERT INTO messages VALUES (?, ?, ?, ?)", [
+        ('m1', 's1', 'Sarah Chen wants a discount', '2026-01-01T10:00'),
+        ('m2', 's2', 'Ask Sarah about the Acme Corp contract', '2026-01-02T10:00'),
+        ('m3', 's2', 'Sarahs list', '2026-01-02T11:00'),
+    ])
+    conn.execute("INSERT INTO observations VALUES ('o1', 's1', 'create_task', ?, '2026-01-01T10:05')",
+                 (json.dumps(['Acme Corp']),))
+    conn.commit()
+    return conn
+
+
+def ids(hits):
+    return [item_id for item_id, _, _ in hits]
+
+
+def built_index(tmp_path, source, **kwargs):
+    """A MentionIndex whose background build against `source` has finished."""
+    index = MentionIndex(tmp_path / "mentions.db", **kwargs)
+    assert index.timeline(source, 'Acme Corp', 'session') is None  # build started, caller scans
+    assert index.wait_built(5)
+    return index
+
+
+def test_timelines_from_entities_json_and_fts_hits(tmp_path):
+    source = make_source(tmp_path)
+    index = built_index(tmp_path, source)
+
+    assert ids(index.timeline(source, 'Acme Corp', 'session')) == ['s1']
+    assert ids(index.timeline(source, 'Acme Corp', 'message')) == ['m2']
+    assert ids(index.timeline(source, 'acme  corp', 'observation')) == ['o1']
+    # Names that were never extracted are looked up in FTS directly; matching is by whole tokens
+    assert ids(index.timeline(source, 'Sarah', 'message')) == ['m2', 'm1']
+    assert ids(index.timeline(source, 'Sarah', 'message', limit=1, offset=1)) == ['m1']
+    assert ids(index.timeline(source, 'Sarah Chen', 'session')) == ['s1']
+    assert index.status()['entities'] == 1  # ad-hoc names aren't stored
+
+
+def test_first_build_runs_in_the_background(tmp_path):
+    source = make_source(tmp_path)
+    index = built_index(tmp_path, source)
+    assert not index.status()['building']
+    assert ids(index.timeline(source, 'Acme Corp', 'message')) == ['m2']
+
+    # A reopened index is ready at once; a replaced sessions DB is rebuilt in the background
+    reopened = MentionIndex(tmp_path / "mentions.db")
+    assert ids(reopened.timeline(source, 'Acme Corp', 'message')) == ['m2']
+    replacement = tmp_path / "new"
+    replacement.mkdir()
+    make_source(replacement).close()
+    source.close()
+    (replacement / "sessions.db").replace(tmp_path / "sessions.db")  # new inode
+    source = sqlite3.connect(str(tmp_path / "sessions.db"))
+    assert reopened.timeline(source, 'Acme Corp', 'message') is None
+    assert reopened.wait_built(5)
+    assert ids(reopened.timeline(source, 'Acme Corp', 'message')) == ['m2']
+
+
+def test_new_messages_and_edited_sessions_are_picked_up(tmp_path):
+    source = make_source(tmp_path)
+    index = built_index(tmp_path, source, refresh_interval=0)
+    assert ids(index.timeline(source, 'Sarah Chen', 'message')) == ['m1']
+
+    source.execute("INSERT INTO messages VALUES ('m4', 's2', 'Follow up with Sarah Chen', '2026-01-03T09:00')")
+    source.execute("UPDATE sessions SET summary = 'Sarah Chen joined late', updated_at = '2026-01-03' WHERE id = 's2'")
+    source.execute("UPDATE sessions SET summary = 'Talked pricing', updated_at = '2026-01-03' WHERE id = 's1'")
+    source.commit()
+
+    assert ids(index.timeline(source, 'Sarah Chen', 'message')) == ['m4', 'm1']
+    assert ids(index.timeline(source, 'Sarah Chen', 'session')) == ['s2']
+    assert ids(index.timeline(source, 'Acme Corp', 'session')) == ['s1']  # still in its entities JSON
+
+
+def test_lookups_only_catch_up_the_queried_entity(tmp_path):
+    source = make_source(tmp_path)
+    source.execute("INSERT INTO sessions VALUES ('s3', 'Intro', 'Met Sarah Chen', ?, '2026-01-03')",
+                   (json.dumps(['Sarah Chen']),))
+    source.commit()
+    index = built_index(tmp_path, source, refresh_interval=0)
+
+    source.execute("INSERT INTO messages VALUES ('m4', 's3', 'Sarah Chen from Acme Corp', '2026-01-04T09:00')")
+    source.commit()
+    scans = []
+    real_scan = index._scan
+    index._scan = lambda *args: scans.append((args[2], threading.current_thread().name)) or real_scan(*args)
+
+    assert ids(index.timeline(source, 'Acme Corp', 'message')) == ['m4', 'm2']
+    assert ('acme corp', 'MainThread') in scans
+    assert ('sarah chen', 'MainThread') not in scans  # left to the background catch-up
+    assert index.wait_built(5)
+    assert ('sarah chen', 'mention-index-catch-up') in scans
+    scans.clear()
+    assert ids(index.timeline(source, 'Sarah Chen', 'message')) == ['m4', 'm1']
+    assert scans == []
+
+
+def test_unindexable_sources_return_none(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "plain.db"))
+    conn.execute("CREATE TABLE sessions (id TEXT, name TEXT, summary TEXT, entities TEXT, updated_at TEXT)")
+    conn.execute("CREATE TABLE messages (id TEXT, session_id TEXT, content TEXT, created_at TEXT)")
+    index = MentionIndex(tmp_path / "mentions.db")
+    assert index.timeline(conn, 'Sarah', 'message') is None
+    assert index.timeline(make_source(tmp_path), '!!', 'message') is None
+
+
+def test_entity_names_and_normalize():
+    assert entity_names('{"entities": [{"name": "Sarah Chen"}, "Acme", {"type": "x"}]}') == ['Sarah Chen', 'Acme']
+    assert entity_names('["Acme"]') == ['Acme']
+    assert entity_names('not json') == []
+    assert normalize('  Sarah_Chen! ') == 'sarah chen'
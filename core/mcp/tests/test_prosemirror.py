@@ -0,0 +1,85 @@
+"""
+Tests for the ProseMirror renderer and its memo cache
+
+Run with: pytest core/mcp/tests/test_prosemirror.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.prosemirror import MarkdownCache, to_markdown
+
+
+def text(value, *marks):
+    node = {'type': 'text', 'text': value}
+    if marks:
+        node['marks'] = [{'type': mark} for mark in marks]
+    return node
+
+
+def para(*children):
+    return {'type': 'paragraph', 'content': list(children)}
+
+
+def item(*children):
+    return {'type': 'listItem', 'content': list(children)}
+
+
+PANEL = {'type': 'doc', 'content': [
+    {'type': 'heading', 'attrs': {'level': 2}, 'content': [text('Decisions')]},
+    para(text('Ship '), text('v2', 'bold'), text(' on '), text('Friday', 'italic')),
+    {'type': 'bulletList', 'content': [
+        item(para(text('Pricing')), {'type': 'bulletList', 'content': [item(para(text('Enterprise tier')))]}),
+        item(para(text('Hiring'))),
+    ]},
+    {'type': 'orderedList', 'content': [item(para(text('First'))), {'type': 'note'}, item(para(text('Third')))]},
+    {'type': 'codeBlock', 'content': [text('run()', 'code')]},
+    {'type': 'blockquote', 'content': [text('line one'), {'type': 'hardBreak'}, text('line two')]},
+]}
+
+
+def test_renders_granola_node_types():
+    assert to_markdown(PANEL) == (
+        "## Decisions\n\n"
+        "Ship **v2** on *Friday*\n\n"
+        "- Pricing\n\n- Enterprise tier\n"
+        "- Hiring\n\n"
+        "1. First\n3. Third\n\n"
+        "```\n`run()````\n\n"
+        "> line one\nline two"
+    )
+    assert to_markdown({}) == ""
+    assert to_markdown({'type': 'doc'}) == ""
+
+
+def test_deep_nesting_does_not_recurse():
+    node = para(text('bottom'))
+    for _ in range(sys.getrecursionlimit() * 2):
+        node = {'type': 'bulletList', 'content': [item(node)]}
+    assert to_markdown({'type': 'doc', 'content': [node]}) == '- ' * (sys.getrecursionlimit() * 2) + 'bottom'
+
+
+def test_cache_memoizes_by_key_and_persists(tmp_path):
+    db_path = tmp_path / "notes.db"
+    cache = MarkdownCache(db_path=db_path)
+    assert cache.render(PANEL, key='m1:2026-01-01') == to_markdown(PANEL)
+    assert cache.render(PANEL, key='m1:2026-01-01') == to_markdown(PANEL)
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+    cache.close()
+
+    reopened = MarkdownCache(db_path=db_path)
+    # A changed key (document edited) renders again; the old key is served from disk
+    edited = {'type': 'doc', 'content': [para(text('Edited'))]}
+    assert reopened.render(edited, key='m1:2026-01-02') == "Edited"
+    assert reopened.render(PANEL, key='m1:2026-01-01') == to_markdown(PANEL)
+    assert reopened.stats()['disk_hits'] == 1
+    reopened.close()
+
+
+def test_cache_without_key_renders_uncached():
+    cache = MarkdownCache(max_entries=1)
+    assert cache.render(PANEL) == to_markdown(PANEL)
+    assert cache.stats()['entries'] == 0
@@ -0,0 +1,86 @@
+"""
+Tests for the QMD reindex scheduler
+
+Run with: pytest core/mcp/tests/test_qmd_indexer.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.qmd_indexer import ReindexScheduler
+
+
+class FakeReindex:
+    """Records each run and how many runs overlapped."""
+
+    def __init__(self, duration=0.0):
+        self.duration = duration
+        self.runs = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.duration)
+        with self.lock:
+            self.active -= 1
+            self.runs.append(time.monotonic())
+        return None
+
+
+def test_burst_is_coalesced_into_one_run():
+    reindex = FakeReindex()
+    scheduler = ReindexScheduler(reindex, debounce=0.1)
+
+    for _ in range(30):
+        scheduler.request()
+    status = scheduler.status()
+    assert status['pending'] and status['queued_requests'] == 30
+
+    assert scheduler.wait_idle(timeout=5)
+    assert len(reindex.runs) == 1
+    last = scheduler.status()['last_run']
+    assert last['coalesced_requests'] == 30 and last['error'] is None
+
+
+def test_single_flight_with_one_pending_rerun():
+    reindex = FakeReindex(duration=0.3)
+    scheduler = ReindexScheduler(reindex, debounce=0.02)
+
+    scheduler.request()
+    time.sleep(0.1)  # first run is in progress
+    assert scheduler.status()['running']
+    for _ in range(5):
+        scheduler.request()
+    assert scheduler.status()['queued_requests'] == 5
+
+    assert scheduler.wait_idle(timeout=5)
+    assert len(reindex.runs) == 2 and reindex.max_active == 1
+    assert scheduler.status()['last_run']['coalesced_requests'] == 5
+
+
+def test_max_delay_bounds_a_steady_stream_and_errors_are_reported():
+    errors = iter(["qmd update returned 1"])
+    runs = []
+
+    def reindex():
+        runs.append(time.monotonic())
+        return next(errors, None)
+
+    scheduler = ReindexScheduler(reindex, debounce=0.2, max_delay=0.3)
+    start = time.monotonic()
+    while time.monotonic() - start < 0.5:
+        scheduler.request()
+        time.sleep(0.05)
+    assert runs and runs[0] - start < 0.45  # ran during the stream, not after it went quiet
+
+    assert scheduler.wait_idle(timeout=5)
+    assert scheduler.status()['failures'] == 1
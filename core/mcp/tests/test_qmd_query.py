@@ -0,0 +1,119 @@
+"""
+Tests for vault_search_multi merging and concurrency
+
+Run with: pytest core/mcp/tests/test_qmd_query.py -v
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils import qmd_query
+
+FAKE_RESULTS = {
+    "pricing": [("a.md", 0.9), ("b.md", 0.5), ("c.md", 0.4)],
+    "Sarah Chen": [("c.md", 0.7), ("b.md", 0.6)],
+    "Acme": [("c.md", 0.3), ("d.md", 0.2)],
+}
+
+
+@pytest.fixture
+def fake_search(monkeypatch):
+    def vault_search(query, limit=10, **kwargs):
+        if query.startswith("sleep:"):
+            time.sleep(float(query.split(":")[1]))
+            return [{"path": f"{query}.md", "score": 1.0}]
+        return [{"path": path, "score": score, "query": query} for path, score in FAKE_RESULTS[query][:limit]]
+
+    monkeypatch.setattr(qmd_query, "vault_search", vault_search)
+
+
+def test_max_and_rrf_merging(fake_search):
+    queries = ["pricing", "Sarah Chen", "Acme"]
+
+    merged = qmd_query.vault_search_multi(queries)
+    assert [(r["path"], r["score"]) for r in merged] == [("a.md", 0.9), ("c.md", 0.7), ("b.md", 0.6), ("d.md", 0.2)]
+
+    # c.md is found by every query, so fusion ranks it first
+    fused = qmd_query.vault_search_multi(queries, merge="rrf")
+    assert [r["path"] for r in fused] == ["c.md", "b.md", "a.md", "d.md"]
+    assert fused[0]["score"] == 0.7 and fused[0]["rrf_score"] > fused[1]["rrf_score"]
+
+    assert len(qmd_query.vault_search_multi(queries, deduplicate=False)) == 7
+    # Undeduplicated fusion keeps every hit but still orders by agreement across queries
+    fused_all = qmd_query.vault_search_multi(queries, deduplicate=False, merge="rrf")
+    assert [r["path"] for r in fused_all] == ["c.md"] * 3 + ["b.md"] * 2 + ["a.md", "d.md"]
+    assert [r["score"] for r in fused_all[:3]] == [0.7, 0.4, 0.3]
+    with pytest.raises(ValueError):
+        qmd_query.vault_search_multi(queries, merge="sum")
+
+
+def test_queries_run_concurrently_within_a_time_budget(fake_search):
+    started = time.perf_counter()
+    results = qmd_query.vault_search_multi(["sleep:0.3", "sleep:0.3", "sleep:0.3", "pricing"])
+    assert time.perf_counter() - started < 0.8
+    assert {r["path"] for r in results} >= {"sleep:0.3.md", "a.md"}
+
+    started = time.perf_counter()
+    results = qmd_query.vault_search_multi(["sleep:2", "pricing"], timeout=0.3)
+    assert time.perf_counter() - started < 1.0
+    assert [r["path"] for r in results] == ["a.md", "b.md", "c.md"]
+
+
+def test_queued_queries_share_an_overall_deadline(fake_search, monkeypatch, caplog):
+    # One worker, stuck on the first query: the rest never start, and the call
+    # still returns at timeout × ceil(3 / 1) instead of after the stuck query
+    monkeypatch.setattr(qmd_query, "MULTI_SEARCH_WORKERS", 1)
+    started = time.perf_counter()
+    results = qmd_query.vault_search_multi(["sleep:2", "pricing", "Acme"], timeout=0.2)
+    assert 0.5 < time.perf_counter() - started < 1.0
+    assert results == []
+    assert "timed out after 0.2s" in caplog.text and "never started within 0.2s" in caplog.text
+
+
+def test_qmd_results_are_cached_until_the_index_changes(tmp_path, monkeypatch):
+    from core.utils import qmd_indexer
+
+    (tmp_path / "System").mkdir()
+    monkeypatch.setenv("VAULT_PATH", str(tmp_path))
+    monkeypatch.setattr(qmd_query, "_qmd_available", True)
+    monkeypatch.setattr(qmd_query, "SEARCH_CACHE_SIZE", 2)
+    qmd_query.clear_search_cache()
+    calls = []
+
+    def qmd_search(query, limit=10, search_type="query"):
+        calls.append(query)
+        return [{"path": f"{query}.md", "score": 0.8, "snippet": "", "source": "qmd"}]
+
+    monkeypatch.setattr(qmd_query, "_qmd_search", qmd_search)
+
+    first = qmd_query.vault_search("pricing")
+    first[0]["score"] = 0  # callers mutating results don't change what's cached
+    assert qmd_query.vault_search("pricing") == [{"path": "pricing.md", "score": 0.8, "snippet": "", "source": "qmd"}]
+    assert calls == ["pricing"]
+    qmd_query.vault_search("pricing", limit=3)  # different key
+    assert calls == ["pricing", "pricing"]
+
+    # A reindex here, or one finished by another server (the generation file), invalidates
+    qmd_indexer._bump_generation()
+    qmd_query.vault_search("pricing")
+    assert len(calls) == 3
+    generation_file = tmp_path / qmd_indexer.GENERATION_FILE
+    stat = generation_file.stat()
+    os.utime(generation_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    qmd_query.vault_search("pricing")
+    assert len(calls) == 4
+
+    # LRU: the least recently used entry is evicted first
+    qmd_query.vault_search("hiring")
+    qmd_query.vault_search("budget")
+    qmd_query.vault_search("hiring")
+    assert calls[-2:] == ["hiring", "budget"]
+    assert qmd_query.search_cache_stats()["entries"] == 2
+    qmd_query.clear_search_cache()
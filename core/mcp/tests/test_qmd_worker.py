@@ -0,0 +1,132 @@
+"""
+Tests for the warm QMD worker
+
+Run with: pytest core/mcp/tests/test_qmd_worker.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils import qmd_query
+from core.utils.qmd_worker import QMDWorker, QMDWorkerError, QMDWorkerTimeout
+
+# Stand-in for `qmd mcp`: newline-delimited JSON-RPC on stdio, each call answered
+# on its own thread so slow queries finish out of order
+FAKE_QMD_MCP = r'''
+import json, os, sys, threading, time
+
+lock = threading.Lock()
+
+def send(message):
+    with lock:
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+def call(request):
+    query = request["params"]["arguments"]["query"]
+    if query == "crash":
+        os._exit(1)
+    if query.startswith("sleep:"):
+        time.sleep(float(query.split(":")[1]))
+    results = [{"file": "qmd://vault/%s.md" % query.replace(":", "-"), "score": 0.9, "snippet": str(os.getpid())}]
+    send({"jsonrpc": "2.0", "id": request["id"],
+          "result": {"content": [{"type": "text", "text": json.dumps(results)}]}})
+
+for line in sys.stdin:
+    request = json.loads(line)
+    method = request.get("method")
+    if "id" not in request:
+        continue
+    if method == "initialize":
+        send({"jsonrpc": "2.0", "id": request["id"], "result": {"protocolVersion": "2024-11-05"}})
+    elif method == "tools/list":
+        send({"jsonrpc": "2.0", "id": request["id"], "result": {"tools": [{"name": "query"}, {"name": "search"}]}})
+    elif method == "ping":
+        send({"jsonrpc": "2.0", "id": request["id"], "result": {}})
+    elif method == "tools/call":
+        threading.Thread(target=call, args=(request,)).start()
+'''
+
+
+@pytest.fixture
+def worker(tmp_path):
+    script = tmp_path / "fake_qmd_mcp.py"
+    script.write_text(FAKE_QMD_MCP)
+    worker = QMDWorker([sys.executable, str(script)], idle_timeout=0, request_timeout=5)
+    yield worker
+    worker.stop()
+
+
+def text(result):
+    return result["content"][0]["text"]
+
+
+def test_concurrent_requests_share_one_process(worker):
+    results = {}
+
+    def search(query):
+        results[query] = text(worker.search("query", query))
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=search, args=(f"sleep:{delay}",)) for delay in (0.6, 0.3, 0.0)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Responses come back out of order but each caller gets its own
+    assert all(f"sleep-{delay}.md" in results[f"sleep:{delay}"] for delay in (0.6, 0.3, 0.0))
+    assert time.perf_counter() - started < 1.2
+    assert worker.status()["starts"] == 1
+    assert worker.ping()
+
+    with pytest.raises(QMDWorkerError):
+        worker.search("vsearch", "no vector tool on this server")
+    with pytest.raises(QMDWorkerTimeout):
+        worker.search("query", "sleep:1", timeout=0.2)
+
+
+def test_restarts_after_crash_and_stops_when_idle(worker):
+    assert not worker.is_running()  # started by the first search, not before
+    worker.search("query", "warm up")
+    first_pid = worker.status()["pid"]
+
+    with pytest.raises(QMDWorkerError):
+        worker.search("query", "crash")
+    assert not worker.is_running()
+
+    assert "restarted.md" in text(worker.search("query", "restarted"))
+    assert worker.status()["pid"] != first_pid
+    assert worker.status()["starts"] == 2
+
+    worker.idle_timeout = 0.2
+    worker.stop()
+    worker.search("query", "again")
+    deadline = time.monotonic() + 3
+    while worker.is_running() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not worker.is_running()
+    assert worker.status()["idle_stops"] == 1
+
+
+def test_qmd_query_falls_back_to_cli_when_worker_fails(tmp_path, monkeypatch):
+    # A "qmd" whose mcp subcommand exits at once but whose CLI search works
+    qmd = tmp_path / "qmd"
+    qmd.write_text("#!/bin/sh\n"
+                   "if [ \"$1\" = mcp ]; then exit 1; fi\n"
+                   "echo '[{\"file\": \"notes/from-cli.md\", \"score\": 0.7, \"snippet\": \"cli\"}]'\n")
+    qmd.chmod(0o755)
+    monkeypatch.setattr(qmd_query, "_qmd_path", str(qmd))
+    monkeypatch.setattr(qmd_query, "_worker", None)
+
+    results = qmd_query._qmd_search("anything", limit=3)
+    assert [r["path"] for r in results] == ["notes/from-cli.md"]
+    assert qmd_query.worker_status()["starts"] == 1
+    qmd_query._worker.stop()
@@ -0,0 +1,94 @@
+"""
+Tests for the API response cache
+
+Run with: pytest core/mcp/tests/test_response_cache.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.response_cache import ResponseCache
+
+
+class CountingFetch:
+    def __init__(self, result=None, delay=0.0):
+        self.result = result if result is not None else {'docs': [1, 2, 3]}
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return self.result
+
+
+def test_hits_and_per_endpoint_ttl():
+    cache = ResponseCache(ttls={'/fast': 0.05}, default_ttl=60)
+    fast, slow = CountingFetch(), CountingFetch()
+
+    for _ in range(3):
+        cache.get_or_fetch('/fast', {'a': 1}, fast)
+        cache.get_or_fetch('/slow', {'a': 1}, slow)
+    assert fast.calls == 1 and slow.calls == 1
+
+    time.sleep(0.06)
+    cache.get_or_fetch('/fast', {'a': 1}, fast)
+    cache.get_or_fetch('/slow', {'a': 1}, slow)
+    assert fast.calls == 2 and slow.calls == 1
+
+    stats = cache.stats()
+    assert stats['endpoints']['/slow']['hit_ratio'] == 0.75
+    assert stats['hits'] == 5 and stats['misses'] == 3
+
+
+def test_failures_are_not_cached_and_use_cache_false_refreshes():
+    cache = ResponseCache()
+    assert cache.get_or_fetch('/x', {}, lambda: None) is None
+    assert cache.get_or_fetch('/x', {}, CountingFetch({'v': 1})) == {'v': 1}
+
+    assert cache.get_or_fetch('/x', {}, CountingFetch({'v': 2}), use_cache=False) == {'v': 2}
+    assert cache.get_or_fetch('/x', {}, CountingFetch({'v': 3})) == {'v': 2}
+
+
+def test_size_bound_evicts_least_recently_used():
+    cache = ResponseCache(max_bytes=60)
+    for i in range(5):
+        cache.get_or_fetch('/e', {'i': i}, CountingFetch({'payload': 'x' * 20}))
+    stats = cache.stats()
+    assert stats['bytes'] <= 60
+    assert stats['entries'] == 1 and stats['evictions'] == 4
+
+
+def test_concurrent_identical_requests_share_one_fetch():
+    cache = ResponseCache()
+    fetch = CountingFetch(delay=0.1)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_fetch('/e', {'p': 1}, fetch)))
+               for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert fetch.calls == 1
+    assert len(results) == 8 and all(r == fetch.result for r in results)
+    assert cache.stats()['coalesced'] == 7
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    db_path = tmp_path / "api-cache.db"
+    first = ResponseCache(db_path=db_path)
+    first.get_or_fetch('/e', {'p': 1}, CountingFetch({'v': 'stored'}))
+    first.close()
+
+    second = ResponseCache(db_path=db_path)
+    fetch = CountingFetch({'v': 'fresh'})
+    assert second.get_or_fetch('/e', {'p': 1}, fetch) == {'v': 'stored'}
+    assert fetch.calls == 0
+    assert second.stats()['disk_hits'] == 1
+    second.close()
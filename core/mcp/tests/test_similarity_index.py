@@ -0,0 +1,41 @@
+"""
+Tests for the trigram candidate index used by task dedup
+
+Run with: pytest core/mcp/tests/test_similarity_index.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.similarity_index import SimilarityIndex, ngrams
+
+
+def test_candidates_rank_by_trigram_overlap():
+    index = SimilarityIndex()
+    index.sync({
+        1: "Send Q1 board deck",
+        2: "Send the Q1 board deck to investors",
+        3: "Book flights for offsite",
+    })
+
+    candidates = index.candidates("send q1 board  deck")
+    assert [key for key, _ in candidates] == [1, 2]
+    assert candidates[0][1] == 1.0 > candidates[1][1] >= 0.4
+    assert index.candidates("Send Q1 board deck", limit=1) == [(1, 1.0)]
+    assert index.candidates("xyz") == []
+    assert ngrams("A") == {" a "}
+
+
+def test_sync_only_touches_changed_titles():
+    index = SimilarityIndex()
+    assert index.sync({1: "Send Q1 board deck", 2: "Book flights"}) == (2, 0)
+    assert index.sync({1: "Send Q1 board deck", 2: "Book flights"}) == (0, 0)
+
+    assert index.sync({1: "Send Q2 board deck", 3: "Renew Acme contract"}) == (2, 1)
+    assert len(index) == 2 and 2 not in index
+    assert index.title(1) == "Send Q2 board deck"
+    assert [key for key, _ in index.candidates("Book flights")] == []
+    assert [key for key, _ in index.candidates("Send Q2 board deck")] == [1]
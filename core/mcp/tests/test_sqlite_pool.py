@@ -0,0 +1,94 @@
+"""
+Tests for the read-only SQLite connection pool
+
+Run with: pytest core/mcp/tests/test_sqlite_pool.py -v
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.sqlite_pool import ReadOnlyPool
+
+
+def make_db(path, tables):
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    for table in tables:
+        conn.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.execute(f"INSERT INTO {table} (name) VALUES ('a')")
+    conn.commit()
+    conn.close()
+
+
+def test_connection_is_reused_and_read_only(tmp_path):
+    db = tmp_path / "sessions.db"
+    make_db(db, ['sessions'])
+    pool = ReadOnlyPool(db)
+
+    conn = pool.connection()
+    assert pool.connection() is conn
+    assert conn.execute("SELECT name FROM sessions").fetchone()["name"] == 'a'
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("INSERT INTO sessions (name) VALUES ('b')")
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+    assert pool.stats()['opened'] == 2
+    pool.close()
+
+
+def test_schema_probed_once_and_again_after_file_replaced(tmp_path):
+    db = tmp_path / "sessions.db"
+    make_db(db, ['sessions'])
+    pool = ReadOnlyPool(db)
+    assert not pool.has_table('observations')
+    assert pool.has_table('sessions')
+    assert pool.stats()['probes'] == 1
+
+    replacement = tmp_path / "new.db"
+    make_db(replacement, ['sessions', 'observations'])
+    os.replace(replacement, db)
+    for suffix in ('-wal', '-shm'):
+        Path(f"{db}{suffix}").unlink(missing_ok=True)
+
+    assert pool.has_table('observations')
+    stats = pool.stats()
+    assert stats['probes'] == 2 and stats['reopened'] == 1
+    pool.close()
+
+
+def test_schema_reprobed_after_migration_in_place(tmp_path):
+    db = tmp_path / "sessions.db"
+    make_db(db, ['sessions'])
+    pool = ReadOnlyPool(db)
+    assert not pool.has_table('observations')
+    assert not pool.has_table('observations')
+    assert pool.stats()['probes'] == 1
+
+    # The app adds a table to the live file: same inode, new schema_version
+    writer = sqlite3.connect(db)
+    writer.execute("CREATE TABLE observations (id INTEGER PRIMARY KEY)")
+    writer.commit()
+    writer.close()
+
+    assert pool.has_table('observations')
+    stats = pool.stats()
+    assert stats['probes'] == 2 and stats['reopened'] == 0
+    pool.close()
+
+
+def test_missing_database_raises_file_not_found(tmp_path):
+    pool = ReadOnlyPool(tmp_path / "absent.db", missing_message="start the app first")
+    with pytest.raises(FileNotFoundError, match="start the app first"):
+        pool.connection()
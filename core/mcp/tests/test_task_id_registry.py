@@ -0,0 +1,77 @@
+"""
+Tests for the task ID registry
+
+Run with: pytest core/mcp/tests/test_task_id_registry.py -v
+"""
+
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.task_id_registry import TaskIdRegistry
+
+
+DAY = datetime(2026, 2, 6)
+
+
+@pytest.fixture
+def vault(tmp_path):
+    (tmp_path / "03-Tasks").mkdir()
+    (tmp_path / "03-Tasks" / "Tasks.md").write_text(
+        "- [ ] Existing ^task-20260206-004\n- [ ] Older ^task-20260205-009\n"
+    )
+    return tmp_path
+
+
+class TestTaskIdRegistry:
+    """Test ID allocation."""
+
+    def test_seeds_from_vault(self, vault):
+        registry = TaskIdRegistry(vault)
+        assert registry.allocate(DAY) == "task-20260206-005"
+        assert registry.allocate(datetime(2026, 2, 5)) == "task-20260205-010"
+        assert registry.allocate(datetime(2026, 2, 7)) == "task-20260207-001"
+
+    def test_does_not_rescan_after_seed(self, vault):
+        registry = TaskIdRegistry(vault)
+        registry.allocate(DAY)
+        # A file the registry hasn't been told about is not rescanned
+        (vault / "Later.md").write_text("- [ ] Manual ^task-20260206-050\n")
+        assert registry.allocate(DAY) == "task-20260206-006"
+
+    def test_floor_and_observe(self, vault):
+        registry = TaskIdRegistry(vault)
+        assert registry.allocate(DAY, floor=20) == "task-20260206-021"
+        registry.observe(["task-20260206-030", "not-a-task"])
+        assert registry.allocate(DAY) == "task-20260206-031"
+
+    def test_persists_across_instances(self, vault):
+        TaskIdRegistry(vault).allocate(DAY)
+        assert TaskIdRegistry(vault).allocate(DAY) == "task-20260206-006"
+
+    def test_corrupt_state_reseeds(self, vault):
+        registry = TaskIdRegistry(vault)
+        registry.allocate(DAY)
+        registry.state_file.write_text("{not json")
+        assert registry.allocate(DAY) == "task-20260206-005"
+
+    def test_concurrent_allocations_are_unique(self, vault):
+        registry = TaskIdRegistry(vault)
+        ids = []
+
+        def worker():
+            for _ in range(20):
+                ids.append(registry.allocate(DAY))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(ids) == len(set(ids)) == 100
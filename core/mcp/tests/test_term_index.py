@@ -0,0 +1,75 @@
+"""
+Tests for the in-memory substring index used by company aggregation
+
+Run with: pytest core/mcp/tests/test_term_index.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.term_index import TermIndex
+
+DOCS = {
+    "a.md": "# Acme sync\n\nAttendees: jo@acme.com, sam@globex.io\n",
+    "b.md": "# Pipeline review\n\nAcmeCorp renewal and the Initech deal.\n",
+    "c.md": "# 1:1\n\nNothing about customers.\n",
+    "d.md": "# Partner call\n\nGlobex Corporation (globex.io) wants a demo.\n",
+}
+
+
+def brute_force(docs, term):
+    return {key for key, text in docs.items() if term.lower() in text.lower()}
+
+
+def test_search_matches_a_substring_scan():
+    index = TermIndex()
+    index.sync({key: (1, lambda text=text: text) for key, text in DOCS.items()})
+
+    terms = ["acme", "ACME.COM", "globex.io", "corp", "Globex Corporation", "me s", "1:1", "io",
+             "x", "", "initech deal.", "missing", "acmecorp renewal"]
+    for term in terms:
+        assert index.search(term) == brute_force(DOCS, term), term
+    assert index.text("a.md") == DOCS["a.md"].lower()
+
+    rng = random.Random(5)
+    corpus = "".join(DOCS.values())
+    for _ in range(200):
+        start = rng.randrange(len(corpus))
+        term = corpus[start:start + rng.randint(1, 12)]
+        assert index.search(term) == brute_force(DOCS, term), term
+
+
+def test_sync_reloads_only_changed_documents():
+    loads = []
+
+    def loader(text):
+        def load():
+            loads.append(text)
+            return text
+        return load
+
+    index = TermIndex()
+    assert index.sync({key: (1, loader(text)) for key, text in DOCS.items()}) == (4, 0)
+    assert index.search("globex") == {"a.md", "d.md"}
+
+    loads.clear()
+    docs = {key: (1, loader(text)) for key, text in DOCS.items() if key != "d.md"}
+    docs["a.md"] = (2, loader("# Acme sync\n\nRescheduled.\n"))
+    docs["e.md"] = (1, loader("Globex follow-up"))
+    assert index.sync(docs) == (2, 1)
+    assert sorted(loads) == ["# Acme sync\n\nRescheduled.\n", "Globex follow-up"]
+    assert len(index) == 4
+
+    # Cached answers are dropped when documents change
+    assert index.search("globex") == {"e.md"}
+    assert index.search("acme.com") == set()
+
+    def unreadable():
+        raise OSError("gone")
+    docs["e.md"] = (2, unreadable)
+    assert index.sync(docs) == (0, 0)
+    assert index.search("globex") == set() and len(index) == 3
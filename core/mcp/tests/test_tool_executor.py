@@ -0,0 +1,113 @@
+"""
+Tests for the off-loop tool executor
+
+Run with: pytest core/mcp/tests/test_tool_executor.py -v
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.tool_executor import ToolExecutor, check_cancelled
+
+
+@pytest.mark.asyncio
+async def test_blocking_handler_does_not_stall_event_loop():
+    executor = ToolExecutor()
+
+    async def slow_handler():
+        time.sleep(0.3)
+        return "done"
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    tick_task = asyncio.create_task(ticker())
+    assert await executor.run_handler("slow", slow_handler) == "done"
+    tick_task.cancel()
+    assert ticks >= 10
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_per_tool_limit_and_exclusive_tools():
+    executor = ToolExecutor(max_workers=4, limits={"limited": 1}, exclusive={"write"})
+    lock = threading.Lock()
+    running = {"limited": 0, "write": 0, "total": 0}
+    peaks = {"limited": 0, "write_overlap": 0}
+
+    def work(tool):
+        with lock:
+            running[tool] = running.get(tool, 0) + 1
+            running["total"] += 1
+            peaks["limited"] = max(peaks["limited"], running["limited"])
+            if running.get("write") and running["total"] > 1:
+                peaks["write_overlap"] += 1
+        time.sleep(0.05)
+        with lock:
+            running[tool] -= 1
+            running["total"] -= 1
+
+    calls = [executor.run(tool, work, tool) for tool in ["limited"] * 3 + ["read"] * 3 + ["write"] * 2]
+    await asyncio.gather(*calls)
+
+    assert peaks["limited"] == 1
+    assert peaks["write_overlap"] == 0
+    assert executor.stats()["completed"] == 8
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancellation_stops_worker_and_holds_slot_until_done():
+    executor = ToolExecutor(limits={"scan": 1})
+    stopped = threading.Event()
+
+    def scan():
+        try:
+            for _ in range(500):
+                check_cancelled()
+                time.sleep(0.01)
+        finally:
+            stopped.set()
+        return "finished"
+
+    task = asyncio.create_task(executor.run("scan", scan))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # The slot was released only after the worker returned
+    assert stopped.is_set()
+    assert executor.stats()["cancelled"] == 1
+    assert await executor.run("scan", lambda: "next") == "next"
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancellation_interrupts_async_handler():
+    executor = ToolExecutor()
+
+    async def waits_on_io():
+        await asyncio.sleep(30)
+
+    task = asyncio.create_task(executor.run_handler("io", waits_on_io))
+    await asyncio.sleep(0.05)
+    start = time.monotonic()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert time.monotonic() - start < 1
+    executor.shutdown()
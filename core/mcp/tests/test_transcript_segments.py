@@ -0,0 +1,61 @@
+"""
+Tests for the transcript segment index
+
+Run with: pytest core/mcp/tests/test_transcript_segments.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.transcript_segments import TranscriptSegments, format_offset
+
+
+def entry(minute, second, text, source='system'):
+    start = f"2026-01-05T09:{minute:02d}:{second:02d}.000Z"
+    end = f"2026-01-05T09:{minute:02d}:{second + 8:02d}.000Z"
+    return {'start_timestamp': start, 'end_timestamp': end, 'text': text, 'source': source}
+
+
+ENTRIES = [
+    entry(10, 0, 'Then we looked at hiring.'),
+    entry(0, 0, 'Hi everyone.', 'microphone'),
+    entry(5, 0, 'Pricing for the enterprise tier is too low.'),
+    entry(5, 10, 'Agreed, we should raise pricing.', 'microphone'),
+    entry(20, 0, 'Wrap up.'),
+]
+
+
+def test_orders_segments_with_offsets_and_speakers():
+    segments = TranscriptSegments(ENTRIES)
+    assert [s.start for s in segments.segments] == [0, 300, 310, 600, 1200]
+    assert [s.speaker for s in segments.segments] == ['me', 'them', 'me', 'them', 'them']
+    assert segments.text().startswith('Hi everyone. Pricing for')
+    assert segments.text_length == len(segments.text())
+    assert segments.duration == 1208
+    assert format_offset(3725) == '1:02:05'
+
+
+def test_window_includes_segment_running_at_start():
+    segments = TranscriptSegments(ENTRIES)
+    assert segments.window(300, 600) == [1, 2, 3]
+    assert segments.window(304, 400) == [1, 2]  # segment 1 runs 300-308
+    assert segments.window(1300) == []
+
+
+def test_search_merges_overlapping_context():
+    segments = TranscriptSegments(ENTRIES)
+    excerpts = segments.search('PRICING', context=1)
+    assert len(excerpts) == 1
+    assert excerpts[0]['matches'] == 2
+    assert [s['index'] for s in excerpts[0]['segments']] == [0, 1, 2, 3]
+    assert [s.get('match', False) for s in excerpts[0]['segments']] == [False, True, True, False]
+    assert segments.search('nothing here') == []
+
+
+def test_page():
+    segments = TranscriptSegments(ENTRIES)
+    assert segments.page(3, 10) == [3, 4]
+    assert segments.to_dicts(segments.page(0, 1))[0]['time'] == '00:00'
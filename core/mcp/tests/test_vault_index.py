@@ -0,0 +1,103 @@
+"""
+Tests for the built-in BM25 vault index
+
+Run with: pytest core/mcp/tests/test_vault_index.py -v
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils import qmd_query
+from core.utils.vault_index import VaultIndex, glob_regex, tokenize
+
+
+def make_vault(tmp_path):
+    (tmp_path / "System").mkdir()
+    files = {
+        "04-Projects/Retention_Plan.md": "# Customer Retention Plan\n\nReduce churn for enterprise accounts.\n",
+        "04-Projects/Launch.md": "# Launch\n\n## Retention risks\n\nSome customers may churn after launch.\n",
+        "00-Inbox/Meetings/2026-01-05 Sync.md": "# Weekly sync\n\nTalked about hiring, budget and retention once.\n"
+                                                + "Lots of unrelated words here. " * 20,
+        "03-Tasks/Tasks.md": "- [ ] Call Acme about renewal\n",
+        ".obsidian/cache.md": "retention retention retention\n",
+    }
+    for rel_path, text in files.items():
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return tmp_path
+
+
+def rel_paths(hits):
+    return [hit['rel_path'] for hit in hits]
+
+
+def test_ranks_by_bm25_with_title_and_heading_boosts(tmp_path):
+    index = VaultIndex(make_vault(tmp_path))
+
+    hits = index.search("customer retention", limit=10)
+    assert rel_paths(hits) == ["04-Projects/Retention_Plan.md", "04-Projects/Launch.md",
+                               "00-Inbox/Meetings/2026-01-05 Sync.md"]
+    assert 1 >= hits[0]['score'] > hits[1]['score'] > hits[2]['score'] > 0
+    assert hits[0]['title'] == "Customer Retention Plan"
+
+    assert rel_paths(index.search("retention", glob="04-Projects/**/*.md")) == \
+        ["04-Projects/Retention_Plan.md", "04-Projects/Launch.md"]
+    assert rel_paths(index.search("renewals")) == ["03-Tasks/Tasks.md"]
+    assert index.search("nonexistent zebra") == []
+    # A word no note contains doesn't lower the normalized scores
+    assert index.search("customer retention zebra") == hits
+
+    assert glob_regex("03-Tasks/**/*.md").match("03-Tasks/Tasks.md")
+    assert not glob_regex("*.md").match("03-Tasks/Tasks.md")
+    assert tokenize("The Companies' meetings") == ["company", "meeting"]
+
+
+def test_incremental_updates_and_persistence(tmp_path):
+    vault = make_vault(tmp_path)
+    index = VaultIndex(vault, refresh_interval=0)
+    assert index.refresh()['added'] == 4  # hidden folders are skipped
+    assert index.status()['documents'] == 4
+
+    tasks = vault / "03-Tasks/Tasks.md"
+    tasks.write_text("- [ ] Draft retention survey\n")
+    os.utime(tasks, ns=(1, 1))
+    (vault / "04-Projects/Launch.md").unlink()
+    (vault / "04-Projects/Pricing.md").write_text("# Pricing\n")
+    assert index.refresh() == {'added': 1, 'updated': 1, 'removed': 1}
+    assert "03-Tasks/Tasks.md" in rel_paths(index.search("retention"))
+    assert index.search("renewal") == []
+
+    # A new process loads the saved file and only re-reads what changed since
+    reloaded = VaultIndex(vault, refresh_interval=0)
+    assert reloaded.refresh() == {'added': 0, 'updated': 0, 'removed': 0}
+    assert rel_paths(reloaded.search("retention")) == rel_paths(index.search("retention"))
+    assert reloaded.status()['tombstones'] == 2  # saved as is, compacted only past COMPACT_RATIO
+    assert reloaded.status()['documents'] == 4
+
+    (vault / "System/.dex-vault-search.idx").write_bytes(b"garbage")
+    rebuilt = VaultIndex(vault)
+    assert rel_paths(rebuilt.search("retention")) == rel_paths(index.search("retention"))
+
+
+def test_vault_search_uses_index_when_qmd_missing(tmp_path, monkeypatch):
+    vault = make_vault(tmp_path)
+    monkeypatch.setenv("VAULT_PATH", str(vault))
+    monkeypatch.setattr(qmd_query, "_qmd_available", False)
+    monkeypatch.setattr(qmd_query, "_vault_indexes", {})
+
+    results = qmd_query.vault_search("customer retention", limit=2, fallback_glob="04-Projects/**/*.md")
+    assert [r["source"] for r in results] == ["index", "index"]
+    assert results[0]["path"] == str(vault / "04-Projects/Retention_Plan.md")
+    assert "Retention" in results[0]["snippet"]
+
+    # Index hits all below min_score: grep gets a chance instead of returning nothing
+    strict = qmd_query.vault_search("customer retention", limit=2, min_score=1.01)
+    assert strict and {r["source"] for r in strict} == {"grep"}
+
+    # Substrings the index's whole words don't cover still come from grep
+    assert [r["source"] for r in qmd_query.vault_search("retent", limit=2)] == ["grep", "grep"]
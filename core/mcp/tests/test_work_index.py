@@ -0,0 +1,191 @@
+"""
+Tests for the persistent work index
+
+Run with: pytest core/mcp/tests/test_work_index.py -v
+"""
+
+import os
+import sys
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+# Add vault root to path for core.utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from core.utils.work_index import WorkIndex
+
+
+def count_lines_parser(calls):
+    """Parser that records how often it runs."""
+    def parse(path: Path):
+        calls.append(path)
+        return [
+            {"n": i + 1, "text": line, "id": f"line-{i + 1}"}
+            for i, line in enumerate(path.read_text().split("\n"))
+            if line.strip()
+        ]
+    return parse
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = WorkIndex(tmp_path / "index.db")
+    yield idx
+    idx.close()
+
+
+@pytest.fixture
+def tasks_file(tmp_path):
+    path = tmp_path / "Tasks.md"
+    path.write_text("- [ ] First\n- [ ] Second\n")
+    return path
+
+
+class TestWorkIndexRefresh:
+    """Test incremental refresh behavior."""
+
+    def test_parses_once_while_unchanged(self, index, tasks_file):
+        calls = []
+        parser = count_lines_parser(calls)
+        first = index.records("tasks", tasks_file, parser, id_field="id")
+        second = index.records("tasks", tasks_file, parser, id_field="id")
+        assert first == second
+        assert len(first) == 2
+        assert len(calls) == 1
+
+    def test_returns_fresh_copies(self, index, tasks_file):
+        parser = count_lines_parser([])
+        records = index.records("tasks", tasks_file, parser)
+        records[0]["text"] = "mutated"
+        assert index.records("tasks", tasks_file, parser)[0]["text"] == "- [ ] First"
+
+    def test_reparses_after_edit(self, index, tasks_file):
+        calls = []
+        parser = count_lines_parser(calls)
+        index.records("tasks", tasks_file, parser)
+        tasks_file.write_text("- [ ] First\n- [ ] Second\n- [ ] Third\n")
+        records = index.records("tasks", tasks_file, parser)
+        assert len(records) == 3
+        assert len(calls) == 2
+
+    def test_touch_without_edit_skips_reparse(self, index, tasks_file):
+        calls = []
+        parser = count_lines_parser(calls)
+        index.records("tasks", tasks_file, parser)
+        st = tasks_file.stat()
+        os.utime(tasks_file, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        index.records("tasks", tasks_file, parser)
+        assert len(calls) == 1
+        assert index.stats["rehashed"] == 1
+
+    def test_parser_key_change_forces_reparse(self, index, tasks_file):
+        calls = []
+        parser = count_lines_parser(calls)
+        index.records("tasks", tasks_file, parser, parser_key="a")
+        index.records("tasks", tasks_file, parser, parser_key="b")
+        assert len(calls) == 2
+
+    def test_survives_restart(self, tmp_path, tasks_file):
+        calls = []
+        parser = count_lines_parser(calls)
+        first = WorkIndex(tmp_path / "index.db")
+        first.records("tasks", tasks_file, parser)
+        first.close()
+
+        second = WorkIndex(tmp_path / "index.db")
+        assert len(second.records("tasks", tasks_file, parser)) == 2
+        assert len(calls) == 1
+        second.close()
+
+    def test_missing_file_returns_empty(self, index, tmp_path):
+        assert index.records("tasks", tmp_path / "nope.md", count_lines_parser([])) == []
+
+
+class TestWorkIndexDrift:
+    """Test drift detection and rebuilds."""
+
+    def test_row_count_mismatch_triggers_rebuild(self, tmp_path, tasks_file):
+        calls = []
+        parser = count_lines_parser(calls)
+        idx = WorkIndex(tmp_path / "index.db")
+        idx.records("tasks", tasks_file, parser)
+        idx.close()
+
+        conn = sqlite3.connect(tmp_path / "index.db")
+        conn.execute("DELETE FROM records WHERE seq = 0")
+        conn.commit()
+        conn.close()
+
+        idx = WorkIndex(tmp_path / "index.db")
+        assert len(idx.records("tasks", tasks_file, parser)) == 2
+        assert idx.stats["rebuilds"] == 1
+        assert len(calls) == 2
+        idx.close()
+
+    def test_corrupt_database_is_replaced(self, tmp_path, tasks_file):
+        (tmp_path / "index.db").write_bytes(b"not a database" * 100)
+        idx = WorkIndex(tmp_path / "index.db")
+        assert len(idx.records("tasks", tasks_file, count_lines_parser([]))) == 2
+        idx.close()
+
+
+class TestWorkIndexFind:
+    """Test ID lookups."""
+
+    def test_find_by_record_id(self, index, tasks_file):
+        index.refresh("tasks", tasks_file, count_lines_parser([]), id_field="id")
+        hits = index.find("tasks", "line-2")
+        assert len(hits) == 1
+        assert hits[0]["text"] == "- [ ] Second"
+
+    def test_find_scoped_to_path(self, index, tasks_file, tmp_path):
+        other = tmp_path / "Other.md"
+        other.write_text("- [ ] Elsewhere\n- [ ] Again\n")
+        parser = count_lines_parser([])
+        index.refresh("tasks", tasks_file, parser, id_field="id")
+        index.refresh("tasks", other, parser, id_field="id")
+        assert len(index.find("tasks", "line-1")) == 2
+        assert index.find("tasks", "line-1", path=other)[0]["text"] == "- [ ] Elsewhere"
+
+    def test_changed_lists_new_and_modified_files(self, index, tasks_file, tmp_path):
+        other = tmp_path / "Other.md"
+        other.write_text("- [ ] Elsewhere\n")
+        index.refresh("tasks", tasks_file, count_lines_parser([]), id_field="id")
+
+        def stats():
+            return {str(p): (p.stat().st_mtime_ns, p.stat().st_size) for p in (tasks_file, other)}
+
+        assert index.changed("tasks", stats()) == [str(other)]
+        index.refresh("tasks", other, count_lines_parser([]), id_field="id")
+        assert index.changed("tasks", stats()) == []
+        os.utime(tasks_file, ns=(1, 1))
+        assert index.changed("tasks", stats()) == [str(tasks_file)]
+        assert index.changed("links", stats()) == [str(tasks_file), str(other)]
+
+    def test_invalidate_forces_reparse(self, index, tasks_file):
+        calls = []
+        parser = count_lines_parser(calls)
+        index.refresh("tasks", tasks_file, parser, id_field="id")
+        index.invalidate("tasks", tasks_file)
+        assert index.find("tasks", "line-1") == []
+        index.refresh("tasks", tasks_file, parser, id_field="id")
+        assert len(calls) == 2
+
+
+def test_batch_commits_once(index, tmp_path):
+    files = []
+    for i in range(3):
+        path = tmp_path / f"notes-{i}.md"
+        path.write_text(f"- [ ] Item {i}\n")
+        files.append(path)
+
+    with index.batch():
+        for path in files:
+            index.refresh("tasks", path, count_lines_parser([]), id_field="id")
+        # Nothing is visible to another connection until the batch ends
+        other = sqlite3.connect(str(index.db_path))
+        assert other.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 0
+    assert other.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 3
+    other.close()
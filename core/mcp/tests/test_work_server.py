@@ -0,0 +1,482 @@
+"""
+Tests for Work MCP Server task, dedup, reference and company helpers
+
+Run with: pytest core/mcp/tests/test_work_server.py -v
+"""
+
+import asyncio
+import importlib
+import json
+import os
+import random
+import sys
+import threading
+from difflib import SequenceMatcher
+from pathlib import Path
+
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture
+def ws(tmp_path, monkeypatch):
+    """work_server imported fresh against an empty temporary vault."""
+    monkeypatch.setenv('VAULT_PATH', str(tmp_path))
+    (tmp_path / 'System').mkdir()
+    (tmp_path / '03-Tasks').mkdir()
+    sys.modules.pop('work_server', None)
+    module = importlib.import_module('work_server')
+    yield module
+    if module._work_index is not None:
+        module._work_index.close()
+    sys.modules.pop('work_server', None)
+
+
+def call_tool(ws, name, arguments):
+    """Run one tool through the server's handler and decode its JSON result."""
+    return json.loads(asyncio.run(ws._handle_call_tool_inner(name, arguments))[0].text)
+
+
+class TestCreateTasks:
+    """Bulk task creation and its shared helpers."""
+
+    def test_ids_are_consecutive_and_continue_after_existing_tasks(self, ws):
+        today = ws.datetime.now().strftime('%Y%m%d')
+        ws.TASKS_FILE.write_text(f"# Tasks\n\n- [ ] Existing task ^task-{today}-004\n")
+
+        ids = ws.generate_task_ids(3)
+        assert ids == [f"task-{today}-{n:03d}" for n in (5, 6, 7)]
+        assert ws.generate_task_ids(2) == [f"task-{today}-008", f"task-{today}-009"]
+
+    def test_registry_failure_is_retried_then_raised_not_guessed(self, ws, monkeypatch):
+        today = ws.datetime.now().strftime('%Y%m%d')
+        assert ws.generate_task_ids(2) == [f"task-{today}-001", f"task-{today}-002"]
+        allocate_many = ws._task_id_registry.allocate_many
+        failures = []
+
+        def flaky(count, date=None, floor=0):
+            if len(failures) < 1:
+                failures.append(count)
+                raise OSError("lock busy")
+            return allocate_many(count, date, floor=floor)
+
+        # 001-002 were never written anywhere, so a vault scan would reissue them
+        monkeypatch.setattr(ws._task_id_registry, 'allocate_many', flaky)
+        assert ws.generate_task_ids(1) == [f"task-{today}-003"]
+
+        def broken(count, date=None, floor=0):
+            raise OSError("read-only file system")
+
+        monkeypatch.setattr(ws._task_id_registry, 'allocate_many', broken)
+        with pytest.raises(OSError):
+            ws.generate_task_ids(1)
+
+    def test_batch_of_invalid_items_is_rejected_without_writing(self, ws):
+        result = call_tool(ws, 'create_tasks', {'tasks': [
+            {'title': 'Draft the Q3 pricing proposal for Acme', 'pillar': 'not_a_pillar'},
+            {'title': 'Send renewal terms to Globex procurement', 'pillar': 'pillar_1', 'priority': 'P9'},
+        ]})
+
+        assert result['success'] is False
+        assert result['summary'] == {'requested': 2, 'created': 0, 'rejected': 2}
+        assert [r['error'].split(' ')[1] for r in result['results']] == ['pillar', 'priority']
+        assert not ws.TASKS_FILE.exists()
+        assert ws.validate_task_fields('Draft the Q3 pricing proposal for Acme', 'pillar_1', 'P2') is None
+
+    def test_entries_go_under_an_existing_section_in_one_write(self, ws):
+        ws.TASKS_FILE.write_text(
+            "# Tasks\n\n## Next Week\n- [ ] Existing task\n\n## Later\n"
+            "- [ ] Mentions ## Next Week in its title\n"
+        )
+
+        result = call_tool(ws, 'create_tasks', {'tasks': [
+            {'title': 'Draft the Q3 pricing proposal for Acme', 'pillar': 'pillar_1'},
+            {'title': 'Send renewal terms to Globex procurement', 'pillar': 'pillar_2', 'priority': 'P1',
+             'context': 'Include the multi-year discount'},
+            {'title': 'Draft the Q3 pricing proposal for Acme', 'pillar': 'pillar_1'},
+        ]})
+
+        assert result['summary'] == {'requested': 3, 'created': 2, 'rejected': 1}
+        assert result['results'][2]['error'] == "Potential duplicate of another task in this batch"
+        first, second = (r['task']['task_id'] for r in result['results'][:2])
+        assert int(second[-3:]) == int(first[-3:]) + 1
+
+        assert ws.TASKS_FILE.read_text() == (
+            "# Tasks\n\n## Next Week\n"
+            f"- [ ] **Draft the Q3 pricing proposal for Acme** ^{first}\n"
+            "\t- Pillar: Pillar 1 | Priority: P2\n"
+            f"- [ ] **Send renewal terms to Globex procurement** ^{second}\n"
+            "\t- Include the multi-year discount\n"
+            "\t- Pillar: Pillar 2 | Priority: P1\n"
+            "\n- [ ] Existing task\n\n## Later\n"
+            "- [ ] Mentions ## Next Week in its title\n"
+        )
+
+
+def synthetic_tasks(count, seed=3):
+    """Open tasks with overlapping vocabulary, so near-duplicates exist."""
+    rng = random.Random(seed)
+    verbs = ['Send', 'Review', 'Draft', 'Schedule', 'Follow up on', 'Prepare']
+    objects = ['Q1 board deck', 'pricing proposal', 'renewal terms', 'hiring plan', 'launch checklist',
+               'security review', 'partner contract', 'churn analysis', 'roadmap update', 'budget forecast']
+    people = ['Acme', 'Globex', 'Initech', 'Sarah', 'the sales team', 'finance', 'legal']
+    return [
+        {'title': f"{rng.choice(verbs)} {rng.choice(objects)} for {rng.choice(people)}",
+         'section': rng.choice(['This Week', 'Next Week']), 'source_file': 'Tasks.md',
+         'completed': rng.random() < 0.1}
+        for _ in range(count)
+    ]
+
+
+class TestFindSimilarTasks:
+    """Dedup through the trigram candidate index."""
+
+    QUERIES = ['Send Q1 board deck to Acme', 'Review the pricing proposal for Globex',
+               'Prepare hiring plan', 'Book flights for the offsite', 'Follow up on renewal terms with legal']
+
+    def brute_force(self, ws, item, tasks):
+        """Score every open task with the full ratio, as dedup did before the index."""
+        item_keywords = ws.extract_keywords(item)
+        similar = []
+        for task in tasks:
+            if task.get('completed'):
+                continue
+            task_keywords = ws.extract_keywords(task['title'])
+            overlap = (len(item_keywords & task_keywords) / len(item_keywords | task_keywords)
+                       if item_keywords and task_keywords else 0)
+            score = SequenceMatcher(None, item.lower(), task['title'].lower()).ratio() * 0.6 + overlap * 0.25
+            if score >= ws.DEDUP_CONFIG['similarity_threshold']:
+                similar.append((task['title'], round(score, 2)))
+        similar.sort(key=lambda x: x[1], reverse=True)
+        return similar[:3]
+
+    def test_indexed_path_matches_full_scan(self, ws, monkeypatch):
+        tasks = synthetic_tasks(400)
+        assert len([t for t in tasks if not t['completed']]) >= ws.DEDUP_CONFIG['index_min_tasks']
+
+        found = 0
+        for item in self.QUERIES:
+            indexed = ws.find_similar_tasks(item, tasks, use_qmd=False)
+            with monkeypatch.context() as m:
+                m.setitem(ws.DEDUP_CONFIG, 'index_min_tasks', 10 ** 9)
+                full = ws.find_similar_tasks(item, tasks, use_qmd=False)
+            assert indexed == full
+            assert [(t['title'], t['similarity_score']) for t in indexed] == self.brute_force(ws, item, tasks)
+            found += len(indexed)
+        assert found  # the queries do hit near-duplicates
+
+        # Later calls reuse the synced index without comparing the task list, and
+        # resync once it grows (batch dedup appends to the list it passes)
+        syncs = []
+        real_sync = ws._similarity_index.sync
+        monkeypatch.setattr(ws._similarity_index, 'sync', lambda docs: syncs.append(len(docs)) or real_sync(docs))
+        ws.find_similar_tasks(self.QUERIES[0], tasks, use_qmd=False)
+        assert syncs == []
+        tasks.append({'title': 'Book flights for the team offsite', 'section': 'This Week', 'source_file': 'Tasks.md'})
+        assert [t['title'] for t in ws.find_similar_tasks('Book flights for the offsite', tasks, use_qmd=False)] == \
+            ['Book flights for the team offsite']
+        assert len(syncs) == 1
+
+    def test_candidates_keep_task_order_and_skip_unrelated_titles(self, ws):
+        tasks = synthetic_tasks(250) + [{'title': 'Book flights for offsite', 'section': 'Next Week'}]
+        candidates = ws._dedup_candidates('Book flights for the offsite', tasks, set())
+        assert candidates == [tasks[-1]]
+
+        candidates = ws._dedup_candidates('Send Q1 board deck for Acme', tasks, set())
+        assert candidates and len(candidates) < len(tasks)
+        assert candidates == sorted(candidates, key=lambda t: next(i for i, x in enumerate(tasks) if x is t))
+
+
+def write_task_ref_vault(ws):
+    """Tasks.md referencing a few people and company pages, plus those pages."""
+    (ws.BASE_DIR / 'People' / 'External').mkdir(parents=True)
+    ws.COMPANIES_DIR.mkdir(parents=True)
+    pages = {
+        'People/External/Sarah_Chen.md': "# Sarah Chen\n\n## Notes\n",
+        'People/External/Tom_Ford.md': "# Tom Ford\n\n## Notes\n",
+        'People/External/Ann_Lee.md': "# Ann Lee\n\n## Related Tasks\n*Synced from 03-Tasks/Tasks.md — old*\n\n"
+                                      "| Status | Task | Priority |\n|--------|------|----------|\n"
+                                      "| ⏳ | Stale task | P2 |\n",
+        'Active/Relationships/Companies/Acme.md': "# Acme\n\n## Overview\n",
+    }
+    for rel_path, text in pages.items():
+        (ws.BASE_DIR / rel_path).write_text(text)
+    ws.TASKS_FILE.write_text(
+        "# Tasks\n\n## This Week\n"
+        "- [ ] **Send deck to Sarah** | People/External/Sarah_Chen.md Active/Relationships/Companies/Acme.md ^task-20260101-001\n"
+        "- [x] **Intro Tom to acme legal** | People/External/Tom_Ford.md ^task-20260101-002\n"
+        "\n## Next Week\n"
+        "- [ ] **Plan offsite** ^task-20260101-003\n"
+        "- [ ] Ask sarah_chen about renewal\n"
+    )
+    return pages
+
+
+class TestTaskRefGraph:
+    """Reverse task reference graph and Related Tasks sync."""
+
+    def full_scan(self, ws, page_path):
+        """Every task line mentioning the page name, read straight from Tasks.md."""
+        stem = Path(page_path).stem.lower()
+        return [
+            (entry['title'], entry['completed'], entry['priority'], entry['section'], entry['line_number'])
+            for entry in ws.parse_task_ref_entries(ws.TASKS_FILE)
+            if stem in entry['line_lower']
+        ]
+
+    def test_graph_matches_a_full_scan_and_follows_file_changes(self, ws):
+        pages = write_task_ref_vault(ws)
+
+        for page_path in list(pages) + ['People/Nobody.md']:
+            found = [(t['title'], t['completed'], t['priority'], t['section'], t['line_number'])
+                     for t in ws.find_tasks_for_page(page_path)]
+            assert found == self.full_scan(ws, page_path)
+        assert [t['title'] for t in ws.find_tasks_for_page('People/External/Sarah_Chen.md')] == \
+            ['Send deck to Sarah', 'Ask sarah_chen about renewal']
+        assert [t['title'] for t in ws.find_tasks_for_page('Acme')] == ['Send deck to Sarah', 'Intro Tom to acme legal']
+
+        graph = ws.get_task_ref_graph()
+        assert ws.get_task_ref_graph() is graph
+
+        with ws.TASKS_FILE.open('a') as f:
+            f.write("- [ ] Renew Acme contract\n")
+        assert ws.get_task_ref_graph() is not graph
+        assert [t['title'] for t in ws.find_tasks_for_page('Acme')] == \
+            ['Send deck to Sarah', 'Intro Tom to acme legal', 'Renew Acme contract']
+        assert len(ws.find_tasks_for_page('Acme')) == len(self.full_scan(ws, 'Acme'))
+
+    def test_sync_all_only_rewrites_pages_whose_table_changed(self, ws):
+        write_task_ref_vault(ws)
+        first = ws.sync_all_task_refs()
+        assert first['updated_pages'] == ['Active/Relationships/Companies/Acme.md', 'People/External/Ann_Lee.md',
+                                          'People/External/Sarah_Chen.md', 'People/External/Tom_Ford.md']
+        assert "*No related tasks*" in (ws.BASE_DIR / 'People/External/Ann_Lee.md').read_text()
+        acme = (ws.BASE_DIR / 'Active/Relationships/Companies/Acme.md').read_text()
+        assert "| ⏳ | Send deck to Sarah | P2 |" in acme and "| ✅ | Intro Tom to acme legal | P2 |" in acme
+
+        # Nothing changed: no page is written, so none of them gets a new mtime
+        for page in first['updated_pages']:
+            os.utime(ws.BASE_DIR / page, ns=(1, 1))
+        second = ws.sync_all_task_refs()
+        assert second['updated_pages'] == [] and second['unchanged_count'] == 4
+        assert all((ws.BASE_DIR / page).stat().st_mtime_ns == 1 for page in first['updated_pages'])
+
+        ws.TASKS_FILE.write_text(ws.TASKS_FILE.read_text().replace('- [ ] **Send deck', '- [x] **Send deck'))
+        third = ws.sync_all_task_refs()
+        assert third['updated_pages'] == ['Active/Relationships/Companies/Acme.md', 'People/External/Sarah_Chen.md']
+        assert ws.update_related_tasks_section('People/External/Tom_Ford.md',
+                                               ws.find_tasks_for_page('People/External/Tom_Ford.md'),
+                                               only_if_changed=True) is False
+
+
+def write_company_vault(ws):
+    """Two companies, their people, and meeting notes that mention them."""
+    people_dir = ws.BASE_DIR / 'People' / 'External'
+    people_dir.mkdir(parents=True)
+    ws.COMPANIES_DIR.mkdir(parents=True)
+    ws.MEETINGS_DIR.mkdir(parents=True)
+    people = {
+        'Sarah_Chen': ('Acme', 'VP Sales'),
+        'Tom_Ford': ('Acme Corp', 'CTO'),
+        'Ann_Lee': ('Globex', 'Buyer'),
+    }
+    for stem, (company, role) in people.items():
+        (people_dir / f"{stem}.md").write_text(
+            f"# {stem}\n\n| Field | Value |\n|---|---|\n| **Company** | {company} |\n| **Role** | {role} |\n"
+        )
+    for name, domain in (('Acme', 'acme.com'), ('Globex', 'globex.io')):
+        ws.create_company_page(name, domains=[domain])
+    meetings = {
+        '2026-01-05 - Acme kickoff.md': "# Acme kickoff\n\nAttendees: jo@acme.com\n",
+        '2026-01-09 - Pipeline review.md': "# Pipeline review\n\nRenewal with ACME next month.\n",
+        '2026-01-07 - Partner call.md': "# Partner call\n\nsam@globex.io wants a demo.\n",
+        '2026-01-08 - 1-1.md': "# 1:1\n\nNothing about customers.\n",
+    }
+    for filename, text in meetings.items():
+        (ws.MEETINGS_DIR / filename).write_text(text)
+    ws.TASKS_FILE.write_text("# Tasks\n\n- [ ] **Send Acme the renewal quote** | Active/Relationships/Companies/Acme.md\n")
+
+
+class TestCompanyAggregation:
+    """Company pages built from one scan of people and meeting notes."""
+
+    def test_refresh_all_companies_matches_direct_scans(self, ws, monkeypatch):
+        write_company_vault(ws)
+
+        people = ws.load_person_pages()
+        groups = ws.build_company_people_index(people)
+        assert sorted(groups) == [('Acme', ''), ('Acme Corp', ''), ('Globex', '')]
+        assert sorted(p['name'] for p in ws.find_people_at_company('Acme', people, groups)) == ['Sarah Chen', 'Tom Ford']
+
+        index = ws.sync_meeting_index()
+        assert len(index) == 4
+        indexed = ws.find_meetings_for_company('Acme', ['acme.com'], index)
+        assert [m['title'] for m in indexed] == ['Pipeline review', 'Acme kickoff']
+        with monkeypatch.context() as m:
+            m.setattr(ws, '_meeting_index', None)
+            assert ws.find_meetings_for_company('Acme', ['acme.com']) == indexed
+
+        result = ws.refresh_all_companies()
+        assert result['success'] and result['failed'] == []
+        assert result['refreshed'] == [
+            {'company': 'Acme', 'contacts_found': 2, 'meetings_found': 2, 'tasks_found': 1},
+            {'company': 'Globex', 'contacts_found': 1, 'meetings_found': 1, 'tasks_found': 0},
+        ]
+        acme = (ws.COMPANIES_DIR / 'Acme.md').read_text()
+        assert "Sarah Chen" in acme and "| 2026-01-09 | Pipeline review |" in acme
+        assert "Send Acme the renewal quote" in acme
+
+    def test_exported_meeting_notes_count_for_companies(self, ws, monkeypatch):
+        from core.utils.meeting_export import ExportItem, MeetingExporter
+
+        sys.modules.pop('granola_server', None)
+        granola_server = importlib.import_module('granola_server')
+        granola_server._meeting_store.close()
+        sys.modules.pop('granola_server', None)
+
+        write_company_vault(ws)
+        (ws.MEETINGS_DIR / 'README.md').write_text("# Meetings\n\nNotes about Acme and Globex live here.\n")
+        info = {'id': 'm1', 'title': 'Q1 renewal', 'notes': 'Pricing and seats.',
+                'participants': [{'name': 'Ann Lee', 'email': 'ann@globex.io'}]}
+        summary = MeetingExporter(ws.BASE_DIR).export([ExportItem(
+            id='m1', version='v1', date='2026-01-12', title='Q1 renewal',
+            render=lambda: granola_server.render_meeting_note(info, ws.datetime(2026, 1, 12, 10, 0)),
+        )])
+        assert summary['written'] == 1
+        assert (ws.MEETINGS_DIR / '2026-01-12' / 'q1-renewal.md').read_text().startswith('---\n')
+
+        # Notes the meeting-intel sync still writes to Inbox/Meetings count too
+        ws.LEGACY_MEETINGS_DIR.mkdir(parents=True)
+        (ws.LEGACY_MEETINGS_DIR / '2026-01-03 - Globex intro.md').write_text("# Globex intro\n\nFirst call.\n")
+        (ws.LEGACY_MEETINGS_DIR / 'queue.md').write_text("# Queue\n\n- Globex intro\n")
+
+        expected = [('2026-01-12', 'Q1 renewal'), ('2026-01-07', 'Partner call'), ('2026-01-03', 'Globex intro')]
+        assert [(m['date'], m['title']) for m in ws.find_meetings_for_company('Globex', ['globex.io'])] == expected
+        globex = next(r for r in ws.refresh_all_companies()['refreshed'] if r['company'] == 'Globex')
+        assert globex['meetings_found'] == 3
+        assert "| 2026-01-12 | Q1 renewal |" in (ws.COMPANIES_DIR / 'Globex.md').read_text()
+
+        # The direct scan used without the term index agrees
+        monkeypatch.setattr(ws, '_meeting_index', None)
+        assert [(m['date'], m['title']) for m in ws.find_meetings_for_company('Globex', ['globex.io'])] == expected
+
+    def test_person_pages_are_parsed_once_per_change(self, ws, monkeypatch):
+        write_company_vault(ws)
+        parsed = []
+        real_parse = ws.parse_person_page
+        monkeypatch.setattr(ws, 'parse_person_page', lambda f: parsed.append(f.stem) or real_parse(f))
+
+        assert len(ws.load_person_pages()) == 3 and len(parsed) == 3
+        ws.load_person_pages()
+        assert ws.load_person_page(ws.BASE_DIR / 'People/External/Ann_Lee.md')['company'] == 'Globex'
+        assert len(parsed) == 3
+
+        ann = ws.BASE_DIR / 'People/External/Ann_Lee.md'
+        ann.write_text(ann.read_text().replace('Globex', 'Initech'))
+        os.utime(ann, ns=(1, 1))
+        assert ws.load_person_page(ann)['company'] == 'Initech'
+        assert sorted(parsed[:3]) == ['Ann_Lee', 'Sarah_Chen', 'Tom_Ford'] and parsed[3:] == ['Ann_Lee']
+
+    def test_meeting_index_picks_up_new_and_changed_notes(self, ws):
+        write_company_vault(ws)
+        index = ws.sync_meeting_index()
+        assert ws.find_meetings_for_company('Globex', ['globex.io'], index)[0]['title'] == 'Partner call'
+
+        (ws.MEETINGS_DIR / '2026-01-07 - Partner call.md').unlink()
+        (ws.MEETINGS_DIR / '2026-01-10 - Globex QBR.md').write_text("# Globex QBR\n")
+        one_on_one = ws.MEETINGS_DIR / '2026-01-08 - 1-1.md'
+        one_on_one.write_text("# 1:1\n\nGlobex asked for a discount.\n")
+        os.utime(one_on_one, ns=(1, 1))
+
+        index = ws.sync_meeting_index()
+        assert [m['title'] for m in ws.find_meetings_for_company('Globex', ['globex.io'], index)] == \
+            ['Globex QBR', '1:1']
+
+
+class TestRefreshConfig:
+    """PILLARS and PRIORITY_LIMITS follow edits to pillars.yaml without a restart."""
+
+    def test_reloads_after_pillars_yaml_changes(self, ws, monkeypatch):
+        assert ws.PILLARS is ws.DEFAULT_PILLARS
+        pillars_file = ws.BASE_DIR / 'System' / 'pillars.yaml'
+        pillars_file.write_text(
+            "pillars:\n  - id: revenue\n    name: Revenue\npriority_limits:\n  P0: 1\n"
+        )
+        os.utime(pillars_file, ns=(1_000, 1_000))
+        ws.refresh_config()
+        assert list(ws.PILLARS) == ['revenue']
+        assert ws.PRIORITY_LIMITS == {'P0': 1, 'P1': 5, 'P2': 10}
+
+        # Unchanged file: no reload
+        loads = []
+        monkeypatch.setattr(ws, 'load_pillars_from_yaml', lambda: loads.append(1) or {})
+        ws.refresh_config()
+        assert loads == [] and list(ws.PILLARS) == ['revenue']
+        monkeypatch.undo()
+
+        pillars_file.write_text("pillars:\n  - id: product\n    name: Product\n")
+        os.utime(pillars_file, ns=(2_000, 2_000))
+        # Every tool call re-checks the file first
+        asyncio.run(ws.handle_call_tool('get_system_status', {}))
+        assert list(ws.PILLARS) == ['product'] and ws.PRIORITY_LIMITS == ws.DEFAULT_PRIORITY_LIMITS
+
+        pillars_file.unlink()
+        ws.refresh_config()
+        assert ws.PILLARS is ws.DEFAULT_PILLARS
+
+    def test_quarter_info_reads_the_cached_profile(self, ws):
+        from core.utils.config_snapshot import cache_stats
+
+        ws.USER_PROFILE_FILE.write_text("quarterly_planning:\n  q1_start_month: 4\n")
+        before = cache_stats()
+        assert ws.get_quarter_info(ws.date(2026, 5, 10))['quarter_num'] == 1
+        assert ws.get_quarter_info(ws.date(2026, 3, 10))['quarter_num'] == 4
+        after = cache_stats()
+        assert after['loads'] - before['loads'] == 1 and after['hits'] > before['hits']
+
+
+class TestFindTaskById:
+    """Task location index lookups."""
+
+    def test_unknown_ids_force_at_most_one_sweep_per_interval(self, ws, monkeypatch):
+        ws.TASKS_FILE.write_text("- [ ] Ship pricing page ^task-20260101-001\n")
+        assert [t['title'] for t in ws.find_task_by_id('task-20260101-001')] == ['Ship pricing page']
+
+        # The first lookup just swept, so misses right after it don't sweep again
+        ran = []
+        real_sweep = ws._sweep_task_locations
+        monkeypatch.setattr(ws, '_sweep_task_locations', lambda force=False: ran.append(real_sweep(force)) or ran[-1])
+        for _ in range(5):
+            assert ws.find_task_by_id('task-20991231-999') == []
+        assert len(ran) == 10 and not any(ran)
+
+        # A task written to a new file is still found once the forced interval has passed
+        (ws.BASE_DIR / 'Notes.md').write_text("- [ ] Call Acme ^task-20260101-002\n")
+        monkeypatch.setattr(ws, '_last_task_location_sweep', 0.0)
+        assert [t['title'] for t in ws.find_task_by_id('task-20260101-002')] == ['Call Acme']
+
+    def test_large_first_sweep_runs_in_the_background(self, ws, monkeypatch):
+        monkeypatch.setattr(ws, 'TASK_LOCATION_INLINE_FILES', 2)
+        monkeypatch.setattr(ws, 'TASK_LOCATION_SWEEP_CHUNK', 2)
+        for n in range(1, 6):
+            (ws.BASE_DIR / f'Notes-{n}.md').write_text(f"- [ ] Task {n} ^task-20260101-00{n}\n")
+        scanned = []
+        real_scan = ws._scan_task_by_id
+        monkeypatch.setattr(ws, '_scan_task_by_id', lambda task_id: scanned.append(task_id) or real_scan(task_id))
+        release = threading.Event()
+        real_index = ws._index_task_files
+        monkeypatch.setattr(ws, '_index_task_files', lambda files: release.wait(5) and real_index(files))
+
+        # Answered by a scan while the index is built off the request path
+        assert [t['title'] for t in ws.find_task_by_id('task-20260101-003')] == ['Task 3']
+        assert ws.task_location_sweep_running() and scanned == ['task-20260101-003']
+        release.set()
+        ws._task_location_sweep_thread.join(5)
+        assert not ws.task_location_sweep_running()
+        assert [t['title'] for t in ws.find_task_by_id('task-20260101-005')] == ['Task 5']
+        assert scanned == ['task-20260101-003']
+        assert ws._work_index.changed('task_locations', {
+            str(f): (f.stat().st_mtime_ns, f.stat().st_size) for f in ws.BASE_DIR.glob('Notes-*.md')
+        }) == []
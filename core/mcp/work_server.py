@@ -17,6 +17,9 @@ import sys
 import json
 import logging
 import re
+import threading
+import time
+import bisect
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta, date
@@ -33,14 +36,16 @@ from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 import mcp.types as types
 
-# QMD semantic search (optional - gracefully degrade if not available)
-try:
-    from utils.qmd_query import is_qmd_available, vault_search
-    HAS_QMD = True
-except ImportError:
-    HAS_QMD = False
+# Set up logging first (before any imports that might use it)
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
-# Analytics helper (optional - gracefully degrade if not available)
+# Add grandparent directory to path for 'core.utils' imports
+# The script is at core/mcp/work_server.py, so we need to add the vault root
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Analytics helper (optional - gracefully degrade if not available). Imported
+# after the vault root is on the path so it can use the cached user profile
 try:
     from analytics_helper import fire_event as _fire_analytics_event
     HAS_ANALYTICS = True
@@ -49,14 +54,6 @@ except ImportError:
     def _fire_analytics_event(event_name, properties=None):
         return {'fired': False, 'reason': 'analytics_not_available'}
 
-# Set up logging first (before any imports that might use it)
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-# Add grandparent directory to path for 'core.utils' imports
-# The script is at core/mcp/work_server.py, so we need to add the vault root
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 # Import reference formatter for Obsidian wiki link support
 try:
     from core.utils.reference_formatter import (
@@ -72,12 +69,19 @@ except ImportError:
     logger.warning("Reference formatter not available - wiki links disabled")
     HAS_REFERENCE_FORMATTER = False
 
-# Import QMD search index refresh (optional - silently skips if QMD not installed)
+# QMD semantic search (optional - gracefully degrade if not available)
 try:
-    from core.utils.qmd_indexer import refresh_search_index
+    from core.utils.qmd_query import is_qmd_available, search_cache_stats, vault_search
     HAS_QMD = True
 except ImportError:
     HAS_QMD = False
+
+# Import QMD search index refresh (optional - silently skips if QMD not installed)
+try:
+    from core.utils.qmd_indexer import refresh_search_index, search_index_status
+    HAS_QMD_INDEXER = True
+except ImportError:
+    HAS_QMD_INDEXER = False
     def refresh_search_index(): pass
 
 # Health system — error queue and health reporting
@@ -87,6 +91,59 @@ try:
 except ImportError:
     _HAS_HEALTH = False
 
+# Cached YAML config (optional - falls back to parsing on every lookup)
+try:
+    from core.utils.config_snapshot import load_yaml, get_profile_flag, get_user_profile, file_signature
+    HAS_CONFIG_SNAPSHOT = True
+except ImportError:
+    HAS_CONFIG_SNAPSHOT = False
+
+# Persistent work index (optional - falls back to parsing markdown on every call)
+try:
+    from core.utils.work_index import WorkIndex
+    HAS_WORK_INDEX = True
+except ImportError:
+    HAS_WORK_INDEX = False
+
+# Near-duplicate candidate index (optional - falls back to scoring every task)
+try:
+    from core.utils.similarity_index import SimilarityIndex
+    HAS_SIMILARITY_INDEX = True
+except ImportError:
+    HAS_SIMILARITY_INDEX = False
+
+# Substring index over meeting notes (optional - falls back to reading every note)
+try:
+    from core.utils.term_index import TermIndex
+    HAS_TERM_INDEX = True
+except ImportError:
+    HAS_TERM_INDEX = False
+
+# Shared parsed-document cache (optional - falls back to parsing on every call)
+try:
+    from core.utils.doc_cache import cached_parser, cache_stats as doc_cache_stats
+    HAS_DOC_CACHE = True
+except ImportError:
+    HAS_DOC_CACHE = False
+    def cached_parser(name, copy=True):
+        return lambda parser: parser
+
+# Off-loop tool execution (optional - handlers run inline on the event loop without it)
+try:
+    from core.utils.tool_executor import ToolExecutor, check_cancelled
+    HAS_TOOL_EXECUTOR = True
+except ImportError:
+    HAS_TOOL_EXECUTOR = False
+    def check_cancelled():
+        pass
+
+# Durable task ID allocator (optional - falls back to scanning the vault)
+try:
+    from core.utils.task_id_registry import TaskIdRegistry
+    HAS_TASK_ID_REGISTRY = True
+except ImportError:
+    HAS_TASK_ID_REGISTRY = False
+
 # Custom JSON encoder for handling date/datetime objects
 class DateTimeEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -104,7 +161,9 @@ INBOX_DIR = BASE_DIR / 'Inbox'
 PILLARS_FILE = BASE_DIR / 'System' / 'pillars.yaml'
 COMPANIES_DIR = BASE_DIR / 'Active' / 'Relationships' / 'Companies'
 PEOPLE_DIR = BASE_DIR / 'People'
-MEETINGS_DIR = BASE_DIR / 'Inbox' / 'Meetings'
+MEETINGS_DIR = BASE_DIR / '00-Inbox' / 'Meetings'
+LEGACY_MEETINGS_DIR = BASE_DIR / 'Inbox' / 'Meetings'  # meeting-intel sync and older vaults
+WORK_INDEX_FILE = BASE_DIR / 'System' / '.dex-work-index.db'
 
 # Demo Mode Configuration
 USER_PROFILE_FILE = BASE_DIR / 'System' / 'user-profile.yaml'
@@ -112,6 +171,9 @@ DEMO_DIR = BASE_DIR / 'System' / 'Demo'
 
 def is_demo_mode() -> bool:
     """Check if demo mode is enabled in user-profile.yaml"""
+    if HAS_CONFIG_SNAPSHOT:
+        return get_profile_flag(BASE_DIR, 'demo_mode')
+    
     if not USER_PROFILE_FILE.exists() or yaml is None:
         return False
     
@@ -149,11 +211,55 @@ def get_people_dir() -> Path:
         return DEMO_DIR / 'People'
     return PEOPLE_DIR
 
-def get_meetings_dir() -> Path:
-    """Get the appropriate Meetings directory based on demo mode"""
+def get_meetings_dirs() -> List[Path]:
+    """Every folder meeting notes are written to: the Granola export's and the legacy Inbox/Meetings"""
     if is_demo_mode():
-        return DEMO_DIR / 'Inbox' / 'Meetings'
-    return MEETINGS_DIR
+        return [DEMO_DIR / '00-Inbox' / 'Meetings', DEMO_DIR / 'Inbox' / 'Meetings']
+    return [MEETINGS_DIR, LEGACY_MEETINGS_DIR]
+
+_MEETING_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_MEETING_NON_NOTES = {'README.md', 'queue.md'}
+
+def list_meeting_notes() -> List[Path]:
+    """Every meeting note, whether flat (YYYY-MM-DD Title.md) or exported into dated folders (YYYY-MM-DD/slug.md)"""
+    notes = []
+    for meetings_dir in get_meetings_dirs():
+        if meetings_dir.exists():
+            notes.extend(f for f in meetings_dir.rglob('*.md') if f.name not in _MEETING_NON_NOTES)
+    return notes
+
+def meeting_note_date(meeting_file: Path) -> str:
+    """YYYY-MM-DD from a meeting note's filename, or from its dated folder"""
+    for name in (meeting_file.stem, meeting_file.parent.name):
+        match = _MEETING_DATE.match(name)
+        if match:
+            return match.group(0)
+    return ''
+
+_FRONTMATTER_TITLE = re.compile(r'^title:\s*(.+?)\s*$', re.MULTILINE)
+
+def meeting_note_title(content: str, meeting_file: Path) -> str:
+    """Title from a meeting note's frontmatter, else its first `# ` heading, else its filename"""
+    body = content
+    if content.startswith('---'):
+        end_idx = content.find('\n---', 3)
+        if end_idx > 0:
+            match = _FRONTMATTER_TITLE.search(content, 3, end_idx)
+            if match:
+                title = match.group(1)
+                if title.startswith('"'):
+                    try:
+                        title = json.loads(title)
+                    except ValueError:
+                        pass
+                title = str(title).strip('\'"').strip()
+                if title:
+                    return title
+            body = content[end_idx + 4:]
+    for line in body.split('\n'):
+        if line.startswith('# '):
+            return line[2:].strip() or meeting_file.stem
+    return meeting_file.stem
 
 
 # Default pillars (used if pillars.yaml doesn't exist or can't be loaded)
@@ -182,6 +288,12 @@ DEFAULT_PRIORITY_LIMITS = {
     'P2': 10,  # Normal - suggested limit
 }
 
+def _read_pillars_yaml() -> Any:
+    """Parsed pillars.yaml (shared between pillar and priority-limit loading)"""
+    if HAS_CONFIG_SNAPSHOT:
+        return load_yaml(get_pillars_file(), copy=False)
+    return yaml.safe_load(get_pillars_file().read_text())
+
 def load_pillars_from_yaml() -> Dict[str, Dict]:
     """Load pillars configuration from System/pillars.yaml"""
     if not get_pillars_file().exists():
@@ -193,8 +305,7 @@ def load_pillars_from_yaml() -> Dict[str, Dict]:
         return DEFAULT_PILLARS
     
     try:
-        content = get_pillars_file().read_text()
-        data = yaml.safe_load(content)
+        data = _read_pillars_yaml()
         
         if not data or 'pillars' not in data:
             logger.warning("No pillars found in YAML, using defaults")
@@ -226,8 +337,7 @@ def load_priority_limits_from_yaml() -> Dict[str, int]:
         return DEFAULT_PRIORITY_LIMITS
     
     try:
-        content = get_pillars_file().read_text()
-        data = yaml.safe_load(content)
+        data = _read_pillars_yaml()
         
         if data and 'priority_limits' in data:
             return {
@@ -244,6 +354,26 @@ def load_priority_limits_from_yaml() -> Dict[str, int]:
 PILLARS = load_pillars_from_yaml()
 PRIORITY_LIMITS = load_priority_limits_from_yaml()
 
+_config_signature = None
+
+def refresh_config() -> None:
+    """Reload PILLARS and PRIORITY_LIMITS if pillars.yaml (or demo mode) changed since the last call"""
+    global PILLARS, PRIORITY_LIMITS, _config_signature
+    
+    if not HAS_CONFIG_SNAPSHOT:
+        return
+    
+    pillars_file = get_pillars_file()
+    signature = (str(pillars_file), file_signature(pillars_file))
+    if signature == _config_signature:
+        return
+    if _config_signature is not None:
+        PILLARS = load_pillars_from_yaml()
+        PRIORITY_LIMITS = load_priority_limits_from_yaml()
+    _config_signature = signature
+
+refresh_config()
+
 # Priority configuration
 PRIORITIES = ['P0', 'P1', 'P2', 'P3']
 
@@ -259,6 +389,8 @@ STATUS_CODES = {
 DEDUP_CONFIG = {
     "similarity_threshold": 0.6,
     "check_keywords": True,
+    "index_min_tasks": 200,          # Below this, score every task directly
+    "candidate_min_overlap": 0.4,    # Trigram overlap needed to be scored at all
 }
 
 # ============================================================================
@@ -320,11 +452,10 @@ def guess_priority(item: str) -> str:
     # Default
     return 'P2'
 
-def generate_task_id() -> str:
-    """Generate a unique task ID in format: task-YYYYMMDD-XXX"""
-    date_str = datetime.now().strftime('%Y%m%d')
-    
-    # Find existing task IDs for today to get next sequential number
+_task_id_registry = TaskIdRegistry(BASE_DIR) if HAS_TASK_ID_REGISTRY else None
+
+def _scan_task_id_suffixes(date_str: str) -> List[int]:
+    """Find today's used task ID suffixes by reading every markdown file in the vault"""
     existing_ids = []
     for md_file in BASE_DIR.rglob('*.md'):
         try:
@@ -334,18 +465,207 @@ def generate_task_id() -> str:
             existing_ids.extend([int(m) for m in matches])
         except Exception:
             continue
+    return existing_ids
+
+def generate_task_ids(count: int) -> List[str]:
+    """Generate `count` unique, consecutive task IDs in format: task-YYYYMMDD-XXX"""
+    now = datetime.now()
+    date_str = now.strftime('%Y%m%d')
+    
+    if _task_id_registry is not None:
+        # The tasks file is the one we're about to write to; anything typed
+        # there by hand since the last allocation must not be reissued
+        floor = 0
+        for task in load_tasks_file(get_tasks_file()):
+            task_id = task.get('task_id') or ''
+            if task_id.startswith(f'task-{date_str}-'):
+                floor = max(floor, int(task_id[-3:]))
+        # A vault scan can't see IDs the registry handed out that haven't been
+        # written yet, so a failed allocation is retried once and then raised
+        # rather than guessed at. ValueError (the day's 999 IDs are used up)
+        # is raised as is.
+        try:
+            return _task_id_registry.allocate_many(count, now, floor=floor)
+        except OSError as e:
+            logger.warning(f"Task ID allocation failed ({e}), retrying")
+        return _task_id_registry.allocate_many(count, now, floor=floor)
     
-    # Get next available number
-    next_num = max(existing_ids, default=0) + 1
-    return f"task-{date_str}-{next_num:03d}"
+    # Get next available numbers
+    next_num = max(_scan_task_id_suffixes(date_str), default=0) + 1
+    if next_num + count - 1 > 999:
+        raise ValueError(f"Task ID space exhausted for {date_str}")
+    return [f"task-{date_str}-{n:03d}" for n in range(next_num, next_num + count)]
+
+def generate_task_id() -> str:
+    """Generate a unique task ID in format: task-YYYYMMDD-XXX"""
+    return generate_task_ids(1)[0]
+
+def record_task_ids(task_ids: List[str]) -> None:
+    """Tell the task ID registry about IDs written outside generate_task_id (e.g. in Obsidian)"""
+    if _task_id_registry is None:
+        return
+    try:
+        _task_id_registry.observe(task_ids)
+    except OSError as e:
+        logger.warning(f"Could not record task IDs: {e}")
 
 def extract_task_id(line: str) -> Optional[str]:
     """Extract task ID from a line"""
     match = re.search(r'\^(task-\d{8}-\d{3})', line)
     return match.group(1) if match else None
 
-def find_task_by_id(task_id: str) -> List[Dict[str, Any]]:
-    """Find all instances of a task ID across all markdown files"""
+# Task locations are kept in the work index (kind "task_locations") so finding
+# every copy of a task reads only the files that hold it. New files are picked
+# up by a periodic stat sweep; the sync daemon indexes files as they change.
+TASK_LOCATION_SWEEP_INTERVAL = 30  # seconds between vault sweeps
+TASK_LOCATION_FORCED_SWEEP_INTERVAL = 5  # a lookup miss forces a sweep at most this often
+TASK_LOCATION_PATTERN = re.compile(r'\^(task-\d{8}-\d{3})')
+TASK_LOCATION_SWEEP_CHUNK = 50  # files indexed per work-index transaction
+TASK_LOCATION_INLINE_FILES = 200  # more changed files than this: index them in the background
+_last_task_location_sweep = 0.0
+_task_location_sweep_lock = threading.Lock()  # held for the whole sweep, by whichever thread runs it
+_task_location_sweep_thread: Optional[threading.Thread] = None
+
+def _task_instance(filepath: Path, line_number: int, line: str) -> Dict[str, Any]:
+    """Build a task instance dict from a checkbox line"""
+    # Extract task title
+    title_match = re.match(r'-\s*\[[x ]\]\s*\*?\*?(.+?)\*?\*?\s*\^', line.strip())
+    title = title_match.group(1).strip() if title_match else line.strip()
+    
+    return {
+        'file': str(filepath),
+        'line_number': line_number,
+        'line_content': line,
+        'title': title,
+        'completed': '- [x]' in line
+    }
+
+def parse_task_locations(filepath: Path) -> List[Dict[str, Any]]:
+    """Parse every task ID occurrence in a file with its line, byte offset and checkbox state"""
+    locations = []
+    byte_offset = 0
+    
+    for i, line in enumerate(filepath.read_text().split('\n')):
+        if '^task-' in line and ('- [ ]' in line or '- [x]' in line):
+            for task_id in dict.fromkeys(TASK_LOCATION_PATTERN.findall(line)):
+                location = _task_instance(filepath, i + 1, line)
+                location['task_id'] = task_id
+                location['byte_offset'] = byte_offset
+                locations.append(location)
+        byte_offset += len(line.encode('utf-8')) + 1
+    
+    return locations
+
+def index_task_locations(filepath: Path) -> None:
+    """Bring the task-location index up to date for one file (no-op if unchanged)"""
+    if _work_index is None:
+        return
+    try:
+        _work_index.refresh('task_locations', Path(filepath), parse_task_locations, id_field='task_id')
+    except Exception as e:
+        logger.warning(f"Could not index task locations in {filepath}: {e}")
+
+def _changed_task_files() -> List[Path]:
+    """Markdown files whose stat differs from the task-location index (stat pass holds no lock)"""
+    stats = {}
+    for md_file in BASE_DIR.rglob('*.md'):
+        try:
+            st = md_file.stat()
+        except OSError:
+            continue
+        stats[str(md_file)] = (st.st_mtime_ns, st.st_size)
+    return [Path(path) for path in _work_index.changed('task_locations', stats)]
+
+def _index_task_files(files: List[Path]) -> None:
+    """Index files in chunks, so other readers of the work index wait for one chunk at most"""
+    for start in range(0, len(files), TASK_LOCATION_SWEEP_CHUNK):
+        with _work_index.batch():
+            for md_file in files[start:start + TASK_LOCATION_SWEEP_CHUNK]:
+                index_task_locations(md_file)
+
+def _finish_task_location_sweep(files: List[Path]) -> None:
+    """Background half of a large sweep; releases the sweep lock taken by the caller"""
+    global _last_task_location_sweep
+    try:
+        _index_task_files(files)
+        _last_task_location_sweep = time.time()
+    except Exception as e:
+        logger.warning(f"Background task location sweep failed: {e}")
+    finally:
+        _task_location_sweep_lock.release()
+
+def task_location_sweep_running() -> bool:
+    """Whether a background sweep is still building the index (lookups scan meanwhile)"""
+    thread = _task_location_sweep_thread
+    return thread is not None and thread.is_alive()
+
+def _sweep_task_locations(force: bool = False) -> bool:
+    """Stat every markdown file and reindex the ones that changed since the last sweep.
+    
+    force shortens the wait between sweeps rather than removing it, so a run of
+    lookups for unknown IDs doesn't re-stat the vault on every call. More than
+    TASK_LOCATION_INLINE_FILES changed files (a first sweep of the vault) are
+    indexed on a background thread instead of the request path.
+    Returns whether a sweep ran inline.
+    """
+    global _last_task_location_sweep, _task_location_sweep_thread
+    
+    interval = TASK_LOCATION_FORCED_SWEEP_INTERVAL if force else TASK_LOCATION_SWEEP_INTERVAL
+    if time.time() - _last_task_location_sweep < interval:
+        return False
+    if not _task_location_sweep_lock.acquire(blocking=False):
+        return False  # another thread is sweeping
+    handed_off = False
+    try:
+        changed = _changed_task_files()
+        if len(changed) > TASK_LOCATION_INLINE_FILES:
+            _task_location_sweep_thread = threading.Thread(
+                target=_finish_task_location_sweep, args=(changed,), daemon=True, name='task-location-sweep'
+            )
+            _task_location_sweep_thread.start()
+            handed_off = True
+            return False
+        _index_task_files(changed)
+        _last_task_location_sweep = time.time()
+        return True
+    finally:
+        if not handed_off:
+            _task_location_sweep_lock.release()
+
+def _indexed_task_locations(task_id: str) -> List[Dict[str, Any]]:
+    """Look up a task ID in the index, repairing entries whose files changed or lines moved"""
+    candidates = _work_index.find('task_locations', task_id)
+    for path in {c['file'] for c in candidates}:
+        index_task_locations(Path(path))
+    
+    instances = []
+    for path in dict.fromkeys(c['file'] for c in _work_index.find('task_locations', task_id)):
+        filepath = Path(path)
+        try:
+            lines = filepath.read_text().split('\n')
+        except OSError:
+            continue
+        
+        locations = _work_index.find('task_locations', task_id, path=filepath)
+        stale = any(
+            loc['line_number'] > len(lines) or lines[loc['line_number'] - 1] != loc['line_content']
+            for loc in locations
+        )
+        if stale:
+            # The file changed without its stat changing (same size within one
+            # mtime tick) - drop the entries and reparse from what we just read
+            logger.info(f"Repairing stale task locations in {filepath}")
+            _work_index.invalidate('task_locations', filepath)
+            index_task_locations(filepath)
+            locations = _work_index.find('task_locations', task_id, path=filepath)
+        
+        for loc in locations:
+            instances.append({k: loc[k] for k in ('file', 'line_number', 'line_content', 'title', 'completed')})
+    
+    return instances
+
+def _scan_task_by_id(task_id: str) -> List[Dict[str, Any]]:
+    """Find a task ID by reading every markdown file in the vault"""
     instances = []
     
     for md_file in BASE_DIR.rglob('*.md'):
@@ -355,23 +675,31 @@ def find_task_by_id(task_id: str) -> List[Dict[str, Any]]:
             
             for i, line in enumerate(lines):
                 if f'^{task_id}' in line and ('- [ ]' in line or '- [x]' in line):
-                    # Extract task title
-                    title_match = re.match(r'-\s*\[[x ]\]\s*\*?\*?(.+?)\*?\*?\s*\^', line.strip())
-                    title = title_match.group(1).strip() if title_match else line.strip()
-                    
-                    instances.append({
-                        'file': str(md_file),
-                        'line_number': i + 1,
-                        'line_content': line,
-                        'title': title,
-                        'completed': '- [x]' in line
-                    })
+                    instances.append(_task_instance(md_file, i + 1, line))
         except Exception as e:
             logger.error(f"Error reading {md_file}: {e}")
             continue
     
     return instances
 
+def find_task_by_id(task_id: str) -> List[Dict[str, Any]]:
+    """Find all instances of a task ID across all markdown files"""
+    if _work_index is None:
+        return _scan_task_by_id(task_id)
+    
+    try:
+        _sweep_task_locations()
+        if task_location_sweep_running():
+            return _scan_task_by_id(task_id)
+        instances = _indexed_task_locations(task_id)
+        if not instances and _sweep_task_locations(force=True):
+            # Might live in a file created since the last sweep
+            instances = _indexed_task_locations(task_id)
+        return instances
+    except Exception as e:
+        logger.warning(f"Task location index unavailable ({e}), scanning vault")
+        return _scan_task_by_id(task_id)
+
 def update_task_status_everywhere(task_id: str, completed: bool) -> Dict[str, Any]:
     """Update task status for all instances of a task ID across all files"""
     instances = find_task_by_id(task_id)
@@ -415,6 +743,7 @@ def update_task_status_everywhere(task_id: str, completed: bool) -> Dict[str, An
             if new_line != old_line:
                 lines[line_idx] = new_line
                 filepath.write_text('\n'.join(lines))
+                index_task_locations(filepath)
                 updated_files.append({
                     'file': str(filepath),
                     'line': instance['line_number']
@@ -514,80 +843,155 @@ def extract_file_refs_from_task(task_line: str) -> List[str]:
     
     return list(set(refs))
 
-def find_tasks_for_page(page_path: str) -> List[Dict[str, Any]]:
-    """Find all tasks in 03-Tasks/Tasks.md that reference a given page"""
-    if not get_tasks_file().exists():
-        return []
-    
-    content = get_tasks_file().read_text()
-    lines = content.split('\n')
+def parse_task_ref_entries(filepath: Path) -> List[Dict[str, Any]]:
+    """Parse every task line in a tasks file for Related Tasks syncing (one pass)"""
+    lines = filepath.read_text().split('\n')
     
-    # Normalize page path for matching
-    page_name = Path(page_path).stem.lower()
-    page_path_lower = page_path.lower()
-    
-    matching_tasks = []
+    entries = []
     current_section = None
     
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        
+    for i, line in enumerate(lines):
         # Track section headers
         if line.startswith('# ') or line.startswith('## '):
             current_section = line.lstrip('#').strip()
-            i += 1
             continue
         
         # Check if this is a task line
-        if line.strip().startswith('- [ ]') or line.strip().startswith('- [x]'):
-            completed = line.strip().startswith('- [x]')
-            
-            # Check if this task references the page
-            file_refs = extract_file_refs_from_task(line)
-            task_mentions_page = any(
-                page_name in ref.lower() or page_path_lower in ref.lower()
-                for ref in file_refs
-            )
-            
-            # Also check if page name appears in task text
-            if not task_mentions_page:
-                task_mentions_page = page_name in line.lower()
-            
-            if task_mentions_page:
-                # Extract title
-                title_match = re.match(r'-\s*\[[x ]\]\s*\*?\*?(.+?)\*?\*?(?:\s*\|.*)?$', line.strip())
-                title = title_match.group(1).strip() if title_match else line.strip()[6:]
-                
-                # Clean title of file references for display
-                clean_title = re.sub(r'\s*\|\s*(?:People|Active)/[^\s]+', '', title)
-                clean_title = re.sub(r'\s+\.md\b', '', clean_title)
-                clean_title = re.sub(r'\s*\|.*$', '', clean_title)  # Remove trailing | refs
-                
-                # Look for context/priority in following lines
-                priority = 'P2'
-                j = i + 1
-                while j < len(lines) and lines[j].strip().startswith('\t-'):
-                    if 'Priority:' in lines[j]:
-                        priority_match = re.search(r'Priority:\s*(P[0-3])', lines[j])
-                        if priority_match:
-                            priority = priority_match.group(1)
-                    j += 1
-                
-                matching_tasks.append({
-                    'title': clean_title,
-                    'completed': completed,
-                    'priority': priority,
-                    'section': current_section,
-                    'line_number': i + 1
-                })
+        if not (line.strip().startswith('- [ ]') or line.strip().startswith('- [x]')):
+            continue
         
-        i += 1
+        completed = line.strip().startswith('- [x]')
+        
+        # Extract title
+        title_match = re.match(r'-\s*\[[x ]\]\s*\*?\*?(.+?)\*?\*?(?:\s*\|.*)?$', line.strip())
+        title = title_match.group(1).strip() if title_match else line.strip()[6:]
+        
+        # Clean title of file references for display
+        clean_title = re.sub(r'\s*\|\s*(?:People|Active)/[^\s]+', '', title)
+        clean_title = re.sub(r'\s+\.md\b', '', clean_title)
+        clean_title = re.sub(r'\s*\|.*$', '', clean_title)  # Remove trailing | refs
+        
+        # Look for context/priority in following lines
+        priority = 'P2'
+        j = i + 1
+        while j < len(lines) and lines[j].strip().startswith('\t-'):
+            if 'Priority:' in lines[j]:
+                priority_match = re.search(r'Priority:\s*(P[0-3])', lines[j])
+                if priority_match:
+                    priority = priority_match.group(1)
+            j += 1
+        
+        entries.append({
+            'title': clean_title,
+            'completed': completed,
+            'priority': priority,
+            'section': current_section,
+            'line_number': i + 1,
+            'refs': extract_file_refs_from_task(line),
+            'line_lower': line.lower()
+        })
     
-    return matching_tasks
+    return entries
 
-def update_related_tasks_section(page_path: str, tasks: List[Dict[str, Any]]) -> bool:
-    """Update the Related Tasks section in a page"""
+# Reverse reference graph over 03-Tasks/Tasks.md: page stem -> referencing task
+# entries. Rebuilt only when the tasks file changes; stems are resolved lazily
+# and memoized until then.
+_task_ref_graph: Dict[str, Any] = {'key': None}
+
+def get_task_ref_graph() -> Dict[str, Any]:
+    """Return the reference graph for the current tasks file, rebuilding it if the file changed"""
+    global _task_ref_graph
+    
+    tasks_file = get_tasks_file()
+    try:
+        st = tasks_file.stat()
+    except FileNotFoundError:
+        return {'key': None, 'entries': [], 'text': '', 'line_starts': [], 'by_stem': {}}
+    
+    key = (str(tasks_file), st.st_mtime_ns, st.st_size)
+    if _task_ref_graph['key'] == key:
+        return _task_ref_graph
+    
+    entries = _load_indexed('task_refs', tasks_file, parse_task_ref_entries)
+    
+    # All task lines joined, so one str.find pass locates every line that
+    # mentions a page instead of testing each line separately
+    line_starts = []
+    offset = 0
+    for entry in entries:
+        line_starts.append(offset)
+        offset += len(entry['line_lower']) + 1
+    
+    _task_ref_graph = {
+        'key': key,
+        'entries': entries,
+        'text': '\n'.join(e['line_lower'] for e in entries),
+        'line_starts': line_starts,
+        'by_stem': {}
+    }
+    return _task_ref_graph
+
+def _task_refs_for_stem(graph: Dict[str, Any], page_name: str) -> List[Dict[str, Any]]:
+    """Task entries whose line mentions page_name (memoized per graph)"""
+    if page_name in graph['by_stem']:
+        return graph['by_stem'][page_name]
+    
+    matched = []
+    text = graph['text']
+    line_starts = graph['line_starts']
+    pos = text.find(page_name) if page_name else -1
+    while pos != -1:
+        idx = bisect.bisect_right(line_starts, pos) - 1
+        matched.append(graph['entries'][idx])
+        # Skip to the next line - one match per task is enough
+        next_line = line_starts[idx + 1] if idx + 1 < len(line_starts) else len(text)
+        pos = text.find(page_name, next_line)
+    
+    graph['by_stem'][page_name] = matched
+    return matched
+
+def find_tasks_for_page(page_path: str) -> List[Dict[str, Any]]:
+    """Find all tasks in 03-Tasks/Tasks.md that reference a given page
+    
+    A task references a page when one of its file refs or its text mentions
+    the page name. Every file ref contains the page name if it matches the
+    page at all, so a single text search over the task lines covers both.
+    """
+    graph = get_task_ref_graph()
+    page_name = Path(page_path).stem.lower()
+    
+    return [
+        {
+            'title': entry['title'],
+            'completed': entry['completed'],
+            'priority': entry['priority'],
+            'section': entry['section'],
+            'line_number': entry['line_number']
+        }
+        for entry in _task_refs_for_stem(graph, page_name)
+    ]
+
+def render_related_tasks_table(tasks: List[Dict[str, Any]]) -> str:
+    """Render the body of a Related Tasks section (everything below the sync timestamp)"""
+    if not tasks:
+        return "*No related tasks*\n"
+    
+    table = "| Status | Task | Priority |\n"
+    table += "|--------|------|----------|\n"
+    for task in tasks:
+        status = "✅" if task['completed'] else "⏳"
+        table += f"| {status} | {task['title']} | {task['priority']} |\n"
+    return table
+
+RELATED_TASKS_SECTION_PATTERN = r'## Related Tasks\n.*?(?=\n## |\n# |\Z)'
+
+def update_related_tasks_section(page_path: str, tasks: List[Dict[str, Any]],
+                                 only_if_changed: bool = False) -> bool:
+    """Update the Related Tasks section in a page
+    
+    With only_if_changed, a page whose existing table already matches is left
+    untouched (keeping its mtime, so it isn't reindexed) and False is returned.
+    """
     filepath = BASE_DIR / page_path
     if not page_path.endswith('.md'):
         filepath = BASE_DIR / f"{page_path}.md"
@@ -598,24 +1002,22 @@ def update_related_tasks_section(page_path: str, tasks: List[Dict[str, Any]]) ->
     
     content = filepath.read_text()
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
+    table = render_related_tasks_table(tasks)
     
-    # Build the new Related Tasks section
-    section_content = f"## Related Tasks\n*Synced from 03-Tasks/Tasks.md — {timestamp}*\n\n"
+    existing = re.search(RELATED_TASKS_SECTION_PATTERN, content, re.DOTALL)
+    if only_if_changed and existing:
+        # Compare everything after the "*Synced from ...*" line
+        existing_body = existing.group(0).split('\n', 2)[2:]
+        if existing_body and existing_body[0].strip() == table.strip():
+            return False
     
-    if tasks:
-        section_content += "| Status | Task | Priority |\n"
-        section_content += "|--------|------|----------|\n"
-        for task in tasks:
-            status = "✅" if task['completed'] else "⏳"
-            section_content += f"| {status} | {task['title']} | {task['priority']} |\n"
-    else:
-        section_content += "*No related tasks*\n"
+    # Build the new Related Tasks section
+    section_content = f"## Related Tasks\n*Synced from 03-Tasks/Tasks.md — {timestamp}*\n\n" + table
     
     # Check if section already exists
-    section_pattern = r'## Related Tasks\n.*?(?=\n## |\n# |\Z)'
-    if re.search(section_pattern, content, re.DOTALL):
+    if existing:
         # Replace existing section
-        new_content = re.sub(section_pattern, section_content.rstrip(), content, flags=re.DOTALL)
+        new_content = re.sub(RELATED_TASKS_SECTION_PATTERN, section_content.rstrip(), content, flags=re.DOTALL)
     else:
         # Add section before any existing ## sections or at the end
         # Find the best place to insert (after frontmatter and intro, before other sections)
@@ -646,22 +1048,66 @@ def sync_task_refs_for_page(page_path: str) -> Dict[str, Any]:
         "tasks": tasks
     }
 
+def sync_all_task_refs() -> Dict[str, Any]:
+    """Sync Related Tasks on every people/company page, rewriting only pages whose table changed
+    
+    Covers pages that are referenced by at least one task or already carry a
+    Related Tasks section (so completed/removed tasks are cleared too).
+    """
+    graph = get_task_ref_graph()
+    
+    candidates: Dict[str, Path] = {}
+    for directory in (get_people_dir(), COMPANIES_DIR):
+        if directory.exists():
+            for md_file in directory.rglob('*.md'):
+                candidates[str(md_file)] = md_file
+    for entry in graph['entries']:
+        for ref in entry['refs']:
+            ref_path = BASE_DIR / (ref if ref.endswith('.md') else f"{ref}.md")
+            if ref_path.exists():
+                candidates.setdefault(str(ref_path), ref_path)
+    
+    updated, unchanged, skipped = [], [], 0
+    for md_file in candidates.values():
+        check_cancelled()
+        try:
+            page_path = str(md_file.relative_to(BASE_DIR))
+        except ValueError:
+            page_path = str(md_file)
+        tasks = find_tasks_for_page(page_path)
+        
+        if not tasks:
+            try:
+                has_section = '## Related Tasks' in md_file.read_text()
+            except OSError:
+                continue
+            if not has_section:
+                skipped += 1
+                continue
+        
+        if update_related_tasks_section(page_path, tasks, only_if_changed=True):
+            updated.append(page_path)
+        else:
+            unchanged.append(page_path)
+    
+    return {
+        "success": True,
+        "pages_checked": len(updated) + len(unchanged),
+        "updated_pages": sorted(updated),
+        "unchanged_count": len(unchanged),
+        "skipped_without_tasks": skipped
+    }
+
 def propagate_task_status_to_refs(task_title: str, completed: bool) -> List[str]:
     """Update task status in all referenced pages' Related Tasks sections"""
     updated_pages = []
     
     # Find all pages that might reference this task
-    # Look for WikiLinks in the task line
-    if not get_tasks_file().exists():
-        return updated_pages
-    
-    content = get_tasks_file().read_text()
-    
-    # Find the task line
-    for line in content.split('\n'):
-        if task_title.lower() in line.lower() and ('- [ ]' in line or '- [x]' in line):
-            file_refs = extract_file_refs_from_task(line)
-            for ref in file_refs:
+    # Look for file references in the task line
+    task_title_lower = task_title.lower()
+    for entry in get_task_ref_graph()['entries']:
+        if task_title_lower in entry['line_lower']:
+            for ref in entry['refs']:
                 result = sync_task_refs_for_page(ref)
                 if result['success']:
                     updated_pages.append(ref)
@@ -712,35 +1158,62 @@ def parse_person_page(filepath: Path) -> Dict[str, Any]:
     
     return person
 
-def find_people_at_company(company_name: str) -> List[Dict[str, Any]]:
-    """Find all people pages that reference a company"""
+def load_person_page(filepath: Path) -> Dict[str, Any]:
+    """Indexed parse_person_page()"""
+    records = _load_indexed('person', filepath, lambda f: [parse_person_page(f)])
+    return records[0] if records else {}
+
+def load_person_pages() -> List[Dict[str, Any]]:
+    """Parse every person page in People/External and People/Internal (cached per file)"""
     people = []
-    company_name_lower = company_name.lower().replace('_', ' ')
-    company_name_underscore = company_name.replace(' ', '_')
-    
-    # Search through People directories
     for subdir in ['External', 'Internal']:
         people_subdir = get_people_dir() / subdir
         if not people_subdir.exists():
             continue
         
         for person_file in people_subdir.glob('*.md'):
-            person = parse_person_page(person_file)
-            
-            # Match by company name or company page path
-            matches = False
-            if person.get('company'):
-                if company_name_lower in person['company'].lower():
-                    matches = True
-            if person.get('company_page'):
-                if company_name_underscore in person['company_page'] or company_name_lower in person['company_page'].lower():
-                    matches = True
-            
-            if matches:
-                people.append(person)
+            people.append(load_person_page(person_file))
     
     return people
 
+def build_company_people_index(people: List[Dict[str, Any]]) -> Dict[tuple, List[int]]:
+    """Group people by their (company, company page) fields: field pair -> indexes into people
+    
+    Thousands of people usually share a few hundred distinct company values,
+    so matching a company against the groups is much cheaper than against
+    every person.
+    """
+    groups: Dict[tuple, List[int]] = {}
+    for i, person in enumerate(people):
+        key = (person.get('company') or '', person.get('company_page') or '')
+        groups.setdefault(key, []).append(i)
+    return groups
+
+def find_people_at_company(company_name: str, people: Optional[List[Dict[str, Any]]] = None,
+                           groups: Optional[Dict[tuple, List[int]]] = None) -> List[Dict[str, Any]]:
+    """Find all people pages that reference a company
+    
+    Pass people/groups from load_person_pages() and build_company_people_index()
+    when matching many companies against the same snapshot.
+    """
+    if people is None:
+        people = load_person_pages()
+    if groups is None:
+        groups = build_company_people_index(people)
+    
+    company_name_lower = company_name.lower().replace('_', ' ')
+    company_name_underscore = company_name.replace(' ', '_')
+    
+    matched: List[int] = []
+    for (company, company_page), indexes in groups.items():
+        # Match by company name or company page path
+        if (company and company_name_lower in company.lower()) or \
+           (company_page and (company_name_underscore in company_page or company_name_lower in company_page.lower())):
+            matched.extend(indexes)
+    
+    return [people[i] for i in sorted(matched)]
+
+@cached_parser('company_domains')
 def get_company_domains(company_filepath: Path) -> List[str]:
     """Extract domains from a company page"""
     if not company_filepath.exists():
@@ -760,16 +1233,70 @@ def get_company_domains(company_filepath: Path) -> List[str]:
     
     return domains
 
-def find_meetings_for_company(company_name: str, domains: List[str]) -> List[Dict[str, Any]]:
-    """Find meetings that involve people from a company"""
-    meetings = []
+_meeting_index = TermIndex() if HAS_TERM_INDEX else None
+_meeting_meta: Dict[str, Dict[str, Any]] = {}  # filepath -> {'date', 'title', 'filepath', 'position'}
+
+def _read_meeting_note(meeting_file: Path) -> str:
+    """Read a meeting note and record its title/date for company aggregation"""
+    content = meeting_file.read_text()
+    _meeting_meta[str(meeting_file)] = {
+        'date': meeting_note_date(meeting_file),
+        'title': meeting_note_title(content, meeting_file),
+        'filepath': str(meeting_file)
+    }
+    return content
+
+def sync_meeting_index() -> Optional['TermIndex']:
+    """Bring the meeting-note index up to date, re-reading only notes whose mtime changed"""
+    if _meeting_index is None:
+        return None
+    
+    docs = {}
+    for meeting_file in list_meeting_notes():
+        try:
+            st = meeting_file.stat()
+        except OSError:
+            continue
+        docs[str(meeting_file)] = ((st.st_mtime_ns, st.st_size), lambda f=meeting_file: _read_meeting_note(f))
+    
+    _meeting_index.sync(docs)
+    for key in list(_meeting_meta):
+        if key not in docs:
+            del _meeting_meta[key]
+    # Listing order, so date ties sort exactly as a direct directory scan would
+    for position, key in enumerate(docs):
+        if key in _meeting_meta:
+            _meeting_meta[key]['position'] = position
+    return _meeting_index
+
+def find_meetings_for_company(company_name: str, domains: List[str],
+                              meeting_index: Optional['TermIndex'] = None) -> List[Dict[str, Any]]:
+    """Find meetings that involve people from a company
+    
+    Pass an already-synced meeting_index when checking many companies in a row.
+    """
+    if meeting_index is None:
+        meeting_index = sync_meeting_index()
     
-    if not get_meetings_dir().exists():
-        return meetings
+    if meeting_index is not None:
+        # Check if company name or any domain appears in meeting
+        matched = set(meeting_index.search(company_name))
+        for domain in domains:
+            matched |= meeting_index.search(domain)
+        
+        meetings = [
+            {k: _meeting_meta[key][k] for k in ('date', 'title', 'filepath')}
+            for key in sorted(matched, key=lambda key: _meeting_meta[key].get('position', 0))
+            if key in _meeting_meta
+        ]
+        # Sort by date descending
+        meetings.sort(key=lambda x: x['date'], reverse=True)
+        return meetings[:10]  # Return last 10 meetings
     
+    meetings = []
     company_name_lower = company_name.lower()
     
-    for meeting_file in get_meetings_dir().glob('*.md'):
+    for meeting_file in list_meeting_notes():
         content = meeting_file.read_text()
         content_lower = content.lower()
         
@@ -782,14 +1309,9 @@ def find_meetings_for_company(company_name: str, domains: List[str]) -> List[Dic
                     break
         
         if matches:
-            # Extract meeting info
-            lines = content.split('\n')
-            title = lines[0].lstrip('#').strip() if lines else meeting_file.stem
-            date = meeting_file.stem[:10] if len(meeting_file.stem) >= 10 else ''
-            
             meetings.append({
-                'date': date,
-                'title': title,
+                'date': meeting_note_date(meeting_file),
+                'title': meeting_note_title(content, meeting_file),
                 'filepath': str(meeting_file)
             })
     
@@ -797,8 +1319,14 @@ def find_meetings_for_company(company_name: str, domains: List[str]) -> List[Dic
     meetings.sort(key=lambda x: x['date'], reverse=True)
     return meetings[:10]  # Return last 10 meetings
 
-def refresh_company_page(company_path: str) -> Dict[str, Any]:
-    """Refresh all aggregated sections on a company page"""
+def refresh_company_page(company_path: str, people: Optional[List[Dict[str, Any]]] = None,
+                         groups: Optional[Dict[tuple, List[int]]] = None,
+                         meeting_index: Optional['TermIndex'] = None) -> Dict[str, Any]:
+    """Refresh all aggregated sections on a company page
+    
+    people/groups/meeting_index let refresh_all_companies share one vault scan
+    across every company; they are built on demand when omitted.
+    """
     
     # Normalize path
     if not company_path.endswith('.md'):
@@ -822,10 +1350,10 @@ def refresh_company_page(company_path: str) -> Dict[str, Any]:
     domains = get_company_domains(filepath)
     
     # Find people at this company
-    people = find_people_at_company(company_name)
+    contacts = find_people_at_company(company_name, people, groups)
     
     # Find related meetings
-    meetings = find_meetings_for_company(company_name, domains)
+    meetings = find_meetings_for_company(company_name, domains, meeting_index)
     
     # Find related tasks
     tasks = find_tasks_for_page(company_path)
@@ -835,10 +1363,10 @@ def refresh_company_page(company_path: str) -> Dict[str, Any]:
     # Build Key Contacts section
     contacts_section = "## Key Contacts\n\n"
     contacts_section += f"<!-- Auto-populated from People pages with company: {company_name} -->\n\n"
-    if people:
+    if contacts:
         contacts_section += "| Name | Role | Last Interaction |\n"
         contacts_section += "|------|------|------------------|\n"
-        for person in people:
+        for person in contacts:
             name_link = f"[{person['name']}]({person['filepath']})"
             role = person.get('role') or '-'
             last = person.get('last_interaction') or '-'
@@ -896,7 +1424,7 @@ def refresh_company_page(company_path: str) -> Dict[str, Any]:
     return {
         'success': True,
         'company': company_name,
-        'contacts_found': len(people),
+        'contacts_found': len(contacts),
         'meetings_found': len(meetings),
         'tasks_found': len(tasks),
         'filepath': str(filepath)
@@ -909,6 +1437,10 @@ def list_companies() -> List[Dict[str, Any]]:
     if not COMPANIES_DIR.exists():
         return companies
     
+    # One pass over People pages shared by every company
+    people = load_person_pages()
+    groups = build_company_people_index(people)
+    
     for company_file in COMPANIES_DIR.glob('*.md'):
         content = company_file.read_text()
         
@@ -931,12 +1463,52 @@ def list_companies() -> List[Dict[str, Any]]:
                     company['industry'] = parts[2].strip()
         
         # Count related items
-        company['contacts'] = len(find_people_at_company(company['name']))
+        company['contacts'] = len(find_people_at_company(company['name'], people, groups))
         
         companies.append(company)
     
     return companies
 
+def refresh_all_companies() -> Dict[str, Any]:
+    """Refresh every company page from a single scan of People pages and meeting notes"""
+    if not COMPANIES_DIR.exists():
+        return {
+            'success': True,
+            'refreshed': [],
+            'failed': [],
+            'count': 0
+        }
+    
+    people = load_person_pages()
+    groups = build_company_people_index(people)
+    meeting_index = sync_meeting_index()
+    
+    refreshed, failed = [], []
+    for company_file in sorted(COMPANIES_DIR.glob('*.md')):
+        check_cancelled()
+        try:
+            result = refresh_company_page(str(company_file.relative_to(BASE_DIR)), people, groups, meeting_index)
+        except Exception as e:
+            logger.error(f"Error refreshing {company_file}: {e}")
+            result = {'success': False, 'error': str(e)}
+        
+        if result.get('success'):
+            refreshed.append({
+                'company': result['company'],
+                'contacts_found': result['contacts_found'],
+                'meetings_found': result['meetings_found'],
+                'tasks_found': result['tasks_found']
+            })
+        else:
+            failed.append({'company': company_file.stem.replace('_', ' '), 'error': result.get('error')})
+    
+    return {
+        'success': not failed,
+        'refreshed': refreshed,
+        'failed': failed,
+        'count': len(refreshed)
+    }
+
 def create_company_page(name: str, website: str = '', industry: str = '', 
                        size: str = '', stage: str = 'Prospect', 
                        domains: List[str] = None) -> Dict[str, Any]:
@@ -1052,7 +1624,11 @@ def get_quarter_info(quarter_date: Optional[date] = None) -> Dict[str, Any]:
     
     # Read q1_start_month from user profile
     q1_start_month = 1  # Default to January
-    if USER_PROFILE_FILE.exists() and yaml:
+    if HAS_CONFIG_SNAPSHOT:
+        planning = get_user_profile(BASE_DIR, copy=False).get('quarterly_planning')
+        if isinstance(planning, dict):
+            q1_start_month = planning.get('q1_start_month', 1)
+    elif USER_PROFILE_FILE.exists() and yaml:
         try:
             content = USER_PROFILE_FILE.read_text()
             data = yaml.safe_load(content)
@@ -1221,7 +1797,7 @@ def get_goal_by_id(goal_id: str) -> Optional[Dict[str, Any]]:
     if is_demo_mode():
         goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
     
-    goals = parse_quarterly_goals(goals_file)
+    goals = load_quarterly_goals(goals_file)
     for goal in goals:
         if goal.get('goal_id') == goal_id:
             return goal
@@ -1233,32 +1809,29 @@ def find_linked_priorities(goal_id: str) -> List[Dict[str, Any]]:
     if not priorities_file.exists():
         return []
     
-    content = priorities_file.read_text()
-    lines = content.split('\n')
-    
     linked_priorities = []
-    for i, line in enumerate(lines):
-        # Look for lines that mention the goal_id
-        if goal_id in line:
-            # Check if this is a priority line
-            if '**' in line and ('- [ ]' in line or '- [x]' in line or line.strip().startswith('1.') or line.strip().startswith('2.') or line.strip().startswith('3.')):
-                completed = '- [x]' in line
-                
-                # Extract priority ID
-                priority_id = extract_priority_id(line)
-                
-                # Extract title
-                title_match = re.search(r'(?:\d+\.\s+)?(.+?)\s+—', line)
-                if not title_match:
-                    title_match = re.search(r'\*\*(.+?)\*\*', line)
-                title = title_match.group(1).strip() if title_match else line.strip()
-                
-                linked_priorities.append({
-                    'priority_id': priority_id,
-                    'title': title,
-                    'completed': completed,
-                    'line_number': i + 1
-                })
+    # Only lines that mention the goal_id (served from the work index)
+    for link in find_id_links(priorities_file, goal_id):
+        line = link['line']
+        # Check if this is a priority line
+        if '**' in line and ('- [ ]' in line or '- [x]' in line or line.strip().startswith('1.') or line.strip().startswith('2.') or line.strip().startswith('3.')):
+            completed = '- [x]' in line
+            
+            # Extract priority ID
+            priority_id = extract_priority_id(line)
+            
+            # Extract title
+            title_match = re.search(r'(?:\d+\.\s+)?(.+?)\s+—', line)
+            if not title_match:
+                title_match = re.search(r'\*\*(.+?)\*\*', line)
+            title = title_match.group(1).strip() if title_match else line.strip()
+            
+            linked_priorities.append({
+                'priority_id': priority_id,
+                'title': title,
+                'completed': completed,
+                'line_number': link['line_number']
+            })
     
     return linked_priorities
 
@@ -1483,13 +2056,11 @@ def find_linked_tasks(priority_id: str) -> List[Dict[str, Any]]:
     if not tasks_file.exists():
         return []
     
-    content = tasks_file.read_text()
-    lines = content.split('\n')
-    
     linked_tasks = []
-    for i, line in enumerate(lines):
-        # Look for tasks that mention the priority_id
-        if priority_id in line and ('- [ ]' in line or '- [x]' in line):
+    # Only lines that mention the priority_id (served from the work index)
+    for link in find_id_links(tasks_file, priority_id):
+        line = link['line']
+        if '- [ ]' in line or '- [x]' in line:
             completed = '- [x]' in line
             task_id = extract_task_id(line)
             
@@ -1501,7 +2072,7 @@ def find_linked_tasks(priority_id: str) -> List[Dict[str, Any]]:
                 'task_id': task_id,
                 'title': title,
                 'completed': completed,
-                'line_number': i + 1
+                'line_number': link['line_number']
             })
     
     return linked_tasks
@@ -1688,32 +2259,142 @@ def get_all_tasks() -> List[Dict[str, Any]]:
     
     # 03-Tasks/Tasks.md
     if get_tasks_file().exists():
-        tasks = parse_tasks_file(get_tasks_file())
+        tasks = load_tasks_file(get_tasks_file())
         for t in tasks:
             t['source'] = 'tasks'
         all_tasks.extend(tasks)
     
     # Week Priorities
     if get_week_priorities_file().exists():
-        tasks = parse_tasks_file(get_week_priorities_file())
+        tasks = load_tasks_file(get_week_priorities_file())
         for t in tasks:
             t['source'] = 'week_priorities'
         all_tasks.extend(tasks)
-    
+
     return all_tasks
 
-def find_similar_tasks(item: str, existing_tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+# ============================================================================
+# WORK INDEX (persistent parse cache for read tools)
+# ============================================================================
+
+# Any ID the planning hierarchy links by: tasks, weekly priorities, quarterly goals
+ID_REF_PATTERN = re.compile(r'(task-\d{8}-\d{3}|week-\d{4}-W\d{2}-p\d+|Q\d+-\d{4}-goal-\d+)')
+
+_work_index = WorkIndex(WORK_INDEX_FILE) if HAS_WORK_INDEX else None
+
+def parse_id_links(filepath: Path) -> List[Dict[str, Any]]:
+    """Record every line that mentions a task, priority or goal ID"""
+    links = []
+    if not filepath.exists():
+        return links
+
+    for i, line in enumerate(filepath.read_text().split('\n')):
+        for ref_id in dict.fromkeys(ID_REF_PATTERN.findall(line)):
+            links.append({
+                'ref_id': ref_id,
+                'line_number': i + 1,
+                'line': line
+            })
+
+    return links
+
+def _pillars_key() -> str:
+    """Fingerprint of pillar config — task records embed guess_pillar() output"""
+    return json.dumps(PILLARS, sort_keys=True)
+
+def _load_indexed(kind: str, filepath: Path, parser, id_field: Optional[str] = None,
+                  parser_key: str = '') -> List[Dict[str, Any]]:
+    """Read parsed records through the work index, parsing directly if it's unavailable"""
+    if _work_index is None:
+        return parser(filepath)
+    try:
+        return _work_index.records(kind, filepath, parser, parser_key=parser_key, id_field=id_field)
+    except Exception as e:
+        logger.warning(f"Work index unavailable for {filepath} ({e}), parsing directly")
+        return parser(filepath)
+
+def load_tasks_file(filepath: Path) -> List[Dict[str, Any]]:
+    """Indexed parse_tasks_file()"""
+    return _load_indexed('tasks', filepath, parse_tasks_file, 'task_id', _pillars_key())
+
+def load_weekly_priorities(filepath: Path) -> List[Dict[str, Any]]:
+    """Indexed parse_weekly_priorities()"""
+    return _load_indexed('priorities', filepath, parse_weekly_priorities, 'priority_id')
+
+def load_quarterly_goals(filepath: Path) -> List[Dict[str, Any]]:
+    """Indexed parse_quarterly_goals()"""
+    return _load_indexed('goals', filepath, parse_quarterly_goals, 'goal_id')
+
+def find_id_links(filepath: Path, ref_id: str) -> List[Dict[str, Any]]:
+    """Lines in a file that mention ref_id, served from the index when possible"""
+    if _work_index is not None:
+        try:
+            _work_index.refresh('links', filepath, parse_id_links, id_field='ref_id')
+            return _work_index.find('links', ref_id, path=filepath)
+        except Exception as e:
+            logger.warning(f"Work index unavailable for {filepath} ({e}), parsing directly")
+    return [link for link in parse_id_links(filepath) if link['ref_id'] == ref_id]
+
+_similarity_index = SimilarityIndex() if HAS_SIMILARITY_INDEX else None
+_similarity_index_source = None  # (task list, its length, key map) last synced into the index
+
+def _dedup_candidates(item: str, active_tasks: List[Dict[str, Any]], qmd_matches: set,
+                      existing_tasks: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """Narrow active tasks down to the ones worth scoring against item.
+    
+    The trigram index is synced to the current task list (only titles that
+    changed since the last call are touched), then asked for titles sharing
+    enough trigrams with item. Tasks QMD flagged are always kept, since the
+    semantic boost can push a low-overlap title over the threshold.
+    
+    existing_tasks is the list active_tasks was filtered from. Callers check
+    many items against one loaded list (and only ever append to a batch
+    list), so the same list object at the same length means the key map is
+    still current, without comparing every task.
+    """
+    global _similarity_index_source
+    
+    source = existing_tasks if existing_tasks is not None else active_tasks
+    cached = _similarity_index_source
+    if cached is not None and cached[0] is source and cached[1] == len(source):
+        keyed = cached[2]
+    else:
+        keyed = {}
+        for pos, task in enumerate(active_tasks):
+            # The same line can appear twice; a full scan scores both, so keep both
+            key = (task.get('title', ''), task.get('section', ''), task.get('source_file', ''))
+            keyed.setdefault(key, []).append((pos, task))
+        _similarity_index.sync({key: key[0] for key in keyed})
+        _similarity_index_source = (source, len(source), keyed)
+    
+    keys = {key for key, _ in _similarity_index.candidates(item, DEDUP_CONFIG['candidate_min_overlap'])}
+    if qmd_matches:
+        for key in keyed:
+            title = key[0].lower()
+            if any(title in snippet.lower() or snippet.lower() in title for snippet in qmd_matches):
+                keys.add(key)
+    
+    # Keep original task order so ties sort exactly as a full scan would
+    positions = sorted(entry for key in keys for entry in keyed[key])
+    return [task for _, task in positions]
+
+def find_similar_tasks(item: str, existing_tasks: List[Dict[str, Any]],
+                       use_qmd: bool = True) -> List[Dict[str, Any]]:
     """Find tasks similar to the given item.
     
     Uses QMD semantic search when available for meaning-based dedup
     (e.g., "Review Q1 metrics" matches "Check quarterly pipeline numbers").
-    Falls back to keyword overlap when QMD is not installed.
+    Falls back to keyword overlap when QMD is not installed. Pass
+    use_qmd=False when existing_tasks aren't in the vault yet (batch items).
+    
+    Large task lists go through a trigram candidate index first, so only
+    titles that share enough characters with item are scored.
     """
     similar = []
     
     # --- QMD semantic dedup (if available) ---
     qmd_matches = set()
-    if HAS_QMD and is_qmd_available():
+    if use_qmd and HAS_QMD and is_qmd_available():
         try:
             results = vault_search(
                 query=item,
@@ -1732,15 +2413,20 @@ def find_similar_tasks(item: str, existing_tasks: List[Dict[str, Any]]) -> List[
         except Exception:
             pass  # Fall through to keyword matching
     
+    active_tasks = [
+        t for t in existing_tasks
+        if not (t.get('completed') or t.get('status') == 'd')
+    ]
+    if _similarity_index is not None and len(active_tasks) >= DEDUP_CONFIG['index_min_tasks']:
+        active_tasks = _dedup_candidates(item, active_tasks, qmd_matches, existing_tasks)
+    
     # --- Standard keyword + sequence matching ---
     item_keywords = extract_keywords(item)
+    threshold = DEDUP_CONFIG['similarity_threshold']
+    matcher = SequenceMatcher(None, item.lower(), '')
     
-    for task in existing_tasks:
-        if task.get('completed') or task.get('status') == 'd':
-            continue
-        
+    for task in active_tasks:
         title = task.get('title', '')
-        title_similarity = calculate_similarity(item, title)
         
         task_keywords = extract_keywords(title)
         if item_keywords and task_keywords:
@@ -1756,9 +2442,16 @@ def find_similar_tasks(item: str, existing_tasks: List[Dict[str, Any]]) -> List[
                     qmd_boost = 0.15
                     break
         
+        # quick_ratio() is an upper bound on ratio(); skip the full diff when
+        # even a perfect sequence score couldn't reach the threshold
+        matcher.set_seq2(title.lower())
+        if (matcher.quick_ratio() * 0.6) + (keyword_overlap * 0.25) + qmd_boost < threshold - 1e-9:
+            continue
+        title_similarity = matcher.ratio()
+        
         similarity_score = (title_similarity * 0.6) + (keyword_overlap * 0.25) + qmd_boost
         
-        if similarity_score >= DEDUP_CONFIG['similarity_threshold']:
+        if similarity_score >= threshold:
             similar.append({
                 'title': title,
                 'section': task.get('section', ''),
@@ -1770,6 +2463,84 @@ def find_similar_tasks(item: str, existing_tasks: List[Dict[str, Any]]) -> List[
     similar.sort(key=lambda x: x['similarity_score'], reverse=True)
     return similar[:3]
 
+# ============================================================================
+# TASK CREATION HELPERS
+# ============================================================================
+
+def validate_task_fields(title: str, pillar: str, priority: str) -> Optional[Dict[str, Any]]:
+    """Check pillar, priority and title clarity. Returns an error result, or None if valid."""
+    if pillar not in PILLARS:
+        return {
+            "success": False,
+            "error": f"Invalid pillar '{pillar}'. Must be one of: {list(PILLARS.keys())}"
+        }
+    
+    if priority not in PRIORITIES:
+        return {
+            "success": False,
+            "error": f"Invalid priority '{priority}'. Must be one of: {PRIORITIES}"
+        }
+    
+    if is_ambiguous(title):
+        return {
+            "success": False,
+            "error": "Task is too vague",
+            "title": title,
+            "clarification_needed": generate_clarification_questions(title),
+            "suggestion": "Please provide more specific details before creating this task"
+        }
+    
+    return None
+
+def build_task_entry(title: str, task_id: str, pillar: str, priority: str, context: str = '',
+                     weekly_priority_id: str = '', account: str = '',
+                     people: Optional[List[str]] = None) -> str:
+    """Build the markdown lines for a new task in 03-Tasks/Tasks.md"""
+    # Build file references for account/people
+    file_refs = []
+    if account:
+        # Use plain file path reference
+        file_refs.append(account if account.endswith('.md') else f"{account}.md")
+    for person in people or []:
+        file_refs.append(person if person.endswith('.md') else f"{person}.md")
+    
+    # Create the task entry with plain file references and task ID
+    pillar_name = PILLARS[pillar]['name']
+    task_line = f"- [ ] **{title}**"
+    if file_refs:
+        task_line += " | " + " ".join(file_refs)
+    task_line += f" ^{task_id}"
+    
+    task_entry = task_line
+    if context:
+        task_entry += f"\n\t- {context}"
+    task_entry += f"\n\t- Pillar: {pillar_name} | Priority: {priority}"
+    if weekly_priority_id:
+        task_entry += f" | Weekly priority: [{weekly_priority_id}]"
+    
+    return task_entry
+
+def insert_task_entries(content: str, section: str, task_entries: List[str]) -> str:
+    """Insert task entries under a section header, creating the section if needed"""
+    entries = "\n".join(task_entries)
+    
+    # Find the section and add the task
+    section_header = f"## {section}"
+    if section_header in content:
+        # Add after section header
+        parts = content.split(section_header, 1)
+        return parts[0] + section_header + "\n" + entries + "\n" + parts[1]
+    
+    # Create new section at the top
+    lines = content.split('\n')
+    insert_idx = 1  # After the first header
+    for i, line in enumerate(lines):
+        if line.startswith('# '):
+            insert_idx = i + 1
+            break
+    lines.insert(insert_idx, f"\n{section_header}\n{entries}\n")
+    return '\n'.join(lines)
+
 # ============================================================================
 # MIGRATION HELPERS
 # ============================================================================
@@ -1948,7 +2719,7 @@ def get_week_progress_data() -> Dict[str, Any]:
     
     # Get weekly priorities
     priorities_file = get_week_priorities_file()
-    priorities = parse_weekly_priorities(priorities_file) if priorities_file.exists() else []
+    priorities = load_weekly_priorities(priorities_file) if priorities_file.exists() else []
     
     # Enrich priorities with task data
     priorities_detail = []
@@ -2137,7 +2908,7 @@ def get_meeting_context_data(meeting_title: str = None, attendees: List[str] = N
             
             for person_file in people_subdir.glob('*.md'):
                 if attendee_normalized in person_file.stem.lower():
-                    person_data = parse_person_page(person_file)
+                    person_data = load_person_page(person_file)
                     result['attendee_details'].append(person_data)
                     break
     
@@ -2241,48 +3012,43 @@ def get_commitments_due_data(date_range: str = 'today') -> Dict[str, Any]:
         'sources_scanned': []
     }
     
-    # Scan recent meeting notes
-    meetings_dir = get_meetings_dir()
-    if meetings_dir.exists():
-        # Look at meetings from last 14 days
-        for meeting_file in meetings_dir.glob('*.md'):
-            try:
-                # Extract date from filename (assuming YYYY-MM-DD prefix)
-                filename = meeting_file.stem
-                date_match = re.match(r'(\d{4}-\d{2}-\d{2})', filename)
-                if date_match:
-                    meeting_date_str = date_match.group(1)
-                    meeting_date = datetime.strptime(meeting_date_str, '%Y-%m-%d').date()
-                    
-                    # Only look at recent meetings
-                    if (today - meeting_date).days > 14:
-                        continue
-                
-                content = meeting_file.read_text()
-                commitments = extract_commitments_from_text(
-                    content, 
-                    source=str(meeting_file.relative_to(BASE_DIR)),
-                    date_context=meeting_date_str if date_match else ''
-                )
+    # Scan recent meeting notes (last 14 days)
+    for meeting_file in list_meeting_notes():
+        try:
+            # Date from the filename or its dated folder
+            meeting_date_str = meeting_note_date(meeting_file)
+            if meeting_date_str:
+                meeting_date = datetime.strptime(meeting_date_str, '%Y-%m-%d').date()
                 
-                for c in commitments:
-                    if c['due_date']:
-                        due_lower = c['due_date'].lower()
-                        if due_lower in ['today', today.strftime('%A').lower()]:
-                            result['commitments_due_today'].append(c)
-                        elif due_lower in ['tomorrow', 'this week', 'friday', 'thursday', 'wednesday', 'tuesday', 'monday']:
-                            result['commitments_due_this_week'].append(c)
-                        else:
-                            result['commitments_no_date'].append(c)
+                # Only look at recent meetings
+                if (today - meeting_date).days > 14:
+                    continue
+            
+            content = meeting_file.read_text()
+            commitments = extract_commitments_from_text(
+                content, 
+                source=str(meeting_file.relative_to(BASE_DIR)),
+                date_context=meeting_date_str
+            )
+            
+            for c in commitments:
+                if c['due_date']:
+                    due_lower = c['due_date'].lower()
+                    if due_lower in ['today', today.strftime('%A').lower()]:
+                        result['commitments_due_today'].append(c)
+                    elif due_lower in ['tomorrow', 'this week', 'friday', 'thursday', 'wednesday', 'tuesday', 'monday']:
+                        result['commitments_due_this_week'].append(c)
                     else:
                         result['commitments_no_date'].append(c)
-                
-                result['sources_scanned'].append(str(meeting_file.name))
-                
-            except Exception as e:
-                logger.error(f"Error scanning {meeting_file}: {e}")
-                continue
-    
+                else:
+                    result['commitments_no_date'].append(c)
+            
+            result['sources_scanned'].append(str(meeting_file.name))
+            
+        except Exception as e:
+            logger.error(f"Error scanning {meeting_file}: {e}")
+            continue
+
     # Scan person pages for "owe" or "follow up" mentions
     for subdir in ['External', 'Internal']:
         people_subdir = get_people_dir() / subdir
@@ -2536,6 +3302,7 @@ app = Server("dex-work-mcp")
 @app.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """List all available tools"""
+    refresh_config()
     pillar_ids = get_pillar_ids()
     pillar_description = ", ".join(pillar_ids)
     
@@ -2572,6 +3339,34 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["title", "pillar"]
             }
         ),
+        types.Tool(
+            name="create_tasks",
+            description="Create several tasks in one call (e.g. action items after a meeting). Each item is validated and checked for duplicates against existing tasks and the rest of the batch; accepted tasks are written to 03-Tasks/Tasks.md in a single update and each linked page is synced once. Returns a result per item.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "tasks": {
+                        "type": "array",
+                        "description": "Tasks to create, same fields as create_task",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "title": {"type": "string", "description": "Task title (be specific, not vague)"},
+                                "pillar": {"type": "string", "enum": pillar_ids, "description": f"Which strategic pillar this supports ({pillar_description})"},
+                                "priority": {"type": "string", "enum": ["P0", "P1", "P2", "P3"], "default": "P2"},
+                                "context": {"type": "string", "description": "Additional context or sub-tasks"},
+                                "section": {"type": "string", "description": "Which section in 03-Tasks/Tasks.md to add to", "default": "Next Week"},
+                                "weekly_priority_id": {"type": "string", "description": "Link to weekly priority (e.g., 'week-2026-W05-p1')"},
+                                "account": {"type": "string", "description": "Path to account page to link"},
+                                "people": {"type": "array", "items": {"type": "string"}, "description": "List of paths to people pages to link"}
+                            },
+                            "required": ["title", "pillar"]
+                        }
+                    }
+                },
+                "required": ["tasks"]
+            }
+        ),
         types.Tool(
             name="update_task_status",
             description="Update task status everywhere it appears (03-Tasks/Tasks.md, meeting notes, person pages). Provide task_id for guaranteed sync across all locations, or task_title for search-based update.",
@@ -2637,13 +3432,13 @@ async def handle_list_tools() -> list[types.Tool]:
         ),
         types.Tool(
             name="sync_task_refs",
-            description="Refresh the Related Tasks section on an account or people page by reading from 03-Tasks/Tasks.md",
+            description="Refresh the Related Tasks section on an account or people page by reading from 03-Tasks/Tasks.md. Set all_pages to sync every people/company page at once; only pages whose task table changed are rewritten.",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "page_path": {"type": "string", "description": "Path to the page to sync"}
-                },
-                "required": ["page_path"]
+                    "page_path": {"type": "string", "description": "Path to the page to sync"},
+                    "all_pages": {"type": "boolean", "description": "Sync every referenced people/company page instead of one page", "default": False}
+                }
             }
         ),
         types.Tool(
@@ -2657,6 +3452,11 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["company_path"]
             }
         ),
+        types.Tool(
+            name="refresh_all_companies",
+            description="Refresh aggregated sections (contacts, meetings, tasks) on every company page in one pass over People pages and meeting notes",
+            inputSchema={"type": "object", "properties": {}}
+        ),
         types.Tool(
             name="list_companies",
             description="List all company pages with basic info and contact counts",
@@ -2901,21 +3701,38 @@ async def handle_list_tools() -> list[types.Tool]:
 
 # Tools that write to vault files and should trigger search index refresh
 WRITE_TOOLS = {
-    "create_task", "update_task_status", "create_company", "refresh_company",
-    "sync_task_refs", "create_quarterly_goal", "update_goal_progress",
+    "create_task", "create_tasks", "update_task_status", "create_company", "refresh_company",
+    "refresh_all_companies", "sync_task_refs", "create_quarterly_goal", "update_goal_progress",
     "create_weekly_priority", "complete_weekly_priority",
     "process_inbox_with_dedup", "migrate_quarterly_goals", "migrate_weekly_priorities",
 }
 
+# Tools that run alone: vault writes, plus reads that rebuild the shared
+# meeting/company indexes
+EXCLUSIVE_TOOLS = WRITE_TOOLS | {"list_companies"}
+
+# Concurrent calls per tool (others default to 2)
+TOOL_CONCURRENCY_LIMITS = {
+    "refresh_all_companies": 1,
+    "analyze_calendar_capacity": 1,
+    "suggest_task_scheduling": 1,
+}
+
+_tool_executor = ToolExecutor(limits=TOOL_CONCURRENCY_LIMITS, exclusive=EXCLUSIVE_TOOLS) if HAS_TOOL_EXECUTOR else None
+
 @app.call_tool()
 async def handle_call_tool(
     name: str, arguments: dict | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """Handle tool calls"""
     try:
-        result = await _handle_call_tool_inner(name, arguments)
+        refresh_config()
+        if _tool_executor is not None:
+            result = await _tool_executor.run_handler(name, _handle_call_tool_inner, name, arguments)
+        else:
+            result = await _handle_call_tool_inner(name, arguments)
 
-        # Refresh QMD search index after any write operation (non-blocking)
+        # Refresh QMD search index after any write operation (non-blocking, bursts coalesced)
         if name in WRITE_TOOLS:
             refresh_search_index()
 
@@ -2925,6 +3742,7 @@ async def handle_call_tool(
             _tool_human_messages = {
                 "list_tasks": "Task listing failed",
                 "create_task": "Task creation failed",
+                "create_tasks": "Bulk task creation failed",
                 "update_task_status": "Task status update failed",
                 "get_system_status": "System status check failed",
                 "check_priority_limits": "Priority limits check failed",
@@ -2934,6 +3752,7 @@ async def handle_call_tool(
                 "get_pillar_summary": "Pillar summary failed",
                 "sync_task_refs": "Task reference sync failed",
                 "refresh_company": "Company page refresh failed",
+                "refresh_all_companies": "Bulk company refresh failed",
                 "list_companies": "Company listing failed",
                 "create_company": "Company creation failed",
                 "create_quarterly_goal": "Quarterly goal creation failed",
@@ -3007,30 +3826,9 @@ async def _handle_call_tool_inner(
         account = arguments.get('account', '')
         people = arguments.get('people', [])
         
-        # Validate pillar
-        if pillar not in PILLARS:
-            return [types.TextContent(type="text", text=json.dumps({
-                "success": False,
-                "error": f"Invalid pillar '{pillar}'. Must be one of: {list(PILLARS.keys())}"
-            }, indent=2))]
-        
-        # Validate priority
-        if priority not in PRIORITIES:
-            return [types.TextContent(type="text", text=json.dumps({
-                "success": False,
-                "error": f"Invalid priority '{priority}'. Must be one of: {PRIORITIES}"
-            }, indent=2))]
-        
-        # Check ambiguity
-        if is_ambiguous(title):
-            questions = generate_clarification_questions(title)
-            return [types.TextContent(type="text", text=json.dumps({
-                "success": False,
-                "error": "Task is too vague",
-                "title": title,
-                "clarification_needed": questions,
-                "suggestion": "Please provide more specific details before creating this task"
-            }, indent=2))]
+        error = validate_task_fields(title, pillar, priority)
+        if error:
+            return [types.TextContent(type="text", text=json.dumps(error, indent=2))]
         
         # Check for duplicates
         existing_tasks = get_all_tasks()
@@ -3060,27 +3858,9 @@ async def _handle_call_tool_inner(
         # Generate unique task ID
         task_id = generate_task_id()
         
-        # Build file references for account/people
-        file_refs = []
-        if account:
-            # Use plain file path reference
-            file_refs.append(account if account.endswith('.md') else f"{account}.md")
-        for person in people:
-            file_refs.append(person if person.endswith('.md') else f"{person}.md")
-        
-        # Create the task entry with plain file references and task ID
         pillar_name = PILLARS[pillar]['name']
-        task_line = f"- [ ] **{title}**"
-        if file_refs:
-            task_line += " | " + " ".join(file_refs)
-        task_line += f" ^{task_id}"
-        
-        task_entry = task_line
-        if context:
-            task_entry += f"\n\t- {context}"
-        task_entry += f"\n\t- Pillar: {pillar_name} | Priority: {priority}"
-        if weekly_priority_id:
-            task_entry += f" | Weekly priority: [{weekly_priority_id}]"
+        task_entry = build_task_entry(title, task_id, pillar, priority, context,
+                                      weekly_priority_id, account, people)
         
         # Add to 03-Tasks/Tasks.md under the appropriate section
         if get_tasks_file().exists():
@@ -3088,22 +3868,7 @@ async def _handle_call_tool_inner(
         else:
             content = "# Tasks\n\n"
         
-        # Find the section and add the task
-        section_header = f"## {section}"
-        if section_header in content:
-            # Add after section header
-            parts = content.split(section_header)
-            new_content = parts[0] + section_header + "\n" + task_entry + "\n" + parts[1]
-        else:
-            # Create new section at the top
-            lines = content.split('\n')
-            insert_idx = 1  # After the first header
-            for i, line in enumerate(lines):
-                if line.startswith('# '):
-                    insert_idx = i + 1
-                    break
-            lines.insert(insert_idx, f"\n{section_header}\n{task_entry}\n")
-            new_content = '\n'.join(lines)
+        new_content = insert_task_entries(content, section, [task_entry])
         
         get_tasks_file().write_text(new_content)
         
@@ -3144,6 +3909,156 @@ async def _handle_call_tool_inner(
         }
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
     
+    elif name == "create_tasks":
+        task_specs = arguments.get('tasks', [])
+        
+        if not task_specs:
+            return [types.TextContent(type="text", text=json.dumps({
+                "success": False,
+                "error": "No tasks provided"
+            }, indent=2))]
+        
+        # Read existing tasks once for the whole batch
+        existing_tasks = get_all_tasks()
+        active_tasks = [t for t in existing_tasks if not t.get('completed')]
+        priority_counts = Counter(t.get('priority', 'P2') for t in active_tasks)
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(task_specs)
+        accepted = []  # (index, normalized spec)
+        batch_tasks = []  # Accepted items, for dedup within the batch
+        
+        for i, spec in enumerate(task_specs):
+            title = spec.get('title', '')
+            pillar = spec.get('pillar', '')
+            priority = spec.get('priority', 'P2')
+            section = spec.get('section', 'Next Week')
+            
+            error = validate_task_fields(title, pillar, priority)
+            if error:
+                results[i] = {"index": i, "title": title, **error}
+                continue
+            
+            similar = find_similar_tasks(title, existing_tasks)
+            if similar:
+                results[i] = {
+                    "index": i,
+                    "success": False,
+                    "error": "Potential duplicate detected",
+                    "title": title,
+                    "similar_tasks": similar,
+                    "suggestion": "Review these similar tasks. If still unique, rephrase the title to be more distinct."
+                }
+                continue
+            
+            similar = find_similar_tasks(title, batch_tasks, use_qmd=False)
+            if similar:
+                results[i] = {
+                    "index": i,
+                    "success": False,
+                    "error": "Potential duplicate of another task in this batch",
+                    "title": title,
+                    "similar_tasks": similar,
+                    "suggestion": "Merge these items or rephrase the title to be more distinct."
+                }
+                continue
+            
+            # Priority limits count tasks accepted earlier in this batch too
+            if priority in PRIORITY_LIMITS and priority_counts.get(priority, 0) >= PRIORITY_LIMITS[priority]:
+                results[i] = {
+                    "index": i,
+                    "success": False,
+                    "error": f"Priority limit exceeded for {priority}",
+                    "title": title,
+                    "current_count": priority_counts.get(priority, 0),
+                    "limit": PRIORITY_LIMITS[priority],
+                    "suggestion": f"You have too many {priority} tasks. Complete or deprioritize some before adding more."
+                }
+                continue
+            
+            priority_counts[priority] += 1
+            batch_tasks.append({'title': title, 'section': section, 'source': 'batch'})
+            accepted.append((i, {
+                'title': title,
+                'pillar': pillar,
+                'priority': priority,
+                'context': spec.get('context', ''),
+                'section': section,
+                'weekly_priority_id': spec.get('weekly_priority_id', ''),
+                'account': spec.get('account', ''),
+                'people': spec.get('people', []),
+            }))
+        
+        synced_pages = []
+        if accepted:
+            task_ids = generate_task_ids(len(accepted))
+            
+            # Group entries per section, keeping batch order within each section
+            entries_by_section: Dict[str, List[str]] = {}
+            for task_id, (_, task) in zip(task_ids, accepted):
+                task['task_id'] = task_id
+                entries_by_section.setdefault(task['section'], []).append(build_task_entry(
+                    task['title'], task_id, task['pillar'], task['priority'], task['context'],
+                    task['weekly_priority_id'], task['account'], task['people']
+                ))
+            
+            # Single read-modify-write of 03-Tasks/Tasks.md
+            if get_tasks_file().exists():
+                content = get_tasks_file().read_text()
+            else:
+                content = "# Tasks\n\n"
+            for section, entries in entries_by_section.items():
+                content = insert_task_entries(content, section, entries)
+            get_tasks_file().write_text(content)
+            
+            # Sync each referenced page once, however many new tasks link to it
+            pages = []
+            for _, task in accepted:
+                for page in ([task['account']] if task['account'] else []) + list(task['people']):
+                    if page not in pages:
+                        pages.append(page)
+            for page in pages:
+                result_sync = sync_task_refs_for_page(page)
+                if result_sync['success']:
+                    synced_pages.append(page)
+            
+            for i, task in accepted:
+                results[i] = {
+                    "index": i,
+                    "success": True,
+                    "task": {
+                        "title": task['title'],
+                        "task_id": task['task_id'],
+                        "pillar": PILLARS[task['pillar']]['name'],
+                        "priority": task['priority'],
+                        "section": task['section'],
+                        "weekly_priority_id": task['weekly_priority_id'] or None,
+                        "account": task['account'] or None,
+                        "people": task['people'] or None
+                    }
+                }
+                
+                # Fire analytics event (silent, best-effort)
+                try:
+                    _fire_analytics_event('task_created', {
+                        'pillar': task['pillar'],
+                        'priority': task['priority'],
+                    })
+                except Exception:
+                    pass
+        
+        result = {
+            "success": bool(accepted),
+            "results": results,
+            "synced_pages": synced_pages,
+            "summary": {
+                "requested": len(task_specs),
+                "created": len(accepted),
+                "rejected": len(task_specs) - len(accepted)
+            },
+            "message": f"Created {len(accepted)} of {len(task_specs)} tasks"
+        }
+        return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
+    
     elif name == "update_task_status":
         task_id = arguments.get('task_id')
         task_title = arguments.get('task_title')
@@ -3282,6 +4197,14 @@ async def _handle_call_tool_inner(
             "time_insights": time_insights,
             "timestamp": now.isoformat()
         }
+        if HAS_DOC_CACHE:
+            result["document_cache"] = doc_cache_stats()
+        if _tool_executor is not None:
+            result["tool_executor"] = _tool_executor.stats()
+        if HAS_QMD_INDEXER:
+            result["search_index"] = search_index_status()
+        if HAS_QMD:
+            result["search_cache"] = search_cache_stats()
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
     
     elif name == "check_priority_limits":
@@ -3453,7 +4376,16 @@ async def _handle_call_tool_inner(
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
     
     elif name == "sync_task_refs":
-        page_path = arguments['page_path']
+        if arguments.get('all_pages'):
+            result = sync_all_task_refs()
+            return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
+        
+        page_path = arguments.get('page_path')
+        if not page_path:
+            return [types.TextContent(type="text", text=json.dumps({
+                "success": False,
+                "error": "Provide page_path, or set all_pages to sync every page"
+            }, indent=2))]
         
         result = sync_task_refs_for_page(page_path)
         
@@ -3466,6 +4398,11 @@ async def _handle_call_tool_inner(
         
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
     
+    elif name == "refresh_all_companies":
+        result = refresh_all_companies()
+        
+        return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
+    
     elif name == "list_companies":
         companies = list_companies()
         
@@ -3545,7 +4482,7 @@ async def _handle_call_tool_inner(
         if is_demo_mode():
             goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
         
-        goals = parse_quarterly_goals(goals_file)
+        goals = load_quarterly_goals(goals_file)
         
         # Filter by quarter and completion
         filtered_goals = []
@@ -3658,7 +4595,7 @@ async def _handle_call_tool_inner(
             goals_file = QUARTER_GOALS_FILE
             if is_demo_mode():
                 goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
-            goals = parse_quarterly_goals(goals_file) if goals_file.exists() else []
+            goals = load_quarterly_goals(goals_file) if goals_file.exists() else []
             
             if goals:
                 candidates = infer_goal_link(title, pillar, goals)
@@ -3764,7 +4701,7 @@ async def _handle_call_tool_inner(
         
         # Parse priorities
         priorities_file = get_week_priorities_file()
-        priorities = parse_weekly_priorities(priorities_file) if priorities_file.exists() else []
+        priorities = load_weekly_priorities(priorities_file) if priorities_file.exists() else []
         
         # Enrich with linked tasks
         for priority in priorities:
@@ -3778,7 +4715,7 @@ async def _handle_call_tool_inner(
         goals_file = QUARTER_GOALS_FILE
         if is_demo_mode():
             goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
-        goals = parse_quarterly_goals(goals_file) if goals_file.exists() else []
+        goals = load_quarterly_goals(goals_file) if goals_file.exists() else []
         quarter_info = get_quarter_info()
 
         linked_count = sum(1 for p in priorities if p.get('linked_goal_id'))
@@ -3819,7 +4756,7 @@ async def _handle_call_tool_inner(
                 "error": "Week Priorities file not found"
             }, indent=2))]
         
-        priorities = parse_weekly_priorities(priorities_file)
+        priorities = load_weekly_priorities(priorities_file)
         priority = None
         for p in priorities:
             if p.get('priority_id') == priority_id:
@@ -3863,11 +4800,11 @@ async def _handle_call_tool_inner(
         if is_demo_mode():
             goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
         
-        goals = parse_quarterly_goals(goals_file) if goals_file.exists() else []
+        goals = load_quarterly_goals(goals_file) if goals_file.exists() else []
         
         # Get weekly priorities
         priorities_file = get_week_priorities_file()
-        priorities = parse_weekly_priorities(priorities_file) if priorities_file.exists() else []
+        priorities = load_weekly_priorities(priorities_file) if priorities_file.exists() else []
         
         # Get tasks
         all_tasks = get_all_tasks()
@@ -3917,9 +4854,9 @@ async def _handle_call_tool_inner(
         if is_demo_mode():
             goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
         
-        goals = parse_quarterly_goals(goals_file) if goals_file.exists() else []
+        goals = load_quarterly_goals(goals_file) if goals_file.exists() else []
         priorities_file = get_week_priorities_file()
-        priorities = parse_weekly_priorities(priorities_file) if priorities_file.exists() else []
+        priorities = load_weekly_priorities(priorities_file) if priorities_file.exists() else []
         all_tasks = get_all_tasks()
         active_tasks = [t for t in all_tasks if not t.get('completed')]
         
@@ -3973,7 +4910,7 @@ async def _handle_call_tool_inner(
         if is_demo_mode():
             goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
         
-        goals = parse_quarterly_goals(goals_file) if goals_file.exists() else []
+        goals = load_quarterly_goals(goals_file) if goals_file.exists() else []
         
         # Calculate metrics
         total_goals = len(goals)
@@ -4032,7 +4969,7 @@ async def _handle_call_tool_inner(
         if is_demo_mode():
             goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
 
-        goals = parse_quarterly_goals(goals_file) if goals_file.exists() else []
+        goals = load_quarterly_goals(goals_file) if goals_file.exists() else []
         quarter_info = get_quarter_info()
         weeks_remaining = quarter_info.get('weeks_remaining', 0)
         weeks_elapsed = 13 - weeks_remaining
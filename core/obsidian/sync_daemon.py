@@ -73,7 +73,16 @@ class DexSyncHandler(FileSystemEventHandler):
             return
         
         logger.info(f"Found {len(matches)} tasks in {file_path.name}")
-        
+
+        # Keep the task ID registry ahead of IDs typed directly in Obsidian,
+        # and the task-location index current for this file
+        try:
+            from core.mcp.work_server import record_task_ids, index_task_locations
+            record_task_ids([task_id for _, task_id in matches])
+            index_task_locations(file_path)
+        except Exception as e:
+            logger.error(f"Failed to index task IDs from {file_path.name}: {e}")
+
         # Call Work MCP to sync each task
         for checkbox_state, task_id in matches:
             status = 'd' if checkbox_state.lower() == 'x' else 'n'
@@ -0,0 +1,104 @@
+"""
+Dex Config Snapshot — mtime-keyed cache for YAML config files
+
+System/user-profile.yaml and System/pillars.yaml are consulted constantly:
+every demo-mode path lookup, every Obsidian-mode reference format, every
+ScreenPipe feature check. Each of those used to read and YAML-parse the file
+again. This module parses a config file once and serves the parsed result
+until the file's (mtime, size) changes, so steady-state calls cost one stat()
+and edits (e.g. toggling demo_mode) still take effect without a restart.
+
+Usage:
+    from core.utils.config_snapshot import load_yaml, get_user_profile
+
+    profile = get_user_profile(vault_path)            # fresh copy, safe to mutate
+    demo = load_yaml(path, copy=False).get('demo_mode')  # read-only, no copy
+"""
+
+import copy as _copy
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+logger = logging.getLogger(__name__)
+
+# path -> ((mtime_ns, size), parsed data)
+_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_lock = threading.Lock()
+_stats = {"hits": 0, "loads": 0}
+
+
+def file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        st = Path(path).stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_yaml(path: Path, default: Any = None, copy: bool = True) -> Any:
+    """
+    Parse a YAML file, reusing the previous parse while the file is unchanged.
+
+    Args:
+        path:    YAML file
+        default: Returned when the file is missing, empty, unparseable, or
+                 PyYAML isn't installed
+        copy:    Return a deep copy (default). Pass False only for read-only
+                 lookups on hot paths — the cached object is shared.
+    """
+    if yaml is None:
+        return default
+
+    key = str(path)
+    signature = file_signature(path)
+    if signature is None:
+        with _lock:
+            _cache.pop(key, None)
+        return default
+
+    with _lock:
+        cached = _cache.get(key)
+        if cached and cached[0] == signature:
+            _stats["hits"] += 1
+            data = cached[1]
+        else:
+            try:
+                data = yaml.safe_load(Path(path).read_text())
+            except Exception as e:
+                logger.error(f"Error loading {path}: {e}")
+                return default
+            _cache[key] = (signature, data)
+            _stats["loads"] += 1
+
+    if data is None:
+        return default
+    return _copy.deepcopy(data) if copy else data
+
+
+def get_user_profile(vault_path: Path, copy: bool = True) -> Dict[str, Any]:
+    """Parsed System/user-profile.yaml ({} if missing)."""
+    data = load_yaml(Path(vault_path) / 'System' / 'user-profile.yaml', {}, copy=copy)
+    return data if isinstance(data, dict) else {}
+
+
+def get_profile_flag(vault_path: Path, key: str, default: bool = False) -> bool:
+    """Top-level boolean from user-profile.yaml (e.g. demo_mode, obsidian_mode)."""
+    return bool(get_user_profile(vault_path, copy=False).get(key, default))
+
+
+def cache_stats() -> Dict[str, int]:
+    with _lock:
+        return {**_stats, "files": len(_cache)}
+
+
+def clear_cache() -> None:
+    with _lock:
+        _cache.clear()
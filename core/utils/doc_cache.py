@@ -0,0 +1,180 @@
+"""
+Dex Document Cache — Shared mtime-keyed cache of parsed markdown files
+
+The work, career and company tools re-read and re-parse the same People,
+Companies and Evidence pages on nearly every call. This module keeps the parsed
+result of each (parser, file) pair and serves it again while the file's
+(mtime_ns, size) is unchanged, so steady-state lookups cost one stat().
+
+One process-wide cache is shared by every registered parser. It is bounded by
+an approximate memory budget (DEX_DOC_CACHE_MB, default 32) and evicts the
+least recently used entries first. Hit/miss/eviction counters are kept per
+parser so the effect can be checked from a status tool.
+
+Usage:
+    from core.utils.doc_cache import cached_parser, cache_stats
+
+    @cached_parser('person')
+    def parse_person_page(filepath: Path) -> dict:
+        ...
+
+    parse_person_page(path)        # parses; later calls return a fresh copy
+    cache_stats()                  # {'entries': .., 'parsers': {'person': {'hits': ..}}}
+"""
+
+import copy as _copy
+import functools
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_MAX_BYTES = int(float(os.environ.get('DEX_DOC_CACHE_MB', '32')) * 1024 * 1024)
+
+
+def approx_size(obj: Any) -> int:
+    """Rough in-memory size of a parsed document (dicts, lists, strings, scalars)."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += approx_size(key) + approx_size(value)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += approx_size(item)
+    return size
+
+
+class DocumentCache:
+    """LRU cache of parsed files keyed by (parser, path) and validated by (mtime_ns, size)."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        # (parser, path) -> ((mtime_ns, size), value, approx bytes)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Tuple[int, int], Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def _counters(self, name: str) -> Dict[str, int]:
+        counters = self._stats.get(name)
+        if counters is None:
+            counters = self._stats[name] = {"hits": 0, "misses": 0, "evictions": 0}
+        return counters
+
+    def _drop(self, key: Tuple[str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def get(self, name: str, path: Path, parser: Callable[..., Any], *args,
+            copy: bool = True, **kwargs) -> Any:
+        """
+        Parsed content of `path`, reusing the cached parse while the file is unchanged.
+
+        Args:
+            name:   Parser name — one namespace per parser, so two parsers of the
+                    same file don't share results
+            path:   File to parse
+            parser: Called as parser(path, *args, **kwargs) on a miss
+            copy:   Return a deep copy (default). Pass False only when the caller
+                    never mutates the result.
+        """
+        key = (name, str(path))
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Missing/unreadable — let the parser produce its usual fallback
+            with self._lock:
+                self._drop(key)
+                self._counters(name)["misses"] += 1
+            return parser(path, *args, **kwargs)
+        signature = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self._counters(name)["hits"] += 1
+                value = entry[1]
+                return _copy.deepcopy(value) if copy else value
+            self._counters(name)["misses"] += 1
+
+        value = parser(path, *args, **kwargs)
+        size = approx_size(value)
+
+        with self._lock:
+            self._drop(key)
+            if size <= self.max_bytes:
+                self._entries[key] = (signature, value, size)
+                self._bytes += size
+                self._evict()
+        return _copy.deepcopy(value) if copy else value
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            (name, _), (_, _, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._counters(name)["evictions"] += 1
+
+    def invalidate(self, path: Optional[Path] = None, name: Optional[str] = None) -> None:
+        """Forget cached parses of one file and/or one parser (everything if both are None)."""
+        with self._lock:
+            for key in list(self._entries):
+                if (path is None or key[1] == str(path)) and (name is None or key[0] == name):
+                    self._drop(key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            totals = {"hits": 0, "misses": 0, "evictions": 0}
+            for counters in self._stats.values():
+                for field in totals:
+                    totals[field] += counters[field]
+            lookups = totals["hits"] + totals["misses"]
+            return {
+                **totals,
+                "hit_rate": round(totals["hits"] / lookups, 3) if lookups else None,
+                "entries": len(self._entries),
+                "approx_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "parsers": {name: dict(counters) for name, counters in self._stats.items()},
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._stats.clear()
+
+
+_document_cache = DocumentCache()
+
+
+def get_document_cache() -> DocumentCache:
+    """The process-wide cache shared by every registered parser."""
+    return _document_cache
+
+
+def cached_parser(name: str, copy: bool = True) -> Callable:
+    """
+    Decorator registering a `parser(path, ...)` function with the shared cache.
+
+    The wrapped function keeps its signature; the original is available as
+    `.uncached` for callers that need to bypass the cache.
+    """
+    def decorator(parser: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(parser)
+        def wrapper(path, *args, **kwargs):
+            return _document_cache.get(name, path, parser, *args, copy=copy, **kwargs)
+        wrapper.uncached = parser
+        return wrapper
+    return decorator
+
+
+def cache_stats() -> Dict[str, Any]:
+    return _document_cache.stats()
+
+
+def clear_cache() -> None:
+    _document_cache.clear()
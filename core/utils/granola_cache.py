@@ -0,0 +1,168 @@
+"""
+Dex Granola Cache Reader — Parse-once reader for Granola's cache-v3.json
+
+Granola's local cache is a JSON file whose `cache` field is itself a JSON
+string, and with transcripts it easily reaches hundreds of MB. The Granola
+tools used to read and decode it twice on every fallback call. This module
+decodes it once per file version (mtime, size) and keeps only what the tools
+use:
+
+- documents:   id -> document (shared, treat as read-only)
+- meeting_ids: ids of live meeting documents, newest first
+- people:      Granola's people state, as stored
+- transcripts: a lazy mapping — each meeting's entries are kept as a compact
+               JSON string and only decoded when that meeting is asked for.
+               Entry count, a version tag and the joined text length are
+               precomputed so list views never decode transcripts at all.
+
+Every other top-level state key (panels, lists, UI state, ...) is dropped
+right after decoding.
+
+Usage:
+    from core.utils.granola_cache import load_granola_cache
+
+    cache = load_granola_cache(cache_path)       # None if missing/unreadable
+    doc = cache['documents'][meeting_id]
+    entries = cache['transcripts'].get(meeting_id, [])
+    count, version, text_length = cache['transcripts'].meta(meeting_id)
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Decoded transcripts kept around for repeat lookups of the same meeting
+DECODED_TRANSCRIPTS_KEPT = 8
+
+
+def _sort_key(entry: Dict[str, Any]) -> str:
+    return entry.get('start_timestamp', '')
+
+
+def joined_length(entries: List[Dict[str, Any]]) -> int:
+    """Length of the entries' text joined with spaces in time order, stripped."""
+    return len(' '.join(e.get('text', '') for e in sorted(entries, key=_sort_key)).strip())
+
+
+class LazyTranscripts(Mapping):
+    """meeting id -> transcript entries, decoded on access."""
+
+    def __init__(self, transcripts: Dict[str, Any]):
+        self._raw: Dict[str, str] = {}
+        self._meta: Dict[str, Tuple[int, str, int]] = {}
+        for meeting_id, entries in transcripts.items():
+            if not isinstance(entries, list):
+                continue
+            last = entries[-1] if entries else {}
+            version = f"{len(entries)}:{last.get('end_timestamp') or last.get('start_timestamp', '')}"
+            self._meta[meeting_id] = (len(entries), version, joined_length(entries))
+            self._raw[meeting_id] = json.dumps(entries, separators=(',', ':'))
+        self._decoded: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, meeting_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            entries = self._decoded.get(meeting_id)
+            if entries is not None:
+                self._decoded.move_to_end(meeting_id)
+                return entries
+        entries = json.loads(self._raw[meeting_id])
+        with self._lock:
+            self._decoded[meeting_id] = entries
+            while len(self._decoded) > DECODED_TRANSCRIPTS_KEPT:
+                self._decoded.popitem(last=False)
+        return entries
+
+    def __contains__(self, meeting_id: object) -> bool:
+        return meeting_id in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def meta(self, meeting_id: str) -> Tuple[int, str, int]:
+        """(entry count, version tag, joined text length) — (0, '', 0) if there is no transcript."""
+        return self._meta.get(meeting_id, (0, '', 0))
+
+
+_lock = threading.Lock()
+_cached: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_stats = {"hits": 0, "loads": 0, "errors": 0}
+
+
+def _decode(path: Path) -> Dict[str, Any]:
+    with open(path, 'rb') as f:
+        wrapper = json.loads(f.read())
+    inner = wrapper.get('cache', '{}')
+    del wrapper
+    state = (json.loads(inner) if isinstance(inner, str) else inner or {}).get('state', {})
+    del inner
+
+    documents = state.get('documents') or {}
+    transcripts = LazyTranscripts(state.get('transcripts') or {})
+    people = state.get('people') or {}
+    del state
+
+    meeting_ids = [
+        doc_id for doc_id, doc in documents.items()
+        if isinstance(doc, dict) and doc.get('type') == 'meeting' and not doc.get('deleted_at')
+    ]
+    meeting_ids.sort(key=lambda doc_id: documents[doc_id].get('created_at') or '', reverse=True)
+
+    return {
+        'documents': documents,
+        'transcripts': transcripts,
+        'people': people,
+        'meeting_ids': meeting_ids,
+    }
+
+
+def load_granola_cache(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Decoded cache for `path`, reusing the previous decode while the file is unchanged.
+
+    Concurrent callers share one decode. Returns None if the file is missing
+    or can't be parsed.
+    """
+    key = str(path)
+    try:
+        st = Path(path).stat()
+    except OSError:
+        with _lock:
+            _cached.pop(key, None)
+        return None
+    signature = (st.st_mtime_ns, st.st_size)
+
+    with _lock:
+        cached = _cached.get(key)
+        if cached and cached[0] == signature:
+            _stats["hits"] += 1
+            return cached[1]
+        # Drop the stale version before decoding so both aren't in memory at once
+        _cached.pop(key, None)
+        try:
+            data = _decode(Path(path))
+        except Exception as e:
+            _stats["errors"] += 1
+            logger.error(f"Error reading Granola cache {path}: {e}")
+            return None
+        _cached[key] = (signature, data)
+        _stats["loads"] += 1
+        return data
+
+
+def cache_stats() -> Dict[str, int]:
+    with _lock:
+        return dict(_stats)
+
+
+def clear_cache() -> None:
+    with _lock:
+        _cached.clear()
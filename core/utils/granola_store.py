@@ -0,0 +1,570 @@
+"""
+Dex Granola Store — Local SQLite mirror of Granola meeting documents
+
+The Granola tools used to fetch the first page of /v2/get-documents (100 docs)
+on every call and filter it client-side, so anything older than the 100th
+document was invisible and every call re-downloaded the same payload. This
+module mirrors the full document history into a SQLite database and keeps it
+current with cheap delta syncs, so tool calls become local queries.
+
+Sync strategy (the API lists documents most-recently-active first and has no
+server-side "changed since" filter):
+
+1. Full pass: page through every document once. Progress is checkpointed
+   after each page, so an interrupted backfill resumes where it stopped.
+   Documents not seen by a pass that ran start to finish are removed
+   (deleted upstream); a resumed pass leaves that to the next fresh one.
+2. Delta pass: page from the top and upsert documents that are new or whose
+   updated_at moved past what is stored; stop at the first page with no
+   changes. Usually one request.
+3. A full pass is repeated every FULL_RESYNC_INTERVAL to pick up edits and
+   deletions the delta walk can't see (e.g. an old meeting's notes edited).
+
+Full-text search: every stored document is also indexed in an FTS5 table over
+title, rendered notes, transcript and attendee names/emails, updated in the
+same transaction as the document. Searches rank by BM25, support "quoted
+phrases" and prefix* terms, filter by date range and return highlighted
+snippets. Transcripts come from Granola's local cache (the document list API
+doesn't include them) and are attached with set_transcripts(). Without FTS5 in
+the local SQLite build, search() returns None and callers scan instead.
+
+Usage:
+    from core.utils.granola_store import GranolaMeetingStore
+
+    store = GranolaMeetingStore(vault_path / "System" / ".granola-meetings.db", doc_text=render)
+    store.sync(lambda offset, limit: fetch_docs(offset, limit))
+    docs = store.documents(since="2026-01-01T00:00:00")
+    doc = store.get(meeting_id)
+    hits = store.search('"pricing review" acme*', since="2026-01-01")
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the table layout changes — the mirror is rebuilt by the next sync
+SCHEMA_VERSION = 2
+
+# Documents per API page
+PAGE_SIZE = 100
+
+# Seconds between full passes (edits to older meetings, upstream deletions)
+FULL_RESYNC_INTERVAL = 24 * 3600
+
+# fetch_page(offset, limit) -> list of API documents, or None if the request failed
+PageFetcher = Callable[[int, int], Optional[List[Dict[str, Any]]]]
+
+# doc_text(doc) -> {'notes': ..., 'attendees': ...} searchable text for a document
+DocText = Callable[[Dict[str, Any]], Dict[str, str]]
+
+# BM25 column weights: title, notes, transcript, attendees
+BM25_WEIGHTS = (10.0, 4.0, 1.0, 6.0)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    id          TEXT PRIMARY KEY,
+    title       TEXT,
+    created_at  TEXT NOT NULL DEFAULT '',
+    updated_at  TEXT NOT NULL DEFAULT '',
+    deleted_at  TEXT,
+    generation  INTEGER NOT NULL,
+    doc         TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_meetings_created ON meetings(created_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transcripts (
+    id        TEXT PRIMARY KEY,
+    signature TEXT NOT NULL,
+    text      TEXT NOT NULL
+);
+"""
+
+# rowid = meetings.rowid (stable: documents are updated in place, never replaced)
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS meeting_fts USING fts5(
+    title, notes, transcript, attendees,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+"""
+
+_QUERY_TOKEN = re.compile(r'"([^"]*)"|(\S+)')
+_OPERATORS = {'AND', 'OR', 'NOT'}
+
+
+def build_match_query(query: str) -> str:
+    """
+    Turn a user query into a safe FTS5 MATCH expression.
+
+    Bare words are quoted (so emails, domains and punctuation can't break the
+    syntax), "quoted phrases" stay phrases, a trailing * makes a prefix term,
+    and upper-case AND/OR/NOT pass through as operators. Terms are ANDed.
+    """
+    parts: List[str] = []
+    for phrase, word in _QUERY_TOKEN.findall(query):
+        if phrase:
+            if phrase.strip():
+                parts.append('"' + phrase.replace('"', '""') + '"')
+        elif word in _OPERATORS:
+            if parts and parts[-1] not in _OPERATORS:
+                parts.append(word)
+        else:
+            prefix = word.endswith('*')
+            word = word.rstrip('*').replace('"', ' ')
+            if re.search(r'\w', word):
+                parts.append(f'"{word}"' + ('*' if prefix else ''))
+    while parts and parts[-1] in _OPERATORS:
+        parts.pop()
+    return ' '.join(parts)
+
+
+def default_doc_text(doc: Dict[str, Any]) -> Dict[str, str]:
+    """Searchable text from fields every Granola document carries (no panel rendering)."""
+    attendees = []
+    for attendee in (doc.get('people') or {}).get('attendees') or []:
+        name = ((attendee.get('details') or {}).get('person') or {}).get('name', {}).get('fullName') \
+            or attendee.get('name')
+        attendees.extend(v for v in (name, attendee.get('email')) if v)
+    return {
+        'notes': doc.get('notes_markdown') or doc.get('notes_plain') or '',
+        'attendees': ' '.join(attendees),
+    }
+
+
+class GranolaMeetingStore:
+    """SQLite mirror of Granola documents, refreshed by full and delta syncs."""
+
+    def __init__(self, db_path: Path, full_resync_interval: float = FULL_RESYNC_INTERVAL,
+                 doc_text: Optional[DocText] = None):
+        self.db_path = Path(db_path)
+        self.full_resync_interval = full_resync_interval
+        self.doc_text = doc_text or default_doc_text
+        self.has_fts = False
+        self._lock = threading.RLock()
+        self._full_pass_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # ------------------------------------------------------------------
+    # Connection / schema
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            conn = self._open()
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Granola store unreadable ({e}), rebuilding")
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(f"{self.db_path}{suffix}")
+                except FileNotFoundError:
+                    pass
+            conn = self._open()
+
+        self._conn = conn
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.executescript(
+                "DROP TABLE IF EXISTS meetings; DROP TABLE IF EXISTS sync_state; "
+                "DROP TABLE IF EXISTS transcripts; DROP TABLE IF EXISTS meeting_fts;"
+            )
+            if version:
+                logger.info(f"Granola store schema v{version} → v{SCHEMA_VERSION}, resyncing")
+        conn.executescript(_SCHEMA)
+        try:
+            conn.executescript(_FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite FTS5 unavailable ({e}); meeting search will scan documents")
+            self.has_fts = False
+        conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        conn.commit()
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _state(self, conn: sqlite3.Connection) -> Dict[str, str]:
+        return dict(conn.execute("SELECT key, value FROM sync_state").fetchall())
+
+    def _set_state(self, conn: sqlite3.Connection, **values: Any) -> None:
+        conn.executemany(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+            [(key, str(value)) for key, value in values.items()],
+        )
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def _upsert(self, conn: sqlite3.Connection, docs: List[Dict[str, Any]], generation: int) -> int:
+        """Store new/changed documents and stamp every seen one with `generation`. Returns changed count."""
+        ids = [doc.get('id') for doc in docs if doc.get('id')]
+        stored = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            stored.update(conn.execute(
+                f"SELECT id, updated_at FROM meetings WHERE id IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall())
+
+        changed = []
+        for doc in docs:
+            doc_id = doc.get('id')
+            if not doc_id:
+                continue
+            updated_at = doc.get('updated_at') or doc.get('created_at') or ''
+            if doc_id in stored and stored[doc_id] >= updated_at:
+                continue
+            changed.append(((
+                doc_id, doc.get('title'), doc.get('created_at') or '', updated_at,
+                doc.get('deleted_at'), generation, json.dumps(doc),
+            ), doc))
+
+        if changed:
+            # Update in place (not INSERT OR REPLACE) so rowids — the FTS keys — stay stable
+            conn.executemany(
+                "INSERT INTO meetings (id, title, created_at, updated_at, deleted_at, generation, doc) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET title = excluded.title, created_at = excluded.created_at, "
+                "updated_at = excluded.updated_at, deleted_at = excluded.deleted_at, "
+                "generation = excluded.generation, doc = excluded.doc",
+                [row for row, _ in changed],
+            )
+            self._index_documents(conn, [doc for _, doc in changed])
+        if ids:
+            conn.executemany("UPDATE meetings SET generation = ? WHERE id = ?", [(generation, i) for i in ids])
+        return len(changed)
+
+    def _index_documents(self, conn: sqlite3.Connection, docs: List[Dict[str, Any]]) -> None:
+        """(Re)write the FTS rows of stored documents, keeping any attached transcript."""
+        if not self.has_fts:
+            return
+        for doc in docs:
+            row = conn.execute(
+                "SELECT m.rowid, t.text FROM meetings m LEFT JOIN transcripts t ON t.id = m.id WHERE m.id = ?",
+                (doc['id'],),
+            ).fetchone()
+            if row is None:
+                continue
+            try:
+                text = self.doc_text(doc)
+            except Exception as e:
+                logger.warning(f"Could not extract search text for {doc['id']}: {e}")
+                text = default_doc_text(doc)
+            conn.execute("DELETE FROM meeting_fts WHERE rowid = ?", (row[0],))
+            conn.execute(
+                "INSERT INTO meeting_fts (rowid, title, notes, transcript, attendees) VALUES (?, ?, ?, ?, ?)",
+                (row[0], doc.get('title') or '', text.get('notes') or '', row[1] or '', text.get('attendees') or ''),
+            )
+
+    def _remove_stale(self, conn: sqlite3.Connection, generation: int) -> int:
+        if self.has_fts:
+            conn.execute(
+                "DELETE FROM meeting_fts WHERE rowid IN (SELECT rowid FROM meetings WHERE generation < ?)",
+                (generation,),
+            )
+        conn.execute(
+            "DELETE FROM transcripts WHERE id IN (SELECT id FROM meetings WHERE generation < ?)", (generation,)
+        )
+        return conn.execute("DELETE FROM meetings WHERE generation < ?", (generation,)).rowcount
+
+    def set_transcripts(self, transcripts: Dict[str, Tuple[str, Callable[[], str]]]) -> int:
+        """
+        Attach transcript text to stored documents: id -> (signature, loader).
+
+        A transcript is loaded and reindexed only when its signature changed, so
+        callers can pass every transcript they know about on each refresh. IDs
+        that aren't in the store are ignored.
+
+        Returns:
+            Number of transcripts (re)indexed
+        """
+        with self._lock:
+            conn = self._connect()
+            known = dict(conn.execute(
+                "SELECT m.id, COALESCE(t.signature, '') FROM meetings m LEFT JOIN transcripts t ON t.id = m.id"
+            ).fetchall())
+            updated = 0
+            for doc_id, (signature, loader) in transcripts.items():
+                if doc_id not in known or known[doc_id] == signature:
+                    continue
+                text = loader()
+                conn.execute(
+                    "INSERT OR REPLACE INTO transcripts (id, signature, text) VALUES (?, ?, ?)",
+                    (doc_id, signature, text),
+                )
+                if self.has_fts:
+                    conn.execute(
+                        "UPDATE meeting_fts SET transcript = ? WHERE rowid = (SELECT rowid FROM meetings WHERE id = ?)",
+                        (text, doc_id),
+                    )
+                updated += 1
+            conn.commit()
+            return updated
+
+    def sync(self, fetch_page: PageFetcher, full: bool = False, page_size: int = PAGE_SIZE) -> Dict[str, Any]:
+        """
+        Bring the mirror up to date.
+
+        Pages are fetched without holding the store lock, so reads (and delta
+        syncs from other threads) keep working while a long full pass runs.
+        Only one full pass runs at a time.
+
+        Args:
+            fetch_page: fetch_page(offset, limit) -> docs, or None on failure
+            full:       Force a full pass even if the last one is recent
+
+        Returns:
+            {'mode', 'pages', 'changed', 'removed', 'complete'}; complete is False
+            when a request failed part-way (progress so far is kept)
+        """
+        if not (full or self.full_pass_due):
+            return self.delta_sync(fetch_page, page_size)
+
+        with self._full_pass_lock:
+            with self._lock:
+                conn = self._connect()
+                state = self._state(conn)
+                generation = int(state.get('generation', '1'))
+                resume_offset = int(state.get('full_sync_offset', '0'))
+                if resume_offset == 0:
+                    # Fresh pass: rows not re-stamped with this generation are gone upstream
+                    generation += 1
+                    self._set_state(conn, generation=generation)
+                    conn.commit()
+            return self._full_pass(fetch_page, page_size, generation, resume_offset)
+
+    def delta_sync(self, fetch_page: PageFetcher, page_size: int = PAGE_SIZE) -> Dict[str, Any]:
+        """
+        Upsert new and changed documents from the top of the list only.
+
+        Safe to run while a full pass is in progress on another thread.
+        """
+        pages = changed = offset = 0
+        complete = True
+        while True:
+            docs = fetch_page(offset, page_size)
+            if docs is None:
+                complete = False
+                break
+            pages += 1
+            with self._lock:
+                conn = self._connect()
+                generation = int(self._state(conn).get('generation', '1'))
+                page_changed = self._upsert(conn, docs, generation)
+                conn.commit()
+            changed += page_changed
+            offset += len(docs)
+            if page_changed == 0 or len(docs) < page_size:
+                break
+        if complete:
+            with self._lock:
+                conn = self._connect()
+                self._set_state(conn, last_sync_at=time.time())
+                conn.commit()
+        return {'mode': 'delta', 'pages': pages, 'changed': changed, 'removed': 0, 'complete': complete}
+
+    def _full_pass(self, fetch_page: PageFetcher, page_size: int, generation: int,
+                   offset: int) -> Dict[str, Any]:
+        # Documents can move between pages while a pass is interrupted (the list
+        # is ordered by activity), so a resumed pass may have skipped some. It
+        # must not delete what it didn't stamp; the next fresh pass cleans up.
+        resumed = offset > 0
+        pages = changed = 0
+        while True:
+            docs = fetch_page(offset, page_size)
+            if docs is None:
+                logger.warning(f"Granola full sync interrupted at offset {offset}; will resume")
+                return {'mode': 'full', 'pages': pages, 'changed': changed, 'removed': 0, 'complete': False}
+            pages += 1
+            offset += len(docs)
+            with self._lock:
+                conn = self._connect()
+                changed += self._upsert(conn, docs, generation)
+                if len(docs) < page_size:
+                    break
+                self._set_state(conn, full_sync_offset=offset)
+                conn.commit()
+
+        with self._lock:
+            conn = self._connect()
+            removed = 0 if resumed else self._remove_stale(conn, generation)
+            self._set_state(conn, full_sync_offset=0, full_sync_completed_at=time.time(),
+                            last_sync_at=time.time())
+            conn.commit()
+        logger.info(f"Granola full sync: {pages} pages, {changed} changed, {removed} removed"
+                    + (" (resumed, stale check deferred)" if resumed else ""))
+        return {'mode': 'full', 'pages': pages, 'changed': changed, 'removed': removed, 'complete': True}
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM meetings").fetchone()[0]
+
+    @property
+    def full_pass_due(self) -> bool:
+        """True when sync() would run a full pass (never completed, interrupted, or stale)."""
+        with self._lock:
+            state = self._state(self._connect())
+        full_done_at = float(state.get('full_sync_completed_at', '0'))
+        return (
+            full_done_at == 0
+            or int(state.get('full_sync_offset', '0')) > 0
+            or time.time() - full_done_at > self.full_resync_interval
+        )
+
+    @property
+    def ready(self) -> bool:
+        """True once a full pass has completed at least once."""
+        with self._lock:
+            return float(self._state(self._connect()).get('full_sync_completed_at', '0')) > 0
+
+    def documents(self, since: Optional[str] = None, include_deleted: bool = False) -> List[Dict[str, Any]]:
+        """
+        Stored documents, newest first.
+
+        Args:
+            since: ISO timestamp — only documents created at/after it. Documents
+                   without a created_at are always included.
+        """
+        sql = "SELECT doc FROM meetings"
+        clauses, params = [], []
+        if since:
+            clauses.append("(created_at >= ? OR created_at = '')")
+            params.append(since)
+        if not include_deleted:
+            clauses.append("deleted_at IS NULL")
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at DESC"
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def summaries(self, since: Optional[str] = None) -> List[Tuple[str, str, str, str]]:
+        """(id, title, created_at, updated_at) of live documents, newest first — no JSON decoding."""
+        sql = "SELECT id, COALESCE(title, ''), created_at, updated_at FROM meetings WHERE deleted_at IS NULL"
+        params: List[str] = []
+        if since:
+            sql += " AND (created_at >= ? OR created_at = '')"
+            params.append(since)
+        sql += " ORDER BY created_at DESC"
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def get(self, meeting_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connect().execute("SELECT doc FROM meetings WHERE id = ?", (meeting_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def search(self, query: str, since: Optional[str] = None, until: Optional[str] = None,
+               limit: int = 10, offset: int = 0) -> Optional[List[Dict[str, Any]]]:
+        """
+        Ranked full-text search over title, notes, transcript and attendees.
+
+        Args:
+            query: Words (ANDed), "quoted phrases", prefix* terms, AND/OR/NOT
+            since: ISO date/timestamp — created at/after
+            until: ISO date/timestamp — created before
+            limit/offset: Page of results, best match first
+
+        Returns:
+            [{'doc', 'score', 'snippet'}] (higher score = better match), or None
+            when FTS5 is unavailable or the query can't be parsed
+        """
+        if not self.has_fts:
+            return None
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        # Rank first, then build snippets for the returned page only — snippet()
+        # over every match costs far more than the ranking itself
+        weights = ', '.join(str(w) for w in BM25_WEIGHTS)
+        sql = (
+            f"SELECT meeting_fts.rowid, bm25(meeting_fts, {weights}) AS rank "
+            f"FROM meeting_fts JOIN meetings m ON m.rowid = meeting_fts.rowid "
+            f"WHERE meeting_fts MATCH ? AND m.deleted_at IS NULL"
+        )
+        params: List[Any] = [match]
+        if since:
+            sql += " AND m.created_at >= ?"
+            params.append(since)
+        if until:
+            sql += " AND m.created_at < ?"
+            params.append(until)
+        sql += " ORDER BY rank LIMIT ? OFFSET ?"
+        params += [limit, offset]
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                ranked = conn.execute(sql, params).fetchall()
+                if not ranked:
+                    return []
+                rowids = [rowid for rowid, _ in ranked]
+                details = {
+                    rowid: (doc, snippet)
+                    for rowid, doc, snippet in conn.execute(
+                        f"SELECT meeting_fts.rowid, m.doc, snippet(meeting_fts, -1, '**', '**', '…', 16) "
+                        f"FROM meeting_fts JOIN meetings m ON m.rowid = meeting_fts.rowid "
+                        f"WHERE meeting_fts MATCH ? AND meeting_fts.rowid IN ({','.join('?' * len(rowids))})",
+                        [match] + rowids,
+                    )
+                }
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Meeting search query {match!r} failed: {e}")
+                return None
+        return [
+            {'doc': json.loads(details[rowid][0]), 'score': round(-rank, 4), 'snippet': details[rowid][1]}
+            for rowid, rank in ranked
+            if rowid in details
+        ]
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._connect()
+            state = self._state(conn)
+            count, oldest, newest = conn.execute(
+                "SELECT COUNT(*), MIN(NULLIF(created_at, '')), MAX(created_at) FROM meetings"
+            ).fetchone()
+            transcripts = conn.execute("SELECT COUNT(*) FROM transcripts").fetchone()[0]
+        full_done_at = float(state.get('full_sync_completed_at', '0'))
+        last_sync_at = float(state.get('last_sync_at', '0'))
+        return {
+            'path': str(self.db_path),
+            'documents': count,
+            'oldest': oldest,
+            'newest': newest,
+            'full_sync_completed_at': full_done_at or None,
+            'last_sync_at': last_sync_at or None,
+            'resume_offset': int(state.get('full_sync_offset', '0')),
+            'transcripts': transcripts,
+            'full_text_search': self.has_fts,
+        }
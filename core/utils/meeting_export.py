@@ -0,0 +1,254 @@
+"""
+Dex Meeting Export — Parallel, resumable export of meetings into vault notes
+
+Onboarding backfills a couple of thousand Granola meetings into
+00-Inbox/Meetings/YYYY-MM-DD/<slug>.md. This module runs that export:
+
+- Meetings are streamed from the caller and rendered/written by a thread
+  pool, with a bounded number in flight so memory stays flat.
+- Every file is written atomically (temp file in the same folder + rename),
+  so an interrupted export never leaves a half-written note.
+- A manifest (System/.granola-export.json) records each meeting's source
+  version, path and the hash of what was written. Unchanged meetings are
+  skipped without rendering, and the manifest is checkpointed as the export
+  runs, so re-running after an interruption picks up where it stopped.
+- Notes are never clobbered: a file we didn't write gets a suffixed name
+  instead, and a note edited since export is left alone unless forced.
+
+Usage:
+    from core.utils.meeting_export import ExportItem, MeetingExporter
+
+    exporter = MeetingExporter(vault_path)
+    summary = exporter.export(
+        ExportItem(id=doc['id'], version=doc['updated_at'], date='2026-01-28',
+                   title=doc['title'], render=lambda doc=doc: render_note(doc))
+        for doc in docs
+    )
+    # {'written': 1980, 'unchanged': 0, 'modified_locally': 2, 'failed': 0, ...}
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+DEFAULT_WORKERS = int(os.environ.get('DEX_EXPORT_WORKERS', '4'))
+
+# Manifest checkpoint interval (meetings completed)
+CHECKPOINT_EVERY = 50
+
+
+@dataclass
+class ExportItem:
+    """One meeting to export. render() is only called if the meeting changed."""
+    id: str
+    version: str           # changes whenever the rendered note would
+    date: str              # YYYY-MM-DD — the note's folder
+    title: str
+    render: Callable[[], str]
+
+
+def slugify(text: str) -> str:
+    """File name slug (same rules as the meeting-intel sync script)."""
+    return re.sub(r'[^a-z0-9]+', '-', (text or '').lower()).strip('-')[:60] or 'meeting'
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Write via a temp file in the same folder and rename over the target."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix='.dex-export.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _file_hash(path: Path) -> Optional[str]:
+    try:
+        return content_hash(path.read_text(encoding='utf-8'))
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+class MeetingExporter:
+    """Exports meetings to dated note files, tracking what was written in a manifest."""
+
+    def __init__(self, vault_path: Path, meetings_dir: str = '00-Inbox/Meetings',
+                 manifest_path: Optional[Path] = None, workers: int = DEFAULT_WORKERS):
+        self.vault_path = Path(vault_path)
+        self.meetings_dir = meetings_dir
+        self.manifest_path = Path(manifest_path) if manifest_path else \
+            self.vault_path / 'System' / '.granola-export.json'
+        self.workers = max(1, workers)
+        self._lock = threading.Lock()
+        self._reserved: Set[str] = set()
+        self.manifest: Dict[str, Dict[str, str]] = self._load_manifest()
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    def _load_manifest(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.manifest_path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Export manifest unreadable ({e}); existing notes will be re-checked")
+            return {}
+        if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+            return {}
+        return dict(data.get('meetings', {}))
+
+    def save_manifest(self) -> None:
+        with self._lock:
+            payload = json.dumps({'version': MANIFEST_VERSION, 'meetings': self.manifest}, indent=1, sort_keys=True)
+        write_atomic(self.manifest_path, payload)
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def _claim_path(self, item: ExportItem, new_hash: str) -> Path:
+        """
+        Target file for a meeting not in the manifest: date/slug.md, suffixed if taken.
+
+        A file that already holds exactly this content is adopted — that's a
+        note written by a run interrupted before its manifest checkpoint.
+        """
+        folder = Path(self.meetings_dir) / (item.date or 'undated')
+        slug = slugify(item.title)
+        candidates = [f"{slug}.md", f"{slug}-{slugify(item.id)[:8]}.md", f"{slug}-{slugify(item.id)}.md"]
+        with self._lock:
+            for name in candidates:
+                relative = str(folder / name)
+                if relative in self._reserved:
+                    continue
+                path = self.vault_path / relative
+                if not path.exists() or _file_hash(path) == new_hash:
+                    self._reserved.add(relative)
+                    return path
+            # The full-id name is unique to this meeting, so it is ours to overwrite
+            self._reserved.add(relative)
+            return path
+
+    def _export_one(self, item: ExportItem, force: bool, dry_run: bool) -> str:
+        """Render and write one meeting. Returns the outcome counter name."""
+        content = item.render()
+        new_hash = content_hash(content)
+        entry = self.manifest.get(item.id)
+
+        path, on_disk = None, None
+        if entry:
+            path = self.vault_path / entry['path']
+            on_disk = _file_hash(path)
+            if on_disk is None:
+                path = None  # note was moved or deleted — export it fresh
+            elif on_disk not in (entry.get('hash'), new_hash) and not force:
+                return 'modified_locally'
+        if path is None:
+            path = self._claim_path(item, new_hash)
+            on_disk = _file_hash(path)
+
+        if on_disk == new_hash:
+            outcome = 'unchanged'
+        else:
+            if not dry_run:
+                write_atomic(path, content)
+            outcome = 'written'
+
+        if not dry_run:
+            with self._lock:
+                self.manifest[item.id] = {
+                    'path': str(path.relative_to(self.vault_path)),
+                    'version': item.version,
+                    'hash': new_hash,
+                }
+        return outcome
+
+    def export(self, items: Iterable[ExportItem], force: bool = False, dry_run: bool = False,
+               on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Export every item, skipping those whose version matches the manifest.
+
+        Args:
+            items:       Meetings to export (consumed lazily)
+            force:       Re-render everything and overwrite notes edited since export
+            dry_run:     Count what would be written without touching the vault
+            on_progress: Called with the running summary after each completed meeting
+                         (also the place to raise to stop the export — the manifest
+                         is checkpointed first)
+        """
+        summary = {'written': 0, 'unchanged': 0, 'skipped': 0, 'modified_locally': 0, 'failed': 0, 'errors': []}
+        completed = 0
+        pending: Set[Future] = set()
+        max_pending = self.workers * 4
+
+        def collect(done):
+            nonlocal completed
+            for future in done:
+                pending.discard(future)
+                try:
+                    summary[future.result()] += 1
+                except Exception as e:
+                    summary['failed'] += 1
+                    if len(summary['errors']) < 20:
+                        summary['errors'].append(f"{future.item.id}: {e}")
+                    logger.warning(f"Export of meeting {future.item.id} failed: {e}")
+                completed += 1
+                if not dry_run and completed % CHECKPOINT_EVERY == 0:
+                    self.save_manifest()
+                if on_progress:
+                    on_progress(summary)
+
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='dex-export')
+        try:
+            for item in items:
+                entry = self.manifest.get(item.id)
+                if not force and entry and entry.get('version') == item.version \
+                        and (self.vault_path / entry['path']).exists():
+                    summary['skipped'] += 1
+                    continue
+                while len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                future = pool.submit(self._export_one, item, force, dry_run)
+                future.item = item
+                pending.add(future)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+            if not dry_run:
+                self.save_manifest()
+            with self._lock:
+                self._reserved.clear()
+
+        summary['total'] = sum(summary[k] for k in ('written', 'unchanged', 'skipped', 'modified_locally', 'failed'))
+        return summary
@@ -0,0 +1,234 @@
+"""
+Dex Memory Search — One ranked search over sessions, messages and observations
+
+The session memory tools search each FTS table separately (sessions and
+messages in search_sessions, observations in search_observations), each
+capped by LIMIT with no way to fetch a second page. This module runs one
+query over all three and merges them into a single ranking:
+
+    score = -bm25 × kind weight × recency
+    recency = RECENCY_FLOOR + (1 - RECENCY_FLOOR) / (1 + age_days / half_life)
+
+so a strong match from last year still outranks a weak one from today, but
+between comparable matches the recent one wins. The recency term is plain
+arithmetic (no SQLite math functions needed) and halves its boost at
+`half_life` days.
+
+Pagination is by keyset cursor. Results are totally ordered by
+(score desc, kind, id), and the cursor carries the last row's key plus the
+"now" the scores were computed against. The next page is the rows after
+that key — no OFFSET, so page 20 costs the same as page 2, and recency
+doesn't move between calls. The key is recomputed from BM25, though, and
+BM25 depends on table-wide statistics: if sessions, messages or
+observations are written while someone is paging, scores shift and a row
+near a page boundary can repeat or be skipped. Pages are exact only while
+the FTS tables are unchanged. A cursor only works with the query, kinds
+and filters it was issued for.
+
+`fields` picks what each result carries (snippets and full content cost
+the most, so they're only computed when asked for).
+
+Usage:
+    from core.utils.memory_search import search_memory
+
+    page = search_memory(conn, 'pricing "Acme Corp"', fields=['kind', 'id', 'snippet'], limit=10)
+    more = search_memory(conn, 'pricing "Acme Corp"', fields=['kind', 'id', 'snippet'],
+                         limit=10, cursor=page['next_cursor'])
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    from core.utils.granola_store import build_match_query
+except ImportError:
+    def build_match_query(query: str) -> str:
+        return query.replace("'", "").replace('"', '').strip()
+
+KINDS = ('session', 'message', 'observation')
+
+FIELDS = ('kind', 'id', 'session_id', 'session_name', 'timestamp', 'score', 'snippet',
+          'title', 'content', 'role', 'type', 'tool_name', 'status')
+DEFAULT_FIELDS = ('kind', 'id', 'session_id', 'session_name', 'timestamp', 'score', 'snippet')
+
+# Relative weight of a match by kind: a session match means its name or summary matched
+KIND_WEIGHTS = {'session': 1.25, 'message': 1.0, 'observation': 1.0}
+
+RECENCY_HALF_LIFE_DAYS = 30.0
+RECENCY_FLOOR = 0.5
+
+MAX_LIMIT = 100
+CURSOR_VERSION = 1
+
+# kind -> FTS table, joins, key columns and the SQL for each optional field
+_SOURCES: Dict[str, Dict[str, Any]] = {
+    'session': {
+        'fts': 'sessions_fts',
+        'join': 'JOIN sessions s ON s.rowid = sessions_fts.rowid',
+        'id': 's.id', 'session_id': 's.id', 'ts': 's.updated_at',
+        'fields': {'session_name': 's.name', 'title': 's.name', 'content': 's.summary',
+                   'status': 's.status', 'role': 'NULL', 'type': 'NULL', 'tool_name': 'NULL'},
+    },
+    'message': {
+        'fts': 'messages_fts',
+        'join': 'JOIN messages m ON m.rowid = messages_fts.rowid JOIN sessions s ON s.id = m.session_id',
+        'id': 'm.id', 'session_id': 'm.session_id', 'ts': 'm.created_at',
+        'fields': {'session_name': 's.name', 'title': 'NULL', 'content': 'm.content',
+                   'status': 'NULL', 'role': 'm.role', 'type': 'NULL', 'tool_name': 'NULL'},
+    },
+    'observation': {
+        'fts': 'observations_fts',
+        'join': 'JOIN observations o ON o.rowid = observations_fts.rowid JOIN sessions s ON s.id = o.session_id',
+        'id': 'o.id', 'session_id': 'o.session_id', 'ts': 'o.timestamp',
+        'fields': {'session_name': 's.name', 'title': 'NULL', 'content': 'o.summary',
+                   'status': 'NULL', 'role': 'NULL', 'type': 'o.type', 'tool_name': 'o.tool_name'},
+    },
+}
+
+
+def _signature(match: str, kinds: Iterable[str], days: Optional[int], half_life: float) -> str:
+    raw = json.dumps([match, sorted(kinds), days, half_life])
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:12]
+
+
+def encode_cursor(signature: str, now: str, score: float, kind: str, item_id: str) -> str:
+    payload = json.dumps({'v': CURSOR_VERSION, 'q': signature, 't': now, 's': score, 'k': kind, 'i': item_id},
+                         separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, signature: str) -> Dict[str, Any]:
+    """Cursor payload, or ValueError if it is malformed or belongs to another search."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, binascii.Error, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from None
+    if not isinstance(payload, dict) or payload.get('v') != CURSOR_VERSION or payload.get('k') not in KINDS:
+        raise ValueError("Invalid cursor")
+    if payload.get('q') != signature:
+        raise ValueError("Cursor belongs to a different query - start again without a cursor")
+    return payload
+
+
+def _kind_sql(kind: str, fields: List[str], since: bool, after: Optional[str]) -> str:
+    """Ranked SELECT for one kind. `after`: None, 'lt' (score <), 'le' (score <=) or 'key' (score, id)."""
+    source = _SOURCES[kind]
+    fts = source['fts']
+    ts = f"COALESCE({source['ts']}, '')"
+    age = f"COALESCE(julianday(:now) - julianday({source['ts']}), 1e9)"
+    score = (f"(-bm25({fts})) * {KIND_WEIGHTS[kind]} * "
+             f"({RECENCY_FLOOR} + {1 - RECENCY_FLOOR} / (1.0 + MAX(0.0, {age}) / :half_life))")
+
+    columns = [f"{source['id']} AS id", f"{source['session_id']} AS session_id", f"{ts} AS timestamp",
+               f"{score} AS score"]
+    columns += [f"{source['fields'][name]} AS {name}" for name in fields if name in source['fields']]
+    if 'snippet' in fields:
+        columns.append(f"snippet({fts}, -1, '«', '»', '…', 24) AS snippet")
+
+    inner = f"SELECT {', '.join(columns)} FROM {fts} {source['join']} WHERE {fts} MATCH :match"
+    if since:
+        inner += f" AND {ts} >= :since"
+
+    sql = f"SELECT * FROM ({inner})"
+    if after == 'lt':
+        sql += " WHERE score < :after_score"
+    elif after == 'le':
+        sql += " WHERE score <= :after_score"
+    elif after == 'key':
+        sql += " WHERE score < :after_score OR (score = :after_score AND id > :after_id)"
+    return sql + " ORDER BY score DESC, id LIMIT :limit"
+
+
+def search_memory(conn: sqlite3.Connection, query: str, kinds: Optional[Iterable[str]] = None,
+                  fields: Optional[Iterable[str]] = None, limit: int = 10, cursor: Optional[str] = None,
+                  days: Optional[int] = None, half_life_days: float = RECENCY_HALF_LIFE_DAYS,
+                  has_table: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
+    """
+    One page of ranked results across sessions, messages and observations.
+
+    Args:
+        conn:           Connection to the sessions DB
+        query:          Words, "quoted phrases", prefix* terms, AND/OR/NOT
+        kinds:          Subset of KINDS to search (default: all present in the DB)
+        fields:         Subset of FIELDS to return per result (default: DEFAULT_FIELDS)
+        limit:          Results per page (max MAX_LIMIT)
+        cursor:         next_cursor from the previous page
+        days:           Only rows from the last N days
+        half_life_days: Age at which the recency boost halves
+        has_table:      Table-exists check (default: asks sqlite_master)
+
+    Returns:
+        {'results': [...], 'next_cursor': str | None, 'kinds': [...]}
+
+    Raises:
+        ValueError: unknown kind/field, or a cursor from a different search
+    """
+    kinds = list(kinds) if kinds else list(KINDS)
+    unknown = [k for k in kinds if k not in KINDS] + [f for f in (fields or ()) if f not in FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown kinds/fields: {', '.join(unknown)}")
+    fields = list(fields) if fields else list(DEFAULT_FIELDS)
+    limit = max(1, min(int(limit), MAX_LIMIT))
+    half_life = max(float(half_life_days), 0.01)
+
+    if has_table is None:
+        def has_table(name: str) -> bool:
+            return conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,)).fetchone() is not None
+    kinds = [k for k in KINDS if k in kinds and has_table(_SOURCES[k]['fts'])]
+
+    match = build_match_query(query)
+    if not match or not kinds:
+        return {'results': [], 'next_cursor': None, 'kinds': kinds}
+
+    signature = _signature(match, kinds, days, half_life)
+    params: Dict[str, Any] = {'match': match, 'half_life': half_life, 'limit': limit + 1}
+    after_kind = None
+    if cursor:
+        # Later pages score against the first page's "now", so the ordering doesn't shift
+        position = decode_cursor(cursor, signature)
+        params.update(now=position['t'], after_score=position['s'], after_id=position['i'])
+        after_kind = position['k']
+    else:
+        params['now'] = datetime.now().isoformat(timespec='seconds')
+    since = (datetime.fromisoformat(params['now']) - timedelta(days=days)).isoformat() if days else None
+    params['since'] = since
+
+    rows = []
+    for kind in kinds:
+        after = None
+        if after_kind is not None:
+            # Total order is (score desc, kind, id): kinds after the cursor's may tie on score
+            order, cursor_order = KINDS.index(kind), KINDS.index(after_kind)
+            after = 'key' if kind == after_kind else 'le' if order > cursor_order else 'lt'
+        try:
+            found = conn.execute(_kind_sql(kind, fields, bool(since), after), params).fetchall()
+        except sqlite3.OperationalError:
+            continue  # FTS syntax the sanitizer let through — nothing from this kind
+        rows.extend((kind, row) for row in found)
+
+    rows.sort(key=lambda item: (-item[1]['score'], KINDS.index(item[0]), item[1]['id']))
+    page = rows[:limit]
+
+    results = []
+    for kind, row in page:
+        result = {}
+        for name in fields:
+            if name == 'kind':
+                result['kind'] = kind
+            elif name == 'score':
+                result['score'] = round(row['score'], 4)
+            else:
+                result[name] = row[name]
+        results.append({k: v for k, v in result.items() if v is not None})
+
+    next_cursor = None
+    if len(rows) > limit:
+        kind, last = page[-1]
+        next_cursor = encode_cursor(signature, params['now'], last['score'], kind, last['id'])
+    return {'results': results, 'next_cursor': next_cursor, 'kinds': kinds}
@@ -0,0 +1,521 @@
+"""
+Dex Mention Index — Entity → session/message/observation side table
+
+The session memory timelines (get_session_context, get_entity_timeline,
+get_observation_timeline) used to run LIKE '%name%' over sessions.entities,
+messages.content and observations.summary: full table scans that grow with
+every conversation. This module keeps a side table of entity mentions,
+keyed by normalized entity name, kind and timestamp, so a timeline is an
+indexed range scan.
+
+The sessions DB belongs to the Dex app and is opened read-only, so the index
+lives in its own file (System/.dex-session-mentions.db) and is built
+incrementally from the sessions DB:
+
+- Entity names come from the app's extracted `entities` JSON on sessions and
+  observations (which also link those rows directly). A name that isn't one
+  of them is answered by a direct FTS query and not stored, so the refresh
+  cost doesn't grow with every name anyone has ever looked up.
+- Mentions in text are FTS token hits: each entity is matched as a phrase
+  against sessions_fts / messages_fts / observations_fts, restricted to rowids
+  past that entity's watermark. New rows and new entities both only cost the
+  delta. Sessions edited in place (re-summarized) are re-matched directly.
+- Lookups ingest new entities JSON at most every REFRESH_INTERVAL and bring
+  only the queried entity up to date for the kind being read, so new
+  messages show up at once. Other entities that lag behind are caught up on
+  a background thread, so a lookup costs the same however many entities
+  there are.
+- The first build (and a rebuild after the sessions DB is replaced, i.e. a
+  new inode) runs on a background thread with its own read-only connection.
+  timeline() returns None until it finishes, so callers keep scanning.
+
+Matching is by whole tokens (FTS semantics), not substrings: "Sarah" finds
+"Sarah Chen" but not "Sarahs".
+
+Usage:
+    from core.utils.mention_index import MentionIndex
+
+    index = MentionIndex(vault_path / "System" / ".dex-session-mentions.db")
+    hits = index.timeline(source_conn, "Sarah Chen", "message", limit=20)
+    # [(message_id, session_id, created_at), ...] newest first, or None if
+    # the sessions DB can't be indexed or the index is still being built
+    # (caller falls back to scanning)
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 2
+
+# Seconds between incremental refreshes triggered by lookups
+REFRESH_INTERVAL = 30
+
+# Entities scanned per lock hold (and transaction) while catching up in the background
+CATCH_UP_CHUNK = 50
+
+# kind -> (table, FTS table, session id column, timestamp column)
+SOURCES = {
+    'session': ('sessions', 'sessions_fts', 'id', 'updated_at'),
+    'message': ('messages', 'messages_fts', 'session_id', 'created_at'),
+    'observation': ('observations', 'observations_fts', 'session_id', 'timestamp'),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    norm                TEXT PRIMARY KEY,
+    name                TEXT NOT NULL,
+    session_through     INTEGER NOT NULL DEFAULT 0,
+    message_through     INTEGER NOT NULL DEFAULT 0,
+    observation_through INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS mentions (
+    norm       TEXT NOT NULL,
+    kind       TEXT NOT NULL,
+    item_id    TEXT NOT NULL,
+    session_id TEXT,
+    ts         TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (norm, kind, item_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_mentions_timeline ON mentions(norm, kind, ts DESC);
+CREATE INDEX IF NOT EXISTS idx_mentions_item ON mentions(kind, item_id);
+CREATE TABLE IF NOT EXISTS index_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_TOKEN = re.compile(r'[^\W_]+')
+
+
+def normalize(name: str) -> str:
+    """Lower-cased word tokens joined by single spaces ('Sarah  Chen!' -> 'sarah chen')."""
+    return ' '.join(_TOKEN.findall((name or '').lower()))
+
+
+def entity_names(value: Any) -> List[str]:
+    """Names in an entities JSON value: a list of strings / {"name": ...} dicts, or {"entities": [...]}."""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return []
+    if isinstance(value, dict):
+        value = value.get('entities', [])
+    names = []
+    for item in value if isinstance(value, list) else []:
+        name = item.get('name') if isinstance(item, dict) else item
+        if isinstance(name, str) and name.strip():
+            names.append(name.strip())
+    return names
+
+
+class MentionIndex:
+    """Incrementally maintained entity mention table over a read-only sessions DB."""
+
+    def __init__(self, db_path: Path, refresh_interval: float = REFRESH_INTERVAL):
+        self.db_path = Path(db_path)
+        self.refresh_interval = refresh_interval
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._last_refresh = 0.0
+        self._tables: frozenset = frozenset()
+        self._built_for: Optional[str] = None  # source identity the index is complete for
+        self._build_thread: Optional[threading.Thread] = None
+        self._catch_up_thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Connection / state
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            conn = self._open()
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Mention index unreadable ({e}), rebuilding")
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(f"{self.db_path}{suffix}")
+                except FileNotFoundError:
+                    pass
+            conn = self._open()
+        self._conn = conn
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            conn.executescript(
+                "DROP TABLE IF EXISTS entities; DROP TABLE IF EXISTS mentions; DROP TABLE IF EXISTS index_state;"
+            )
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        conn.commit()
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _state(self, conn: sqlite3.Connection) -> Dict[str, str]:
+        return dict(conn.execute("SELECT key, value FROM index_state").fetchall())
+
+    def _set_state(self, conn: sqlite3.Connection, **values: Any) -> None:
+        conn.executemany(
+            "INSERT INTO index_state (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            [(k, str(v)) for k, v in values.items()],
+        )
+
+    @staticmethod
+    def _source_identity(source: sqlite3.Connection) -> str:
+        path = source.execute("PRAGMA database_list").fetchone()[2]
+        try:
+            st = os.stat(path)
+        except (OSError, TypeError):
+            return ''
+        return f"{st.st_dev}:{st.st_ino}"
+
+    def _add_entities(self, conn: sqlite3.Connection, names: Iterable[str]) -> None:
+        conn.executemany(
+            "INSERT OR IGNORE INTO entities (norm, name) VALUES (?, ?)",
+            [(normalize(name), name) for name in names if normalize(name)],
+        )
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def refresh(self, source: sqlite3.Connection, force: bool = False) -> bool:
+        """
+        Bring the index fully up to date with the sessions DB (at most every refresh_interval).
+
+        Scans every entity that lags the newest rows, one FTS query per entity
+        and kind, so it runs on the build thread; lookups only ingest inline.
+
+        Returns:
+            True if the sessions DB can be indexed (has sessions and messages FTS)
+        """
+        if not self._ingest(source, force):
+            return False
+        identity = self._source_identity(source)
+        self._catch_up(source)
+        with self._lock:
+            conn = self._connect()
+            self._set_state(conn, source=identity)
+            conn.commit()
+            self._built_for = identity
+        return True
+
+    def _ingest(self, source: sqlite3.Connection, force: bool = False) -> bool:
+        """Throttled: link entities JSON from new or edited sessions and observations."""
+        with self._lock:
+            now = time.time()
+            if not force and now - self._last_refresh < self.refresh_interval:
+                return self._indexable()
+            self._last_refresh = now
+
+            self._probe_tables(source)
+            if not self._indexable():
+                return False
+
+            conn = self._connect()
+            identity = self._source_identity(source)
+            state = self._state(conn)
+            if state.get('source') != identity:
+                if state.get('source'):
+                    logger.info("Sessions DB was replaced; rebuilding the mention index")
+                conn.executescript("DELETE FROM entities; DELETE FROM mentions; DELETE FROM index_state;")
+                state = {}
+
+            started = time.perf_counter()
+            self._ingest_sessions(source, conn, state)
+            if self._has_kind('observation'):
+                self._ingest_observations(source, conn, state)
+            conn.commit()
+            logger.debug(f"Mention index ingested in {(time.perf_counter() - started) * 1000:.0f} ms")
+            return True
+
+    def _refresh_for_lookup(self, source: sqlite3.Connection) -> bool:
+        """Throttled ingest for a lookup; entities left behind are handed to the background catch-up."""
+        if time.time() - self._last_refresh < self.refresh_interval:
+            return self._indexable()
+        if not self._ingest(source, force=True):
+            return False
+        if self._lagging(source):
+            self._start_catch_up(source)
+        return True
+
+    def _lagging(self, source: sqlite3.Connection) -> bool:
+        """Whether any entity's watermark is behind the newest row of its kind."""
+        with self._lock:
+            conn = self._connect()
+            for kind in SOURCES:
+                if self._has_kind(kind) and conn.execute(
+                    f"SELECT 1 FROM entities WHERE {kind}_through < ? LIMIT 1", (self._max_rowid(source, kind),)
+                ).fetchone():
+                    return True
+            return False
+
+    def _catch_up(self, source: sqlite3.Connection) -> None:
+        """
+        Scan every lagging entity up to the newest rows. The lock is taken per
+        CATCH_UP_CHUNK entities, so lookups interleave with a long catch-up.
+        """
+        for kind in SOURCES:
+            if not self._has_kind(kind):
+                continue
+            latest = self._max_rowid(source, kind)
+            with self._lock:
+                behind = [norm for (norm,) in self._connect().execute(
+                    f"SELECT norm FROM entities WHERE {kind}_through < ?", (latest,)
+                )]
+            for start in range(0, len(behind), CATCH_UP_CHUNK):
+                with self._lock:
+                    conn = self._connect()
+                    for norm in behind[start:start + CATCH_UP_CHUNK]:
+                        row = conn.execute(f"SELECT {kind}_through FROM entities WHERE norm = ?",
+                                           (norm,)).fetchone()
+                        if row is not None and row[0] < latest:  # a lookup may have caught it up already
+                            self._scan(source, conn, norm, kind, row[0], latest)
+                    conn.commit()
+
+    def _start_catch_up(self, source: sqlite3.Connection) -> None:
+        """Catch lagging entities up on a background thread with its own connection (single flight)."""
+        thread = self._catch_up_thread
+        if thread is not None and thread.is_alive():
+            return
+        path = source.execute("PRAGMA database_list").fetchone()[2]
+        if not path:
+            return  # in-memory: entities catch up as they're looked up
+        self._catch_up_thread = threading.Thread(target=self._background, args=(path, self._catch_up),
+                                                 daemon=True, name='mention-index-catch-up')
+        self._catch_up_thread.start()
+
+    def _ensure_built(self, source: sqlite3.Connection) -> bool:
+        """
+        True if the index has been built for this sessions DB. Otherwise start
+        the build on a background thread (once) and return False.
+        """
+        identity = self._source_identity(source)
+        if identity and identity == self._built_for:
+            return True
+        thread = self._build_thread
+        if thread is not None and thread.is_alive():
+            return False
+
+        with self._lock:
+            if identity and self._state(self._connect()).get('source') == identity:
+                self._built_for = identity
+                return True
+            self._probe_tables(source)
+            if not self._indexable():
+                return False
+            path = source.execute("PRAGMA database_list").fetchone()[2]
+            if not identity or not path:
+                # Nothing to reopen (e.g. an in-memory DB) — build inline
+                return self.refresh(source, force=True)
+            self._build_thread = threading.Thread(target=self._background, args=(path, self._build),
+                                                  daemon=True, name='mention-index-build')
+            self._build_thread.start()
+            return False
+
+    def _build(self, source: sqlite3.Connection) -> None:
+        started = time.perf_counter()
+        if self.refresh(source, force=True):
+            logger.info(f"Mention index built in {time.perf_counter() - started:.1f}s")
+
+    @staticmethod
+    def _background(path: str, work: Callable[[sqlite3.Connection], None]) -> None:
+        """Run `work` against a read-only connection of its own (connections are per thread)."""
+        try:
+            source = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        except sqlite3.Error as e:
+            logger.warning(f"Mention index could not open {path}: {e}")
+            return
+        try:
+            work(source)
+        except sqlite3.Error as e:
+            logger.warning(f"Mention index {getattr(work, '__name__', 'update')} failed: {e}")
+        finally:
+            source.close()
+
+    def wait_built(self, timeout: Optional[float] = None) -> bool:
+        """Wait for background build/catch-up work to finish. True if none is running afterwards."""
+        for thread in (self._build_thread, self._catch_up_thread):
+            if thread is not None:
+                thread.join(timeout)
+                if thread.is_alive():
+                    return False
+        return True
+
+    def _probe_tables(self, source: sqlite3.Connection) -> None:
+        self._tables = frozenset(row[0] for row in source.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'view')"
+        ).fetchall())
+
+    def _indexable(self) -> bool:
+        return self._has_kind('session') and self._has_kind('message')
+
+    def _has_kind(self, kind: str) -> bool:
+        table, fts, _, _ = SOURCES[kind]
+        return table in self._tables and fts in self._tables
+
+    @staticmethod
+    def _max_rowid(source: sqlite3.Connection, kind: str) -> int:
+        return source.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {SOURCES[kind][0]}").fetchone()[0]
+
+    def _ingest_sessions(self, source: sqlite3.Connection, conn: sqlite3.Connection,
+                         state: Dict[str, str]) -> None:
+        """Entities JSON of new sessions; edited sessions are re-linked from scratch."""
+        seen_rowid = int(state.get('session_rowid', 0))
+        seen_updated = state.get('session_updated', '')
+        rows = source.execute(
+            "SELECT rowid, id, name, summary, entities, updated_at FROM sessions "
+            "WHERE rowid > ? OR updated_at > ?", (seen_rowid, seen_updated)
+        ).fetchall()
+        if not rows:
+            return
+
+        linked = []
+        edited = []
+        for rowid, session_id, name, summary, entities, updated_at in rows:
+            names = entity_names(entities)
+            self._add_entities(conn, names)
+            linked.extend((normalize(n), 'session', session_id, session_id, updated_at or '')
+                          for n in names if normalize(n))
+            if rowid <= seen_rowid:
+                edited.append((session_id, updated_at or '', ' '.join(filter(None, (name, summary, entities)))))
+
+        if edited:
+            # Edited sessions sit below every entity's FTS watermark — match them here instead
+            conn.executemany("DELETE FROM mentions WHERE kind = 'session' AND item_id = ?",
+                             [(session_id,) for session_id, _, _ in edited])
+            vocabulary = [norm for (norm,) in conn.execute("SELECT norm FROM entities")]
+            for session_id, updated_at, text in edited:
+                tokens = f" {normalize(text)} "
+                linked.extend((norm, 'session', session_id, session_id, updated_at)
+                              for norm in vocabulary if f" {norm} " in tokens)
+
+        conn.executemany("INSERT OR REPLACE INTO mentions VALUES (?, ?, ?, ?, ?)", linked)
+        self._set_state(conn,
+                        session_rowid=max(seen_rowid, max(r[0] for r in rows)),
+                        session_updated=max([seen_updated] + [r[5] or '' for r in rows]))
+
+    def _ingest_observations(self, source: sqlite3.Connection, conn: sqlite3.Connection,
+                             state: Dict[str, str]) -> None:
+        """Entities JSON of new observations (observations are append-only)."""
+        seen_rowid = int(state.get('observation_rowid', 0))
+        rows = source.execute(
+            "SELECT rowid, id, session_id, entities, timestamp FROM observations WHERE rowid > ?",
+            (seen_rowid,)
+        ).fetchall()
+        if not rows:
+            return
+        linked = []
+        for _, observation_id, session_id, entities, timestamp in rows:
+            names = entity_names(entities)
+            self._add_entities(conn, names)
+            linked.extend((normalize(n), 'observation', observation_id, session_id, timestamp or '')
+                          for n in names if normalize(n))
+        conn.executemany("INSERT OR REPLACE INTO mentions VALUES (?, ?, ?, ?, ?)", linked)
+        self._set_state(conn, observation_rowid=max(r[0] for r in rows))
+
+    def _scan(self, source: sqlite3.Connection, conn: sqlite3.Connection, norm: str, kind: str,
+              through: int, latest: int) -> None:
+        """FTS token hits for one entity in rows (through, latest]."""
+        table, fts, session_col, ts_col = SOURCES[kind]
+        try:
+            rows = source.execute(
+                f"SELECT t.id, t.{session_col}, t.{ts_col} FROM {fts} "
+                f"JOIN {table} t ON t.rowid = {fts}.rowid "
+                f"WHERE {fts} MATCH ? AND {fts}.rowid > ? AND {fts}.rowid <= ?",
+                (f'"{norm}"', through, latest)
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            logger.debug(f"Mention scan for {norm!r} in {fts} failed: {e}")
+            rows = []
+        conn.executemany(
+            "INSERT OR REPLACE INTO mentions VALUES (?, ?, ?, ?, ?)",
+            [(norm, kind, item_id, session_id, ts or '') for item_id, session_id, ts in rows],
+        )
+        conn.execute(f"UPDATE entities SET {kind}_through = ? WHERE norm = ?", (latest, norm))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def timeline(self, source: sqlite3.Connection, entity: str, kind: str,
+                 limit: int = 20, offset: int = 0) -> Optional[List[Tuple[str, str, str]]]:
+        """
+        Mentions of `entity` of one kind, newest first: [(item_id, session_id, ts), ...]
+
+        Returns None when the entity has no word characters, the sessions DB
+        lacks the tables/FTS indexes for this kind, or the index is still being
+        built — callers scan instead.
+        """
+        norm = normalize(entity)
+        if not norm or kind not in SOURCES:
+            return None
+        if not self._ensure_built(source):
+            return None
+        if not self._refresh_for_lookup(source) or not self._has_kind(kind):
+            return None
+
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(f"SELECT {kind}_through FROM entities WHERE norm = ?", (norm,)).fetchone()
+            if row is None:
+                return self._adhoc_timeline(source, norm, kind, limit, offset)
+            latest = self._max_rowid(source, kind)
+            if row[0] < latest:
+                self._scan(source, conn, norm, kind, row[0], latest)
+                conn.commit()
+            return conn.execute(
+                "SELECT item_id, session_id, ts FROM mentions WHERE norm = ? AND kind = ? "
+                "ORDER BY ts DESC LIMIT ? OFFSET ?", (norm, kind, limit, offset)
+            ).fetchall()
+
+    @staticmethod
+    def _adhoc_timeline(source: sqlite3.Connection, norm: str, kind: str,
+                        limit: int, offset: int) -> List[Tuple[str, str, str]]:
+        """FTS token hits for a name that isn't an extracted entity, straight from the sessions DB."""
+        table, fts, session_col, ts_col = SOURCES[kind]
+        try:
+            rows = source.execute(
+                f"SELECT t.id, t.{session_col}, COALESCE(t.{ts_col}, '') AS ts FROM {fts} "
+                f"JOIN {table} t ON t.rowid = {fts}.rowid "
+                f"WHERE {fts} MATCH ? ORDER BY ts DESC LIMIT ? OFFSET ?",
+                (f'"{norm}"', limit, offset)
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            logger.debug(f"Mention lookup for {norm!r} in {fts} failed: {e}")
+            return []
+        return [tuple(row) for row in rows]
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._connect()
+            counts = dict(conn.execute("SELECT kind, COUNT(*) FROM mentions GROUP BY kind").fetchall())
+            return {
+                'entities': conn.execute("SELECT COUNT(*) FROM entities").fetchone()[0],
+                'mentions': counts,
+                'last_refresh': self._last_refresh or None,
+                'building': self._build_thread is not None and self._build_thread.is_alive(),
+            }
@@ -0,0 +1,223 @@
+"""
+Dex ProseMirror Renderer — Granola panel JSON to Markdown, memoized
+
+Granola stores meeting notes as ProseMirror JSON, and the Granola tools render
+them on every list and search call even though a panel only changes when the
+meeting is edited. This module renders with an explicit stack (deeply nested
+lists can't hit Python's recursion limit) and memoizes the output:
+
+- Key: the caller's document key ("<id>:<updated_at>"). Panels without one
+  are rendered uncached — hashing the JSON costs more than rendering it
+- Memory: LRU of the most recent MAX_ENTRIES renders
+- Disk (optional): a small SQLite table so renders survive restarts, pruned
+  to MAX_DISK_ENTRIES
+
+Usage:
+    from core.utils.prosemirror import MarkdownCache, to_markdown
+
+    markdown = to_markdown(panel['content'])                  # uncached
+    cache = MarkdownCache(db_path=vault / "System" / ".granola-notes.db")
+    markdown = cache.render(panel['content'], key=f"{doc['id']}:{doc['updated_at']}")
+"""
+
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Renders kept in memory
+MAX_ENTRIES = 4096
+
+# Renders kept on disk (oldest pruned first)
+MAX_DISK_ENTRIES = 20000
+
+_MARKS = {'bold': '**{}**', 'italic': '*{}*', 'code': '`{}`'}
+
+
+# Container nodes rendered as prefix + children + suffix
+_WRAPPERS = {
+    'heading': (None, '\n\n'),
+    'paragraph': ('', '\n\n'),
+    'codeBlock': ('```\n', '```\n\n'),
+    'blockquote': ('> ', '\n\n'),
+    'bulletList': ('', '\n\n'),
+    'orderedList': ('', '\n\n'),
+}
+
+
+def to_markdown(content: Dict[str, Any]) -> str:
+    """Render a ProseMirror document (a panel's `content`) to Markdown."""
+    if not content or not isinstance(content, dict) or 'content' not in content:
+        return ""
+
+    out: List[str] = []
+    # Frame: [children iterator, list type, state]. State is the suffix to emit on
+    # close, the start of a list item's output in `out`, or a list's item count.
+    stack: List[list] = []
+
+    def open_node(node: Dict[str, Any]) -> None:
+        node_type = node.get('type', '')
+        prefix, suffix = _WRAPPERS.get(node_type, ('', ''))
+        if node_type == 'heading':
+            prefix = '#' * (node.get('attrs') or {}).get('level', 1) + ' '
+        out.append(prefix)
+        children = node.get('content') or []
+        if node_type in ('bulletList', 'orderedList'):
+            stack.append([enumerate(children, 1), node_type, 0])
+        else:
+            stack.append([iter(children), None, suffix])
+
+    open_node(content)
+    while stack:
+        frame = stack[-1]
+        children, list_type, state = frame
+        if list_type:
+            # List children are items: "- text" / "N. text" (N counts every child), one per line
+            for number, item in children:
+                if isinstance(item, dict) and item.get('type') == 'listItem':
+                    if state:
+                        out.append('\n')
+                    frame[2] += 1
+                    out.append('- ' if list_type == 'bulletList' else f"{number}. ")
+                    stack.append([iter(item.get('content') or []), None, len(out)])
+                    break
+            else:
+                stack.pop()
+                out.append('\n\n')
+            continue
+
+        for node in children:
+            if type(node) is not dict:
+                continue
+            node_type = node.get('type', '')
+            if node_type == 'text':
+                text = node.get('text', '')
+                if text:
+                    for mark in node.get('marks') or ():
+                        template = _MARKS.get(mark.get('type', '')) if isinstance(mark, dict) else None
+                        if template:
+                            text = template.format(text)
+                out.append(text)
+            elif node_type == 'hardBreak':
+                out.append('\n')
+            else:
+                open_node(node)
+                break
+        else:
+            stack.pop()
+            if type(state) is int:
+                item_text = ''.join(out[state:]).strip()
+                del out[state:]
+                out.append(item_text)
+            else:
+                out.append(state)
+
+    return ''.join(out).strip()
+
+
+class MarkdownCache:
+    """Memoized to_markdown with an in-memory LRU and an optional SQLite tier."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, db_path: Optional[Path] = None,
+                 max_disk_entries: int = MAX_DISK_ENTRIES):
+        self.max_entries = max_entries
+        self.db_path = Path(db_path) if db_path else None
+        self.max_disk_entries = max_disk_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_failed = False
+        self._disk_writes = 0
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+    def _disk(self) -> Optional[sqlite3.Connection]:
+        if self.db_path is None or self._disk_failed:
+            return None
+        if self._conn is None:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.db_path), timeout=5, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("CREATE TABLE IF NOT EXISTS rendered (key TEXT PRIMARY KEY, markdown TEXT NOT NULL)")
+                conn.commit()
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.warning(f"Rendered-notes cache unavailable ({e}); keeping renders in memory only")
+                self._disk_failed = True
+                return None
+        return self._conn
+
+    def _remember(self, key: str, markdown: str) -> None:
+        self._entries[key] = markdown
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def render(self, content: Dict[str, Any], key: Optional[str] = None) -> str:
+        """to_markdown(content), reusing an earlier render for the same key."""
+        if not content or not isinstance(content, dict):
+            return ""
+        if not key:
+            return to_markdown(content)
+
+        with self._lock:
+            markdown = self._entries.get(key)
+            if markdown is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return markdown
+
+            conn = self._disk()
+            if conn is not None:
+                try:
+                    row = conn.execute("SELECT markdown FROM rendered WHERE key = ?", (key,)).fetchone()
+                except sqlite3.Error:
+                    row = None
+                if row:
+                    self._stats["disk_hits"] += 1
+                    self._remember(key, row[0])
+                    return row[0]
+            self._stats["misses"] += 1
+
+        markdown = to_markdown(content)
+
+        with self._lock:
+            self._remember(key, markdown)
+            conn = self._disk()
+            if conn is not None:
+                try:
+                    conn.execute("INSERT OR REPLACE INTO rendered (key, markdown) VALUES (?, ?)", (key, markdown))
+                    self._disk_writes += 1
+                    if self._disk_writes % 500 == 0:
+                        conn.execute(
+                            "DELETE FROM rendered WHERE rowid <= "
+                            "(SELECT MAX(rowid) FROM rendered) - ?", (self.max_disk_entries,)
+                        )
+                    conn.commit()
+                except sqlite3.Error as e:
+                    logger.debug(f"Could not persist rendered notes: {e}")
+        return markdown
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["disk_hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "hit_ratio": round((lookups - self._stats["misses"]) / lookups, 3) if lookups else None,
+                "disk": str(self.db_path) if self._conn is not None else None,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -4,23 +4,48 @@ QMD Search Index Refresh Utility
 Triggers incremental re-indexing of vault content after write operations.
 Only processes changed files — typically completes in under a second.
 
+Refresh requests go through one scheduler per process, so a burst of writes
+(e.g. triaging 30 inbox items) becomes one reindex instead of 30 overlapping
+ones fighting over the same index files:
+
+- debounce: a reindex starts once no request has arrived for
+  DEX_QMD_REINDEX_DEBOUNCE seconds (default 2), or MAX_DELAY seconds after
+  the first request of the burst, whichever comes first
+- single flight: at most one `qmd update` + `qmd embed` runs at a time;
+  requests during a run collapse into one pending rerun
+- status: search_index_status() reports the pending queue, whether a run is
+  in progress, and the last run's duration
+- generation: index_generation() changes after every finished reindex (here
+  or in another Dex server, via System/.qmd-index-generation), so qmd_query
+  can drop cached search results the moment the index changes
+
 Gracefully handles:
 - QMD not installed (silently skips)
 - QMD not configured (silently skips)
 - Index errors (logs warning, doesn't break caller)
 
 Usage:
-    from core.utils.qmd_indexer import refresh_search_index
+    from core.utils.qmd_indexer import refresh_search_index, search_index_status
     refresh_search_index()  # Fire-and-forget, non-blocking
+    search_index_status()   # {"pending": True, "queued_requests": 3, "running": False, ...}
 """
 
 import logging
+import os
 import shutil
 import subprocess
 import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+DEBOUNCE_SECONDS = float(os.environ.get('DEX_QMD_REINDEX_DEBOUNCE', '2'))
+
+# A steady stream of writes still gets indexed at least this often
+MAX_DELAY_SECONDS = 30.0
+
 # Cache the QMD binary path (None = not checked, False = not found)
 _qmd_path = None
 
@@ -38,7 +63,6 @@ def _find_qmd() -> str | None:
         return path
 
     # Check common bun/npm global install locations
-    import os
     from pathlib import Path
     home = Path.home()
     candidates = [
@@ -56,11 +80,11 @@ def _find_qmd() -> str | None:
     return None
 
 
-def _run_reindex():
-    """Run qmd update + embed in background. Called from a thread."""
+def _run_reindex() -> Optional[str]:
+    """Run qmd update + embed. Called from the scheduler thread. Returns an error, or None."""
     qmd = _find_qmd()
     if not qmd:
-        return
+        return None
 
     try:
         # Update FTS index (changed files only)
@@ -72,7 +96,7 @@ def _run_reindex():
         )
         if result.returncode != 0:
             logger.debug(f"qmd update returned {result.returncode}: {result.stderr.strip()}")
-            return
+            return f"qmd update returned {result.returncode}"
 
         # Update vector embeddings (changed chunks only)
         result = subprocess.run(
@@ -83,23 +107,174 @@ def _run_reindex():
         )
         if result.returncode != 0:
             logger.debug(f"qmd embed returned {result.returncode}: {result.stderr.strip()}")
+            return f"qmd embed returned {result.returncode}"
 
     except subprocess.TimeoutExpired:
         logger.warning("QMD re-index timed out")
+        return "timed out"
     except Exception as e:
         logger.debug(f"QMD re-index error: {e}")
+        return str(e)
+    return None
+
+
+class ReindexScheduler:
+    """Coalesces reindex requests and runs them one at a time on a background thread."""
+
+    def __init__(self, run: Callable[[], Optional[str]],
+                 debounce: float = DEBOUNCE_SECONDS, max_delay: float = MAX_DELAY_SECONDS):
+        self._run = run
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+        # The pending rerun: when its burst started, the latest request, how many
+        self._first_request: Optional[float] = None
+        self._last_request = 0.0
+        self._queued = 0
+
+        self._running = False
+        self._last_run: Dict[str, Any] = {}
+        self._stats = {'requests': 0, 'runs': 0, 'failures': 0}
+
+    def request(self) -> None:
+        """Ask for a reindex."""
+        with self._cond:
+            now = time.monotonic()
+            if self._first_request is None:
+                self._first_request = now
+            self._last_request = now
+            self._queued += 1
+            self._stats['requests'] += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, daemon=True, name='qmd-reindex')
+                self._thread.start()
+            self._cond.notify_all()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until nothing is pending or running. False if timeout ran out first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._running or self._first_request is not None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def status(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                'pending': self._first_request is not None,
+                'queued_requests': self._queued,
+                'running': self._running,
+                'debounce_seconds': self.debounce,
+                'last_run': dict(self._last_run) or None,
+                **self._stats,
+            }
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while self._first_request is None:
+                    self._cond.wait()
+                # Debounce: wait for the burst to go quiet, but not past max_delay
+                while True:
+                    due = min(self._last_request + self.debounce, self._first_request + self.max_delay)
+                    remaining = due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                coalesced = self._queued
+                self._first_request, self._queued = None, 0
+                self._running = True
+
+            started = time.monotonic()
+            error = None
+            try:
+                error = self._run()
+            except Exception as e:
+                error = str(e)
+                logger.debug(f"QMD re-index error: {e}")
+            finally:
+                with self._cond:
+                    self._running = False
+                    self._stats['runs'] += 1
+                    if error:
+                        self._stats['failures'] += 1
+                    self._last_run = {
+                        'finished_at': datetime.now().isoformat(timespec='seconds'),
+                        'duration_seconds': round(time.monotonic() - started, 3),
+                        'coalesced_requests': coalesced,
+                        'error': error,
+                    }
+                    self._cond.notify_all()
+
+
+# Bumped after every reindex, so caches of QMD results know when they may be stale.
+# The file carries the bump to the other MCP servers' processes.
+GENERATION_FILE = 'System/.qmd-index-generation'
+
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def _generation_file() -> Optional[str]:
+    vault_path = os.environ.get('VAULT_PATH')
+    return os.path.join(vault_path, GENERATION_FILE) if vault_path else None
+
+
+def index_generation() -> tuple:
+    """Changes whenever a reindex finishes, in this process or another Dex server."""
+    path = _generation_file()
+    try:
+        stamp = os.stat(path).st_mtime_ns if path else 0
+    except OSError:
+        stamp = 0
+    return (_generation, stamp)
+
+
+def _bump_generation() -> None:
+    global _generation
+    with _generation_lock:
+        _generation += 1
+        path = _generation_file()
+        if path and os.path.isdir(os.path.dirname(path)):
+            try:
+                with open(path, 'w') as f:
+                    f.write(str(time.time_ns()))
+            except OSError as e:
+                logger.debug(f"Could not update {GENERATION_FILE}: {e}")
+
+
+def _reindex_and_bump() -> Optional[str]:
+    try:
+        return _run_reindex()
+    finally:
+        # Even a failed run may have changed part of the index
+        _bump_generation()
+
+
+_scheduler = ReindexScheduler(_reindex_and_bump)
 
 
 def refresh_search_index():
     """
     Trigger an incremental re-index of the QMD search index.
 
-    Non-blocking: spawns a background thread so the caller returns immediately.
-    Safe to call frequently — only processes changed files.
+    Non-blocking: queues the request with the background scheduler so the caller
+    returns immediately. Safe to call frequently — bursts are coalesced into one
+    run, and only one run happens at a time.
     Silently skips if QMD is not installed.
     """
     if _find_qmd() is None:
         return
 
-    thread = threading.Thread(target=_run_reindex, daemon=True)
-    thread.start()
+    _scheduler.request()
+
+
+def search_index_status() -> Dict[str, Any]:
+    """Reindex scheduler state: pending queue, in-progress run, last run's duration."""
+    return {'qmd_installed': _find_qmd() is not None, 'generation': _generation, **_scheduler.status()}
@@ -2,7 +2,8 @@
 QMD Semantic Search Utility — Shared Query Interface
 
 Provides vault-wide search that uses QMD (semantic: BM25 + vectors + LLM reranking)
-when available, falling back to grep when QMD is not installed.
+when available, falling back to a built-in BM25 keyword index (vault_index.py)
+when QMD is not installed, and to grep if that finds nothing.
 
 Every skill and MCP server that searches vault content should use this utility.
 One place for availability checks, fallback logic, error handling, and result normalization.
@@ -10,7 +11,7 @@ One place for availability checks, fallback logic, error handling, and result no
 Usage:
     from core.utils.qmd_query import vault_search, is_qmd_available
 
-    # Semantic if QMD available, grep fallback if not
+    # Semantic if QMD available, keyword index / grep fallback if not
     results = vault_search("customer retention strategies")
     # Returns: [{"path": "...", "score": 0.85, "snippet": "...", "source": "qmd"}]
 
@@ -23,19 +24,77 @@ Usage:
         "customer retention",
         fallback_grep="retention|churn|cancel|NPS",
     )
+
+QMD searches go to one warm `qmd mcp` process (see qmd_worker.py) so the
+models and index stay loaded between calls. If that can't serve a search,
+the search runs through the `qmd` CLI as before.
+
+QMD results are cached (LRU, DEX_SEARCH_CACHE_SIZE entries, default 256)
+by (query, search_type, limit, glob) and the index generation from
+qmd_indexer, which changes after every reindex — so a repeat query returns
+without touching QMD, and never returns results from before a reindex.
+Changes Dex doesn't know about (running `qmd update` by hand) are picked up
+within DEX_SEARCH_CACHE_TTL seconds (default 600).
 """
 
+import atexit
 import json
 import logging
+import math
 import os
 import re
 import shutil
 import subprocess
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Optional
 
+# Warm QMD worker (optional - falls back to one CLI process per search)
+try:
+    from core.utils.qmd_worker import QMDWorker, QMDWorkerError, QMDWorkerTimeout, result_text
+    HAS_QMD_WORKER = True
+except ImportError:
+    try:
+        from utils.qmd_worker import QMDWorker, QMDWorkerError, QMDWorkerTimeout, result_text
+        HAS_QMD_WORKER = True
+    except ImportError:
+        HAS_QMD_WORKER = False
+
+# QMD index generation (optional - without it, cached results expire by TTL only)
+try:
+    from core.utils.qmd_indexer import index_generation
+except ImportError:
+    try:
+        from utils.qmd_indexer import index_generation
+    except ImportError:
+        def index_generation():
+            return 0
+
+# Built-in BM25 index (optional - falls back to grep)
+try:
+    from core.utils.vault_index import VaultIndex
+    HAS_VAULT_INDEX = True
+except ImportError:
+    try:
+        from utils.vault_index import VaultIndex
+        HAS_VAULT_INDEX = True
+    except ImportError:
+        HAS_VAULT_INDEX = False
+
 logger = logging.getLogger(__name__)
 
+# vault_search_multi: concurrent queries, per-query time budget, RRF constant
+MULTI_SEARCH_WORKERS = int(os.environ.get("DEX_SEARCH_WORKERS", "4"))
+MULTI_QUERY_TIMEOUT = 30.0
+RRF_K = 60
+
+# QMD result cache: entries, and max age for index changes made outside Dex
+SEARCH_CACHE_SIZE = int(os.environ.get("DEX_SEARCH_CACHE_SIZE", "256"))
+SEARCH_CACHE_TTL = float(os.environ.get("DEX_SEARCH_CACHE_TTL", "600"))
+
 # ---------------------------------------------------------------------------
 # QMD Binary Discovery (shared with qmd_indexer.py)
 # ---------------------------------------------------------------------------
@@ -107,9 +166,42 @@ def is_qmd_available() -> bool:
 
 def reset_cache():
     """Reset cached availability state. Useful after install/uninstall."""
-    global _qmd_path, _qmd_available
+    global _qmd_path, _qmd_available, _worker
     _qmd_path = None
     _qmd_available = None
+    if _worker is not None:
+        _worker.stop()
+    _worker = None
+    clear_search_cache()
+
+
+# ---------------------------------------------------------------------------
+# Warm Worker
+# ---------------------------------------------------------------------------
+
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _get_worker():
+    """The shared QMD worker, or None when disabled or QMD isn't installed."""
+    global _worker
+    if not HAS_QMD_WORKER or os.environ.get("DEX_QMD_WORKER", "1") == "0":
+        return None
+    if _worker is None:
+        qmd = _find_qmd()
+        if not qmd:
+            return None
+        with _worker_lock:
+            if _worker is None:
+                _worker = QMDWorker([qmd, "mcp"])
+                atexit.register(_worker.stop)
+    return _worker
+
+
+def worker_status() -> Optional[dict]:
+    """Status of the warm QMD worker (None if it isn't in use)."""
+    return _worker.status() if _worker is not None else None
 
 
 # ---------------------------------------------------------------------------
@@ -123,7 +215,7 @@ def _qmd_search(
     search_type: str = "query",
 ) -> list[dict]:
     """
-    Run a QMD search via CLI and parse results.
+    Run a QMD search (warm worker, else CLI) and parse results.
 
     search_type:
         "query"   — hybrid (BM25 + vectors + LLM reranking) [default, best quality]
@@ -134,6 +226,19 @@ def _qmd_search(
     if not qmd:
         return []
 
+    worker = _get_worker()
+    if worker is not None:
+        try:
+            result = worker.search(search_type, query, limit=limit)
+            structured = result.get("structuredContent")
+            return _parse_qmd_output(json.dumps(structured) if structured else result_text(result))
+        except QMDWorkerTimeout:
+            # A search this slow would time out on the CLI too
+            logger.warning(f"QMD {search_type} timed out for query: {query[:50]}")
+            return []
+        except QMDWorkerError as e:
+            logger.debug(f"QMD worker unavailable ({e}), using the CLI")
+
     try:
         cmd = [qmd, search_type, query, "--limit", str(limit)]
 
@@ -216,6 +321,95 @@ def _parse_qmd_output(output: str) -> list[dict]:
     return results
 
 
+# ---------------------------------------------------------------------------
+# Result Cache
+# ---------------------------------------------------------------------------
+
+# key -> (index generation, stored at, results); most recently used last
+_result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+_result_cache_stats = {"hits": 0, "misses": 0, "stale": 0}
+
+
+def _cached_qmd_search(query: str, limit: int, search_type: str, glob: str) -> list[dict]:
+    """_qmd_search() through the LRU cache. Only non-empty results are stored."""
+    key = (query, search_type, limit, glob)
+    generation = index_generation()
+    now = time.monotonic()
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+        if entry is not None:
+            if entry[0] == generation and now - entry[1] < SEARCH_CACHE_TTL:
+                _result_cache.move_to_end(key)
+                _result_cache_stats["hits"] += 1
+                return [dict(r) for r in entry[2]]
+            del _result_cache[key]
+            _result_cache_stats["stale"] += 1
+        _result_cache_stats["misses"] += 1
+
+    results = _qmd_search(query, limit=limit, search_type=search_type)
+    # Empty may mean a timeout or error, so it isn't cached
+    if results and SEARCH_CACHE_SIZE > 0:
+        with _result_cache_lock:
+            _result_cache[key] = (generation, now, [dict(r) for r in results])
+            _result_cache.move_to_end(key)
+            while len(_result_cache) > SEARCH_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+    return results
+
+
+def clear_search_cache() -> None:
+    with _result_cache_lock:
+        _result_cache.clear()
+
+
+def search_cache_stats() -> dict:
+    with _result_cache_lock:
+        return {"entries": len(_result_cache), "max_entries": SEARCH_CACHE_SIZE, **_result_cache_stats}
+
+
+# ---------------------------------------------------------------------------
+# Keyword Index Fallback
+# ---------------------------------------------------------------------------
+
+_vault_indexes: dict = {}
+_vault_index_lock = threading.Lock()
+
+
+def _get_vault_index(vault_path: str):
+    """The shared BM25 index for a vault (loaded from disk on first use)."""
+    with _vault_index_lock:
+        index = _vault_indexes.get(vault_path)
+        if index is None:
+            index = _vault_indexes[vault_path] = VaultIndex(vault_path)
+        return index
+
+
+def _index_search(
+    query: str,
+    vault_path: str,
+    glob_pattern: str = "**/*.md",
+    grep_pattern: Optional[str] = None,
+    limit: int = 10,
+) -> list[dict]:
+    """Search the built-in BM25 index. Words in grep_pattern count as extra query terms."""
+    extra = re.findall(r"[A-Za-z0-9]{2,}", grep_pattern) if grep_pattern else []
+    try:
+        hits = _get_vault_index(vault_path).search(query, limit=limit, glob=glob_pattern, extra_terms=extra)
+    except Exception as e:
+        logger.debug(f"Vault index error: {e}")
+        return []
+
+    words = [w for w in query.lower().split() if len(w) > 2]
+    pattern = "|".join(re.escape(w) for w in words) or grep_pattern or ""
+    return [{
+        "path": hit["path"],
+        "score": hit["score"],
+        "snippet": _extract_snippet(hit["path"], pattern),
+        "source": "index",
+    } for hit in hits]
+
+
 # ---------------------------------------------------------------------------
 # Grep Fallback
 # ---------------------------------------------------------------------------
@@ -348,18 +542,18 @@ def vault_search(
     Args:
         query:          Natural language search query
         limit:          Maximum results to return
-        min_score:      Minimum relevance score (0.0 to 1.0). Only applied to QMD results.
+        min_score:      Minimum relevance score (0.0 to 1.0). Applied to QMD and index results.
         search_type:    QMD mode — "query" (hybrid), "search" (keyword), "vsearch" (vector)
         fallback_glob:  Glob pattern for grep fallback file matching
         fallback_grep:  Explicit regex for grep fallback. Auto-generated from query if None.
 
     Returns:
-        List of dicts: [{"path": str, "score": float, "snippet": str, "source": "qmd"|"grep"}]
+        List of dicts: [{"path": str, "score": float, "snippet": str, "source": "qmd"|"index"|"grep"}]
         Sorted by score descending. Empty list if nothing found.
     """
     # Try QMD first (semantic: BM25 + vectors + LLM reranking)
     if is_qmd_available():
-        results = _qmd_search(query, limit=limit, search_type=search_type)
+        results = _cached_qmd_search(query, limit, search_type, fallback_glob)
         if results:
             if min_score > 0:
                 results = [r for r in results if r.get("score", 0) >= min_score]
@@ -368,8 +562,18 @@ def vault_search(
         # QMD returned nothing — fall through to grep
         logger.debug(f"QMD returned no results for '{query[:50]}', falling back to grep")
 
-    # Grep fallback
     vault_path = _resolve_vault_path()
+
+    # Built-in BM25 index: real relevance scores, no external binary
+    if HAS_VAULT_INDEX and os.environ.get("DEX_VAULT_INDEX", "1") != "0":
+        results = _index_search(query, vault_path, fallback_glob, fallback_grep, limit)
+        if min_score > 0:
+            results = [r for r in results if r["score"] >= min_score]
+        if results:
+            return results
+        logger.debug(f"Vault index found nothing for '{query[:50]}', falling back to grep")
+
+    # Grep fallback (substring matches the index's whole words can miss)
     return _grep_fallback(
         query=query,
         vault_path=vault_path,
@@ -383,38 +587,110 @@ def vault_search_multi(
     queries: list[str],
     limit_per_query: int = 5,
     deduplicate: bool = True,
+    merge: str = "max",
+    timeout: Optional[float] = MULTI_QUERY_TIMEOUT,
     **kwargs,
 ) -> list[dict]:
     """
     Run multiple search queries and merge results. Useful for meeting prep
     (search topic + each attendee) or triage (match against multiple goals).
 
+    Queries run concurrently on up to DEX_SEARCH_WORKERS threads (default 4);
+    with QMD they all go to the one warm worker process.
+
     Args:
         queries:          List of search queries
         limit_per_query:  Max results per individual query
-        deduplicate:      Remove duplicate paths, keeping highest score
+        deduplicate:      Remove duplicate paths (merged as `merge` says); when False,
+                          every query's hits are kept, still ordered by `merge`
+        merge:            "max" — keep each path's highest-scoring result, sort by score
+                          "rrf" — reciprocal-rank fusion: sort by sum of 1/(60 + rank)
+                          across queries (added as "rrf_score"), so paths several
+                          queries agree on rise above a single strong hit
+        timeout:          Seconds each query may run once started; the whole call
+                          is bounded by timeout × ceil(queries / workers). Results
+                          of queries that overrun or never start in time are left
+                          out (None = no limit)
         **kwargs:         Passed through to vault_search()
 
     Returns:
-        Merged, deduplicated, score-sorted list of results.
+        Merged, sorted list of results (deduplicated unless told otherwise).
     """
-    all_results: list[dict] = []
-    seen_paths: dict[str, float] = {}
-
-    for query in queries:
-        results = vault_search(query, limit=limit_per_query, **kwargs)
-        for r in results:
+    if merge not in ("max", "rrf"):
+        raise ValueError(f"merge must be 'max' or 'rrf', not {merge!r}")
+    per_query = _run_queries(queries, timeout, limit=limit_per_query, **kwargs)
+
+    best: dict[str, dict] = {}
+    fused: dict[str, float] = {}
+    for results in per_query:
+        for rank, r in enumerate(results, start=1):
             path = r.get("path", "")
-            score = r.get("score", 0)
+            if path not in best or r.get("score", 0) > best[path].get("score", 0):
+                best[path] = r
+            fused[path] = fused.get(path, 0.0) + 1.0 / (RRF_K + rank)
+
+    # Without deduplication every hit is kept; under "rrf" each carries its path's fused score
+    merged = [r for results in per_query for r in results] if not deduplicate else list(best.values())
+    if merge == "rrf":
+        merged = [{**r, "rrf_score": round(fused[r.get("path", "")], 6)} for r in merged]
+        merged.sort(key=lambda r: (r["rrf_score"], r.get("score", 0)), reverse=True)
+        return merged
+    merged.sort(key=lambda r: r.get("score", 0), reverse=True)
+    return merged
+
 
-            if deduplicate and path in seen_paths:
-                if score <= seen_paths[path]:
-                    continue
-                # Remove old lower-score entry
-                all_results = [x for x in all_results if x.get("path") != path]
+def _run_queries(queries: list[str], timeout: Optional[float], **kwargs) -> list[list[dict]]:
+    """
+    Results per query (in query order), running them concurrently.
+
+    Each query gets `timeout` seconds once started, and the whole call ends
+    timeout × ceil(len(queries) / workers) after submission, so queries stuck
+    in the queue behind slow ones can't stretch it further.
+    """
+    if not queries:
+        return []
 
-            seen_paths[path] = score
-            all_results.append(r)
+    workers = max(1, min(MULTI_SEARCH_WORKERS, len(queries)))
+    deadline = None if timeout is None else time.monotonic() + timeout * math.ceil(len(queries) / workers)
+    started: dict[int, float] = {}
 
-    all_results.sort(key=lambda r: r.get("score", 0), reverse=True)
-    return all_results
+    def run(i: int, query: str) -> list[dict]:
+        started[i] = time.monotonic()
+        return vault_search(query, **kwargs)
+
+    # A pool per call: on return, queries that never started are cancelled and
+    # ones abandoned on timeout finish in the background without blocking anyone
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vault-search")
+    futures = {pool.submit(run, i, query): i for i, query in enumerate(queries)}
+    results: list[list[dict]] = [[] for _ in queries]
+    pending = set(futures)
+
+    try:
+        while pending:
+            wait_for = None
+            if timeout is not None:
+                now = time.monotonic()
+                if now >= deadline:
+                    for future in pending:
+                        logger.warning(f"Search {'timed out' if futures[future] in started else 'never started'} "
+                                       f"within {timeout:g}s: {queries[futures[future]][:50]}")
+                    break
+                # Abandon queries past their own budget; queued ones haven't started their clock
+                for future in [f for f in pending if futures[f] in started
+                               and now - started[futures[f]] >= timeout and not f.done()]:
+                    pending.discard(future)
+                    logger.warning(f"Search timed out after {timeout:g}s: {queries[futures[future]][:50]}")
+                if not pending:
+                    break
+                running = [started[futures[f]] + timeout for f in pending if futures[f] in started]
+                wait_for = max(0.01, min(running + [deadline]) - now)
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.discard(future)
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    logger.debug(f"Search failed for '{queries[futures[future]][:50]}': {e}")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results
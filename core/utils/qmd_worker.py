@@ -0,0 +1,349 @@
+"""
+QMD Worker — One warm QMD process shared by every search in this server
+
+`qmd query` on the CLI is a fresh process per search: spawn, load the
+embedding and reranking models, open the index, answer, exit. That start-up
+is most of the cost, and the MCP servers search inside hot paths (task dedup,
+meeting prep, commitment matching, idea dedup).
+
+QMD also ships a stdio MCP server (`qmd mcp`) that keeps all of that loaded.
+This module runs one of those per Python process and speaks JSON-RPC to it
+over its stdin/stdout pipes:
+
+- multiplexing: every request carries its own id and a reader thread routes
+  each response to the waiting caller, so concurrent tool threads share the
+  one process instead of queueing behind each other's round trips
+- health checks: a `ping` before reusing a process that has been quiet for a
+  while, or whose last request timed out
+- automatic restart: if the process exits or stops answering, in-flight
+  requests fail, and the next call starts a new one (with backoff when it
+  keeps failing to start)
+- idle shutdown: the process is stopped after DEX_QMD_WORKER_IDLE seconds
+  (default 300) without a request, so the models aren't held in memory all day
+
+Callers treat QMDWorkerError as "use the CLI instead" — qmd_query does exactly
+that, so a QMD build without `mcp`, or without the requested tool, just keeps
+working the old way. Set DEX_QMD_WORKER=0 to disable the worker entirely.
+
+Usage:
+    from core.utils.qmd_worker import QMDWorker, QMDWorkerError
+
+    worker = QMDWorker([qmd_path, "mcp"])
+    try:
+        payload = worker.search("query", "customer retention", limit=10)
+    except QMDWorkerError:
+        ...  # fall back to `qmd query`
+"""
+
+import itertools
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT = float(os.environ.get('DEX_QMD_WORKER_IDLE', '300'))
+DEFAULT_REQUEST_TIMEOUT = 30.0
+START_TIMEOUT = 20.0
+PING_TIMEOUT = 5.0
+
+# Ping before reusing a process that hasn't answered anything for this long
+HEALTH_CHECK_AFTER = 60.0
+
+# After this many failed starts in a row, stop trying for RESTART_COOLDOWN seconds
+MAX_START_FAILURES = 3
+RESTART_COOLDOWN = 60.0
+
+MCP_PROTOCOL_VERSION = '2024-11-05'
+
+# search_type -> MCP tool names QMD has used for it, in preference order
+TOOL_NAMES = {
+    'query': ('query', 'qmd_query', 'deep_search'),
+    'search': ('search', 'qmd_search'),
+    'vsearch': ('vsearch', 'qmd_vsearch', 'vector_search'),
+}
+
+
+class QMDWorkerError(Exception):
+    """The worker can't answer this request; the caller should use the CLI."""
+
+
+class QMDWorkerTimeout(QMDWorkerError):
+    """The worker took longer than the request timeout."""
+
+
+class _Pending:
+    """A request waiting for the reader thread to hand it a response."""
+
+    __slots__ = ('event', 'response', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.response: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+
+
+class QMDWorker:
+    """A long-lived `qmd mcp` process, started on first use and restarted on failure."""
+
+    def __init__(self, command: List[str], idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 request_timeout: float = DEFAULT_REQUEST_TIMEOUT, cwd: Optional[str] = None):
+        self.command = list(command)
+        self.idle_timeout = idle_timeout
+        self.request_timeout = request_timeout
+        self.cwd = cwd
+
+        self._lock = threading.Lock()        # process lifecycle
+        self._write_lock = threading.Lock()  # one request line on stdin at a time
+        self._ids = itertools.count(1)
+        self._proc: Optional[subprocess.Popen] = None
+        self._pending: Dict[int, _Pending] = {}
+        self._tools: Dict[str, str] = {}     # search_type -> tool name on this process
+        self._last_used = 0.0
+        self._last_response = 0.0
+        self._suspect = False
+        self._start_failures = 0
+        self._retry_at = 0.0
+        self._idle_timer: Optional[threading.Timer] = None
+        self._stats = {'starts': 0, 'requests': 0, 'failures': 0, 'idle_stops': 0}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def search(self, search_type: str, query: str, limit: int = 10,
+               timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run one search on the warm process.
+
+        Returns the MCP tool result ({'content': [...], 'structuredContent': ...}).
+        Raises QMDWorkerError when the worker can't serve it (not startable,
+        tool missing, process died, timed out, tool error).
+        """
+        self._ensure_running()
+        tool = self._tools.get(search_type)
+        if not tool:
+            raise QMDWorkerError(f"qmd mcp has no tool for '{search_type}'")
+
+        self._stats['requests'] += 1
+        result = self._request('tools/call', {'name': tool, 'arguments': {'query': query, 'limit': limit}},
+                               timeout or self.request_timeout)
+        if result.get('isError'):
+            raise QMDWorkerError(f"qmd {tool} failed: {result_text(result)[:200]}")
+        return result
+
+    def ping(self, timeout: float = PING_TIMEOUT) -> bool:
+        """True if the process is up and answering."""
+        if not self.is_running():
+            return False
+        try:
+            self._request('ping', {}, timeout)
+            return True
+        except QMDWorkerError:
+            return False
+
+    def is_running(self) -> bool:
+        proc = self._proc
+        return proc is not None and proc.poll() is None
+
+    def stop(self) -> None:
+        """Stop the process (a later search starts a new one)."""
+        with self._lock:
+            self._stop_locked("stopped")
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'running': self.is_running(),
+            'pid': self._proc.pid if self.is_running() else None,
+            'tools': dict(self._tools),
+            'in_flight': len(self._pending),
+            'idle_seconds': round(time.monotonic() - self._last_used, 1) if self._last_used else None,
+            **self._stats,
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _ensure_running(self) -> None:
+        with self._lock:
+            self._last_used = time.monotonic()
+
+            if self.is_running():
+                quiet = time.monotonic() - self._last_response > HEALTH_CHECK_AFTER
+                if not (self._suspect or (quiet and not self._pending)):
+                    return
+                try:
+                    self._request('ping', {}, PING_TIMEOUT)
+                    self._suspect = False
+                    return
+                except QMDWorkerError:
+                    logger.info("QMD worker failed its health check, restarting")
+                    self._stop_locked("failed health check")
+
+            if time.monotonic() < self._retry_at:
+                raise QMDWorkerError("qmd mcp is cooling down after failed starts")
+            try:
+                self._start_locked()
+                self._start_failures = 0
+            except (OSError, QMDWorkerError) as e:
+                self._stop_locked("failed to start")
+                self._start_failures += 1
+                if self._start_failures >= MAX_START_FAILURES:
+                    self._retry_at = time.monotonic() + RESTART_COOLDOWN
+                raise QMDWorkerError(f"qmd mcp did not start: {e}") from None
+
+    def _start_locked(self) -> None:
+        self._proc = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.cwd,
+            text=True,
+            encoding='utf-8',
+            bufsize=1,
+        )
+        self._stats['starts'] += 1
+        threading.Thread(target=self._read_loop, args=(self._proc,), daemon=True,
+                         name='qmd-worker-reader').start()
+
+        self._request('initialize', {
+            'protocolVersion': MCP_PROTOCOL_VERSION,
+            'capabilities': {},
+            'clientInfo': {'name': 'dex', 'version': '1'},
+        }, START_TIMEOUT)
+        self._send({'jsonrpc': '2.0', 'method': 'notifications/initialized'})
+
+        available = {tool.get('name') for tool in self._request('tools/list', {}, START_TIMEOUT).get('tools', [])}
+        self._tools = {}
+        for search_type, names in TOOL_NAMES.items():
+            for name in names:
+                if name in available:
+                    self._tools[search_type] = name
+                    break
+        self._suspect = False
+        self._schedule_idle_stop(self.idle_timeout)
+        logger.info(f"QMD worker started (pid {self._proc.pid}, tools: {sorted(self._tools.values())})")
+
+    def _stop_locked(self, reason: str) -> None:
+        proc, self._proc = self._proc, None
+        self._tools = {}
+        if self._idle_timer:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+        if proc is None:
+            return
+        self._fail_pending(f"qmd mcp {reason}")
+        try:
+            proc.stdin.close()
+        except (OSError, ValueError):
+            pass
+        try:
+            proc.terminate()
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        except OSError:
+            pass
+        logger.debug(f"QMD worker {reason}")
+
+    def _schedule_idle_stop(self, delay: float) -> None:
+        # One timer per process, re-armed for the remaining idle time rather than per request
+        if self.idle_timeout <= 0:
+            return
+        self._idle_timer = threading.Timer(delay, self._idle_check)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _idle_check(self) -> None:
+        with self._lock:
+            if not self.is_running():
+                return
+            idle = time.monotonic() - self._last_used
+            if self._pending or idle < self.idle_timeout:
+                self._schedule_idle_stop(max(self.idle_timeout - idle, 0.05) if not self._pending
+                                         else self.idle_timeout)
+                return
+            self._stats['idle_stops'] += 1
+            self._stop_locked(f"idle for {idle:.0f}s")
+
+    # ------------------------------------------------------------------
+    # JSON-RPC over stdio
+    # ------------------------------------------------------------------
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        proc = self._proc
+        if proc is None or proc.poll() is not None:
+            raise QMDWorkerError("qmd mcp is not running")
+        line = json.dumps(message, separators=(',', ':')) + '\n'
+        try:
+            with self._write_lock:
+                proc.stdin.write(line)
+                proc.stdin.flush()
+        except (OSError, ValueError) as e:
+            raise QMDWorkerError(f"qmd mcp pipe closed: {e}") from None
+
+    def _request(self, method: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        request_id = next(self._ids)
+        pending = _Pending()
+        self._pending[request_id] = pending
+        try:
+            self._send({'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params})
+            if not pending.event.wait(timeout):
+                self._suspect = True
+                raise QMDWorkerTimeout(f"qmd mcp {method} timed out after {timeout:.0f}s")
+        finally:
+            self._pending.pop(request_id, None)
+
+        if pending.error is not None:
+            self._stats['failures'] += 1
+            raise QMDWorkerError(pending.error)
+        response = pending.response or {}
+        if 'error' in response:
+            error = response['error']
+            raise QMDWorkerError(f"qmd mcp {method}: {error.get('message', error) if isinstance(error, dict) else error}")
+        return response.get('result') or {}
+
+    def _read_loop(self, proc: subprocess.Popen) -> None:
+        """Route each response line to its waiting request until the process exits."""
+        try:
+            for line in proc.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # stray log output on stdout
+                if not isinstance(message, dict) or 'id' not in message or 'method' in message:
+                    continue  # notifications and server-initiated requests
+                self._last_response = time.monotonic()
+                pending = self._pending.get(message['id'])
+                if pending is not None:
+                    pending.response = message
+                    pending.event.set()
+        except (OSError, ValueError):
+            pass
+        try:
+            proc.wait(timeout=2)  # reap it, so is_running() is already False when callers wake up
+        except subprocess.TimeoutExpired:
+            pass
+        if self._proc is proc or self._proc is None:
+            self._fail_pending(f"qmd mcp exited (code {proc.poll()})")
+
+    def _fail_pending(self, reason: str) -> None:
+        for pending in list(self._pending.values()):
+            if not pending.event.is_set():
+                pending.error = reason
+                pending.event.set()
+
+
+def result_text(result: Dict[str, Any]) -> str:
+    """Concatenated text blocks of an MCP tool result."""
+    return '\n'.join(block.get('text', '') for block in result.get('content', [])
+                     if isinstance(block, dict) and block.get('type') == 'text')
@@ -13,11 +13,21 @@ try:
 except ImportError:
     yaml = None
 
+# Cached YAML config (optional - falls back to parsing on every lookup)
+try:
+    from core.utils.config_snapshot import get_profile_flag
+    HAS_CONFIG_SNAPSHOT = True
+except ImportError:
+    HAS_CONFIG_SNAPSHOT = False
+
 BASE_DIR = Path(os.environ.get('VAULT_PATH', Path.cwd()))
 USER_PROFILE = BASE_DIR / 'System' / 'user-profile.yaml'
 
 def get_obsidian_mode() -> bool:
     """Check if Obsidian mode is enabled"""
+    if HAS_CONFIG_SNAPSHOT:
+        return get_profile_flag(BASE_DIR, 'obsidian_mode')
+    
     if not USER_PROFILE.exists() or yaml is None:
         return False
     
@@ -0,0 +1,285 @@
+"""
+Dex Response Cache — Bounded, single-flight cache for JSON API responses
+
+The Granola API client kept every response in a module-level dict with one
+5-minute TTL: nothing was ever evicted, the cache was lost on every restart,
+and two tools asking for the same page at the same time both hit the API.
+This cache replaces it:
+
+- Memory: LRU bounded by approximate bytes (the serialized response size)
+- Disk (optional): SQLite table of unexpired responses, read on a memory miss
+  so a restart doesn't mean a cold cache. Pruned to a byte budget.
+- TTLs per endpoint, with a default for everything else
+- Single-flight: concurrent requests for the same key share one fetch
+- Failed fetches (None) are never cached
+
+Responses are shared between callers — treat them as read-only.
+
+Usage:
+    from core.utils.response_cache import ResponseCache
+
+    cache = ResponseCache(ttls={'/v2/get-documents': 120}, db_path=vault / "System" / ".api-cache.db")
+    result = cache.get_or_fetch('/v2/get-documents', {'limit': 1}, lambda: post(...))
+    cache.stats()   # {'hit_ratio': 0.82, 'endpoints': {'/v2/get-documents': {...}}, ...}
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 300
+DEFAULT_MAX_BYTES = int(float(os.environ.get('DEX_API_CACHE_MB', '16')) * 1024 * 1024)
+DEFAULT_MAX_DISK_BYTES = 4 * DEFAULT_MAX_BYTES
+
+
+class _Flight:
+    """A fetch in progress that other callers for the same key wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+
+
+class ResponseCache:
+    """LRU of JSON responses with per-endpoint TTLs, an optional disk tier and single-flight fetches."""
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, default_ttl: float = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_BYTES, db_path: Optional[Path] = None,
+                 max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES):
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.db_path = Path(db_path) if db_path else None
+        self.max_disk_bytes = max_disk_bytes
+        # key -> (expires_at, response, bytes)
+        self._entries: "OrderedDict[str, Tuple[float, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_lock = threading.Lock()  # one statement sequence at a time on the shared connection
+        self._disk_failed = False
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(endpoint: str, payload: Dict[str, Any]) -> str:
+        return f"{endpoint}:{json.dumps(payload, sort_keys=True)}"
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def _counters(self, endpoint: str) -> Dict[str, int]:
+        counters = self._stats.get(endpoint)
+        if counters is None:
+            counters = self._stats[endpoint] = {"hits": 0, "disk_hits": 0, "coalesced": 0, "misses": 0}
+        return counters
+
+    # ------------------------------------------------------------------
+    # Memory tier (callers hold self._lock)
+    # ------------------------------------------------------------------
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def _remember(self, key: str, expires_at: float, response: Any, size: int) -> None:
+        self._drop(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (expires_at, response, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes and self._entries:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+            self._evictions += 1
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+
+    def _disk(self) -> Optional[sqlite3.Connection]:
+        if self.db_path is None or self._disk_failed:
+            return None
+        if self._conn is None:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.db_path), timeout=5, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, size INTEGER NOT NULL, body TEXT NOT NULL)"
+                )
+                conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+                conn.commit()
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.warning(f"API response disk cache unavailable ({e}); caching in memory only")
+                self._disk_failed = True
+                return None
+        return self._conn
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[float, Any, int]]:
+        with self._disk_lock:
+            conn = self._disk()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT expires_at, body, size FROM responses WHERE key = ? AND expires_at > ?", (key, now)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        if not row:
+            return None
+        try:
+            return row[0], json.loads(row[1]), row[2]
+        except ValueError:
+            return None
+
+    def _disk_put(self, key: str, expires_at: float, body: str) -> None:
+        with self._disk_lock:
+            self._disk_write(key, expires_at, body)
+
+    def _disk_write(self, key: str, expires_at: float, body: str) -> None:
+        conn = self._disk()
+        if conn is None:
+            return
+        try:
+            conn.execute("INSERT OR REPLACE INTO responses (key, expires_at, size, body) VALUES (?, ?, ?, ?)",
+                         (key, expires_at, len(body), body))
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_disk_bytes:
+                # Expired rows first, then the soonest to expire
+                conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+                for old_key, size in conn.execute(
+                    "SELECT key, size FROM responses ORDER BY expires_at"
+                ).fetchall():
+                    if total <= self.max_disk_bytes:
+                        break
+                    conn.execute("DELETE FROM responses WHERE key = ?", (old_key,))
+                    total -= size
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Could not persist API response: {e}")
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_or_fetch(self, endpoint: str, payload: Dict[str, Any], fetch: Callable[[], Any],
+                     use_cache: bool = True) -> Any:
+        """
+        Cached response for (endpoint, payload), or the result of fetch().
+
+        With use_cache=False the cached copy is skipped (the fresh result still
+        refreshes it). Concurrent calls for the same key share one fetch either way.
+        """
+        key = self.make_key(endpoint, payload)
+        now = time.time()
+
+        with self._lock:
+            counters = self._counters(endpoint)
+            if use_cache:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    if entry[0] > now:
+                        self._entries.move_to_end(key)
+                        counters["hits"] += 1
+                        return entry[1]
+                    self._drop(key)
+
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                counters["coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            return flight.result
+
+        try:
+            if use_cache:
+                cached = self._disk_get(key, now)
+                if cached is not None:
+                    with self._lock:
+                        counters["disk_hits"] += 1
+                        self._remember(key, *cached)
+                    flight.result = cached[1]
+                    return cached[1]
+
+            with self._lock:
+                counters["misses"] += 1
+            result = fetch()
+            if result is not None:
+                ttl = self.ttl_for(endpoint)
+                if ttl > 0:
+                    body = json.dumps(result)
+                    expires_at = time.time() + ttl
+                    with self._lock:
+                        self._remember(key, expires_at, result, len(body))
+                    self._disk_put(key, expires_at, body)
+            flight.result = result
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    def invalidate(self, endpoint: Optional[str] = None) -> None:
+        """Forget cached responses (for one endpoint, or all)."""
+        prefix = f"{endpoint}:" if endpoint else ""
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                self._drop(key)
+        with self._disk_lock:
+            conn = self._disk()
+            if conn is not None:
+                try:
+                    conn.execute("DELETE FROM responses WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+                    conn.commit()
+                except sqlite3.Error:
+                    pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            endpoints = {}
+            totals = {"hits": 0, "disk_hits": 0, "coalesced": 0, "misses": 0}
+            for endpoint, counters in self._stats.items():
+                lookups = sum(counters.values())
+                endpoints[endpoint] = {
+                    **counters,
+                    "ttl_seconds": self.ttl_for(endpoint),
+                    "hit_ratio": round((lookups - counters["misses"]) / lookups, 3) if lookups else None,
+                }
+                for name, value in counters.items():
+                    totals[name] += value
+            lookups = sum(totals.values())
+            return {
+                **totals,
+                "hit_ratio": round((lookups - totals["misses"]) / lookups, 3) if lookups else None,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions,
+                "disk": str(self.db_path) if self._conn is not None else None,
+                "endpoints": endpoints,
+            }
+
+    def close(self) -> None:
+        with self._disk_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,125 @@
+"""
+Dex Similarity Index — Character n-gram candidate index for near-duplicate titles
+
+Duplicate detection used to score every incoming item against every open task
+with difflib.SequenceMatcher. This module keeps an inverted index from
+character trigrams to titles so only the handful of titles that share enough
+trigrams with the query are handed to the expensive scorer.
+
+The index is synced incrementally: callers pass the current set of titles and
+only the ones that appeared or disappeared since the last sync are touched.
+
+Usage:
+    from core.utils.similarity_index import SimilarityIndex
+
+    index = SimilarityIndex()
+    index.sync({("Tasks.md", "Send Q1 board deck"): "Send Q1 board deck", ...})
+    for key, overlap in index.candidates("Send the Q1 board deck"):
+        ...
+"""
+
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Hashable, List, Set, Tuple
+
+# Gram size — trigrams are the usual sweet spot for short English titles
+NGRAM_SIZE = 3
+
+# Minimum Dice overlap of trigram sets for a title to be a candidate. Titles
+# that clear the dedup threshold (0.6) on their own share well over 0.6.
+DEFAULT_MIN_OVERLAP = 0.4
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def ngrams(text: str, n: int = NGRAM_SIZE) -> Set[str]:
+    """Set of character n-grams of a lowercased, whitespace-normalized string."""
+    normalized = f" {_WHITESPACE.sub(' ', text.lower()).strip()} "
+    if len(normalized) <= n:
+        return {normalized}
+    return {normalized[i:i + n] for i in range(len(normalized) - n + 1)}
+
+
+class SimilarityIndex:
+    """Inverted trigram index over titles, keyed by caller-chosen hashable keys."""
+
+    def __init__(self, n: int = NGRAM_SIZE):
+        self.n = n
+        self._postings: Dict[str, Set[Hashable]] = defaultdict(set)
+        self._grams: Dict[Hashable, Set[str]] = {}
+        self._titles: Dict[Hashable, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._titles
+
+    def add(self, key: Hashable, title: str) -> None:
+        if self._titles.get(key) == title:
+            return
+        if key in self._titles:
+            self.remove(key)
+        grams = ngrams(title, self.n)
+        self._titles[key] = title
+        self._grams[key] = grams
+        for gram in grams:
+            self._postings[gram].add(key)
+
+    def remove(self, key: Hashable) -> None:
+        grams = self._grams.pop(key, None)
+        if grams is None:
+            return
+        del self._titles[key]
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[gram]
+
+    def sync(self, titles: Dict[Hashable, str]) -> Tuple[int, int]:
+        """
+        Make the index hold exactly `titles` (key -> title).
+
+        Returns:
+            (added, removed) counts — (0, 0) when nothing changed
+        """
+        stale = [key for key in self._titles if key not in titles]
+        for key in stale:
+            self.remove(key)
+        added = 0
+        for key, title in titles.items():
+            if self._titles.get(key) != title:
+                self.add(key, title)
+                added += 1
+        return added, len(stale)
+
+    def title(self, key: Hashable) -> str:
+        return self._titles[key]
+
+    def candidates(self, text: str, min_overlap: float = DEFAULT_MIN_OVERLAP,
+                   limit: int = 0) -> List[Tuple[Hashable, float]]:
+        """
+        Titles whose trigram sets overlap the query's by at least `min_overlap`
+        (Dice coefficient), best first.
+
+        Args:
+            text:        Query string
+            min_overlap: Dice threshold in [0, 1]
+            limit:       Cap on returned candidates (0 = no cap)
+        """
+        query = ngrams(text, self.n)
+        shared: Counter = Counter()
+        for gram in query:
+            posting = self._postings.get(gram)
+            if posting:
+                shared.update(posting)
+
+        scored = []
+        for key, count in shared.items():
+            overlap = 2 * count / (len(query) + len(self._grams[key]))
+            if overlap >= min_overlap:
+                scored.append((key, overlap))
+        scored.sort(key=lambda kv: kv[1], reverse=True)
+        return scored[:limit] if limit else scored
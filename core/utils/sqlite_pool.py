@@ -0,0 +1,141 @@
+"""
+Dex SQLite Read Pool — Long-lived read-only connections, one per thread
+
+The session memory server used to open a connection, set journal_mode and
+probe sqlite_master on every query, then close it again — so each call paid
+for opening the file, reading the schema and compiling every statement from
+scratch. This pool keeps one read-only connection per thread for the life of
+the process:
+
+- statements are compiled once per connection and reused from sqlite3's
+  statement cache (keep the SQL text constant and bind values as parameters)
+- the schema is probed once per schema change: which tables exist, so
+  optional features (e.g. observations) are a set lookup instead of a
+  sqlite_master scan. Each lookup reads PRAGMA schema_version (a header
+  field) and re-probes when a migration has bumped it
+- if the file is replaced or deleted (the app recreating its database), the
+  next call notices the new inode and reopens and re-probes
+
+Connections are autocommit and read-only (mode=ro, query_only), so they never
+hold a read snapshot between calls and don't stop the writer's WAL checkpoints.
+
+Usage:
+    from core.utils.sqlite_pool import ReadOnlyPool
+
+    pool = ReadOnlyPool(db_path)
+    conn = pool.connection()            # this thread's connection (do not close it)
+    rows = conn.execute("SELECT ...", params).fetchall()
+    if pool.has_table('observations'):
+        ...
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Distinct SQL strings kept compiled per connection
+DEFAULT_CACHED_STATEMENTS = 128
+
+
+class ReadOnlyPool:
+    """Per-thread read-only connections to one SQLite file, with a cached schema probe."""
+
+    def __init__(self, db_path: Path, cached_statements: int = DEFAULT_CACHED_STATEMENTS,
+                 missing_message: Optional[str] = None):
+        self.db_path = Path(db_path)
+        self.cached_statements = cached_statements
+        self.missing_message = missing_message or f"Database not found at {self.db_path}"
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._identity: Optional[Tuple[int, int]] = None  # (st_dev, st_ino) the open connections belong to
+        self._tables: Optional[FrozenSet[str]] = None
+        self._schema_version: Optional[int] = None  # schema_version _tables was probed at
+        self._connections: List[sqlite3.Connection] = []
+        self._stats = {'opened': 0, 'reused': 0, 'reopened': 0, 'probes': 0}
+
+    def _file_identity(self) -> Tuple[int, int]:
+        try:
+            st = os.stat(self.db_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(self.missing_message) from None
+        return (st.st_dev, st.st_ino)
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro", uri=True,
+            cached_statements=self.cached_statements, check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only=1")
+        return conn
+
+    def _reset(self) -> None:
+        """Drop every connection and the schema probe (caller holds _lock)."""
+        for conn in self._connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._connections.clear()
+        self._tables = None
+        self._schema_version = None
+
+    def connection(self) -> sqlite3.Connection:
+        """This thread's connection — opened on first use, reopened if the file was replaced."""
+        identity = self._file_identity()
+        conn = getattr(self._local, 'conn', None)
+        with self._lock:
+            if identity != self._identity:
+                if self._identity is not None:
+                    logger.info(f"{self.db_path.name} was replaced; reopening connections")
+                    self._stats['reopened'] += 1
+                self._reset()
+                self._identity = identity
+                conn = None
+            elif conn is not None and conn not in self._connections:
+                conn = None  # closed by close() or a reset on another thread
+            if conn is not None:
+                self._stats['reused'] += 1
+                return conn
+
+        conn = self._open()
+        with self._lock:
+            self._connections.append(conn)
+            self._stats['opened'] += 1
+        self._local.conn = conn
+        return conn
+
+    @property
+    def tables(self) -> FrozenSet[str]:
+        """Names of the tables and views in the database (re-probed when the schema changes)."""
+        conn = self.connection()  # resets the probe if the file was replaced
+        version = conn.execute("PRAGMA schema_version").fetchone()[0]
+        tables = self._tables
+        if tables is None or version != self._schema_version:
+            rows = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type IN ('table', 'view')"
+            ).fetchall()
+            tables = frozenset(row[0] for row in rows)
+            with self._lock:
+                self._tables = tables
+                self._schema_version = version
+                self._stats['probes'] += 1
+        return tables
+
+    def has_table(self, name: str) -> bool:
+        return name in self.tables
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, 'connections': len(self._connections),
+                    'tables': sorted(self._tables) if self._tables is not None else None}
+
+    def close(self) -> None:
+        with self._lock:
+            self._reset()
+            self._identity = None
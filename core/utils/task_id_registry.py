@@ -0,0 +1,176 @@
+"""
+Dex Task ID Registry — O(1) allocation of task-YYYYMMDD-NNN IDs
+
+generate_task_id() used to scan every markdown file in the vault to find the
+highest suffix used today. This module keeps the highest suffix per date in a
+small JSON file instead, seeded once from a vault scan and bumped on every
+allocation.
+
+Allocation is a read-modify-write under an exclusive fcntl lock, so the Work
+MCP, other MCP servers and the Obsidian sync daemon can all allocate at the
+same time without ever handing out the same ID twice. The state file is
+replaced atomically so a crash mid-write never leaves it half written; if it
+does get lost or corrupted, the next allocation simply reseeds from the vault.
+
+Usage:
+    from core.utils.task_id_registry import TaskIdRegistry
+
+    registry = TaskIdRegistry(vault_path)
+    task_id = registry.allocate()                 # task-20260206-004
+    batch = registry.allocate_many(3)             # task-20260206-005 .. -007
+    registry.observe(["task-20260206-010"])       # IDs written by hand
+"""
+
+import fcntl
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TASK_ID_PATTERN = re.compile(r'task-(\d{8})-(\d{3})')
+
+STATE_VERSION = 1
+
+
+class TaskIdRegistry:
+    """Durable per-date counter for task IDs, shared across processes."""
+
+    def __init__(self, vault_path: Path, state_file: Optional[Path] = None):
+        self.vault_path = Path(vault_path)
+        self.state_file = Path(state_file) if state_file else self.vault_path / 'System' / '.dex-task-ids.json'
+        self.lock_file = self.state_file.with_name(self.state_file.name + '.lock')
+        # flock is per open file description, so threads in one process
+        # still need their own lock around it
+        self._thread_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # State file
+    # ------------------------------------------------------------------
+
+    def _read_state(self) -> Optional[Dict[str, int]]:
+        try:
+            with open(self.state_file, 'r') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Task ID registry unreadable ({e}), reseeding from vault")
+            return None
+        if not isinstance(state, dict) or state.get('version') != STATE_VERSION:
+            return None
+        return {str(k): int(v) for k, v in state.get('dates', {}).items()}
+
+    def _write_state(self, counters: Dict[str, int]) -> None:
+        # Old dates are never allocated again; keep a bounded history so
+        # observe() on recent dates still works without growing forever
+        recent = dict(sorted(counters.items())[-400:])
+        fd, tmp = tempfile.mkstemp(dir=str(self.state_file.parent), prefix='.dex-task-ids.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'version': STATE_VERSION, 'dates': recent}, f, indent=2, sort_keys=True)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.state_file)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _scan_vault(self) -> Dict[str, int]:
+        """One-time seed: highest suffix per date across all markdown files."""
+        counters: Dict[str, int] = {}
+        for md_file in self.vault_path.rglob('*.md'):
+            try:
+                content = md_file.read_text()
+            except Exception:
+                continue
+            for date_str, num in TASK_ID_PATTERN.findall(content):
+                n = int(num)
+                if n > counters.get(date_str, 0):
+                    counters[date_str] = n
+        logger.info(f"Seeded task ID registry from vault ({len(counters)} dates)")
+        return counters
+
+    def _locked_update(self, update: Callable[[Dict[str, int]], Any]) -> Any:
+        """Run update(counters) under the cross-process lock and persist the result."""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._thread_lock, open(self.lock_file, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                counters = self._read_state()
+                if counters is None:
+                    counters = self._scan_vault()
+                result = update(counters)
+                self._write_state(counters)
+                return result
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def allocate(self, date: Optional[datetime] = None, floor: int = 0) -> str:
+        """
+        Reserve the next task ID for a date (today by default).
+
+        Args:
+            date:  Date the ID is for
+            floor: Highest suffix the caller already knows is taken for that
+                   date (e.g. from the tasks file it is about to write). The
+                   returned ID is always above it.
+        """
+        return self.allocate_many(1, date, floor)[0]
+
+    def allocate_many(self, count: int, date: Optional[datetime] = None, floor: int = 0) -> List[str]:
+        """Reserve `count` consecutive task IDs in one locked update. See allocate()."""
+        date_str = (date or datetime.now()).strftime('%Y%m%d')
+
+        def bump(counters: Dict[str, int]) -> List[str]:
+            first = max(counters.get(date_str, 0), floor) + 1
+            last = first + count - 1
+            if last > 999:
+                raise ValueError(f"Task ID space exhausted for {date_str}")
+            counters[date_str] = last
+            return [f"task-{date_str}-{n:03d}" for n in range(first, last + 1)]
+
+        if count <= 0:
+            return []
+        return self._locked_update(bump)
+
+    def observe(self, task_ids: Iterable[str]) -> None:
+        """Record IDs that were written outside allocate() so they are never reissued."""
+        seen: Dict[str, int] = {}
+        for task_id in task_ids:
+            match = TASK_ID_PATTERN.fullmatch(task_id)
+            if match:
+                date_str, n = match.group(1), int(match.group(2))
+                seen[date_str] = max(seen.get(date_str, 0), n)
+        if not seen:
+            return
+
+        def merge(counters: Dict[str, int]) -> None:
+            for date_str, n in seen.items():
+                if n > counters.get(date_str, 0):
+                    counters[date_str] = n
+
+        self._locked_update(merge)
+
+    def reseed(self) -> None:
+        """Merge a fresh vault scan into the stored counters."""
+        def replace(counters: Dict[str, int]) -> None:
+            scanned = self._scan_vault()
+            # Never move a counter backwards — an allocated ID may not be on disk yet
+            for date_str, n in scanned.items():
+                counters[date_str] = max(counters.get(date_str, 0), n)
+
+        self._locked_update(replace)
@@ -0,0 +1,138 @@
+"""
+Dex Term Index — Case-insensitive substring search across many documents
+
+Company aggregation asks "which meeting notes mention this company name or
+domain anywhere?" for every company page. Reading every note per question is
+O(companies x meetings) file reads. This index keeps each document's text in
+memory once and answers a question by narrowing to documents that contain the
+term's longest word (looked up through a trigram index over the vocabulary),
+then confirming with a plain substring check — so results are exactly what
+`term.lower() in text.lower()` over every document would return.
+
+Documents are synced by version (e.g. mtime), so only changed files are re-read.
+
+Usage:
+    from core.utils.term_index import TermIndex
+
+    index = TermIndex()
+    index.sync({path: (mtime_ns, loader) for path, mtime_ns in files})
+    paths = index.search("acme.com")
+"""
+
+import re
+from collections import defaultdict
+from typing import Callable, Dict, Hashable, Iterable, Set, Tuple
+
+_WORD = re.compile(r'\w+')
+
+
+def _trigrams(word: str) -> Set[str]:
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+
+class TermIndex:
+    """In-memory substring index over a set of versioned documents."""
+
+    def __init__(self):
+        self._texts: Dict[Hashable, str] = {}
+        self._versions: Dict[Hashable, Hashable] = {}
+        self._doc_words: Dict[Hashable, Set[str]] = {}
+        self._word_docs: Dict[str, Set[Hashable]] = defaultdict(set)
+        self._gram_words: Dict[str, Set[str]] = defaultdict(set)
+        self._memo: Dict[str, Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def text(self, key: Hashable) -> str:
+        """Lowercased text stored for a document."""
+        return self._texts[key]
+
+    def add(self, key: Hashable, text: str, version: Hashable = None) -> None:
+        if key in self._texts:
+            self.remove(key)
+        lowered = text.lower()
+        words = set(_WORD.findall(lowered))
+        self._texts[key] = lowered
+        self._versions[key] = version
+        self._doc_words[key] = words
+        for word in words:
+            if not self._word_docs[word]:
+                for gram in _trigrams(word):
+                    self._gram_words[gram].add(word)
+            self._word_docs[word].add(key)
+        self._memo.clear()
+
+    def remove(self, key: Hashable) -> None:
+        if key not in self._texts:
+            return
+        del self._texts[key]
+        del self._versions[key]
+        for word in self._doc_words.pop(key):
+            docs = self._word_docs[word]
+            docs.discard(key)
+            if not docs:
+                del self._word_docs[word]
+                for gram in _trigrams(word):
+                    words = self._gram_words[gram]
+                    words.discard(word)
+                    if not words:
+                        del self._gram_words[gram]
+        self._memo.clear()
+
+    def sync(self, docs: Dict[Hashable, Tuple[Hashable, Callable[[], str]]]) -> Tuple[int, int]:
+        """
+        Make the index hold exactly `docs`: key -> (version, loader).
+
+        A document is (re)loaded only when it is new or its version changed.
+
+        Returns:
+            (loaded, removed) counts
+        """
+        stale = [key for key in self._texts if key not in docs]
+        for key in stale:
+            self.remove(key)
+        loaded = 0
+        for key, (version, loader) in docs.items():
+            if key in self._texts and self._versions[key] == version:
+                continue
+            try:
+                text = loader()
+            except OSError:
+                self.remove(key)
+                continue
+            self.add(key, text, version)
+            loaded += 1
+        return loaded, len(stale)
+
+    def _words_containing(self, fragment: str) -> Iterable[str]:
+        if len(fragment) < 3:
+            return [w for w in self._word_docs if fragment in w]
+        grams = sorted(_trigrams(fragment), key=lambda g: len(self._gram_words.get(g, ())))
+        candidates = set(self._gram_words.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates &= self._gram_words.get(gram, set())
+        return [w for w in candidates if fragment in w]
+
+    def search(self, term: str) -> Set[Hashable]:
+        """Keys of documents whose text contains `term` (case-insensitive)."""
+        term = term.lower()
+        if term in self._memo:
+            return self._memo[term]
+
+        words = _WORD.findall(term)
+        if not words:
+            candidates: Iterable[Hashable] = self._texts.keys()
+        else:
+            # Any occurrence of the term puts its longest word inside some
+            # indexed word of that document
+            longest = max(words, key=len)
+            candidates = set()
+            for word in self._words_containing(longest):
+                candidates |= self._word_docs[word]
+
+        matched = {key for key in candidates if term in self._texts[key]}
+        self._memo[term] = matched
+        return matched
@@ -0,0 +1,243 @@
+"""
+Dex Tool Executor — Run blocking MCP tool work off the asyncio event loop
+
+MCP tool handlers are `async`, but most of their bodies are blocking: vault
+rglob scans, markdown parsing, `subprocess.run` for QMD, `requests.post` for
+analytics. Run directly on the event loop, one slow call stalls every other
+request on the same stdio session (including pings and cancellations).
+
+This module dispatches that work to a bounded thread pool:
+
+- max_workers caps total threads (DEX_TOOL_WORKERS, default 4)
+- per-tool limits cap how many calls of the same tool run at once
+- exclusive tools run alone — nothing else is in flight while they run — for
+  handlers that write vault files or rebuild shared in-memory indexes
+- cancellation: when the awaiting request is cancelled (client cancel or
+  disconnect), async handlers are cancelled at their next await and sync code
+  sees `check_cancelled()` raise at its next safe point. The slot is released
+  only once the worker thread has actually stopped, so limits stay honest.
+
+Usage:
+    from core.utils.tool_executor import ToolExecutor, check_cancelled
+
+    executor = ToolExecutor(limits={"refresh_all_companies": 1}, exclusive=WRITE_TOOLS)
+
+    @app.call_tool()
+    async def handle_call_tool(name, arguments):
+        return await executor.run_handler(name, _handle_call_tool_inner, name, arguments)
+
+    # inside long loops in sync code
+    for page in pages:
+        check_cancelled()
+        ...
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = int(os.environ.get('DEX_TOOL_WORKERS', '4'))
+
+# Concurrent calls allowed per tool unless overridden in `limits`
+DEFAULT_TOOL_LIMIT = 2
+
+
+class ToolCancelled(BaseException):
+    """Raised by check_cancelled() in a worker whose request was cancelled.
+
+    A BaseException (like asyncio.CancelledError) so per-item
+    `except Exception` handlers in long loops don't swallow it.
+    """
+
+
+class CancelToken:
+    """Cancellation flag shared between the awaiting request and its worker thread."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._event.set()
+            if self._loop is not None and self._task is not None:
+                self._loop.call_soon_threadsafe(self._task.cancel)
+
+    def attach(self, loop: asyncio.AbstractEventLoop, task: asyncio.Task) -> None:
+        """Bind the worker-side task so cancel() can interrupt it at its next await."""
+        with self._lock:
+            self._loop, self._task = loop, task
+            if self._event.is_set():
+                task.cancel()
+
+
+_current_token: contextvars.ContextVar[Optional[CancelToken]] = contextvars.ContextVar(
+    'dex_tool_cancel_token', default=None
+)
+
+
+def check_cancelled() -> None:
+    """Raise ToolCancelled if the current tool call was cancelled (no-op outside the executor)."""
+    token = _current_token.get()
+    if token is not None and token.cancelled:
+        raise ToolCancelled()
+
+
+def _run_sync(token: CancelToken, fn: Callable[..., Any], args, kwargs) -> Any:
+    reset = _current_token.set(token)
+    try:
+        check_cancelled()
+        return fn(*args, **kwargs)
+    finally:
+        _current_token.reset(reset)
+
+
+def _run_coroutine(token: CancelToken, handler: Callable[..., Awaitable[Any]], args, kwargs) -> Any:
+    """Drive an async handler to completion on a private event loop in this worker thread."""
+    reset = _current_token.set(token)
+    loop = asyncio.new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        task = loop.create_task(handler(*args, **kwargs))
+        token.attach(loop, task)
+        return loop.run_until_complete(task)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+            _current_token.reset(reset)
+
+
+class _ExclusiveGate:
+    """Readers/writer gate on the event loop: shared calls overlap, exclusive calls run alone."""
+
+    def __init__(self):
+        self._cond = asyncio.Condition()
+        self._shared = 0
+        self._exclusive = False
+        self._waiting_exclusive = 0
+
+    async def acquire(self, exclusive: bool) -> None:
+        async with self._cond:
+            if exclusive:
+                self._waiting_exclusive += 1
+                try:
+                    await self._cond.wait_for(lambda: not self._exclusive and self._shared == 0)
+                finally:
+                    self._waiting_exclusive -= 1
+                self._exclusive = True
+            else:
+                # Queued exclusive calls go first so writes aren't starved by reads
+                await self._cond.wait_for(lambda: not self._exclusive and self._waiting_exclusive == 0)
+                self._shared += 1
+
+    async def release(self, exclusive: bool) -> None:
+        async with self._cond:
+            if exclusive:
+                self._exclusive = False
+            else:
+                self._shared -= 1
+            self._cond.notify_all()
+
+
+class ToolExecutor:
+    """Bounded thread pool with per-tool concurrency limits for one MCP server."""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS,
+                 default_limit: int = DEFAULT_TOOL_LIMIT,
+                 limits: Optional[Dict[str, int]] = None,
+                 exclusive: Iterable[str] = ()):
+        self.max_workers = max(1, max_workers)
+        self.default_limit = max(1, default_limit)
+        self.limits = dict(limits or {})
+        self.exclusive = set(exclusive)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._gate: Optional[_ExclusiveGate] = None
+        self._stats = {"completed": 0, "failed": 0, "cancelled": 0}
+        self._in_flight: Dict[str, int] = {}
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='dex-tool')
+        return self._pool
+
+    def _semaphore(self, tool: str) -> asyncio.Semaphore:
+        sem = self._semaphores.get(tool)
+        if sem is None:
+            sem = self._semaphores[tool] = asyncio.Semaphore(self.limits.get(tool, self.default_limit))
+        return sem
+
+    async def _dispatch(self, tool: str, worker: Callable[..., Any], target, args, kwargs) -> Any:
+        if self._gate is None:
+            self._gate = _ExclusiveGate()
+        exclusive = tool in self.exclusive
+        token = CancelToken()
+
+        async with self._semaphore(tool):
+            await self._gate.acquire(exclusive)
+            self._in_flight[tool] = self._in_flight.get(tool, 0) + 1
+            try:
+                loop = asyncio.get_running_loop()
+                future = loop.run_in_executor(self._get_pool(), worker, token, target, args, kwargs)
+                try:
+                    result = await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    token.cancel()
+                    self._stats["cancelled"] += 1
+                    await self._wait_stopped(tool, future)
+                    raise
+                except BaseException:
+                    self._stats["failed"] += 1
+                    raise
+                self._stats["completed"] += 1
+                return result
+            finally:
+                self._in_flight[tool] -= 1
+                await asyncio.shield(self._gate.release(exclusive))
+
+    @staticmethod
+    async def _wait_stopped(tool: str, future: asyncio.Future) -> None:
+        """Hold the slot until the cancelled worker thread has returned."""
+        while not future.done():
+            try:
+                await asyncio.wait({future})
+            except asyncio.CancelledError:
+                continue
+        error = None if future.cancelled() else future.exception()
+        if error is not None and not isinstance(error, (ToolCancelled, asyncio.CancelledError)):
+            logger.warning(f"Cancelled tool '{tool}' failed while stopping: {error}")
+
+    async def run(self, tool: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking function in the pool under `tool`'s limits."""
+        return await self._dispatch(tool, _run_sync, fn, args, kwargs)
+
+    async def run_handler(self, tool: str, handler: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Run an async handler whose body blocks (file I/O, subprocess) in the pool."""
+        return await self._dispatch(tool, _run_coroutine, handler, args, kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "max_workers": self.max_workers,
+            "in_flight": {tool: n for tool, n in self._in_flight.items() if n},
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
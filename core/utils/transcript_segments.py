@@ -0,0 +1,168 @@
+"""
+Dex Transcript Segments — Time-indexed view of a Granola meeting transcript
+
+Granola keeps a transcript as a list of entries (text, start/end timestamps,
+audio source). The meeting tools used to sort and join every entry into one
+string, even when the caller only needed its length or a few minutes around
+a topic. This index sorts a transcript once and keeps each segment's offset
+from the start of the meeting, its speaker and its text, so callers can ask
+for:
+
+- window(start, end)   segments overlapping a time range (seconds), by bisect
+- search(query)        segments containing a phrase, with surrounding context
+- page(offset, limit)  a slice, for paging through long calls
+
+Speakers come from the entry's `speaker` when present, otherwise from the
+audio source Granola recorded it on: microphone -> "me", system -> "them".
+
+Usage:
+    from core.utils.transcript_segments import TranscriptSegments
+
+    segments = TranscriptSegments(cache['transcripts'][meeting_id])
+    segments.to_dicts(segments.window(600, 900))       # minutes 10-15
+    segments.search('pricing', context=2)              # excerpts around matches
+    segments.to_dicts(segments.page(0, 50))
+"""
+
+import bisect
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional
+
+SPEAKERS = {'microphone': 'me', 'system': 'them'}
+
+
+class Segment(NamedTuple):
+    start: Optional[float]   # seconds from the first segment, None if unparseable
+    end: Optional[float]
+    speaker: str
+    text: str
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def format_offset(seconds: Optional[float]) -> Optional[str]:
+    """"H:MM:SS" / "MM:SS" for an offset in seconds."""
+    if seconds is None:
+        return None
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes:02d}:{secs:02d}"
+
+
+class TranscriptSegments:
+    """Transcript entries in time order, with offsets and speakers."""
+
+    def __init__(self, entries: List[Dict[str, Any]]):
+        ordered = sorted(
+            (e for e in entries if isinstance(e, dict)),
+            key=lambda e: e.get('start_timestamp', '')
+        )
+        starts = [_parse_timestamp(e.get('start_timestamp')) for e in ordered]
+        origin = next((s for s in starts if s is not None), None)
+        self.started_at = origin.isoformat() if origin else None
+
+        segments = []
+        for entry, start in zip(ordered, starts):
+            end = _parse_timestamp(entry.get('end_timestamp'))
+            source = entry.get('source', '')
+            segments.append(Segment(
+                start=(start - origin).total_seconds() if start and origin else None,
+                end=(end - origin).total_seconds() if end and origin else None,
+                speaker=entry.get('speaker') or SPEAKERS.get(source, source or 'unknown'),
+                text=entry.get('text', ''),
+            ))
+        self.segments = segments
+        self._text: Optional[str] = None
+        ends = [s.end if s.end is not None else s.start for s in segments]
+        self.duration: Optional[float] = max((e for e in ends if e is not None), default=None)
+        # Window lookups need monotonic starts; unparseable ones inherit the previous start
+        self._starts: List[float] = []
+        previous = 0.0
+        for segment in segments:
+            previous = segment.start if segment.start is not None else previous
+            self._starts.append(previous)
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def text(self) -> str:
+        """Every segment joined with spaces (the legacy single-string transcript)."""
+        if self._text is None:
+            self._text = ' '.join(s.text for s in self.segments).strip()
+        return self._text
+
+    @property
+    def text_length(self) -> int:
+        return len(self.text())
+
+    def window(self, start: float = 0, end: Optional[float] = None) -> List[int]:
+        """Indices of segments overlapping [start, end] seconds."""
+        lo = bisect.bisect_left(self._starts, start)
+        # The previous segment may still be running at `start`
+        if lo > 0:
+            prev = self.segments[lo - 1]
+            if prev.end is not None and prev.end > start:
+                lo -= 1
+        hi = len(self.segments) if end is None else bisect.bisect_right(self._starts, end)
+        return list(range(lo, hi))
+
+    def page(self, offset: int = 0, limit: int = 50) -> List[int]:
+        """Indices of segments [offset, offset + limit)."""
+        offset = max(0, offset)
+        return list(range(offset, min(len(self.segments), offset + max(0, limit))))
+
+    def search(self, query: str, context: int = 2, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Excerpts around segments containing `query` (case-insensitive).
+
+        Each excerpt holds the matching segments plus `context` segments either
+        side; overlapping excerpts are merged. Returns at most `limit` excerpts.
+        """
+        needle = query.lower().strip()
+        if not needle:
+            return []
+        context = max(0, context)
+
+        excerpts: List[Dict[str, Any]] = []
+        for index, segment in enumerate(self.segments):
+            if needle not in segment.text.lower():
+                continue
+            lo, hi = max(0, index - context), min(len(self.segments), index + context + 1)
+            if excerpts and lo <= excerpts[-1]['_hi']:
+                excerpts[-1]['_hi'] = max(excerpts[-1]['_hi'], hi)
+                excerpts[-1]['matches'].append(index)
+                continue
+            if len(excerpts) >= limit:
+                break
+            excerpts.append({'_lo': lo, '_hi': hi, 'matches': [index]})
+
+        return [{
+            'start': format_offset(self.segments[e['_lo']].start),
+            'matches': len(e['matches']),
+            'segments': self.to_dicts(range(e['_lo'], e['_hi']), highlight=set(e['matches'])),
+        } for e in excerpts]
+
+    def to_dicts(self, indices, highlight: Optional[set] = None) -> List[Dict[str, Any]]:
+        """JSON-friendly segments for the given indices."""
+        result = []
+        for index in indices:
+            segment = self.segments[index]
+            item = {
+                'index': index,
+                'time': format_offset(segment.start),
+                'start_seconds': round(segment.start, 1) if segment.start is not None else None,
+                'end_seconds': round(segment.end, 1) if segment.end is not None else None,
+                'speaker': segment.speaker,
+                'text': segment.text,
+            }
+            if highlight is not None and index in highlight:
+                item['match'] = True
+            result.append(item)
+        return result
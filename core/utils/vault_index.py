@@ -0,0 +1,420 @@
+"""
+Dex Vault Index — BM25 keyword search over vault markdown, no external binary
+
+When QMD isn't installed, vault_search() used to shell out to `rg -l` and rank
+files by the order rg happened to print them. This module keeps an inverted
+index of every markdown file in the vault and ranks with BM25F:
+
+- fields: a file's title (file name and first `# ` heading) counts
+  TITLE_WEIGHT times, other headings HEADING_WEIGHT times, body text once
+- scores: standard BM25 (k1=1.2, b=0.75) over the weighted term counts, also
+  reported normalized to 0-1 against the best score the query's indexed terms
+  could get (a word no note contains doesn't drag every score down)
+- incremental: refresh() stats the vault and re-reads only files whose
+  (mtime, size) changed; removed or replaced documents are tombstoned and
+  compacted away once they make up a quarter of the index
+- persistent: the index is saved to one compact file
+  (System/.dex-vault-search.idx) so a new process doesn't re-read the vault;
+  tombstones are saved as they are, so saving after an edit doesn't renumber
+  every posting
+
+File format: the magic bytes, then one zlib stream of a 4-byte header length,
+the JSON header (documents, null for tombstones, and each term with its
+posting count), then all posting doc ids (uint32) and all term counts
+(uint16) as raw arrays.
+
+Usage:
+    from core.utils.vault_index import VaultIndex
+
+    index = VaultIndex(vault_path)
+    for hit in index.search("customer retention", limit=10, glob="04-Projects/**/*.md"):
+        print(hit['path'], hit['score'])
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from array import array
+from heapq import nlargest
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = 'System/.dex-vault-search.idx'
+MAGIC = b'DEXVIDX1'
+FORMAT_VERSION = 2
+
+K1 = 1.2
+B = 0.75
+TITLE_WEIGHT = 3
+HEADING_WEIGHT = 2
+
+# Compact once tombstoned documents make up this share of the index
+COMPACT_RATIO = 0.25
+
+# How often a search re-stats the vault for changed files (a scan costs ~30ms per 5k notes)
+REFRESH_INTERVAL = 30.0
+
+# Files larger than this are indexed by their first MAX_FILE_BYTES only
+MAX_FILE_BYTES = 2_000_000
+
+SKIP_DIRS = {'node_modules', '__pycache__'}
+
+_WORD = re.compile(r'\w+')
+_HEADING = re.compile(r'^#{1,6}\s+(.*)$')
+
+STOPWORDS = frozenset(
+    'a an and are as at be but by for from has have in is it its of on or that the this to was were '
+    'will with'.split()
+)
+
+
+def normalize_term(word: str) -> str:
+    """Lowercase and fold simple plurals so 'meetings' finds 'meeting'."""
+    word = word.lower()
+    if len(word) > 4 and word.endswith('ies'):
+        return word[:-3] + 'y'
+    if len(word) > 3 and word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    return [normalize_term(w) for w in _WORD.findall(text) if len(w) > 1 and w.lower() not in STOPWORDS]
+
+
+def glob_regex(pattern: str) -> 're.Pattern':
+    """Compile a vault-relative glob ('**/' spans directories, '*' doesn't)."""
+    out, i = [], 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            out.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            out.append('[^/]')
+            i += 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile(''.join(out) + r'\Z')
+
+
+def weighted_terms(rel_path: str, text: str) -> Tuple[Dict[str, int], int, str]:
+    """Term -> field-weighted count, the weighted length, and the document title."""
+    counts: Dict[str, int] = {}
+    length = 0
+    title = Path(rel_path).stem
+    title_terms = tokenize(title.replace('_', ' ').replace('-', ' '))
+    h1_seen = False
+
+    def add(terms, weight):
+        nonlocal length
+        for term in terms:
+            counts[term] = counts.get(term, 0) + weight
+        length += weight * len(terms)
+
+    add(title_terms, TITLE_WEIGHT)
+    for line in text.splitlines():
+        heading = _HEADING.match(line)
+        if heading:
+            if not h1_seen and line.startswith('# '):
+                h1_seen = True
+                title = heading.group(1).strip() or title
+                add(tokenize(heading.group(1)), TITLE_WEIGHT)
+            else:
+                add(tokenize(heading.group(1)), HEADING_WEIGHT)
+        else:
+            add(tokenize(line), 1)
+    return counts, length, title
+
+
+class VaultIndex:
+    """Persistent BM25F inverted index over a vault's markdown files."""
+
+    def __init__(self, vault_path, index_path=None, refresh_interval: float = REFRESH_INTERVAL):
+        self.vault_path = Path(vault_path)
+        self.index_path = Path(index_path) if index_path else self.vault_path / INDEX_FILE
+        self.refresh_interval = refresh_interval
+        self._lock = threading.RLock()
+        self._last_refresh = 0.0
+        self._loaded = False
+        self._reset()
+
+    def _reset(self) -> None:
+        # docs[i] = [rel_path, mtime_ns, size, length, title], or None once tombstoned
+        self._docs: List[Optional[list]] = []
+        self._by_path: Dict[str, int] = {}
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._live = 0
+        self._total_length = 0
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, limit: int = 10, glob: Optional[str] = None,
+               extra_terms: Iterable[str] = ()) -> List[Dict[str, Any]]:
+        """
+        Ranked matches for a query (any term may match; more and rarer terms rank higher).
+
+        Returns [{'path': absolute path, 'rel_path', 'title', 'score': 0-1, 'bm25'}].
+        """
+        self.refresh()
+        terms = list(dict.fromkeys(tokenize(query) + [t for w in extra_terms for t in tokenize(w)]))
+        with self._lock:
+            if not terms or not self._live:
+                return []
+            allowed = glob_regex(glob).match if glob and glob not in ('**/*.md', '**/*') else None
+            allowed_memo: Dict[int, bool] = {}
+            docs = self._docs
+            tombstones = len(docs) != self._live
+            avgdl = self._total_length / self._live
+            scores: Dict[int, float] = {}
+            best_possible = 0.0
+
+            for term in terms:
+                posting = self._postings.get(term)
+                if not posting:
+                    live = []
+                elif tombstones:
+                    live = [(d, tf) for d, tf in zip(*posting) if docs[d] is not None]
+                else:
+                    live = list(zip(*posting))
+                if not live:
+                    continue
+                idf = math.log(1 + (self._live - len(live) + 0.5) / (len(live) + 0.5))
+                best_possible += idf * (K1 + 1)
+                for doc_id, tf in live:
+                    if allowed is not None:
+                        ok = allowed_memo.get(doc_id)
+                        if ok is None:
+                            ok = allowed_memo[doc_id] = allowed(docs[doc_id][0]) is not None
+                        if not ok:
+                            continue
+                    norm = K1 * (1 - B + B * docs[doc_id][3] / avgdl)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+
+            if not scores:
+                return []
+            top = nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+            return [{
+                'path': str(self.vault_path / docs[doc_id][0]),
+                'rel_path': docs[doc_id][0],
+                'title': docs[doc_id][4],
+                'score': round(score / best_possible, 4),
+                'bm25': round(score, 4),
+            } for doc_id, score in top]
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """Bring the index up to date with the vault (throttled unless force). Returns change counts."""
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                self._load()
+            if not force and time.monotonic() - self._last_refresh < self.refresh_interval:
+                return {'added': 0, 'updated': 0, 'removed': 0}
+            self._last_refresh = time.monotonic()
+
+            seen = self._scan()
+            changes = {'added': 0, 'updated': 0, 'removed': 0}
+            for rel_path in [p for p in self._by_path if p not in seen]:
+                self._remove(rel_path)
+                changes['removed'] += 1
+            for rel_path, (mtime_ns, size) in seen.items():
+                doc_id = self._by_path.get(rel_path)
+                if doc_id is not None:
+                    doc = self._docs[doc_id]
+                    if doc[1] == mtime_ns and doc[2] == size:
+                        continue
+                    self._remove(rel_path)
+                    changes['updated'] += 1
+                else:
+                    changes['added'] += 1
+                self._add(rel_path, mtime_ns, size)
+
+            if len(self._docs) - self._live > max(64, COMPACT_RATIO * len(self._docs)):
+                self._compact()
+            if self._dirty:
+                self.save()
+            return changes
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'documents': self._live,
+                'tombstones': len(self._docs) - self._live,
+                'terms': len(self._postings),
+                'postings': sum(len(p[0]) for p in self._postings.values()),
+                'index_file': str(self.index_path),
+                'index_bytes': self.index_path.stat().st_size if self.index_path.exists() else 0,
+            }
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """rel_path -> (mtime_ns, size) for every markdown file outside hidden folders."""
+        found = {}
+        root = str(self.vault_path)
+        stack = ['']
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                entries = os.scandir(os.path.join(root, rel_dir) if rel_dir else root)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('.'):
+                        continue
+                    rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in SKIP_DIRS:
+                                stack.append(rel_path)
+                        elif name.endswith('.md'):
+                            st = entry.stat()
+                            found[rel_path] = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        continue
+        return found
+
+    def _add(self, rel_path: str, mtime_ns: int, size: int) -> None:
+        try:
+            with open(self.vault_path / rel_path, 'r', encoding='utf-8', errors='replace') as f:
+                text = f.read(MAX_FILE_BYTES)
+        except OSError:
+            return
+        counts, length, title = weighted_terms(rel_path, text)
+        doc_id = len(self._docs)
+        self._docs.append([rel_path, mtime_ns, size, length, title])
+        self._by_path[rel_path] = doc_id
+        self._live += 1
+        self._total_length += length
+        for term, tf in counts.items():
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = (array('I'), array('H'))
+            posting[0].append(doc_id)
+            posting[1].append(min(tf, 65535))
+        self._dirty = True
+
+    def _remove(self, rel_path: str) -> None:
+        doc_id = self._by_path.pop(rel_path)
+        self._live -= 1
+        self._total_length -= self._docs[doc_id][3]
+        self._docs[doc_id] = None
+        self._dirty = True
+
+    def _compact(self) -> None:
+        """Drop tombstones and renumber documents (postings stay sorted by doc id)."""
+        remap = {}
+        docs = []
+        for old_id, doc in enumerate(self._docs):
+            if doc is not None:
+                remap[old_id] = len(docs)
+                docs.append(doc)
+        postings = {}
+        for term, (doc_ids, tfs) in self._postings.items():
+            kept = [(remap[d], tf) for d, tf in zip(doc_ids, tfs) if d in remap]
+            if kept:
+                postings[term] = (array('I', [d for d, _ in kept]), array('H', [tf for _, tf in kept]))
+        self._docs = docs
+        self._by_path = {doc[0]: i for i, doc in enumerate(docs)}
+        self._postings = postings
+        self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self) -> None:
+        """Write the index file atomically (skipped if its folder doesn't exist)."""
+        with self._lock:
+            if not self.index_path.parent.is_dir():
+                self._dirty = False
+                return
+            terms = list(self._postings)
+            header = json.dumps({
+                'version': FORMAT_VERSION,
+                'byteorder': sys.byteorder,
+                'docs': self._docs,
+                'terms': [[term, len(self._postings[term][0])] for term in terms],
+            }, separators=(',', ':')).encode('utf-8')
+            doc_ids, tfs = array('I'), array('H')
+            for term in terms:
+                doc_ids.extend(self._postings[term][0])
+                tfs.extend(self._postings[term][1])
+            payload = MAGIC + zlib.compress(
+                struct.pack('<I', len(header)) + header + doc_ids.tobytes() + tfs.tobytes(), 6)
+
+            fd, tmp = tempfile.mkstemp(dir=str(self.index_path.parent), prefix='.dex-vault-search.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.index_path)
+            except OSError as e:
+                logger.debug(f"Could not save vault index: {e}")
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                return
+            self._dirty = False
+
+    def _load(self) -> None:
+        """Load the saved index; anything unreadable means a rebuild on refresh."""
+        try:
+            raw = self.index_path.read_bytes()
+        except OSError:
+            return
+        try:
+            if not raw.startswith(MAGIC):
+                raise ValueError("not a vault index file")
+            data = zlib.decompress(raw[len(MAGIC):])
+            (header_len,) = struct.unpack_from('<I', data)
+            header = json.loads(data[4:4 + header_len])
+            if header.get('version') != FORMAT_VERSION:
+                raise ValueError("old index format")
+            total = sum(count for _, count in header['terms'])
+            doc_ids, tfs = array('I'), array('H')
+            start = 4 + header_len
+            doc_ids.frombytes(data[start:start + total * doc_ids.itemsize])
+            tfs.frombytes(data[start + total * doc_ids.itemsize:start + total * (doc_ids.itemsize + tfs.itemsize)])
+            if len(doc_ids) != total or len(tfs) != total:
+                raise ValueError("truncated index file")
+            if header.get('byteorder') != sys.byteorder:
+                doc_ids.byteswap()
+                tfs.byteswap()
+        except (ValueError, KeyError, TypeError, struct.error, zlib.error) as e:
+            logger.info(f"Rebuilding vault index ({e})")
+            return
+
+        self._docs = header['docs']
+        self._by_path = {doc[0]: i for i, doc in enumerate(self._docs) if doc is not None}
+        self._live = len(self._by_path)
+        self._total_length = sum(doc[3] for doc in self._docs if doc is not None)
+        offset = 0
+        for term, count in header['terms']:
+            self._postings[term] = (doc_ids[offset:offset + count], tfs[offset:offset + count])
+            offset += count
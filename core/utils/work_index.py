@@ -0,0 +1,351 @@
+"""
+Dex Work Index — Persistent parse cache for tasks, priorities and goals
+
+The work MCP's read tools all start from the same three markdown files
+(03-Tasks/Tasks.md, Week Priorities.md, Quarter_Goals.md). Parsing them is
+regex-heavy and gets slow once a vault holds a few thousand tasks. This module
+stores the parsed records in a small SQLite database next to the vault and only
+reparses a file when its content actually changed.
+
+Freshness is checked per file, cheapest signal first:
+1. (mtime_ns, size) unchanged            → serve stored records
+2. stat changed but content hash matches → refresh stat, serve stored records
+3. content hash changed                  → reparse that file only
+
+A full rebuild only happens when the index detects drift: a schema version
+change, a stored record count that no longer matches the rows on disk, or a
+database that can't be opened.
+
+Usage:
+    from core.utils.work_index import WorkIndex
+
+    index = WorkIndex(vault_path / "System" / ".dex-work-index.db")
+    tasks = index.records("tasks", tasks_file, parse_tasks_file)
+    hits = index.find("links", "week-2026-W05-p1")
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the table layout or stored record shape changes
+SCHEMA_VERSION = 1
+
+Parser = Callable[[Path], List[Dict[str, Any]]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path         TEXT NOT NULL,
+    kind         TEXT NOT NULL,
+    mtime_ns     INTEGER NOT NULL,
+    size         INTEGER NOT NULL,
+    sha1         TEXT NOT NULL,
+    parser_key   TEXT NOT NULL,
+    record_count INTEGER NOT NULL,
+    indexed_at   REAL NOT NULL,
+    PRIMARY KEY (path, kind)
+);
+CREATE TABLE IF NOT EXISTS records (
+    path      TEXT NOT NULL,
+    kind      TEXT NOT NULL,
+    seq       INTEGER NOT NULL,
+    record_id TEXT,
+    data      TEXT NOT NULL,
+    PRIMARY KEY (path, kind, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_records_id ON records(kind, record_id);
+"""
+
+
+def _file_sha1(path: Path) -> str:
+    """Content hash used to tell real edits apart from touch/copy mtime bumps."""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class WorkIndex:
+    """SQLite-backed cache of parsed work records, refreshed per file."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # (path, kind) -> (mtime_ns, size, parser_key, [json rows])
+        self._memory: Dict[Tuple[str, str], Tuple[int, int, str, List[str]]] = {}
+        self._batch_depth = 0
+        self.stats = {"hits": 0, "rehashed": 0, "reparsed": 0, "rebuilds": 0}
+
+    # ------------------------------------------------------------------
+    # Connection / schema
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            conn = self._open()
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Work index unreadable ({e}), rebuilding")
+            self._remove_db_files()
+            conn = self._open()
+            self.stats["rebuilds"] += 1
+
+        self._conn = conn
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS records;")
+            if version:
+                logger.info(f"Work index schema v{version} → v{SCHEMA_VERSION}, rebuilding")
+                self.stats["rebuilds"] += 1
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        conn.commit()
+        return conn
+
+    def _remove_db_files(self) -> None:
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(f"{self.db_path}{suffix}")
+            except FileNotFoundError:
+                pass
+
+    def rebuild(self) -> None:
+        """Drop every stored record. Files are reparsed lazily on next access."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM records")
+            conn.execute("DELETE FROM files")
+            conn.commit()
+            self._memory.clear()
+            self.stats["rebuilds"] += 1
+
+    @contextmanager
+    def batch(self):
+        """Group every write made inside the block into one transaction (e.g. a vault sweep)."""
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth and self._conn is not None:
+                    self._conn.commit()
+
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        if not self._batch_depth:
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._memory.clear()
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def _load_rows(self, conn: sqlite3.Connection, key: str, kind: str,
+                   expected: int) -> Optional[List[str]]:
+        rows = conn.execute(
+            "SELECT data FROM records WHERE path = ? AND kind = ? ORDER BY seq",
+            (key, kind),
+        ).fetchall()
+        if len(rows) != expected:
+            return None
+        return [r[0] for r in rows]
+
+    def _store(self, conn: sqlite3.Connection, key: str, kind: str, st: os.stat_result,
+               sha1: str, parser_key: str, records: List[Dict[str, Any]],
+               id_field: Optional[str]) -> List[str]:
+        rows = [json.dumps(r, default=str) for r in records]
+        conn.execute("DELETE FROM records WHERE path = ? AND kind = ?", (key, kind))
+        conn.executemany(
+            "INSERT INTO records (path, kind, seq, record_id, data) VALUES (?, ?, ?, ?, ?)",
+            [
+                (key, kind, seq, (rec.get(id_field) if id_field else None), row)
+                for seq, (rec, row) in enumerate(zip(records, rows))
+            ],
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO files "
+            "(path, kind, mtime_ns, size, sha1, parser_key, record_count, indexed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, kind, st.st_mtime_ns, st.st_size, sha1, parser_key, len(rows), time.time()),
+        )
+        self._commit(conn)
+        return rows
+
+    def _forget(self, conn: sqlite3.Connection, key: str, kind: str) -> None:
+        conn.execute("DELETE FROM records WHERE path = ? AND kind = ?", (key, kind))
+        conn.execute("DELETE FROM files WHERE path = ? AND kind = ?", (key, kind))
+        self._commit(conn)
+        self._memory.pop((key, kind), None)
+
+    def _refresh(self, kind: str, path: Path, parser: Parser, parser_key: str,
+                 id_field: Optional[str]) -> List[str]:
+        key = str(path)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            with self._lock:
+                self._forget(self._connect(), key, kind)
+            return []
+
+        with self._lock:
+            cached = self._memory.get((key, kind))
+            if cached and cached[:3] == (st.st_mtime_ns, st.st_size, parser_key):
+                self.stats["hits"] += 1
+                return cached[3]
+
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT mtime_ns, size, sha1, parser_key, record_count FROM files "
+                "WHERE path = ? AND kind = ?",
+                (key, kind),
+            ).fetchone()
+
+            rows: Optional[List[str]] = None
+            if row and row[3] == parser_key:
+                stored_mtime, stored_size, stored_sha1, _, count = row
+                if (stored_mtime, stored_size) == (st.st_mtime_ns, st.st_size):
+                    rows = self._load_rows(conn, key, kind, count)
+                    if rows is not None:
+                        self.stats["hits"] += 1
+                elif stored_size == st.st_size and _file_sha1(path) == stored_sha1:
+                    rows = self._load_rows(conn, key, kind, count)
+                    if rows is not None:
+                        conn.execute(
+                            "UPDATE files SET mtime_ns = ? WHERE path = ? AND kind = ?",
+                            (st.st_mtime_ns, key, kind),
+                        )
+                        self._commit(conn)
+                        self.stats["rehashed"] += 1
+
+                if rows is None and (stored_mtime, stored_size) == (st.st_mtime_ns, st.st_size):
+                    # Stat says unchanged but the rows don't add up — the index
+                    # drifted from what it recorded. Start over.
+                    logger.warning(f"Work index drift detected for {key} ({kind}), rebuilding")
+                    conn.execute("DELETE FROM records")
+                    conn.execute("DELETE FROM files")
+                    conn.commit()
+                    self._memory.clear()
+                    self.stats["rebuilds"] += 1
+
+            if rows is None:
+                sha1 = _file_sha1(path)
+                records = parser(path)
+                rows = self._store(conn, key, kind, st, sha1, parser_key, records, id_field)
+                self.stats["reparsed"] += 1
+
+            self._memory[(key, kind)] = (st.st_mtime_ns, st.st_size, parser_key, rows)
+            return rows
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def records(self, kind: str, path: Path, parser: Parser, parser_key: str = "",
+                id_field: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return parsed records for a file, reparsing only if it changed.
+
+        Args:
+            kind:        Record family stored for this file ("tasks", "priorities", ...)
+            path:        Markdown file to index
+            parser:      Function that turns the file into a list of JSON-safe dicts
+            parser_key:  Anything the parser output depends on besides the file
+                         (e.g. a hash of pillar config). A change forces a reparse.
+            id_field:    Record field stored as the lookup key for find()
+
+        Returns:
+            Fresh list of dicts — callers may mutate them freely.
+        """
+        rows = self._refresh(kind, Path(path), parser, parser_key, id_field)
+        return [json.loads(r) for r in rows]
+
+    def refresh(self, kind: str, path: Path, parser: Parser, parser_key: str = "",
+                id_field: Optional[str] = None) -> int:
+        """Bring one file's records up to date without decoding them. Returns the record count."""
+        return len(self._refresh(kind, Path(path), parser, parser_key, id_field))
+
+    def changed(self, kind: str, stats: Dict[str, Tuple[int, int]]) -> List[str]:
+        """
+        Paths from {path: (mtime_ns, size)} whose stored stat differs or that
+        aren't indexed yet. One query, so a vault-wide sweep can stat files
+        without holding the lock and only refresh what needs it.
+        """
+        with self._lock:
+            conn = self._connect()
+            stored = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in conn.execute(
+                    "SELECT path, mtime_ns, size FROM files WHERE kind = ?", (kind,)
+                )
+            }
+        return [path for path, st in stats.items() if stored.get(path) != tuple(st)]
+
+    def invalidate(self, kind: str, path: Path) -> None:
+        """Drop one file's records so the next access reparses it."""
+        with self._lock:
+            self._forget(self._connect(), str(path), kind)
+
+    def find(self, kind: str, record_id: str, path: Optional[Path] = None) -> List[Dict[str, Any]]:
+        """
+        Look up stored records by ID without touching the markdown files.
+
+        Only covers files that have been indexed via records() or refresh();
+        call one of those first for the files you care about so they are fresh.
+        """
+        with self._lock:
+            conn = self._connect()
+            if path is None:
+                rows = conn.execute(
+                    "SELECT data FROM records WHERE kind = ? AND record_id = ? ORDER BY path, seq",
+                    (kind, record_id),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT data FROM records WHERE kind = ? AND record_id = ? AND path = ? ORDER BY seq",
+                    (kind, record_id, str(path)),
+                ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def status(self) -> Dict[str, Any]:
+        """Summary of indexed files and cache effectiveness."""
+        with self._lock:
+            conn = self._connect()
+            files = conn.execute(
+                "SELECT path, kind, record_count, indexed_at FROM files ORDER BY path, kind"
+            ).fetchall()
+        return {
+            "db_path": str(self.db_path),
+            "schema_version": SCHEMA_VERSION,
+            "files": [
+                {"path": p, "kind": k, "records": n,
+                 "indexed_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))}
+                for p, k, n, t in files
+            ],
+            "stats": dict(self.stats),
+        }